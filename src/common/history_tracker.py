@@ -12,14 +12,19 @@ with automatic 24-hour expiration:
 import logging
 import time
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
 
 from common.exceptions import ValidationError
-from common.redis_protocol.config import BALANCE_KEY_PREFIX, HISTORY_KEY_PREFIX, HISTORY_TTL_SECONDS
+from common.metric_sink import MetricSink, SortedSetSample, get_shared_metric_sink
+from common.redis_protocol.config import BALANCE_KEY_PREFIX, HISTORY_KEY_PREFIX, HISTORY_RETENTION_SECONDS, HISTORY_TTL_SECONDS
 from common.redis_protocol.error_types import REDIS_ERRORS as _BASE_REDIS_ERRORS
 from common.redis_protocol.typing import RedisClient, ensure_awaitable
 from common.redis_utils import RedisOperationError, get_redis_connection
 
+if TYPE_CHECKING:
+    from common.price_history_buckets import PriceBar
+    from common.weather_history_tracker_helpers import ObservationArrays, StationRollups
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,8 +60,9 @@ class HistoryDataPoint:
 class HistoryTracker:
     """Async history tracker for monitoring service performance."""
 
-    def __init__(self):
+    def __init__(self, metric_sink: Optional[MetricSink] = None):
         self.redis_client: Optional[RedisClient] = None
+        self._metric_sink = metric_sink if metric_sink is not None else get_shared_metric_sink()
 
     async def _ensure_client(self) -> RedisClient:
         if self.redis_client is None:
@@ -66,13 +72,14 @@ class HistoryTracker:
         return self.redis_client
 
     async def record_service_update(self, service_name: str, updates_per_second: float) -> bool:
-        """Record the service update stream."""
+        """Record the service update stream (buffered in the metric sink, flushed once per interval)."""
         try:
             client = await self._ensure_client()
             current_timestamp = int(time.time())
             redis_key = f"{HISTORY_KEY_PREFIX}{service_name}"
             member = f"{current_timestamp}:{updates_per_second}"
-            await ensure_awaitable(client.zadd(redis_key, {member: current_timestamp}))
+            sample = SortedSetSample(redis_key, member, current_timestamp, retention_seconds=HISTORY_RETENTION_SECONDS)
+            await self._metric_sink.record(client, sample)
             logger.debug(
                 "Recorded %s history: %s updates/sec at %s",
                 service_name,
@@ -119,22 +126,31 @@ class PriceHistoryTracker:
     Stores price data in Redis hash with automatic 24-hour expiration:
     - history:btc (hash with datetime as field, price as value)
     - history:eth (hash with datetime as field, price as value)
+
+    plus minute/hour OHLC buckets (history:btc:1m, history:btc:1h, ...).
     """
 
-    def __init__(self):
+    def __init__(self, metric_sink: Optional[MetricSink] = None):
         """Initialize price history tracker with helper delegation"""
         from .price_history_connection_manager import PriceHistoryConnectionManager
         from .price_history_recorder import PriceHistoryRecorder
 
+        self._metric_sink = metric_sink if metric_sink is not None else get_shared_metric_sink()
         self._connection_manager = PriceHistoryConnectionManager(get_redis_connection)
-        self._recorder = PriceHistoryRecorder()
+        self._recorder = PriceHistoryRecorder(self._metric_sink)
 
     async def initialize(self):
         """Initialize Redis connection"""
         await self._connection_manager.initialize()
 
     async def cleanup(self):
-        """Clean up Redis connection to prevent resource leaks"""
+        """Flush buffered price ticks, then clean up Redis connection to prevent resource leaks"""
+        client = self._connection_manager.redis_client
+        if client is not None:
+            try:
+                await self._metric_sink.flush(client)
+            except REDIS_ERRORS:  # policy_guard: allow-silent-handler
+                logger.warning("Failed to flush buffered price history before cleanup", exc_info=True)
         await self._connection_manager.cleanup()
 
     async def record_price_update(self, currency: str, price: float) -> bool:
@@ -186,6 +202,31 @@ class PriceHistoryTracker:
         except ValidationError as exc:
             raise ValueError(str(exc)) from exc
 
+    async def get_price_bars(self, currency: str, hours: int = 24, max_points: Optional[int] = None) -> List["PriceBar"]:
+        """
+        Get downsampled OHLC bars for currency, read from the coarsest tier that fits max_points
+
+        Args:
+            currency: Currency symbol ('BTC' or 'ETH')
+            hours: Number of hours of history to retrieve
+            max_points: Point budget (defaults to DEFAULT_MAX_POINTS)
+
+        Returns:
+            List of PriceBar sorted by bucket start
+
+        Raises:
+            ValueError: If currency is not 'BTC' or 'ETH', or hours/max_points is not positive
+        """
+        from .price_history_buckets import DEFAULT_MAX_POINTS
+        from .price_history_retriever import get_bars
+
+        try:
+            await self._connection_manager.ensure_connected()
+            client = self._connection_manager.get_client()
+            return await get_bars(client, currency, hours, DEFAULT_MAX_POINTS if max_points is None else max_points)
+        except ValidationError as exc:
+            raise ValueError(str(exc)) from exc
+
 
 class WeatherHistoryTracker:
     """
@@ -272,6 +313,52 @@ class WeatherHistoryTracker:
         except REDIS_ERRORS as exc:
             raise RuntimeError(f"Failed to get temperature history for {station_icao}") from exc
 
+    async def get_temperature_history_batch(self, station_icaos: Sequence[str], hours: int = 24) -> Dict[str, "ObservationArrays"]:
+        """
+        Get temperature history for several stations in one Redis round trip.
+
+        Args:
+            station_icaos: Weather station ICAO codes
+            hours: Number of hours of history to retrieve
+
+        Returns:
+            Mapping of ICAO code to ObservationArrays (timestamps, temps_f) ascending by timestamp
+
+        Raises:
+            ValueError: If any station_icao is empty
+        """
+        try:
+            await self._connection_manager.ensure_connected()
+            client = self._connection_manager.get_client()
+            return await self._statistics_retriever.get_history_batch(client, station_icaos, hours)
+        except ValidationError as exc:
+            raise ValueError(str(exc)) from exc
+        except REDIS_ERRORS as exc:
+            raise RuntimeError(f"Failed to get temperature history for {len(station_icaos)} stations") from exc
+
+    async def get_temperature_rollups(self, station_icaos: Sequence[str], hours: int = 24) -> Dict[str, "StationRollups"]:
+        """
+        Get hourly min/max/last temperatures and the UTC day's high so far for several stations.
+
+        Args:
+            station_icaos: Weather station ICAO codes
+            hours: Number of hours of hourly rollups to return
+
+        Returns:
+            Mapping of ICAO code to StationRollups
+
+        Raises:
+            ValueError: If any station_icao is empty
+        """
+        try:
+            await self._connection_manager.ensure_connected()
+            client = self._connection_manager.get_client()
+            return await self._statistics_retriever.get_rollups_batch(client, station_icaos, hours)
+        except ValidationError as exc:
+            raise ValueError(str(exc)) from exc
+        except REDIS_ERRORS as exc:
+            raise RuntimeError(f"Failed to get temperature rollups for {len(station_icaos)} stations") from exc
+
 
 class BalanceHistoryTracker:
     """
@@ -10,6 +10,7 @@ Internal modules:
 - portfolio_operations: Portfolio queries
 - request_builder: HTTP request construction
 - request_executor: Retry logic and error handling
+- request_throttle: Shared read/write token buckets per rate tier
 - response_parser: API response parsing
 - session_manager: HTTP session lifecycle
 """
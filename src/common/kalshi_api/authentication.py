@@ -2,29 +2,111 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import threading
 import time
-from typing import Any, Dict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from time import monotonic, perf_counter
+from typing import Any, Dict, Optional
 
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import padding, rsa
 
 from .client_helpers.errors import KalshiClientError
 
+DEFAULT_SIGNING_WORKERS = 2
+
+# Padding and hash objects are immutable; build them once instead of per request
+_SIGNATURE_HASH = hashes.SHA256()
+_SIGNATURE_PADDING = padding.PSS(
+    mgf=padding.MGF1(hashes.SHA256()),
+    salt_length=padding.PSS.DIGEST_LENGTH,
+)
+
+_signing_pool: Optional[ThreadPoolExecutor] = None
+_signing_pool_lock = threading.Lock()
+
+
+def get_signing_executor() -> ThreadPoolExecutor:
+    """Return the process-wide thread pool used for RSA signing.
+
+    OpenSSL releases the GIL while signing, so a couple of threads keep RSA
+    work off the event loop without contending with it.
+    """
+    global _signing_pool
+    with _signing_pool_lock:
+        if _signing_pool is None:
+            _signing_pool = ThreadPoolExecutor(max_workers=DEFAULT_SIGNING_WORKERS, thread_name_prefix="kalshi-signing")
+        return _signing_pool
+
+
+class SigningMetrics:
+    """Thread-safe counters for request signing throughput and latency."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._started_at = monotonic()
+        self._signatures = 0
+        self._sign_seconds = 0.0
+        self._max_sign_seconds = 0.0
+        self._offloaded = 0
+        self._offload_seconds = 0.0
+        self._max_offload_seconds = 0.0
+
+    def record_signature(self, seconds: float) -> None:
+        """Record the time spent inside one RSA signature."""
+        with self._lock:
+            self._signatures += 1
+            self._sign_seconds += seconds
+            self._max_sign_seconds = max(self._max_sign_seconds, seconds)
+
+    def record_offload(self, seconds: float) -> None:
+        """Record the end-to-end latency of one pooled signing call, queueing included."""
+        with self._lock:
+            self._offloaded += 1
+            self._offload_seconds += seconds
+            self._max_offload_seconds = max(self._max_offload_seconds, seconds)
+
+    @property
+    def stats(self) -> Dict[str, int | float]:
+        """Return signing statistics."""
+        with self._lock:
+            elapsed = max(monotonic() - self._started_at, 1e-9)
+            return {
+                "signatures": self._signatures,
+                "signatures_per_second": self._signatures / elapsed,
+                "mean_sign_ms": _mean_ms(self._sign_seconds, self._signatures),
+                "max_sign_ms": self._max_sign_seconds * 1000.0,
+                "offloaded_signatures": self._offloaded,
+                "mean_offload_ms": _mean_ms(self._offload_seconds, self._offloaded),
+                "max_offload_ms": self._max_offload_seconds * 1000.0,
+            }
+
+
+def _mean_ms(total_seconds: float, count: int) -> float:
+    if not count:
+        return 0.0
+    return total_seconds * 1000.0 / count
+
 
 class AuthenticationHelper:
     """Handles authentication for Kalshi API requests."""
 
-    def __init__(self, access_key: str, private_key: Any) -> None:
+    def __init__(self, access_key: str, private_key: Any, *, signing_executor: Optional[Executor] = None) -> None:
         """
         Initialize authentication helper.
 
         Args:
             access_key: Kalshi API access key
             private_key: RSA private key for signing requests
+            signing_executor: Executor for :meth:`create_auth_headers_async`;
+                defaults to the shared signing thread pool
         """
         self._access_key = access_key
         self._private_key = private_key
+        self._signing_executor = signing_executor
+        self.metrics = SigningMetrics()
 
     def create_auth_headers(self, method: str, path: str) -> Dict[str, str]:
         """
@@ -45,17 +127,21 @@ class AuthenticationHelper:
 
         timestamp = str(int(time.time() * 1000))
         message = timestamp + method + path
-        signature = self._private_key.sign(
-            message.encode("utf-8"),
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.DIGEST_LENGTH,
-            ),
-            hashes.SHA256(),
-        )
+        started = perf_counter()
+        signature = self._private_key.sign(message.encode("utf-8"), _SIGNATURE_PADDING, _SIGNATURE_HASH)
+        self.metrics.record_signature(perf_counter() - started)
 
         return {
             "KALSHI-ACCESS-KEY": self._access_key,
             "KALSHI-ACCESS-SIGNATURE": base64.b64encode(signature).decode("utf-8"),
             "KALSHI-ACCESS-TIMESTAMP": timestamp,
         }
+
+    async def create_auth_headers_async(self, method: str, path: str) -> Dict[str, str]:
+        """Generate authentication headers on the signing pool instead of the event loop."""
+        executor = self._signing_executor if self._signing_executor is not None else get_signing_executor()
+        loop = asyncio.get_running_loop()
+        started = perf_counter()
+        headers = await loop.run_in_executor(executor, self.create_auth_headers, method, path)
+        self.metrics.record_offload(perf_counter() - started)
+        return headers
@@ -15,10 +15,12 @@ from .client_helpers import (
     FillsOperations,
     KeyLoader,
     MarketStatusOperations,
+    PaginationOperations,
     SeriesOperations,
     extract_and_validate_credentials,
 )
 from .client_helpers.errors import KalshiClientError
+from .request_throttle import DEFAULT_KALSHI_RATE_TIER
 
 __all__ = ["KalshiClient", "KalshiClientError", "KalshiConfig"]
 
@@ -28,6 +30,10 @@ DEFAULT_KALSHI_SOCK_READ_TIMEOUT_SECONDS = 20
 DEFAULT_KALSHI_NETWORK_MAX_RETRIES = 3
 DEFAULT_KALSHI_BACKOFF_BASE_SECONDS = 1.0
 DEFAULT_KALSHI_BACKOFF_MAX_SECONDS = 30.0
+DEFAULT_KALSHI_CONNECTION_LIMIT = 100
+DEFAULT_KALSHI_CONNECTION_LIMIT_PER_HOST = 32
+DEFAULT_KALSHI_DNS_CACHE_TTL_SECONDS = 300
+DEFAULT_KALSHI_KEEPALIVE_TIMEOUT_SECONDS = 120.0
 
 if TYPE_CHECKING:
     from common.redis_protocol.trade_store import TradeStore
@@ -44,6 +50,11 @@ class KalshiConfig:
     network_max_retries: int = DEFAULT_KALSHI_NETWORK_MAX_RETRIES
     network_backoff_base_seconds: float = DEFAULT_KALSHI_BACKOFF_BASE_SECONDS
     network_backoff_max_seconds: float = DEFAULT_KALSHI_BACKOFF_MAX_SECONDS
+    rate_limit_tier: str = DEFAULT_KALSHI_RATE_TIER
+    connection_limit: int = DEFAULT_KALSHI_CONNECTION_LIMIT
+    connection_limit_per_host: int = DEFAULT_KALSHI_CONNECTION_LIMIT_PER_HOST
+    dns_cache_ttl_seconds: int = DEFAULT_KALSHI_DNS_CACHE_TTL_SECONDS
+    keepalive_timeout_seconds: float = DEFAULT_KALSHI_KEEPALIVE_TIMEOUT_SECONDS
 
 
 def _session(self):
@@ -88,6 +99,7 @@ class KalshiClient:
     _series_ops: SeriesOperations
     _fills_ops: FillsOperations
     _market_status_ops: MarketStatusOperations
+    _pagination_ops: PaginationOperations
     _trade_store: Optional["TradeStore"]
     _initialized: bool
 
@@ -118,6 +130,7 @@ class KalshiClient:
                 "_series_ops": SeriesOperations(self),
                 "_fills_ops": FillsOperations(self),
                 "_market_status_ops": MarketStatusOperations(self),
+                "_pagination_ops": PaginationOperations(self),
             }
         )
         self._trade_store: Optional["TradeStore"] = None
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import aiohttp
 
@@ -120,7 +120,7 @@ async def _api_request_impl(
             operation_name=operation_name,
         )
         await client.initialize()
-        request_kwargs["headers"] = client.auth_headers(method_upper, path)
+        # Headers are left unset so the executor signs them on the signing pool
         return await builder.execute_request(method_upper, url, request_kwargs, path, op)
 
     await client.initialize()
@@ -248,6 +248,29 @@ async def _get_all_fills_impl(
     return await fills_ops.get_all_fills(min_ts, max_ts, ticker, cursor)
 
 
+def _pagination_ops(client) -> Any:
+    pagination_ops = getattr(client, "_pagination_ops", None)
+    if pagination_ops is None:
+        raise KalshiClientError("Pagination operations not initialized")
+    return pagination_ops
+
+
+def _iter_fills_impl(client, **filters: Any) -> AsyncIterator[Dict[str, Any]]:
+    return _pagination_ops(client).iter_fills(**filters)
+
+
+def _iter_orders_impl(client, **filters: Any) -> AsyncIterator[Dict[str, Any]]:
+    return _pagination_ops(client).iter_orders(**filters)
+
+
+def _iter_markets_impl(client, **filters: Any) -> AsyncIterator[Dict[str, Any]]:
+    return _pagination_ops(client).iter_markets(**filters)
+
+
+def _iter_positions_impl(client, **filters: Any) -> AsyncIterator[Dict[str, Any]]:
+    return _pagination_ops(client).iter_positions(**filters)
+
+
 async def _get_exchange_status_impl(client) -> Dict[str, bool]:
     market_status_ops = getattr(client, "_market_status_ops", None)
     if market_status_ops is None:
@@ -360,6 +383,10 @@ def bind_client_methods(client_cls, session_getter, session_setter) -> None:
     client_cls.get_fills = _get_fills_impl
     client_cls.get_series = _get_series_impl
     client_cls.get_all_fills = _get_all_fills_impl
+    client_cls.iter_fills = _iter_fills_impl
+    client_cls.iter_orders = _iter_orders_impl
+    client_cls.iter_markets = _iter_markets_impl
+    client_cls.iter_positions = _iter_positions_impl
     client_cls.get_exchange_status = _get_exchange_status_impl
     client_cls.is_market_open = _is_market_open_impl
     setattr(client_cls, "_build_order_payload", _build_order_payload_impl)
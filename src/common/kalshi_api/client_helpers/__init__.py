@@ -6,6 +6,8 @@ from .component_initializer import ComponentInitializer, SeriesOperations
 from .errors import KalshiClientError
 from .fills_operations import FillsOperations, MarketStatusOperations
 from .key_loader import KeyLoader, extract_and_validate_credentials
+from .pagination import PaginationOperations
+from .sync_checkpoint import RedisSyncCheckpoint, SyncCheckpoint
 
 __all__ = [
     "ComponentInitializer",
@@ -13,6 +15,9 @@ __all__ = [
     "KalshiClientError",
     "KeyLoader",
     "MarketStatusOperations",
+    "PaginationOperations",
+    "RedisSyncCheckpoint",
     "SeriesOperations",
+    "SyncCheckpoint",
     "extract_and_validate_credentials",
 ]
@@ -30,6 +30,7 @@ class ComponentInitializer:
             self.config.network_max_retries,
             self.config.network_backoff_base_seconds,
             self.config.network_backoff_max_seconds,
+            self.config.rate_limit_tier,
         )
         portfolio_ops = PortfolioOperations(request_builder)
         order_ops = OrderOperations(request_builder)
@@ -0,0 +1,206 @@
+"""Auto-paginating async iterators over Kalshi list endpoints.
+
+Kalshi list endpoints return one page plus a ``cursor`` for the next.  The
+iterators here request page N+1 as soon as page N arrives, so the network
+round trip overlaps with the caller processing page N's records.  Feeds with
+a ``min_ts`` filter (fills, orders) can resume from a
+:class:`~.sync_checkpoint.RedisSyncCheckpoint`, which is advanced only after
+every record of a page has been consumed (at-least-once delivery).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .errors import KalshiClientError
+from .sync_checkpoint import RedisSyncCheckpoint, SyncCheckpoint
+
+PageFetcher = Callable[[Optional[str]], Awaitable[Dict[str, Any]]]
+TimestampExtractor = Callable[[Dict[str, Any]], Optional[int]]
+
+_FILLS_PATH = "/trade-api/v2/portfolio/fills"
+_ORDERS_PATH = "/trade-api/v2/portfolio/orders"
+_MARKETS_PATH = "/trade-api/v2/markets"
+_POSITIONS_PATH = "/trade-api/v2/portfolio/positions"
+
+
+async def iterate_pages(
+    fetch_page: PageFetcher, *, start_cursor: Optional[str] = None
+) -> AsyncIterator[Tuple[Dict[str, Any], Optional[str]]]:
+    """Yield ``(page, next_cursor)`` pairs, prefetching the next page before yielding."""
+    pending: Optional[asyncio.Future] = asyncio.ensure_future(fetch_page(start_cursor))
+    cursor = start_cursor
+    try:
+        while pending is not None:
+            page = await pending
+            pending = None
+            next_cursor = page.get("cursor") or None
+            if next_cursor is not None:
+                if next_cursor == cursor:
+                    raise KalshiClientError(f"Kalshi pagination cursor did not advance: {next_cursor!r}")
+                pending = asyncio.ensure_future(fetch_page(next_cursor))
+            yield page, next_cursor
+            cursor = next_cursor
+    finally:
+        if pending is not None:
+            _discard(pending)
+
+
+def _discard(pending: asyncio.Future) -> None:
+    if not pending.done():
+        pending.cancel()
+    elif not pending.cancelled():
+        # Retrieve the prefetch outcome so an unused failure is not logged as unhandled
+        pending.exception()
+
+
+class PaginationOperations:
+    """Async-generator APIs streaming records from Kalshi list endpoints."""
+
+    def __init__(self, client: Any) -> None:
+        self.client = client
+
+    def iter_fills(
+        self,
+        *,
+        min_ts: Optional[int] = None,
+        max_ts: Optional[int] = None,
+        ticker: Optional[str] = None,
+        page_size: Optional[int] = None,
+        checkpoint: Optional[RedisSyncCheckpoint] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream fills, optionally resuming from and advancing ``checkpoint``."""
+        params = _build_params(min_ts=min_ts, max_ts=max_ts, ticker=ticker, limit=page_size)
+        return self._iterate(_FILLS_PATH, "fills", "iter_fills", params, checkpoint, _fill_timestamp)
+
+    def iter_orders(
+        self,
+        *,
+        min_ts: Optional[int] = None,
+        max_ts: Optional[int] = None,
+        ticker: Optional[str] = None,
+        event_ticker: Optional[str] = None,
+        status: Optional[str] = None,
+        page_size: Optional[int] = None,
+        checkpoint: Optional[RedisSyncCheckpoint] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream orders, optionally resuming from and advancing ``checkpoint``."""
+        params = _build_params(min_ts=min_ts, max_ts=max_ts, ticker=ticker, event_ticker=event_ticker, status=status, limit=page_size)
+        return self._iterate(_ORDERS_PATH, "orders", "iter_orders", params, checkpoint, _created_timestamp)
+
+    def iter_markets(
+        self,
+        *,
+        event_ticker: Optional[str] = None,
+        series_ticker: Optional[str] = None,
+        status: Optional[str] = None,
+        tickers: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream markets matching the filters."""
+        params = _build_params(
+            event_ticker=event_ticker,
+            series_ticker=series_ticker,
+            status=status,
+            tickers=",".join(tickers) if tickers else None,
+            limit=page_size,
+        )
+        return self._iterate(_MARKETS_PATH, "markets", "iter_markets", params)
+
+    def iter_positions(
+        self,
+        *,
+        ticker: Optional[str] = None,
+        event_ticker: Optional[str] = None,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream raw market position entries."""
+        params = _build_params(ticker=ticker, event_ticker=event_ticker, limit=page_size)
+        return self._iterate(_POSITIONS_PATH, "market_positions", "iter_positions", params)
+
+    async def _iterate(
+        self,
+        path: str,
+        items_field: str,
+        operation_name: str,
+        params: Dict[str, Any],
+        checkpoint: Optional[RedisSyncCheckpoint] = None,
+        timestamp_of: Optional[TimestampExtractor] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        start_cursor, high_water = None, None
+        if checkpoint is not None:
+            start_cursor, high_water = await _resume_from_checkpoint(checkpoint, params)
+        pass_min_ts = params.get("min_ts")
+
+        async def fetch_page(cursor: Optional[str]) -> Dict[str, Any]:
+            page_params = dict(params)
+            if cursor:
+                page_params["cursor"] = cursor
+            return await self.client.api_request(method="GET", path=path, params=page_params, operation_name=operation_name)
+
+        async for page, next_cursor in iterate_pages(fetch_page, start_cursor=start_cursor):
+            items = _page_items(page, items_field, operation_name)
+            high_water = _page_high_water(items, timestamp_of, high_water)
+            for item in items:
+                yield item
+            if checkpoint is not None:
+                await checkpoint.save(SyncCheckpoint(min_ts=pass_min_ts, cursor=next_cursor, high_water_ts=high_water))
+
+
+async def _resume_from_checkpoint(checkpoint: RedisSyncCheckpoint, params: Dict[str, Any]) -> Tuple[Optional[str], Optional[int]]:
+    """Apply a saved checkpoint's ``min_ts`` to ``params``; return its ``(cursor, high_water_ts)``."""
+    state = await checkpoint.load()
+    if state.cursor:
+        # A cursor is only valid with the filters of the pass that issued it
+        params.pop("min_ts", None)
+        if state.min_ts is not None:
+            params["min_ts"] = state.min_ts
+    elif state.high_water_ts is not None:
+        params["min_ts"] = max(state.high_water_ts, params.get("min_ts", state.high_water_ts))
+    return state.cursor, state.high_water_ts
+
+
+def _page_items(page: Dict[str, Any], items_field: str, operation_name: str) -> List[Any]:
+    items = page.get(items_field)
+    if items is None:
+        return []
+    if not isinstance(items, list):
+        raise KalshiClientError(f"Kalshi {operation_name} page field {items_field!r} is not a list")
+    return items
+
+
+def _page_high_water(items: List[Any], timestamp_of: Optional[TimestampExtractor], high_water: Optional[int]) -> Optional[int]:
+    """Return the newest record timestamp seen so far, including ``items``."""
+    if timestamp_of is None:
+        return high_water
+    for item in items:
+        item_ts = timestamp_of(item)
+        if item_ts is not None and (high_water is None or item_ts > high_water):
+            high_water = item_ts
+    return high_water
+
+
+def _build_params(**filters: Any) -> Dict[str, Any]:
+    return {name: value for name, value in filters.items() if value is not None and value != ""}
+
+
+def _fill_timestamp(fill: Dict[str, Any]) -> Optional[int]:
+    raw_ts = fill.get("ts")
+    if isinstance(raw_ts, (int, float)):
+        return int(raw_ts)
+    return _created_timestamp(fill)
+
+
+def _created_timestamp(record: Dict[str, Any]) -> Optional[int]:
+    created = record.get("created_time")
+    if not isinstance(created, str) or not created:
+        return None
+    try:
+        return int(datetime.fromisoformat(created.replace("Z", "+00:00")).timestamp())
+    except ValueError as exc:
+        raise KalshiClientError(f"Invalid created_time {created!r} in Kalshi record") from exc
+
+
+__all__ = ["PaginationOperations", "iterate_pages"]
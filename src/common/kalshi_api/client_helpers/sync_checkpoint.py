@@ -0,0 +1,90 @@
+"""Redis-persisted checkpoints for incremental syncs of paginated Kalshi feeds."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from redis.typing import EncodableT, FieldT
+
+from common.redis_protocol.typing import RedisClient, ensure_awaitable
+from common.redis_schema import SyncCheckpointKey
+
+from .errors import KalshiClientError
+
+_SOURCE = "kalshi"
+_MIN_TS_FIELD = "min_ts"
+_CURSOR_FIELD = "cursor"
+_HIGH_WATER_FIELD = "high_water_ts"
+
+
+@dataclass(frozen=True)
+class SyncCheckpoint:
+    """Progress of one feed's sync.
+
+    ``cursor`` is set while a pass is in flight and names the next page; it is
+    only valid together with the ``min_ts`` that pass started from.  Once a
+    pass completes the cursor is cleared and ``high_water_ts`` (the newest
+    record timestamp seen) becomes the next pass's ``min_ts``.
+    """
+
+    min_ts: Optional[int] = None
+    cursor: Optional[str] = None
+    high_water_ts: Optional[int] = None
+
+
+class RedisSyncCheckpoint:
+    """Load and save a :class:`SyncCheckpoint` in an ``ops:sync_checkpoints:`` hash."""
+
+    def __init__(self, redis: RedisClient, feed: str) -> None:
+        self._redis = redis
+        self._key = SyncCheckpointKey(_SOURCE, feed).key()
+
+    @property
+    def key(self) -> str:
+        return self._key
+
+    async def load(self) -> SyncCheckpoint:
+        raw = await ensure_awaitable(self._redis.hgetall(self._key))
+        fields = {_decode(name): _decode(value) for name, value in (raw or {}).items()}
+        return SyncCheckpoint(
+            min_ts=self._parse_int(fields, _MIN_TS_FIELD),
+            cursor=fields.get(_CURSOR_FIELD) or None,
+            high_water_ts=self._parse_int(fields, _HIGH_WATER_FIELD),
+        )
+
+    async def save(self, checkpoint: SyncCheckpoint) -> None:
+        mapping: Dict[FieldT, EncodableT] = {}
+        if checkpoint.min_ts is not None:
+            mapping[_MIN_TS_FIELD] = str(checkpoint.min_ts)
+        if checkpoint.cursor:
+            mapping[_CURSOR_FIELD] = checkpoint.cursor
+        if checkpoint.high_water_ts is not None:
+            mapping[_HIGH_WATER_FIELD] = str(checkpoint.high_water_ts)
+        async with self._redis.pipeline() as pipe:
+            pipe.delete(self._key)
+            if mapping:
+                pipe.hset(self._key, mapping=mapping)
+            await ensure_awaitable(pipe.execute())
+
+    async def reset(self) -> None:
+        """Forget the checkpoint so the next sync starts from scratch."""
+        await ensure_awaitable(self._redis.delete(self._key))
+
+    def _parse_int(self, fields: Dict[str, str], name: str) -> Optional[int]:
+        raw = fields.get(name)
+        if raw is None or raw == "":
+            return None
+        try:
+            return int(raw)
+        except ValueError as exc:
+            raise KalshiClientError(f"Invalid {name} {raw!r} in sync checkpoint {self._key}") from exc
+
+
+def _decode(value: Any) -> str:
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode("utf-8")
+    return str(value)
+
+
+__all__ = ["RedisSyncCheckpoint", "SyncCheckpoint"]
@@ -0,0 +1,113 @@
+"""Keep-alive instrumentation for the Kalshi HTTP session.
+
+An aiohttp ``TraceConfig`` reports, per request, whether the connector handed
+out a pooled keep-alive connection or had to open a new one (TCP connect plus
+TLS handshake).  Counts and handshake latency are kept on
+:class:`ConnectionStats` and forwarded to the process-wide ``session_tracker``
+so idle-period reconnects show up next to the session's request counts.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Optional
+
+import aiohttp
+
+from common.session_tracker import session_tracker
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ConnectionStats:
+    """Connection reuse and handshake latency for one session manager."""
+
+    new_connections: int = 0
+    reused_connections: int = 0
+    queued_requests: int = 0
+    connect_seconds: float = 0.0
+    max_connect_seconds: float = 0.0
+    last_connect_seconds: float = 0.0
+
+    @property
+    def reuse_ratio(self) -> float:
+        total = self.new_connections + self.reused_connections
+        if not total:
+            return 0.0
+        return self.reused_connections / total
+
+    @property
+    def mean_connect_ms(self) -> float:
+        if not self.new_connections:
+            return 0.0
+        return self.connect_seconds * 1000.0 / self.new_connections
+
+    def as_dict(self) -> Dict[str, int | float]:
+        return {
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "queued_requests": self.queued_requests,
+            "reuse_ratio": self.reuse_ratio,
+            "mean_connect_ms": self.mean_connect_ms,
+            "max_connect_ms": self.max_connect_seconds * 1000.0,
+            "last_connect_ms": self.last_connect_seconds * 1000.0,
+        }
+
+
+class ConnectionTracer:
+    """Feeds aiohttp connection trace events into :class:`ConnectionStats`."""
+
+    def __init__(self, stats: ConnectionStats, session_id_provider: Callable[[], Optional[str]]) -> None:
+        self._stats = stats
+        self._session_id_provider = session_id_provider
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_connection_queued_start.append(self._on_queued)
+        trace_config.on_connection_create_start.append(self._on_create_start)
+        trace_config.on_connection_create_end.append(self._on_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_reuse)
+        return trace_config
+
+    def record_new_connection(self, connect_seconds: float) -> None:
+        stats = self._stats
+        stats.new_connections += 1
+        stats.connect_seconds += connect_seconds
+        stats.max_connect_seconds = max(stats.max_connect_seconds, connect_seconds)
+        stats.last_connect_seconds = connect_seconds
+        logger.debug("Kalshi opened a new connection in %.1fms", connect_seconds * 1000.0)
+        session_id = self._session_id_provider()
+        if session_id is not None:
+            session_tracker.track_session_connection(session_id, reused=False, connect_seconds=connect_seconds)
+
+    def record_reused_connection(self) -> None:
+        self._stats.reused_connections += 1
+        session_id = self._session_id_provider()
+        if session_id is not None:
+            session_tracker.track_session_connection(session_id, reused=True)
+
+    async def _on_request_start(self, _session: Any, _ctx: SimpleNamespace, _params: Any) -> None:
+        session_id = self._session_id_provider()
+        if session_id is not None:
+            session_tracker.track_session_activity(session_id)
+
+    async def _on_queued(self, _session: Any, _ctx: SimpleNamespace, _params: Any) -> None:
+        self._stats.queued_requests += 1
+
+    async def _on_create_start(self, _session: Any, ctx: SimpleNamespace, _params: Any) -> None:
+        ctx.connect_started = perf_counter()
+
+    async def _on_create_end(self, _session: Any, ctx: SimpleNamespace, _params: Any) -> None:
+        started = getattr(ctx, "connect_started", None)
+        self.record_new_connection(perf_counter() - started if started is not None else 0.0)
+
+    async def _on_reuse(self, _session: Any, _ctx: SimpleNamespace, _params: Any) -> None:
+        self.record_reused_connection()
+
+
+__all__ = ["ConnectionStats", "ConnectionTracer"]
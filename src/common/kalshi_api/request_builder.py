@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 from .client_helpers.errors import KalshiClientError
 from .request_executor import RequestExecutor
+from .request_throttle import DEFAULT_KALSHI_RATE_TIER, get_shared_throttle
 
 if TYPE_CHECKING:
     from .authentication import AuthenticationHelper
@@ -26,9 +27,12 @@ class RequestBuilder:
         max_retries: int,
         backoff_base: float,
         backoff_max: float,
+        rate_tier: str = DEFAULT_KALSHI_RATE_TIER,
     ) -> None:
         self._base_url = base_url
-        self._executor = RequestExecutor(session_manager, auth_helper, max_retries, backoff_base, backoff_max)
+        self._executor = RequestExecutor(
+            session_manager, auth_helper, max_retries, backoff_base, backoff_max, get_shared_throttle(rate_tier)
+        )
 
     def build_request_context(
         self,
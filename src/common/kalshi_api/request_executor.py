@@ -3,12 +3,13 @@
 import asyncio
 import logging
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import aiohttp
 
 from ..rate_limiter import RateLimiter
 from .client_helpers.errors import KalshiClientError
+from .request_throttle import KalshiRequestThrottle, get_shared_throttle
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,7 @@ WARNING_LOG_ATTEMPT_THRESHOLD = 3
 class _AttemptContext:
     """Context for a single request attempt."""
 
+    method: str
     path: str
     op: str
     attempt: int
@@ -39,13 +41,22 @@ class _RetryResult:
 class RequestExecutor:
     """Execute HTTP requests with retries and error handling."""
 
-    def __init__(self, session_manager, auth_helper, max_retries, backoff_base, backoff_max):
+    def __init__(
+        self,
+        session_manager,
+        auth_helper,
+        max_retries,
+        backoff_base,
+        backoff_max,
+        throttle: Optional[KalshiRequestThrottle] = None,
+    ):
         self._session_manager = session_manager
         self._auth_helper = auth_helper
         self._max_retries = max_retries
         self._backoff_base = backoff_base
         self._backoff_max = backoff_max
         self._rate_limiter = RateLimiter()
+        self._throttle = throttle if throttle is not None else get_shared_throttle()
 
     async def execute_request(
         self, method_upper: str, url: str, request_kwargs: Dict[str, Any], path: str, operation_name: str
@@ -54,7 +65,7 @@ class RequestExecutor:
         await self._session_manager.initialize()
         session = self._session_manager.get_session()
         if request_kwargs.get("headers") is None:
-            request_kwargs["headers"] = self._auth_helper.create_auth_headers(method_upper, path)
+            request_kwargs["headers"] = await self._auth_helper.create_auth_headers_async(method_upper, path)
         return await self._retry_request(session, method_upper, url, request_kwargs, path, operation_name)
 
     async def _retry_request(
@@ -62,7 +73,7 @@ class RequestExecutor:
     ) -> Dict[str, Any]:
         max_attempts = 1 + max(0, self._max_retries)
         for attempt in range(1, max_attempts + 1):
-            ctx = _AttemptContext(path=path, op=op, attempt=attempt, max_attempts=max_attempts)
+            ctx = _AttemptContext(method=method_upper, path=path, op=op, attempt=attempt, max_attempts=max_attempts)
             result = await self._execute_single_attempt(session, method_upper, url, request_kwargs, ctx)
             if isinstance(result, _RetryResult):
                 await asyncio.sleep(result.delay)
@@ -73,6 +84,7 @@ class RequestExecutor:
     async def _execute_single_attempt(
         self, session: aiohttp.ClientSession, method_upper: str, url: str, request_kwargs: Dict[str, Any], ctx: _AttemptContext
     ) -> Dict[str, Any] | _RetryResult:
+        await self._throttle.acquire(method_upper, ctx.path)
         await self._rate_limiter.wait()
         try:
             async with session.request(method_upper, url, **request_kwargs) as response:
@@ -95,6 +107,7 @@ class RequestExecutor:
 
     def _handle_rate_limit(self, ctx: _AttemptContext) -> _RetryResult:
         self._rate_limiter.record_rate_limit()
+        self._throttle.record_rate_limit(ctx.method)
         if ctx.attempt >= ctx.max_attempts:
             raise KalshiClientError(f"Kalshi rate limit exceeded for {ctx.op} after {ctx.max_attempts} attempts")
         delay = self._compute_retry_delay(ctx.attempt)
@@ -0,0 +1,97 @@
+"""Process-wide proactive throttling for Kalshi REST requests.
+
+Kalshi meters reads and writes (order create/amend/cancel) against separate
+per-second budgets that depend on the account tier.  Every
+:class:`RequestExecutor` in a process shares one :class:`KalshiRequestThrottle`
+per tier, so separate ``KalshiClient`` instances draw from the same buckets
+instead of each running at full speed into 429s.  Order placement and
+cancels queue ahead of portfolio and fills polling.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict
+
+from ..token_bucket import RequestPriority, TokenBucket
+
+
+@dataclass(frozen=True)
+class KalshiRateTier:
+    """Published per-second request budgets for a Kalshi API tier."""
+
+    read_per_second: float
+    write_per_second: float
+
+
+KALSHI_RATE_TIERS: Dict[str, KalshiRateTier] = {
+    "basic": KalshiRateTier(read_per_second=20, write_per_second=10),
+    "advanced": KalshiRateTier(read_per_second=30, write_per_second=30),
+    "premier": KalshiRateTier(read_per_second=100, write_per_second=100),
+    "prime": KalshiRateTier(read_per_second=400, write_per_second=400),
+}
+DEFAULT_KALSHI_RATE_TIER = "basic"
+
+_READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_ORDERS_PATH = "/trade-api/v2/portfolio/orders"
+_PORTFOLIO_PATH = "/trade-api/v2/portfolio/"
+
+
+def is_write_request(method_upper: str) -> bool:
+    """Kalshi bills every mutating request against the write budget."""
+    return method_upper not in _READ_METHODS
+
+
+def request_priority(method_upper: str, path: str) -> RequestPriority:
+    """Order placement/cancels first, portfolio and fills polling last."""
+    if path.startswith(_ORDERS_PATH) and is_write_request(method_upper):
+        return RequestPriority.URGENT
+    if path.startswith(_PORTFOLIO_PATH):
+        return RequestPriority.BACKGROUND
+    return RequestPriority.NORMAL
+
+
+class KalshiRequestThrottle:
+    """Separate read and write token buckets for one Kalshi tier."""
+
+    def __init__(self, tier: KalshiRateTier) -> None:
+        self._read_bucket = TokenBucket(tier.read_per_second)
+        self._write_bucket = TokenBucket(tier.write_per_second)
+
+    async def acquire(self, method_upper: str, path: str) -> None:
+        """Wait for a token in the bucket that meters this request."""
+        await self._bucket(method_upper).acquire(request_priority(method_upper, path))
+
+    def record_rate_limit(self, method_upper: str, penalty_seconds: float = 0.0) -> None:
+        """Drain the metering bucket so every client sharing it pauses after a 429."""
+        self._bucket(method_upper).drain(penalty_seconds)
+
+    def _bucket(self, method_upper: str) -> TokenBucket:
+        return self._write_bucket if is_write_request(method_upper) else self._read_bucket
+
+
+_SHARED_THROTTLES: Dict[str, KalshiRequestThrottle] = {}
+
+
+def get_shared_throttle(tier_name: str = DEFAULT_KALSHI_RATE_TIER) -> KalshiRequestThrottle:
+    """Return the process-wide throttle for ``tier_name``."""
+    tier_key = tier_name.lower()
+    throttle = _SHARED_THROTTLES.get(tier_key)
+    if throttle is None:
+        tier = KALSHI_RATE_TIERS.get(tier_key)
+        if tier is None:
+            raise ValueError(f"Unknown Kalshi rate tier {tier_name!r}; expected one of {sorted(KALSHI_RATE_TIERS)}")
+        throttle = KalshiRequestThrottle(tier)
+        _SHARED_THROTTLES[tier_key] = throttle
+    return throttle
+
+
+__all__ = [
+    "DEFAULT_KALSHI_RATE_TIER",
+    "KALSHI_RATE_TIERS",
+    "KalshiRateTier",
+    "KalshiRequestThrottle",
+    "get_shared_throttle",
+    "is_write_request",
+    "request_priority",
+]
@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
 import aiohttp
 
+from common.session_tracker import session_tracker
+
+from .connection_metrics import ConnectionStats, ConnectionTracer
+
 if TYPE_CHECKING:
     from .client import KalshiConfig
 
+KALSHI_SESSION_SERVICE = "kalshi_api"
+
 
 class SessionManager:
     """Manages HTTP session lifecycle for Kalshi API."""
@@ -20,9 +26,15 @@ class SessionManager:
         self._connector: Optional[aiohttp.TCPConnector] = None
         self._session_lock = asyncio.Lock()
         self._closing = False
+        self._session_id: Optional[str] = None
+        self._connection_stats = ConnectionStats()
+        self._tracer = ConnectionTracer(self._connection_stats, lambda: self._session_id)
 
     async def initialize(self) -> None:
         """Ensure the HTTP session is ready."""
+        # Called before every request; skip the lock once the session is up
+        if self._session is not None and not self._session.closed and not self._closing:
+            return
         async with self._session_lock:
             if self._closing:
                 raise RuntimeError("Cannot initialize session while close is in progress")
@@ -34,11 +46,19 @@ class SessionManager:
                 connect=self._config.connect_timeout_seconds,
                 sock_read=self._config.sock_read_timeout_seconds,
             )
-            self._connector = aiohttp.TCPConnector()
+            # aiohttp already sets TCP_NODELAY on every client connection
+            self._connector = aiohttp.TCPConnector(
+                limit=self._config.connection_limit,
+                limit_per_host=self._config.connection_limit_per_host,
+                ttl_dns_cache=self._config.dns_cache_ttl_seconds,
+                keepalive_timeout=self._config.keepalive_timeout_seconds,
+            )
             self._session = aiohttp.ClientSession(
                 connector=self._connector,
                 timeout=timeout,
+                trace_configs=[self._tracer.trace_config()],
             )
+            self._session_id = session_tracker.track_session_creation(self._session, KALSHI_SESSION_SERVICE)
 
     async def close(self) -> None:
         """Close the HTTP session and connector."""
@@ -51,6 +71,9 @@ class SessionManager:
                 if self._connector is not None:
                     await self._connector.close()
                     self._connector = None
+                if self._session_id is not None:
+                    session_tracker.track_session_closure(self._session_id)
+                    self._session_id = None
                 # Allow the event loop to finalize SSL transports while still
                 # holding the lock so that initialize() cannot race.
                 await asyncio.sleep(0)
@@ -80,3 +103,8 @@ class SessionManager:
     def set_session_lock(self, lock: asyncio.Lock) -> None:
         """Replace the session lock (tests sometimes inject custom locks)."""
         self._session_lock = lock
+
+    @property
+    def connection_stats(self) -> Dict[str, int | float]:
+        """Keep-alive reuse versus new-connection (TLS handshake) counts and latency."""
+        return self._connection_stats.as_dict()
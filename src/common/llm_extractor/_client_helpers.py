@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from typing import Callable
 
 import aiohttp
 
@@ -63,12 +64,14 @@ def extract_text(data: dict) -> str:
 async def request_with_retries(
     payload: dict,
     headers: dict,
+    on_rate_limited: Callable[[], None] | None = None,
 ) -> dict:
     """Execute the API request with exponential backoff retry logic.
 
     Args:
         payload: The request payload.
         headers: The request headers.
+        on_rate_limited: Called on every 429 response, before backing off.
 
     Returns:
         The full response JSON dict.
@@ -84,6 +87,8 @@ async def request_with_retries(
             async with aiohttp.ClientSession(timeout=timeout) as session:
                 async with session.post(_ANTHROPIC_API_URL, json=payload, headers=headers) as resp:
                     if resp.status == _HTTP_RATE_LIMIT:
+                        if on_rate_limited is not None:
+                            on_rate_limited()
                         wait = get_retry_wait(resp, backoff, attempt)
                         await asyncio.sleep(wait)
                         backoff = min(backoff * 2, _MAX_BACKOFF_SECONDS)
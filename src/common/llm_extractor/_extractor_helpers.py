@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
 from typing import TYPE_CHECKING
 
@@ -38,11 +40,25 @@ _REDIS_PREFIX_KALSHI = "market:extracted:kalshi"
 _REDIS_PREFIX_POLY = "market:extracted:poly"
 _BATCH_SIZE = 10
 _CONCURRENT_REQUESTS = 5
+_MAX_CONCURRENT_REQUESTS = 16
+_LATENCY_TARGET_SECONDS = 60.0
 
 # Minimum underlyings required for dedup
 _MIN_UNDERLYINGS_FOR_DEDUP = 2
 
 
+def build_content_cache_key(prefix: str, *, model: str, system_prompt: str, user_content: str) -> str:
+    """Stable cache key for an LLM call, derived from everything that shapes its answer.
+
+    The rendered prompt carries both the prompt wording and the inputs, so
+    editing the template or switching models yields a new key, while the same
+    request maps to the same key in every process.
+    """
+    payload = json.dumps([model, system_prompt, user_content], ensure_ascii=False)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"{prefix}:{digest}"
+
+
 def get_redis_key(market_id: str, platform: str) -> str:
     """Generate Redis key for extracted fields."""
     if platform == "kalshi":
@@ -65,6 +81,16 @@ def get_concurrent_requests() -> int:
     return _CONCURRENT_REQUESTS
 
 
+def get_max_concurrent_requests() -> int:
+    """Return the ceiling for adaptive request concurrency."""
+    return _MAX_CONCURRENT_REQUESTS
+
+
+def get_latency_target_seconds() -> float:
+    """Return the batch latency above which concurrency backs off."""
+    return _LATENCY_TARGET_SECONDS
+
+
 def get_min_underlyings_for_dedup() -> int:
     """Return minimum underlyings required for dedup."""
     return _MIN_UNDERLYINGS_FOR_DEDUP
@@ -129,6 +155,19 @@ async def load_kalshi_cached(market_id: str, redis: Redis) -> str | None:
     return None
 
 
+async def load_kalshi_cached_batch(market_ids: list[str], redis: Redis) -> dict[str, str]:
+    """Load cached underlyings for many markets in a single pipeline round trip."""
+    if not market_ids:
+        return {}
+
+    pipe = redis.pipeline()
+    for market_id in market_ids:
+        pipe.hget(get_redis_key(market_id, "kalshi"), "underlying")
+    values = await pipe.execute()
+
+    return {market_id: underlying for market_id, underlying in zip(market_ids, values) if underlying}
+
+
 async def store_kalshi_cached_batch(results: dict[str, str], redis: Redis) -> None:
     """Store batch of underlyings in Redis cache."""
     if not results:
@@ -333,14 +372,18 @@ async def store_poly_no_match_batch(market_ids: list[str], redis: Redis) -> None
 
 
 __all__ = [
+    "build_content_cache_key",
     "get_redis_key",
     "get_ttl",
     "get_batch_size",
     "get_concurrent_requests",
+    "get_max_concurrent_requests",
+    "get_latency_target_seconds",
     "get_min_underlyings_for_dedup",
     "extract_kalshi_single",
     "extract_kalshi_batch_with_retry",
     "load_kalshi_cached",
+    "load_kalshi_cached_batch",
     "store_kalshi_cached_batch",
     "extract_poly_single_with_retry",
     "extract_poly_batch_with_retry",
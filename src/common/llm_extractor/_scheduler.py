@@ -0,0 +1,110 @@
+"""Work-queue scheduling for LLM batch extraction.
+
+Batches run from a queue that keeps ``limit`` requests in flight at all
+times.  A slow request only occupies its own slot, instead of holding back
+a whole fixed-size chunk as ``asyncio.gather`` would.  The limit adapts
+additively-increase/multiplicatively-decrease style: it shrinks when the
+API answers 429 or a batch runs past the latency target, and grows back one
+slot per window of healthy completions.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Awaitable, Callable, Iterable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_BACKOFF_FACTOR = 0.5
+
+
+class AdaptiveConcurrency:
+    """AIMD concurrency limit driven by rate limits and request latency."""
+
+    def __init__(self, initial: int, *, maximum: int, latency_target_seconds: float, minimum: int = 1) -> None:
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError(f"Expected 1 <= minimum <= initial <= maximum, got {minimum}, {initial}, {maximum}")
+        self._limit = float(initial)
+        self._minimum = minimum
+        self._maximum = maximum
+        self._latency_target_seconds = latency_target_seconds
+
+    @property
+    def limit(self) -> int:
+        """Number of requests that may be in flight."""
+        return int(self._limit)
+
+    def record_success(self, latency_seconds: float) -> None:
+        """Grow by one slot per ``limit`` fast completions; shrink on slow ones."""
+        if latency_seconds > self._latency_target_seconds:
+            self._shrink(f"slow batch {latency_seconds:.1f}s")
+            return
+        self._limit = min(float(self._maximum), self._limit + 1.0 / self._limit)
+
+    def record_rate_limited(self) -> None:
+        """Halve the limit after the API answered 429."""
+        self._shrink("rate limited")
+
+    def _shrink(self, reason: str) -> None:
+        previous = self.limit
+        self._limit = max(float(self._minimum), self._limit * _BACKOFF_FACTOR)
+        if self.limit < previous:
+            logger.info("LLM concurrency %d -> %d (%s)", previous, self.limit, reason)
+
+
+async def stream_completed(
+    items: Iterable[T],
+    worker: Callable[[T], Awaitable[R]],
+    concurrency: AdaptiveConcurrency,
+    *,
+    rate_limited_count: Callable[[], int],
+) -> AsyncIterator[R]:
+    """Run ``worker`` over ``items`` and yield each result as soon as it completes.
+
+    ``rate_limited_count`` reports the client's cumulative 429 count; any
+    increase between completions shrinks the limit.  Closing the iterator
+    early cancels the requests still in flight.
+    """
+    queue = iter(items)
+    exhausted = False
+    started: dict[asyncio.Future[R], float] = {}
+    seen_rate_limits = rate_limited_count()
+    try:
+        while True:
+            while not exhausted and len(started) < concurrency.limit:
+                try:
+                    item = next(queue)
+                except StopIteration:  # policy_guard: allow-silent-handler
+                    exhausted = True
+                    break
+                started[asyncio.ensure_future(worker(item))] = time.monotonic()
+            if not started:
+                return
+
+            done, _ = await asyncio.wait(started, return_when=asyncio.FIRST_COMPLETED)
+            finished_at = time.monotonic()
+            rate_limits = rate_limited_count()
+            throttled = rate_limits > seen_rate_limits
+            seen_rate_limits = rate_limits
+            if throttled:
+                concurrency.record_rate_limited()
+
+            for future in done:
+                latency = finished_at - started.pop(future)
+                result = future.result()
+                if not throttled:
+                    concurrency.record_success(latency)
+                yield result
+    finally:
+        for future in started:
+            if not future.cancel() and not future.cancelled():
+                # Finished alongside a failed batch; retrieve so it is not reported as unhandled
+                future.exception()
+
+
+__all__ = ["AdaptiveConcurrency", "stream_completed"]
@@ -0,0 +1,37 @@
+"""Share one in-flight LLM call between concurrent identical requests."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Run at most one coroutine per key; concurrent callers await the same result."""
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Future[T]] = {}
+
+    @property
+    def inflight(self) -> int:
+        """Number of keys with a call in progress."""
+        return len(self._inflight)
+
+    async def run(self, key: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Await ``call()`` for ``key``, joining an identical call already running."""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done, key=key: self._forget(key, done))
+        # Shield so one caller being cancelled does not cancel the shared call
+        return await asyncio.shield(future)
+
+    def _forget(self, key: str, done: asyncio.Future[T]) -> None:
+        if self._inflight.get(key) is done:
+            del self._inflight[key]
+
+
+__all__ = ["SingleFlight"]
@@ -48,8 +48,14 @@ class AnthropicClient:
         self._output_cost_per_mtok = costs[1]
         self._total_input_tokens = 0
         self._total_output_tokens = 0
+        self._rate_limited_count = 0
         logger.info("Initialized AnthropicClient (model: %s)", self._model)
 
+    @property
+    def model(self) -> str:
+        """Model identifier sent with every request."""
+        return self._model
+
     async def send_message(
         self,
         system_prompt: str,
@@ -80,7 +86,7 @@ class AnthropicClient:
         }
         if tools and any("type" in t and t["type"].startswith("web_search") for t in tools):
             headers["anthropic-beta"] = "web-search-2025-03-05"
-        data = await request_with_retries(payload, headers)
+        data = await request_with_retries(payload, headers, self._record_rate_limited)
         self._accumulate_usage(data)
         text = extract_text(data)
 
@@ -100,6 +106,14 @@ class AnthropicClient:
         self._total_input_tokens += usage["input_tokens"]
         self._total_output_tokens += usage["output_tokens"]
 
+    def _record_rate_limited(self) -> None:
+        """Count a 429 response from the API."""
+        self._rate_limited_count += 1
+
+    def get_rate_limited_count(self) -> int:
+        """Return how many 429 responses this client has received."""
+        return self._rate_limited_count
+
     def compute_call_cost(self, input_tokens: int, output_tokens: int) -> float:
         """Calculate cost in USD for a single call's token usage."""
         input_cost = (input_tokens / 1_000_000) * self._input_cost_per_mtok
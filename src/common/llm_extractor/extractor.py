@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, AsyncIterator
 
 from redis.asyncio import Redis
 
@@ -14,20 +15,25 @@ if TYPE_CHECKING:
     pass
 
 from ._extractor_helpers import (
+    build_content_cache_key,
     extract_kalshi_batch_with_retry,
     extract_poly_batch_with_retry,
     get_batch_size,
     get_concurrent_requests,
+    get_latency_target_seconds,
+    get_max_concurrent_requests,
     get_min_underlyings_for_dedup,
     get_redis_key,
     get_ttl,
-    load_kalshi_cached,
+    load_kalshi_cached_batch,
     load_poly_cached_batch,
 )
 from ._response_parser import (
     parse_expiry_alignment_response,
     parse_kalshi_dedup_response,
 )
+from ._scheduler import AdaptiveConcurrency, stream_completed
+from ._single_flight import SingleFlight
 from .client import AnthropicClient
 from .models import MarketExtraction
 from .prompts import (
@@ -40,6 +46,16 @@ logger = logging.getLogger(__name__)
 
 _REDIS_PREFIX_DEDUP = "crossarb:dedup"
 _REDIS_PREFIX_EXPIRY_ALIGN = "crossarb:expiry_align"
+_DEDUP_USER_CONTENT = "Please identify any duplicates."
+
+
+def _adaptive_concurrency() -> AdaptiveConcurrency:
+    """Fresh concurrency limit for one extraction run."""
+    return AdaptiveConcurrency(
+        get_concurrent_requests(),
+        maximum=get_max_concurrent_requests(),
+        latency_target_seconds=get_latency_target_seconds(),
+    )
 
 
 class KalshiUnderlyingExtractor:
@@ -60,57 +76,46 @@ class KalshiUnderlyingExtractor:
         redis: Redis,
     ) -> tuple[dict[str, str], set[str]]:
         """Load cached underlyings from Redis."""
-        results: dict[str, str] = {}
-        accumulated: set[str] = set()
-        for market in markets:
-            market_id = market["id"]
-            cached = await load_kalshi_cached(market_id, redis)
-            if cached:
-                results[market_id] = cached
-                accumulated.add(cached)
-        return results, accumulated
-
-    async def _process_extraction_chunk(
-        self,
-        chunk: list[list[dict]],
-        accumulated_underlyings: set[str],
-        results: dict[str, str],
-        redis: Redis,
-    ) -> None:
-        """Process a chunk of batches for extraction."""
-        existing = list(accumulated_underlyings)
-        tasks = [extract_kalshi_batch_with_retry(self._client, batch, existing, redis) for batch in chunk]
-        chunk_results = await asyncio.gather(*tasks)
-        for batch_results in chunk_results:
-            for market_id, underlying in batch_results.items():
-                results[market_id] = underlying
-                accumulated_underlyings.add(underlying)
+        results = await load_kalshi_cached_batch([market["id"] for market in markets], redis)
+        return results, set(results.values())
 
-    async def extract_underlyings(
+    async def iter_underlyings(
         self,
         markets: list[dict],
         redis: Redis,
-    ) -> dict[str, str]:
-        """Extract underlyings for Kalshi markets with batching."""
-        results, accumulated_underlyings = await self._load_cached_underlyings(markets, redis)
+    ) -> AsyncIterator[tuple[str, str]]:
+        """Stream ``(market_id, underlying)`` pairs: cached ones first, then each batch as it completes.
+
+        Every batch is written to Redis before it is yielded, so an interrupted
+        run resumes from the cache instead of starting over.
+        """
+        cached, accumulated_underlyings = await self._load_cached_underlyings(markets, redis)
+        for market_id, underlying in cached.items():
+            yield market_id, underlying
 
-        uncached = [m for m in markets if m["id"] not in results]
+        uncached = [m for m in markets if m["id"] not in cached]
         if not uncached:
             logger.info("All %d Kalshi markets cached", len(markets))
-            return results
+            return
 
         logger.info("Extracting underlyings for %d uncached Kalshi markets", len(uncached))
 
         batch_size = get_batch_size()
-        concurrent = get_concurrent_requests()
         batches = [uncached[i : i + batch_size] for i in range(0, len(uncached), batch_size)]
 
-        for chunk_start in range(0, len(batches), concurrent):
-            chunk_end = min(chunk_start + concurrent, len(batches))
-            chunk = batches[chunk_start:chunk_end]
-            await self._process_extraction_chunk(chunk, accumulated_underlyings, results, redis)
+        async def extract(batch: list[dict]) -> tuple[int, dict[str, str]]:
+            # Snapshot at start so later batches see underlyings found by earlier ones
+            existing = list(accumulated_underlyings)
+            return len(batch), await extract_kalshi_batch_with_retry(self._client, batch, existing, redis)
 
-            processed = min(chunk_end * batch_size, len(uncached))
+        processed = 0
+        async for batch_len, batch_results in stream_completed(
+            batches, extract, _adaptive_concurrency(), rate_limited_count=self._client.get_rate_limited_count
+        ):
+            processed += batch_len
+            for market_id, underlying in batch_results.items():
+                accumulated_underlyings.add(underlying)
+                yield market_id, underlying
             logger.info(
                 "Progress: %d/%d Kalshi markets extracted (total: $%.4f)",
                 processed,
@@ -118,6 +123,13 @@ class KalshiUnderlyingExtractor:
                 self._client.get_cost(),
             )
 
+    async def extract_underlyings(
+        self,
+        markets: list[dict],
+        redis: Redis,
+    ) -> dict[str, str]:
+        """Extract underlyings for Kalshi markets with batching."""
+        results = {market_id: underlying async for market_id, underlying in self.iter_underlyings(markets, redis)}
         logger.info(
             "Kalshi extraction complete: %d total (total: $%.4f)",
             len(results),
@@ -132,43 +144,56 @@ class KalshiDedupExtractor:
     def __init__(self, api_key: str | None = None) -> None:
         """Initialize the extractor."""
         self._client = AnthropicClient(model="claude-haiku-4-5", max_tokens=4096, api_key=api_key)
+        self._single_flight: SingleFlight[dict[str, str]] = SingleFlight()
 
     @property
     def client(self) -> AnthropicClient:
         """Access the underlying Anthropic client for usage stats."""
         return self._client
 
+    def _cache_key(self, category: str, underlyings: list[str]) -> str:
+        """Content-addressed cache key, stable across processes."""
+        prompt = build_kalshi_dedup_prompt(category, underlyings)
+        return build_content_cache_key(
+            f"{_REDIS_PREFIX_DEDUP}:{category}",
+            model=self._client.model,
+            system_prompt=prompt,
+            user_content=_DEDUP_USER_CONTENT,
+        )
+
     async def dedup_underlyings(
         self,
         underlyings_by_category: dict[str, set[str]],
         redis: Redis,
     ) -> dict[str, str]:
         """Deduplicate underlyings across all categories."""
-        import json as json_module
-
         all_mappings: dict[str, str] = {}
-        uncached_categories: list[tuple[str, list[str], str]] = []
         min_underlyings = get_min_underlyings_for_dedup()
 
+        candidates: list[tuple[str, list[str], str]] = []
         for category, underlyings in underlyings_by_category.items():
             if len(underlyings) < min_underlyings:
                 continue
+            sorted_underlyings = sorted(underlyings)
+            candidates.append((category, sorted_underlyings, self._cache_key(category, sorted_underlyings)))
+
+        if not candidates:
+            return all_mappings
 
-            underlyings_hash = hash(tuple(sorted(underlyings)))
-            cache_key = f"{_REDIS_PREFIX_DEDUP}:{category}:{underlyings_hash}"
-            cached = await redis.get(cache_key)
+        cached_values = await redis.mget([cache_key for _, _, cache_key in candidates])
+        uncached_categories: list[tuple[str, list[str], str]] = []
+        for (category, underlyings, cache_key), cached in zip(candidates, cached_values):
             if cached:
-                cached_mapping = json_module.loads(cached)
-                all_mappings.update(cached_mapping)
+                all_mappings.update(json.loads(cached))
                 logger.info("Loaded cached dedup mapping for %s", category)
             else:
-                uncached_categories.append((category, list(underlyings), cache_key))
+                uncached_categories.append((category, underlyings, cache_key))
 
         if not uncached_categories:
             return all_mappings
 
         logger.info("Deduplicating %d categories", len(uncached_categories))
-        tasks = [self._dedup_category_with_cache(cat, underlyings, cache_key, redis) for cat, underlyings, cache_key in uncached_categories]
+        tasks = [self._dedup_category_coalesced(cat, underlyings, cache_key, redis) for cat, underlyings, cache_key in uncached_categories]
         results = await asyncio.gather(*tasks)
 
         for mapping in results:
@@ -177,6 +202,16 @@ class KalshiDedupExtractor:
         logger.info("Dedup complete: %d aliases found (total: $%.4f)", len(all_mappings), self._client.get_cost())
         return all_mappings
 
+    async def _dedup_category_coalesced(
+        self,
+        category: str,
+        underlyings: list[str],
+        cache_key: str,
+        redis: Redis,
+    ) -> dict[str, str]:
+        """Join an identical dedup already in flight instead of paying for a second call."""
+        return await self._single_flight.run(cache_key, lambda: self._dedup_category_with_cache(category, underlyings, cache_key, redis))
+
     async def _dedup_category_with_cache(
         self,
         category: str,
@@ -185,10 +220,8 @@ class KalshiDedupExtractor:
         redis: Redis,
     ) -> dict[str, str]:
         """Run dedup for a single category and cache result."""
-        import json as json_module
-
         mapping = await self._dedup_category(category, underlyings)
-        await redis.set(cache_key, json_module.dumps(mapping), ex=get_ttl())
+        await redis.set(cache_key, json.dumps(mapping), ex=get_ttl())
         if mapping:
             logger.info("Deduped %s: found %d aliases", category, len(mapping))
         return mapping
@@ -196,7 +229,7 @@ class KalshiDedupExtractor:
     async def _dedup_category(self, category: str, underlyings: list[str]) -> dict[str, str]:
         """Run dedup for a single category."""
         prompt = build_kalshi_dedup_prompt(category, underlyings)
-        response = await self._client.send_message(prompt, "Please identify any duplicates.")
+        response = await self._client.send_message(prompt, _DEDUP_USER_CONTENT)
         return parse_kalshi_dedup_response(response.text, original_underlyings=set(underlyings))
 
 
@@ -212,40 +245,41 @@ class PolyExtractor:
         """Access the underlying Anthropic client for usage stats."""
         return self._client
 
-    async def extract_batch(
+    async def iter_extractions(
         self,
         markets: list[dict],
         valid_categories: set[str],
         valid_underlyings: set[str],
         redis: Redis,
-    ) -> list[MarketExtraction]:
-        """Extract fields for Poly markets with batching and retry."""
-        results: list[MarketExtraction] = []
+    ) -> AsyncIterator[MarketExtraction]:
+        """Stream extractions: cached ones first, then each batch as it completes.
 
+        Every batch is written to Redis before it is yielded, so an interrupted
+        run resumes from the cache instead of starting over.
+        """
         cached, uncached = await load_poly_cached_batch(markets, redis)
-        results.extend(cached)
+        for extraction in cached:
+            yield extraction
 
         if not uncached:
             logger.info("All %d Poly markets cached", len(markets))
-            return results
+            return
 
         logger.info("Extracting %d uncached Poly markets", len(uncached))
 
         batch_size = get_batch_size()
-        concurrent = get_concurrent_requests()
         batches = [uncached[i : i + batch_size] for i in range(0, len(uncached), batch_size)]
 
-        for chunk_start in range(0, len(batches), concurrent):
-            chunk_end = min(chunk_start + concurrent, len(batches))
-            chunk = batches[chunk_start:chunk_end]
-
-            tasks = [extract_poly_batch_with_retry(self._client, batch, valid_categories, valid_underlyings, redis) for batch in chunk]
-            chunk_results = await asyncio.gather(*tasks)
-
-            for batch_results in chunk_results:
-                results.extend(batch_results)
+        async def extract(batch: list[dict]) -> tuple[int, list[MarketExtraction]]:
+            return len(batch), await extract_poly_batch_with_retry(self._client, batch, valid_categories, valid_underlyings, redis)
 
-            processed = min(chunk_end * batch_size, len(uncached))
+        processed = 0
+        async for batch_len, batch_results in stream_completed(
+            batches, extract, _adaptive_concurrency(), rate_limited_count=self._client.get_rate_limited_count
+        ):
+            processed += batch_len
+            for extraction in batch_results:
+                yield extraction
             logger.info(
                 "Progress: %d/%d Poly markets extracted (total: $%.4f)",
                 processed,
@@ -253,10 +287,18 @@ class PolyExtractor:
                 self._client.get_cost(),
             )
 
+    async def extract_batch(
+        self,
+        markets: list[dict],
+        valid_categories: set[str],
+        valid_underlyings: set[str],
+        redis: Redis,
+    ) -> list[MarketExtraction]:
+        """Extract fields for Poly markets with batching and retry."""
+        results = [extraction async for extraction in self.iter_extractions(markets, valid_categories, valid_underlyings, redis)]
         logger.info(
-            "Poly extraction complete: %d cached, %d new (total: $%.4f)",
-            len(cached),
-            len(results) - len(cached),
+            "Poly extraction complete: %d extracted (total: $%.4f)",
+            len(results),
             self._client.get_cost(),
         )
         return results
@@ -268,6 +310,7 @@ class ExpiryAligner:
     def __init__(self, redis: Redis) -> None:
         self._client = AnthropicClient(model="claude-haiku-4-5", max_tokens=4096)
         self._redis = redis
+        self._single_flight: SingleFlight[str | None] = SingleFlight()
 
     @property
     def client(self) -> AnthropicClient:
@@ -311,6 +354,21 @@ class ExpiryAligner:
         context: dict[str, str] | None = None,
     ) -> str | None:
         """Determine if markets are the same event and return aligned expiry."""
+        return await self._single_flight.run(
+            self._get_cache_key(kalshi_id, poly_id),
+            lambda: self._align_expiry_uncoalesced(kalshi_id, kalshi_title, kalshi_expiry, poly_id, poly_title, poly_expiry, context),
+        )
+
+    async def _align_expiry_uncoalesced(
+        self,
+        kalshi_id: str,
+        kalshi_title: str,
+        kalshi_expiry: str,
+        poly_id: str,
+        poly_title: str,
+        poly_expiry: str,
+        context: dict[str, str] | None,
+    ) -> str | None:
         found, cached_result = await self._get_cached(kalshi_id, poly_id)
         if found:
             return cached_result
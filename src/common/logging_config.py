@@ -2,20 +2,104 @@
 
 Console output to stdout, file output to logs/{service_name}.log.
 Every restart rewrites the log file fresh (mode "w").
+
+In queue mode (``use_queue=True`` or ``LOG_QUEUE_MODE=1``) the root logger
+only enqueues records; a ``QueueListener`` thread owns the console and file
+handlers, so the event loop never blocks on stream or disk I/O.  The queue is
+bounded: when it is full, records are dropped and counted (ERROR and above
+wait briefly for space first).  Hot loggers can be sampled so that only one
+in N of their DEBUG/INFO records is enqueued.
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
 import threading
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
-
-import matplotlib
+from typing import Dict, List, Mapping, Optional
 
 _config_lock = threading.Lock()
 _UNKNOWN_LOGGER_NAME = "<unknown>"
 
+DEFAULT_LOG_QUEUE_SIZE = 10_000
+_ERROR_PUT_TIMEOUT_SECONDS = 0.05
+
+
+@dataclass
+class LogQueueStats:
+    """Counters for the queue-mode logging backend."""
+
+    queued: int = 0
+    dropped: int = 0
+    sampled_out: int = 0
+
+
+class _BoundedQueueHandler(QueueHandler):
+    """Non-blocking ``QueueHandler`` with drop accounting and per-logger sampling.
+
+    ``emit`` runs under the handler lock, so the counters need no extra locking.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]", sample_rates: Mapping[str, int]):
+        super().__init__(log_queue)
+        self._log_queue = log_queue
+        self.stats = LogQueueStats()
+        self._sample_rates = {name: int(rate) for name, rate in sample_rates.items() if int(rate) > 1}
+        self._rate_by_logger: Dict[str, int] = {}
+        self._seen_by_logger: Dict[str, int] = {}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.levelno <= logging.INFO and not self._keep_sampled(record.name):
+            self.stats.sampled_out += 1
+            return
+        super().emit(record)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if record.levelno >= logging.ERROR:
+                self._log_queue.put(record, timeout=_ERROR_PUT_TIMEOUT_SECONDS)
+            else:
+                self._log_queue.put_nowait(record)
+        except queue.Full:  # Drop instead of blocking the caller  # policy_guard: allow-silent-handler
+            self.stats.dropped += 1
+            return
+        self.stats.queued += 1
+
+    def _keep_sampled(self, logger_name: str) -> bool:
+        rate = self._rate_by_logger.get(logger_name)
+        if rate is None:
+            rate = self._resolve_rate(logger_name)
+            self._rate_by_logger[logger_name] = rate
+        if rate <= 1:
+            return True
+        seen = self._seen_by_logger.get(logger_name, 0)
+        self._seen_by_logger[logger_name] = seen + 1
+        return seen % rate == 0
+
+    def _resolve_rate(self, logger_name: str) -> int:
+        """Rate of the most specific configured logger that ``logger_name`` falls under."""
+        name = logger_name
+        while name:
+            if name in self._sample_rates:
+                return self._sample_rates[name]
+            name = name.rpartition(".")[0]
+        return 1
+
+
+@dataclass
+class _QueueBackend:
+    handler: _BoundedQueueHandler
+    listener: QueueListener
+    targets: List[logging.Handler]
+
+
+_queue_backend: Optional[_QueueBackend] = None
+_atexit_registered = False
+
 
 def _close_handlers(logger: logging.Logger, logger_name: Optional[str] = None) -> None:
     """Close all handlers for a logger."""
@@ -43,16 +127,87 @@ def _reset_all_handlers(root_logger: logging.Logger) -> None:
 
 def _suppress_noisy_third_parties() -> None:
     """Suppress verbose third-party loggers to WARNING."""
-    for name in ("urllib3", "asyncio", "websockets", "aiohttp", "redis", "redis.connection", "redis.asyncio", matplotlib.__name__, "PIL"):
+    for name in ("urllib3", "asyncio", "websockets", "aiohttp", "redis", "redis.connection", "redis.asyncio", "matplotlib", "PIL"):
         logging.getLogger(name).setLevel(logging.WARNING)
 
 
-def setup_logging(service_name: Optional[str] = None, *, log_to_file: bool = True) -> None:
-    """Configure logging for the application."""
+def _queue_mode_from_env() -> bool:
+    return os.environ.get("LOG_QUEUE_MODE") in ("1", "true")
+
+
+def _stop_queue_backend(root_logger: logging.Logger) -> None:
+    """Drain and stop the listener thread, handing its handlers back to the root logger."""
+    global _queue_backend
+    backend = _queue_backend
+    if backend is None:
+        return
+    _queue_backend = None
+    backend.listener.stop()
+    root_logger.removeHandler(backend.handler)
+    for handler in backend.targets:
+        root_logger.addHandler(handler)
+    if backend.handler.stats.dropped or backend.handler.stats.sampled_out:
+        logging.getLogger(__name__).warning(
+            "Log queue dropped %d records and sampled out %d", backend.handler.stats.dropped, backend.handler.stats.sampled_out
+        )
+
+
+def _start_queue_backend(
+    root_logger: logging.Logger,
+    targets: List[logging.Handler],
+    queue_size: int,
+    sampled_loggers: Mapping[str, int],
+) -> None:
+    global _queue_backend, _atexit_registered
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=queue_size)
+    handler = _BoundedQueueHandler(log_queue, sampled_loggers)
+    listener = QueueListener(log_queue, *targets, respect_handler_level=True)
+    root_logger.addHandler(handler)
+    listener.start()
+    _queue_backend = _QueueBackend(handler=handler, listener=listener, targets=targets)
+    if not _atexit_registered:
+        atexit.register(shutdown_logging)
+        _atexit_registered = True
+
+
+def get_log_queue_stats() -> Optional[LogQueueStats]:
+    """Counters for the queue-mode backend, or ``None`` when logging writes synchronously."""
+    backend = _queue_backend
+    return backend.handler.stats if backend is not None else None
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and return to synchronous logging (no-op outside queue mode)."""
+    with _config_lock:
+        _stop_queue_backend(logging.getLogger())
+
+
+def setup_logging(
+    service_name: Optional[str] = None,
+    *,
+    log_to_file: bool = True,
+    use_queue: Optional[bool] = None,
+    queue_size: int = DEFAULT_LOG_QUEUE_SIZE,
+    sampled_loggers: Optional[Mapping[str, int]] = None,
+) -> None:
+    """Configure logging for the application.
+
+    Args:
+        service_name: Names the log file; no file is written without it.
+        log_to_file: Whether to write logs/{service_name}.log.
+        use_queue: Hand records to a background listener thread (defaults to ``LOG_QUEUE_MODE``).
+        queue_size: Maximum records waiting for the listener in queue mode.
+        sampled_loggers: Logger name -> N; in queue mode only one in N DEBUG/INFO records
+            from that logger (and its children) is kept.
+    """
+    if queue_size < 1:
+        raise ValueError(f"queue_size must be at least 1, got {queue_size}")
     with _config_lock:
         root_logger = logging.getLogger()
         managed_by_monitor = os.environ.get("MANAGED_BY_MONITOR") in ("1", "true")
+        queue_mode = _queue_mode_from_env() if use_queue is None else use_queue
 
+        _stop_queue_backend(root_logger)
         _reset_all_handlers(root_logger)
 
         formatter = logging.Formatter(
@@ -60,10 +215,11 @@ def setup_logging(service_name: Optional[str] = None, *, log_to_file: bool = Tru
             "%Y-%m-%d %H:%M:%S",
         )
 
+        handlers: List[logging.Handler] = []
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
         console_handler.setLevel(logging.INFO if managed_by_monitor else logging.DEBUG)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
         if service_name and not managed_by_monitor and log_to_file:
             logs_dir = Path.cwd() / "logs"
@@ -71,7 +227,13 @@ def setup_logging(service_name: Optional[str] = None, *, log_to_file: bool = Tru
             file_handler = logging.FileHandler(logs_dir / f"{service_name}.log", mode="w")
             file_handler.setFormatter(formatter)
             file_handler.setLevel(logging.INFO)
-            root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
+
+        if queue_mode:
+            _start_queue_backend(root_logger, handlers, queue_size, sampled_loggers or {})
+        else:
+            for handler in handlers:
+                root_logger.addHandler(handler)
 
         root_logger.setLevel(logging.INFO)
         _suppress_noisy_third_parties()
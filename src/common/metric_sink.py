@@ -0,0 +1,296 @@
+"""Shared in-process buffer for high-frequency Redis metric writes.
+
+Service rate history, message-count history and price ticks each used to
+issue their own ZADD (or ZREMRANGEBYSCORE+ZADD pipeline) per sample.  Writers
+now hand samples to one :class:`MetricSink` per process, which keeps a
+separate buffer per Redis client: a flush only ever writes a client's own
+samples through that client, so one writer's failure is never raised to
+another.  A buffer is flushed in a single pipelined round trip when a writer
+records after ``flush_interval_seconds`` has elapsed, by a background loop
+every ``flush_interval_seconds`` (so a writer that goes quiet still lands its
+last samples), and on :meth:`MetricSink.stop`.  Retention pruning runs in the
+same pipeline, but only every ``prune_interval_seconds``.
+
+Each buffer is bounded: when it is full the oldest sample is dropped and
+counted, so a Redis outage cannot grow memory without limit.  A failed flush
+puts its samples back (still bounded) and re-raises to the writer that
+triggered it, so callers keep their fail-fast error handling.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional, Protocol
+
+from common.redis_protocol.error_types import REDIS_ERRORS
+from common.redis_protocol.typing import RedisClient, ensure_awaitable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+DEFAULT_MAX_BUFFERED_SAMPLES = 10_000
+DEFAULT_PRUNE_INTERVAL_SECONDS = 300.0
+
+
+class MetricWrite(Protocol):
+    """A buffered write that queues its commands on a pipeline at flush time."""
+
+    @property
+    def key(self) -> str: ...
+
+    @property
+    def retention_seconds(self) -> Optional[int]: ...
+
+    @property
+    def coalesce_key(self) -> Optional[Hashable]:
+        """Writes sharing a coalesce key replace each other in the buffer; ``None`` never coalesces."""
+        ...
+
+    async def queue(self, pipe: Any) -> None: ...
+
+
+@dataclass(frozen=True)
+class SortedSetSample:
+    """One ``timestamp:value``-style member for a history sorted set scored by epoch seconds."""
+
+    key: str
+    member: str
+    score: float
+    retention_seconds: Optional[int] = None
+
+    @property
+    def coalesce_key(self) -> Hashable:
+        # One sample per key and second: a later sample replaces an earlier one
+        return (self.key, self.score)
+
+    async def queue(self, pipe: Any) -> None:
+        pipe.zadd(self.key, {self.member: self.score})
+
+
+@dataclass
+class MetricSinkStats:
+    """Counters for one metric sink."""
+
+    buffered: int = 0
+    flushes: int = 0
+    flushed_samples: int = 0
+    coalesced_samples: int = 0
+    dropped_samples: int = 0
+    failed_flushes: int = 0
+    prune_runs: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "buffered": self.buffered,
+            "flushes": self.flushes,
+            "flushed_samples": self.flushed_samples,
+            "coalesced_samples": self.coalesced_samples,
+            "dropped_samples": self.dropped_samples,
+            "failed_flushes": self.failed_flushes,
+            "prune_runs": self.prune_runs,
+        }
+
+
+@dataclass
+class _ClientBuffer:
+    """Samples waiting to be written through one Redis client."""
+
+    client: RedisClient
+    last_prune: float
+    writes: "OrderedDict[Hashable, MetricWrite]" = field(default_factory=OrderedDict)
+    retention: Dict[str, int] = field(default_factory=dict)
+    last_flush: Optional[float] = None
+
+
+class MetricSink:
+    """Bounded per-client buffers of metric writes flushed in one pipeline per interval."""
+
+    def __init__(
+        self,
+        *,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_buffered_samples: int = DEFAULT_MAX_BUFFERED_SAMPLES,
+        prune_interval_seconds: float = DEFAULT_PRUNE_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        if flush_interval_seconds < 0:
+            raise ValueError(f"flush_interval_seconds must be non-negative, got {flush_interval_seconds}")
+        if max_buffered_samples < 1:
+            raise ValueError(f"max_buffered_samples must be at least 1, got {max_buffered_samples}")
+        self._flush_interval = float(flush_interval_seconds)
+        self._max_buffered = int(max_buffered_samples)
+        self._prune_interval = float(prune_interval_seconds)
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._buffers: Dict[int, _ClientBuffer] = {}
+        self._sequence = itertools.count()
+        self._stats = MetricSinkStats()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def stats(self) -> MetricSinkStats:
+        self._stats.buffered = sum(len(buffer.writes) for buffer in self._buffers.values())
+        return self._stats
+
+    def add(self, client: RedisClient, write: MetricWrite) -> None:
+        """Buffer ``write`` for ``client``, dropping that client's oldest sample when full."""
+        buffer = self._buffer_for(client)
+        coalesce_key = write.coalesce_key
+        if coalesce_key is None:
+            coalesce_key = ("_unique", next(self._sequence))
+        elif coalesce_key in buffer.writes:
+            del buffer.writes[coalesce_key]
+            self._stats.coalesced_samples += 1
+        buffer.writes[coalesce_key] = write
+        if write.retention_seconds is not None:
+            buffer.retention[write.key] = write.retention_seconds
+        self._trim(buffer)
+
+    async def record(self, client: RedisClient, write: MetricWrite) -> None:
+        """Buffer ``write`` and flush ``client``'s samples if the flush interval has elapsed."""
+        self.add(client, write)
+        buffer = self._buffer_for(client)
+        if self._flush_due(buffer):
+            await self._flush_buffer(buffer)
+        if buffer.writes:
+            self._ensure_flush_loop()
+
+    async def flush(self, client: Optional[RedisClient] = None) -> int:
+        """Write buffered samples now; return the number of samples written.
+
+        With ``client`` only that client's samples are flushed and a failure is
+        re-raised.  Without it every client's buffer is flushed, failures are
+        logged and their samples stay buffered for the next attempt.
+        """
+        if client is not None:
+            return await self._flush_buffer(self._buffer_for(client))
+        written = 0
+        for buffer in list(self._buffers.values()):
+            try:
+                written += await self._flush_buffer(buffer)
+            except REDIS_ERRORS as exc:  # policy_guard: allow-silent-handler
+                logger.warning("Metric sink flush failed; %d samples kept for retry: %s", len(buffer.writes), exc)
+        return written
+
+    async def start(self) -> None:
+        """Start the periodic background flush loop."""
+        self._ensure_flush_loop()
+
+    async def stop(self) -> None:
+        """Cancel the flush loop, perform a final flush, and warn on unflushed samples."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        await self.flush()
+        unflushed = self.stats.buffered
+        if unflushed:
+            logger.warning("Metric sink: %d samples unflushed on shutdown", unflushed)
+
+    def _ensure_flush_loop(self) -> None:
+        if self._flush_interval <= 0:
+            # Every record flushes immediately; there is nothing for a loop to pick up
+            return
+        task = self._task
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            return
+        self._task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """Flush every buffer once per interval until stopped."""
+        try:
+            while True:
+                await asyncio.sleep(self._flush_interval)
+                await self.flush()
+        except asyncio.CancelledError:
+            logger.debug("Metric sink flush loop cancelled")
+            raise
+
+    def _buffer_for(self, client: RedisClient) -> _ClientBuffer:
+        buffer = self._buffers.get(id(client))
+        if buffer is None or buffer.client is not client:
+            buffer = _ClientBuffer(client=client, last_prune=self._clock())
+            self._buffers[id(client)] = buffer
+        return buffer
+
+    def _flush_due(self, buffer: _ClientBuffer) -> bool:
+        if not buffer.writes:
+            return False
+        return buffer.last_flush is None or self._clock() - buffer.last_flush >= self._flush_interval
+
+    async def _flush_buffer(self, buffer: _ClientBuffer) -> int:
+        now = self._clock()
+        buffer.last_flush = now
+        prune = bool(buffer.retention) and now - buffer.last_prune >= self._prune_interval
+        if not buffer.writes and not prune:
+            return 0
+
+        batch, buffer.writes = buffer.writes, OrderedDict()
+        try:
+            pipe = buffer.client.pipeline(transaction=False)
+            for write in batch.values():
+                await write.queue(pipe)
+            if prune:
+                self._queue_prunes(pipe, buffer.retention)
+            await ensure_awaitable(pipe.execute())
+        except BaseException:
+            self._stats.failed_flushes += 1
+            self._requeue(buffer, batch)
+            raise
+        if prune:
+            buffer.last_prune = now
+            self._stats.prune_runs += 1
+        self._stats.flushes += 1
+        self._stats.flushed_samples += len(batch)
+        return len(batch)
+
+    def _queue_prunes(self, pipe: Any, retention: Dict[str, int]) -> None:
+        wall_now = self._wall_clock()
+        for key, retention_seconds in retention.items():
+            pipe.zremrangebyscore(key, "-inf", f"({int(wall_now) - retention_seconds}")
+
+    def _requeue(self, buffer: _ClientBuffer, batch: "OrderedDict[Hashable, MetricWrite]") -> None:
+        # Samples buffered while the flush was in flight are newer and win on coalesce
+        for coalesce_key, write in buffer.writes.items():
+            batch.pop(coalesce_key, None)
+            batch[coalesce_key] = write
+        buffer.writes = batch
+        self._trim(buffer)
+
+    def _trim(self, buffer: _ClientBuffer) -> None:
+        overflow = len(buffer.writes) - self._max_buffered
+        if overflow <= 0:
+            return
+        for _ in range(overflow):
+            buffer.writes.popitem(last=False)
+        self._stats.dropped_samples += overflow
+        logger.warning("Metric sink full; dropped %d oldest samples (%d dropped total)", overflow, self._stats.dropped_samples)
+
+
+_SHARED_SINK: Optional[MetricSink] = None
+
+
+def get_shared_metric_sink() -> MetricSink:
+    """Return the process-wide metric sink."""
+    global _SHARED_SINK
+    if _SHARED_SINK is None:
+        _SHARED_SINK = MetricSink()
+    return _SHARED_SINK
+
+
+__all__ = [
+    "DEFAULT_FLUSH_INTERVAL_SECONDS",
+    "DEFAULT_MAX_BUFFERED_SAMPLES",
+    "DEFAULT_PRUNE_INTERVAL_SECONDS",
+    "MetricSink",
+    "MetricSinkStats",
+    "MetricWrite",
+    "SortedSetSample",
+    "get_shared_metric_sink",
+]
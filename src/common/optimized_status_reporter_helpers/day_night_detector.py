@@ -9,7 +9,7 @@ import logging
 import os
 from typing import Dict
 
-from common.time_utils import is_between_dawn_and_dusk
+from common.time_utils import SolarDayCache
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +20,7 @@ class DayNightDetector:
     def __init__(self, moon_phase_calculator):
         self.moon_phase_calculator = moon_phase_calculator
         self._station_coordinates: Dict[str, Dict[str, float]] = {}
+        self._solar_days = SolarDayCache()
 
     def load_weather_station_coordinates(self) -> None:
         """Load weather station coordinates from configuration file."""
@@ -71,7 +72,7 @@ class DayNightDetector:
             longitude = coords["longitude"]
 
             # Check if it's currently between dawn and dusk at this location
-            is_daytime = is_between_dawn_and_dusk(latitude, longitude)
+            is_daytime = self._solar_days.is_between_dawn_and_dusk(icao_code, latitude, longitude)
 
             # Return empty string for daytime, moon phase emoji for nighttime
             if is_daytime:
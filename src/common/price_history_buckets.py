@@ -0,0 +1,155 @@
+"""
+Downsampled OHLC buckets for BTC/ETH price history
+
+Alongside the per-second ``history:<currency>`` sorted set, every tick is
+folded into minute and hour OHLC buckets by the ``price_ohlc.lua`` script
+(queued as EVALSHA on the shared metric sink's pipeline).  Each tier has its own retention, so long
+windows stay cheap to read: a 24h chart needs 1,440 minute bars instead of
+~86,400 raw members.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, Tuple
+
+from common.price_history_utils import generate_bucket_key, generate_redis_key
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+    from redis.commands.core import AsyncScript
+
+_SCRIPT_PATH = Path(__file__).resolve().parent / "redis_protocol" / "lua" / "price_ohlc.lua"
+
+DEFAULT_MAX_POINTS = 2000
+
+
+@dataclass(frozen=True)
+class PriceResolution:
+    """One storage tier: bucket width and how long its buckets are kept."""
+
+    name: str
+    bucket_seconds: int
+    retention_seconds: int
+
+
+RAW_RESOLUTION = PriceResolution("raw", 1, 24 * 3600)
+MINUTE_RESOLUTION = PriceResolution("1m", 60, 7 * 24 * 3600)
+HOUR_RESOLUTION = PriceResolution("1h", 3600, 90 * 24 * 3600)
+BUCKET_RESOLUTIONS: Tuple[PriceResolution, ...] = (MINUTE_RESOLUTION, HOUR_RESOLUTION)
+PRICE_RESOLUTIONS: Tuple[PriceResolution, ...] = (RAW_RESOLUTION, *BUCKET_RESOLUTIONS)
+
+
+@dataclass(frozen=True)
+class PriceBar:
+    """OHLC prices for the bucket starting at ``timestamp``."""
+
+    timestamp: int
+    open: float
+    high: float
+    low: float
+    close: float
+
+
+def select_resolution(hours: float, max_points: int = DEFAULT_MAX_POINTS) -> PriceResolution:
+    """
+    Pick the tier to read for a window.
+
+    The finest tier whose retention covers the window and whose bucket count
+    fits ``max_points`` wins; when none fits the budget, the coarsest tier
+    covering the window is used.
+
+    Raises:
+        ValueError: If hours or max_points is not positive
+    """
+    if hours <= 0:
+        raise ValueError(f"hours must be positive, got {hours}")
+    if max_points <= 0:
+        raise ValueError(f"max_points must be positive, got {max_points}")
+    window_seconds = hours * 3600
+    covering = [resolution for resolution in PRICE_RESOLUTIONS if resolution.retention_seconds >= window_seconds]
+    if not covering:
+        return PRICE_RESOLUTIONS[-1]
+    for resolution in covering:
+        if window_seconds / resolution.bucket_seconds <= max_points:
+            return resolution
+    return covering[-1]
+
+
+def parse_bar_member(member: str | bytes) -> PriceBar:
+    """Parse a 'start|open|high|low|close' bucket member."""
+    decoded = member.decode() if isinstance(member, bytes) else member
+    start, open_, high, low, close = decoded.split("|")
+    return PriceBar(int(start), float(open_), float(high), float(low), float(close))
+
+
+class PriceTickScript:
+    """Runs the OHLC tick Lua script via EVALSHA (loading it on NOSCRIPT)."""
+
+    def __init__(self, resolutions: Tuple[PriceResolution, ...] = BUCKET_RESOLUTIONS) -> None:
+        self._source = _SCRIPT_PATH.read_text(encoding="utf-8")
+        self._resolutions = resolutions
+        self._script: AsyncScript | None = None
+
+    async def record(self, redis: Redis, *, currency: str, int_ts: int, price: float, member: str) -> int:
+        """Add the raw ``member`` and fold ``price`` into every bucket tier; return tiers updated."""
+        return int(await self._call(redis, currency, int_ts, price, member))
+
+    def sample(self, *, currency: str, int_ts: int, price: float, member: str) -> "PriceTickSample":
+        """Wrap one tick for a :class:`~common.metric_sink.MetricSink`, which runs the script at flush time."""
+        return PriceTickSample(self, currency, int_ts, float(price), member)
+
+    async def _call(self, redis: Any, currency: str, int_ts: int, price: float, member: str) -> Any:
+        # ``redis`` may be a pipeline, in which case the EVALSHA is only queued
+        script = self._script
+        if script is None:
+            script = self._script = redis.register_script(self._source)
+        keys: List[str] = [generate_redis_key(currency)]
+        args: List[str | int] = [int_ts, repr(float(price)), member]
+        for resolution in self._resolutions:
+            keys.append(generate_bucket_key(currency, resolution.name))
+            args.extend((resolution.bucket_seconds, resolution.retention_seconds))
+        return await script(keys=keys, args=args, client=redis)
+
+
+@dataclass(frozen=True)
+class PriceTickSample:
+    """A buffered price tick; every tick is kept, so ticks never coalesce."""
+
+    script: PriceTickScript
+    currency: str
+    int_ts: int
+    price: float
+    member: str
+
+    @property
+    def key(self) -> str:
+        return generate_redis_key(self.currency)
+
+    @property
+    def retention_seconds(self) -> int:
+        return RAW_RESOLUTION.retention_seconds
+
+    @property
+    def coalesce_key(self) -> None:
+        return None
+
+    async def queue(self, pipe: Any) -> None:
+        await self.script._call(pipe, self.currency, self.int_ts, self.price, self.member)
+
+
+__all__ = [
+    "BUCKET_RESOLUTIONS",
+    "DEFAULT_MAX_POINTS",
+    "HOUR_RESOLUTION",
+    "MINUTE_RESOLUTION",
+    "PRICE_RESOLUTIONS",
+    "RAW_RESOLUTION",
+    "PriceBar",
+    "PriceResolution",
+    "PriceTickSample",
+    "PriceTickScript",
+    "parse_bar_member",
+    "select_resolution",
+]
@@ -2,16 +2,19 @@
 Price update recording for history tracking
 
 Handles validation and persistence of BTC/ETH price updates to Redis sorted set
-with automatic TTL management and old-entry pruning.
+and the minute/hour OHLC buckets, with per-tier retention.
 """
 
 from __future__ import annotations
 
 import logging
+from typing import Optional
 
 from common.exceptions import ValidationError
-from common.price_history_utils import build_history_member, generate_redis_key, validate_currency
-from common.redis_protocol.typing import RedisClient, ensure_awaitable
+from common.metric_sink import MetricSink, get_shared_metric_sink
+from common.price_history_buckets import PriceTickScript
+from common.price_history_utils import build_history_member, validate_currency
+from common.redis_protocol.typing import RedisClient
 from common.time_utils import get_current_utc
 
 from .price_history_connection_manager import REDIS_ERRORS
@@ -24,9 +27,14 @@ class PriceHistoryRecorder:
     Records price updates to Redis sorted set
 
     Validates currency and price inputs, generates second-precision timestamps,
-    and persists to Redis with automatic TTL and old-entry pruning.
+    and buffers the raw tick plus its OHLC bucket updates in the metric sink,
+    which runs them as one script call per tick in its next pipelined flush.
     """
 
+    def __init__(self, metric_sink: Optional[MetricSink] = None) -> None:
+        self._tick_script = PriceTickScript()
+        self._metric_sink = metric_sink if metric_sink is not None else get_shared_metric_sink()
+
     @staticmethod
     def validate_price(price: float) -> None:
         """
@@ -66,11 +74,10 @@ class PriceHistoryRecorder:
             int_ts = int(current_time.timestamp())
             datetime_str = current_time.replace(microsecond=0).isoformat()
 
-            redis_key = generate_redis_key(currency)
-            score = float(int_ts)
             member = build_history_member(int_ts, float(price))
 
-            await ensure_awaitable(client.zadd(redis_key, {member: score}))
+            sample = self._tick_script.sample(currency=currency, int_ts=int_ts, price=price, member=member)
+            await self._metric_sink.record(client, sample)
 
             logger.debug(f"Recorded {currency} price history: ${price:.2f} at {datetime_str}")
 
@@ -2,7 +2,8 @@
 Price history retrieval for history tracking
 
 Handles fetching and parsing of price history from Redis sorted set with
-time-range filtering via ZRANGEBYSCORE.
+time-range filtering via ZRANGEBYSCORE, and of downsampled OHLC bars from the
+coarsest tier that fits a point budget.
 """
 
 from __future__ import annotations
@@ -10,9 +11,10 @@ from __future__ import annotations
 import json
 import logging
 from datetime import timedelta
-from typing import List, Tuple
+from typing import List, Tuple, Union, cast
 
-from common.price_history_utils import generate_redis_key, parse_history_member_value, validate_currency
+from common.price_history_buckets import DEFAULT_MAX_POINTS, RAW_RESOLUTION, PriceBar, parse_bar_member, select_resolution
+from common.price_history_utils import generate_bucket_key, generate_redis_key, parse_history_member_value, validate_currency
 from common.redis_protocol.typing import RedisClient, ensure_awaitable
 from common.time_utils import get_current_utc
 
@@ -50,3 +52,34 @@ async def get_history(client: RedisClient, currency: str, hours: int = 24) -> Li
         raise
     else:
         return price_history
+
+
+async def get_bars(client: RedisClient, currency: str, hours: int = 24, max_points: int = DEFAULT_MAX_POINTS) -> List[PriceBar]:
+    """
+    Retrieve OHLC bars for the window from the tier chosen by ``select_resolution``.
+
+    Raw ticks are returned as flat bars (open == high == low == close).
+    """
+    validate_currency(currency)
+    resolution = select_resolution(hours, max_points)
+    if resolution == RAW_RESOLUTION:
+        return [PriceBar(ts, price, price, price, price) for ts, price in await get_history(client, currency, hours)]
+    try:
+        redis_key = generate_bucket_key(currency, resolution.name)
+        start_ts = _calculate_start_timestamp(hours)
+        # The bucket containing the window start is included so the first bar is not missing
+        bucket_start = start_ts - (start_ts % resolution.bucket_seconds)
+        # Without WITHSCORES the reply is a plain list of members
+        entries = cast(List[Union[str, bytes]], await ensure_awaitable(client.zrangebyscore(redis_key, bucket_start, "+inf")))
+        if not entries:
+            logger.warning("No %s price bars found for %s using Redis key '%s'", resolution.name, currency, redis_key)
+            return []
+        bars = [parse_bar_member(member) for member in entries]
+    except REDIS_ERRORS as exc:
+        logger.exception("Failed to get %s %s price bars", currency, resolution.name)
+        raise RuntimeError(f"Failed to load {currency} price bars") from exc
+    except (ValueError, TypeError):
+        logger.exception("Failed to parse %s %s price bars", currency, resolution.name)
+        raise
+    else:
+        return bars
@@ -14,6 +14,11 @@ def generate_redis_key(currency: str) -> str:
     return f"history:{currency.lower()}"
 
 
+def generate_bucket_key(currency: str, resolution_name: str) -> str:
+    """Generate the Redis key for a currency's OHLC buckets at one resolution (e.g. '1m')."""
+    return f"{generate_redis_key(currency)}:{resolution_name}"
+
+
 def build_history_member(int_ts: int, value: float) -> str:
     """Build a sorted set member for history keys: 'timestamp|value' format."""
     return f"{int_ts}|{value}"
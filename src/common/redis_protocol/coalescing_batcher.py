@@ -17,18 +17,34 @@ _BATCH_TIME_MS = 200
 
 
 class CoalescingBatcher(Generic[K, V]):
-    """Accumulates updates by key, keeping only the latest value, and flushes every 200ms."""
+    """Accumulates updates by key, keeping only the latest value, and flushes every 200ms.
 
-    def __init__(self, process_batch: Callable[[list[V]], Awaitable[None]], name: str) -> None:
+    The cadence is configurable via ``flush_interval_ms``.  When ``max_pending``
+    is set, reaching that many pending keys wakes the flush loop early.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[list[V]], Awaitable[None]],
+        name: str,
+        *,
+        flush_interval_ms: int = _BATCH_TIME_MS,
+        max_pending: int | None = None,
+    ) -> None:
         self._process_batch = process_batch
         self._name = name
+        self._flush_interval_s = flush_interval_ms / 1000.0
+        self._max_pending = max_pending
         self._pending: dict[K, V] = {}
         self._task: asyncio.Task[None] | None = None
         self._running = False
+        self._wake = asyncio.Event()
 
     def add(self, key: K, value: V) -> None:
         """Store a value by key, overwriting any previous value for the same key."""
         self._pending[key] = value
+        if self._max_pending is not None and len(self._pending) >= self._max_pending:
+            self._wake.set()
 
     async def start(self) -> None:
         """Start the periodic flush loop."""
@@ -52,10 +68,10 @@ class CoalescingBatcher(Generic[K, V]):
             )
 
     async def _flush_loop(self) -> None:
-        """Sleep 200ms, flush, repeat until stopped."""
+        """Wait for the flush interval (or an early wake), flush, repeat until stopped."""
         try:
             while self._running:
-                await asyncio.sleep(_BATCH_TIME_MS / 1000.0)
+                await self._wait_for_flush()
                 results = await asyncio.gather(self._flush(), return_exceptions=True)
                 if isinstance(results[0], RedisError):
                     logger.warning("%s: flush failed, will retry next cycle", self._name)
@@ -63,6 +79,14 @@ class CoalescingBatcher(Generic[K, V]):
             logger.debug("%s: flush loop cancelled", self._name)
             raise
 
+    async def _wait_for_flush(self) -> None:
+        """Sleep until the interval elapses or the size threshold wakes the loop."""
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=self._flush_interval_s)
+        except asyncio.TimeoutError:  # Expected: interval elapsed without early wake  # policy_guard: allow-silent-handler
+            logger.debug("%s: flush interval elapsed", self._name)
+        self._wake.clear()
+
     async def _flush(self) -> None:
         """Swap pending dict and process. Merge back on RedisError."""
         if not self._pending:
@@ -54,6 +54,7 @@ API_TYPE_VOLATILITY_INDEX = "deribit_volatility_index"
 KALSHI_ORDERBOOK_PREFIX = "kalshi:orderbook:"
 HISTORY_KEY_PREFIX = "history:"
 HISTORY_TTL_SECONDS = 7200  # 2 hours (consumers look back 65 minutes max)
+HISTORY_RETENTION_SECONDS = 86400  # 24 hours (longest history window read back)
 BALANCE_KEY_PREFIX = "balance:"
 KALSHI_BALANCE_KEY = "kalshi:account:balance"
 DATA_CUTOFF_DAYS = 3
@@ -170,6 +171,7 @@ __all__ = [
     "DERIBIT_SUBSCRIPTION_CHANNEL",
     "DERIBIT_SUBSCRIPTION_KEY",
     "HISTORY_KEY_PREFIX",
+    "HISTORY_RETENTION_SECONDS",
     "HISTORY_TTL_SECONDS",
     "KALSHI_BALANCE_KEY",
     "KALSHI_MARKET_PREFIX",
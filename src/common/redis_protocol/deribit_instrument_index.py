@@ -14,9 +14,19 @@ from typing import Any, Callable, Dict, List, Optional
 
 from common.redis_schema.markets import DeribitInstrumentType
 
+from .deribit_option_chain import OptionChain, OptionChainSlice, parse_option_coordinates
+from .market_changelog import (
+    DERIBIT_VENUE,
+    INITIAL_GENERATION,
+    fetch_changed_hashes,
+    latest_generation,
+    read_market_changes,
+)
+
 logger = logging.getLogger(__name__)
 
 _SCAN_BATCH_SIZE = 10000
+_INDEXED_CURRENCIES = ("BTC", "ETH")
 
 
 async def load_currency_keys(market_store: Any, currency: str) -> tuple[Any, set[str]]:
@@ -77,7 +87,7 @@ _RECONCILE_TOLERANCE = 5
 async def _count_deribit_keys(redis: Any) -> int:
     """SCAN-count Redis keys matching Deribit market patterns."""
     count = 0
-    for currency in ("BTC", "ETH"):
+    for currency in _INDEXED_CURRENCIES:
         pattern = f"markets:deribit:*:{currency}*"
         cursor = 0
         while True:
@@ -97,15 +107,23 @@ _DERIBIT_CURRENCY_INDEX = 3
 
 
 class DeribitInstrumentIndex:
-    """In-memory index: instrument_key -> market data for Deribit."""
+    """In-memory index: instrument_key -> market data for Deribit.
+
+    Options are additionally kept in a per-currency :class:`OptionChain`
+    (expiry -> sorted strikes with NumPy quote columns) for chain-wide
+    consumers.
+    """
 
     def __init__(self) -> None:
         self._instruments: Dict[str, Dict[str, str]] = {}
-        self._by_type_currency: Dict[str, Dict[str, list[str]]] = {
+        self._by_type_currency: Dict[str, Dict[str, Dict[str, None]]] = {
             _SPOT_INSTRUMENT_TYPE: {},
             _OPTION_INSTRUMENT_TYPE: {},
             _FUTURE_INSTRUMENT_TYPE: {},
         }
+        self._option_chains: Dict[str, OptionChain] = {}
+        self._generation: Optional[str] = None
+        self._changelog_logs_writes = False
 
     async def initialize(self, market_store: Any) -> None:
         """Full scan to populate index from Redis, replacing any prior state."""
@@ -115,7 +133,10 @@ class DeribitInstrumentIndex:
             _OPTION_INSTRUMENT_TYPE: {},
             _FUTURE_INSTRUMENT_TYPE: {},
         }
-        for currency in ("BTC", "ETH"):
+        self._option_chains = {}
+        self._generation = None
+        self._changelog_logs_writes = False
+        for currency in _INDEXED_CURRENCIES:
             redis_client, keys = await load_currency_keys(market_store, currency)
             if not keys:
                 continue
@@ -131,16 +152,38 @@ class DeribitInstrumentIndex:
         existing = self._instruments.get(instrument_key)
         if existing is not None:
             existing.update(fields)
+            self._update_option_chain(instrument_key, existing, fields)
             return
 
         entry: Dict[str, str] = {"instrument_key": instrument_key, **fields}
         self._instruments[instrument_key] = entry
-        self._register_key(instrument_key, fields)
+        self._register_key(instrument_key, entry)
 
     def get_options_by_currency(self, currency: str) -> List[Dict[str, str]]:
         """Return cached option instruments for a currency."""
         return self._get_by_type(currency, _OPTION_INSTRUMENT_TYPE)
 
+    def get_option_expiries(self, currency: str) -> List[str]:
+        """Return option expiries for a currency in chronological order."""
+        chain = self._option_chains.get(currency.upper())
+        if chain is None:
+            return []
+        return chain.expiries()
+
+    def get_option_chain_slice(self, currency: str, expiry: str) -> Optional[OptionChainSlice]:
+        """Return all strikes of one expiry with call/put quote columns, or None."""
+        expiry_chain = self._get_expiry_chain(currency, expiry)
+        if expiry_chain is None:
+            return None
+        return expiry_chain.snapshot(expiry)
+
+    def get_nearest_strikes(self, currency: str, expiry: str, spot: float, count: int) -> Optional[OptionChainSlice]:
+        """Return the ``count`` strikes of one expiry closest around ``spot``, or None."""
+        expiry_chain = self._get_expiry_chain(currency, expiry)
+        if expiry_chain is None:
+            return None
+        return expiry_chain.nearest(expiry, spot, count)
+
     def get_futures_by_currency(self, currency: str) -> List[Dict[str, str]]:
         """Return cached future instruments for a currency."""
         return self._get_by_type(currency, _FUTURE_INSTRUMENT_TYPE)
@@ -163,6 +206,40 @@ class DeribitInstrumentIndex:
         return len(self._instruments)
 
     async def reconcile(self, redis: Any) -> bool:
+        """Catch up with Redis; return True if the caller should re-initialize.
+
+        Applies the instruments added or removed since the last reconcile
+        from the Deribit change log.  The first reconcile after
+        ``initialize`` (or any reconcile while no change log exists) falls
+        back to a SCAN count comparison and records the change-log baseline.
+        Until the log has carried at least one instrument write, only deletes
+        (e.g. expiry cleanup) are known to be logged, so the count comparison
+        keeps running to catch unlogged additions.
+        """
+        generation = await latest_generation(redis, DERIBIT_VENUE)
+        if self._generation is None or generation == INITIAL_GENERATION:
+            diverged = await self._reconcile_by_count(redis)
+            if not diverged:
+                self._generation = generation
+            return diverged
+
+        delta = await read_market_changes(redis, DERIBIT_VENUE, self._generation)
+        if delta.truncated:
+            logger.warning(
+                "DeribitInstrumentIndex change log no longer covers generation %s — caller should re-initialize",
+                self._generation,
+            )
+            return True
+        for instrument_key, raw in await fetch_changed_hashes(redis, delta.keys):
+            self._apply_changed_instrument(instrument_key, raw)
+            if raw:
+                self._changelog_logs_writes = True
+        self._generation = delta.generation
+        if not self._changelog_logs_writes:
+            return await self._reconcile_by_count(redis)
+        return False
+
+    async def _reconcile_by_count(self, redis: Any) -> bool:
         """Compare cache count to Redis; return True if diverged."""
         redis_count = await _count_deribit_keys(redis)
         if abs(redis_count - self.instrument_count) <= _RECONCILE_TOLERANCE:
@@ -174,19 +251,82 @@ class DeribitInstrumentIndex:
         )
         return True
 
+    def _apply_changed_instrument(self, instrument_key: str, raw: Dict[Any, Any]) -> None:
+        """Replace, add or drop one instrument from a change-log HGETALL result."""
+        self._remove_instrument(instrument_key)
+        if not raw:
+            return
+        decoded = _decode_hash(raw)
+        _, currency = _resolve_type_and_currency(instrument_key, decoded)
+        if not currency or currency.upper() not in _INDEXED_CURRENCIES:
+            return
+        decoded["instrument_key"] = instrument_key
+        self._instruments[instrument_key] = decoded
+        self._register_key(instrument_key, decoded)
+
+    def _remove_instrument(self, instrument_key: str) -> None:
+        entry = self._instruments.pop(instrument_key, None)
+        if entry is None:
+            return
+        instrument_type, currency = _resolve_type_and_currency(instrument_key, entry)
+        if not instrument_type or not currency:
+            return
+        currency_upper = currency.upper()
+        bucket = self._by_type_currency.get(instrument_type, {}).get(currency_upper)
+        if bucket is not None:
+            bucket.pop(instrument_key, None)
+        chain = self._option_chains.get(currency_upper)
+        if instrument_type != _OPTION_INSTRUMENT_TYPE or chain is None:
+            return
+        coordinates = parse_option_coordinates(instrument_key, entry)
+        if coordinates is not None:
+            chain.remove(*coordinates)
+
     def _get_by_type(self, currency: str, instrument_type: str) -> List[Dict[str, str]]:
         return _collect_instruments(self._by_type_currency, self._instruments, instrument_type, currency)
 
+    def _get_expiry_chain(self, currency: str, expiry: str):
+        chain = self._option_chains.get(currency.upper())
+        if chain is None:
+            return None
+        return chain.get_expiry(expiry)
+
     def _register_key(self, instrument_key: str, fields: Dict[str, str]) -> None:
         """Classify and register a key by instrument type and currency."""
         instrument_type, currency = _resolve_type_and_currency(instrument_key, fields)
         if not instrument_type or not currency:
             return
         _add_to_bucket(self._by_type_currency, instrument_type, currency.upper(), instrument_key)
+        if instrument_type == _OPTION_INSTRUMENT_TYPE:
+            self._update_option_chain(instrument_key, fields, fields, currency=currency.upper())
+
+    def _update_option_chain(
+        self,
+        instrument_key: str,
+        entry: Dict[str, str],
+        changed: Dict[str, str],
+        *,
+        currency: Optional[str] = None,
+    ) -> None:
+        """Write changed quote fields of an option into its currency's chain."""
+        if currency is None:
+            instrument_type, resolved = _resolve_type_and_currency(instrument_key, entry)
+            if instrument_type != _OPTION_INSTRUMENT_TYPE or not resolved:
+                return
+            currency = resolved.upper()
+        coordinates = parse_option_coordinates(instrument_key, entry)
+        if coordinates is None:
+            return
+        chain = self._option_chains.get(currency)
+        if chain is None:
+            chain = OptionChain()
+            self._option_chains[currency] = chain
+        expiry, strike, side = coordinates
+        chain.update(expiry, strike, side, changed)
 
 
 def _collect_instruments(
-    by_type_currency: Dict[str, Dict[str, list[str]]],
+    by_type_currency: Dict[str, Dict[str, Dict[str, None]]],
     instruments: Dict[str, Dict[str, str]],
     instrument_type: str,
     currency: str,
@@ -225,7 +365,7 @@ def _safe_parse_key(instrument_key: str) -> Optional[tuple[str, str]]:
 
 
 def _add_to_bucket(
-    by_type_currency: Dict[str, Dict[str, list[str]]],
+    by_type_currency: Dict[str, Dict[str, Dict[str, None]]],
     instrument_type: str,
     currency_upper: str,
     instrument_key: str,
@@ -234,14 +374,16 @@ def _add_to_bucket(
     bucket = by_type_currency.get(instrument_type)
     if bucket is None:
         return
-    if currency_upper not in bucket:
-        bucket[currency_upper] = []
-    if instrument_key not in bucket[currency_upper]:
-        bucket[currency_upper].append(instrument_key)
+    keys = bucket.get(currency_upper)
+    if keys is None:
+        keys = {}
+        bucket[currency_upper] = keys
+    # Insertion-ordered dict keys give O(1) dedup while keeping registration order
+    keys[instrument_key] = None
 
 
 def _find_spot_bid_ask(
-    by_type_currency: Dict[str, Dict[str, list[str]]],
+    by_type_currency: Dict[str, Dict[str, Dict[str, None]]],
     instruments: Dict[str, Dict[str, str]],
     currency: str,
 ) -> Optional[tuple[float, float]]:
@@ -0,0 +1,186 @@
+"""NumPy-backed Deribit option chains kept by DeribitInstrumentIndex.
+
+Each currency's chain is organised as expiry -> sorted strike array, with
+call and put quote columns stored as ``(len(CHAIN_FIELDS), n_strikes)``
+float arrays.  Stream updates write into the arrays in place (a binary
+search on the strike array), so consumers that evaluate the whole chain on
+every tick read ready-made columns instead of re-parsing and re-sorting
+instrument dicts.  Missing quotes are NaN.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CHAIN_FIELDS: Tuple[str, ...] = ("best_bid", "best_ask", "best_bid_size", "best_ask_size", "mark_iv")
+FIELD_INDEX: Dict[str, int] = {field: index for index, field in enumerate(CHAIN_FIELDS)}
+
+CALL = 0
+PUT = 1
+_SIDES = {"c": CALL, "p": PUT}
+
+_EXPIRY_INDEX = 4
+_STRIKE_INDEX = 5
+_OPTION_KIND_INDEX = 6
+_MIN_OPTION_KEY_PARTS = 7
+
+
+@dataclass(frozen=True)
+class OptionChainSlice:
+    """Snapshot of one expiry's strikes with call/put quote columns.
+
+    ``calls`` and ``puts`` have shape ``(len(CHAIN_FIELDS), len(strikes))``;
+    use :meth:`call` / :meth:`put` to read a single column by field name.
+    """
+
+    expiry: str
+    strikes: np.ndarray
+    calls: np.ndarray
+    puts: np.ndarray
+
+    def call(self, field: str) -> np.ndarray:
+        """Call column for ``field`` (e.g. ``"best_bid"``), aligned with ``strikes``."""
+        return self.calls[FIELD_INDEX[field]]
+
+    def put(self, field: str) -> np.ndarray:
+        """Put column for ``field`` (e.g. ``"mark_iv"``), aligned with ``strikes``."""
+        return self.puts[FIELD_INDEX[field]]
+
+    def __len__(self) -> int:
+        return int(self.strikes.shape[0])
+
+
+class ExpiryChain:
+    """Sorted strikes and in-place quote arrays for a single expiry."""
+
+    def __init__(self) -> None:
+        self._strikes = np.empty(0, dtype=np.float64)
+        self._values = np.empty((2, len(CHAIN_FIELDS), 0), dtype=np.float64)
+
+    def update(self, strike: float, side: int, fields: Mapping[str, str]) -> None:
+        """Write the chain fields present in ``fields`` for one strike and side."""
+        position = self._position(strike)
+        values = self._values
+        for field, raw in fields.items():
+            index = FIELD_INDEX.get(field)
+            if index is None:
+                continue
+            values[side, index, position] = _to_float(raw)
+
+    def clear(self, strike: float, side: int) -> None:
+        """Blank one side of a strike, dropping the strike once both sides are empty."""
+        position = int(np.searchsorted(self._strikes, strike))
+        if position >= self._strikes.shape[0] or self._strikes[position] != strike:
+            return
+        self._values[side, :, position] = np.nan
+        if np.isnan(self._values[:, :, position]).all():
+            self._strikes = np.delete(self._strikes, position)
+            self._values = np.delete(self._values, position, axis=2)
+
+    def snapshot(self, expiry: str, start: int = 0, stop: Optional[int] = None) -> OptionChainSlice:
+        """Copy strikes ``[start:stop]`` into an :class:`OptionChainSlice`."""
+        return OptionChainSlice(
+            expiry=expiry,
+            strikes=self._strikes[start:stop].copy(),
+            calls=self._values[CALL, :, start:stop].copy(),
+            puts=self._values[PUT, :, start:stop].copy(),
+        )
+
+    def nearest(self, expiry: str, spot: float, count: int) -> OptionChainSlice:
+        """Slice of the ``count`` strikes centred on ``spot``."""
+        total = self._strikes.shape[0]
+        count = min(max(count, 0), total)
+        centre = int(np.searchsorted(self._strikes, spot))
+        start = min(max(centre - count // 2, 0), total - count)
+        return self.snapshot(expiry, start, start + count)
+
+    def __len__(self) -> int:
+        return int(self._strikes.shape[0])
+
+    def _position(self, strike: float) -> int:
+        position = int(np.searchsorted(self._strikes, strike))
+        if position < self._strikes.shape[0] and self._strikes[position] == strike:
+            return position
+        self._strikes = np.insert(self._strikes, position, strike)
+        self._values = np.insert(self._values, position, np.nan, axis=2)
+        return position
+
+
+class OptionChain:
+    """Per-currency option chain: expiry -> :class:`ExpiryChain`."""
+
+    def __init__(self) -> None:
+        self._expiries: Dict[str, ExpiryChain] = {}
+
+    def update(self, expiry: str, strike: float, side: int, fields: Mapping[str, str]) -> None:
+        """Apply quote fields for one option instrument."""
+        chain = self._expiries.get(expiry)
+        if chain is None:
+            chain = ExpiryChain()
+            self._expiries[expiry] = chain
+        chain.update(strike, side, fields)
+
+    def remove(self, expiry: str, strike: float, side: int) -> None:
+        """Drop one option instrument's quotes; empty expiries are forgotten."""
+        chain = self._expiries.get(expiry)
+        if chain is None:
+            return
+        chain.clear(strike, side)
+        if not len(chain):
+            del self._expiries[expiry]
+
+    def expiries(self) -> List[str]:
+        """Expiries in chronological (ISO date) order."""
+        return sorted(self._expiries)
+
+    def get_expiry(self, expiry: str) -> Optional[ExpiryChain]:
+        """Return the chain for ``expiry``, if any strikes are known."""
+        return self._expiries.get(expiry)
+
+
+def parse_option_coordinates(instrument_key: str, fields: Mapping[str, str]) -> Optional[Tuple[str, float, int]]:
+    """Return ``(expiry, strike, side)`` for an option instrument, or None if unparseable.
+
+    Prefers the hash's ``expiry_iso``/``strike``/``option_kind`` fields and
+    falls back to the key layout ``markets:deribit:option:{CUR}:{expiry}:{strike}:{c|p}``.
+    """
+    parts = instrument_key.split(":")
+    from_key = len(parts) >= _MIN_OPTION_KEY_PARTS
+    expiry = fields.get("expiry_iso") or (parts[_EXPIRY_INDEX] if from_key else None)
+    strike_raw = fields.get("strike") or (parts[_STRIKE_INDEX] if from_key else None)
+    kind = fields.get("option_kind") or (parts[_OPTION_KIND_INDEX] if from_key else None)
+    if not expiry or strike_raw is None or kind is None:
+        return None
+    side = _SIDES.get(kind[:1].lower())
+    if side is None:
+        return None
+    try:
+        strike = float(strike_raw)
+    except ValueError:  # Expected data validation or parsing failure  # policy_guard: allow-silent-handler
+        logger.debug("Unparseable strike %r for %s", strike_raw, instrument_key)
+        return None
+    return expiry, strike, side
+
+
+def _to_float(raw: str) -> float:
+    try:
+        return float(raw)
+    except (TypeError, ValueError):  # Expected data validation or parsing failure  # policy_guard: allow-silent-handler
+        return np.nan
+
+
+__all__ = [
+    "CALL",
+    "CHAIN_FIELDS",
+    "ExpiryChain",
+    "OptionChain",
+    "OptionChainSlice",
+    "PUT",
+    "parse_option_coordinates",
+]
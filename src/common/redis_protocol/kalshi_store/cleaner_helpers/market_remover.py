@@ -7,6 +7,7 @@ from __future__ import annotations
 import logging
 
 from ...error_types import REDIS_ERRORS
+from ...market_changelog import changelog_venues, queue_changelog_reset, queue_market_changes
 from .pipeline_executor import PipelineExecutor
 
 logger = logging.getLogger(__name__)
@@ -64,6 +65,7 @@ class MarketRemover:
             subscription_key = f"{self.service_prefix}:{market_ticker_str}"
             pipe.hdel(self.subscriptions_key, subscription_key)
             pipe.delete(market_key)
+            queue_market_changes(pipe, [market_key])
             if snapshot_key:
                 pipe.delete(snapshot_key)
             success = await PipelineExecutor.execute_pipeline(pipe, f"remove market {market_ticker_str}")
@@ -104,6 +106,7 @@ class MarketRemover:
             pipe = redis.pipeline()
             for key in keys_to_remove:
                 pipe.delete(key)
+            queue_changelog_reset(pipe, changelog_venues(keys_to_remove))
             success = await PipelineExecutor.execute_pipeline(pipe, "remove all Kalshi keys")
             if success:
                 logger.info("Successfully removed all Kalshi keys for patterns %s", target_patterns)
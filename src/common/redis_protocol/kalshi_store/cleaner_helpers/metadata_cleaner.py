@@ -5,6 +5,8 @@ Market metadata cleanup operations for KalshiMarketCleaner
 import logging
 from typing import List
 
+from ...market_changelog import changelog_venues, queue_changelog_reset
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,16 +35,24 @@ class MetadataCleaner:
         redis = await self._get_redis()
         total_removed = 0
         batch: List[str] = []
+        venues: set[str] = set()
 
         async for key in redis.scan_iter(match=pattern, count=chunk_size):
             batch.append(key)
             if len(batch) >= chunk_size:
+                venues |= changelog_venues(_decode_keys(batch))
                 total_removed += await redis.delete(*batch)
                 batch.clear()
 
         if batch:
+            venues |= changelog_venues(_decode_keys(batch))
             total_removed += await redis.delete(*batch)
 
+        if total_removed and venues:
+            pipe = redis.pipeline()
+            queue_changelog_reset(pipe, venues)
+            await pipe.execute()
+
         if total_removed:
             logger.info(
                 "Removed %s Kalshi market metadata keys matching pattern '%s'",
@@ -56,3 +66,7 @@ class MetadataCleaner:
             )
 
         return total_removed
+
+
+def _decode_keys(keys: List) -> List[str]:
+    return [key.decode("utf-8") if isinstance(key, (bytes, bytearray)) else str(key) for key in keys]
@@ -2,7 +2,8 @@
 
 Built once on startup from a full KalshiStore scan, then updated
 incrementally as stream messages arrive — avoids reloading all 500+
-markets on every orderbook change.
+markets on every orderbook change.  ``reconcile`` catches up on markets
+added or removed outside the stream via the Kalshi change log.
 """
 
 from __future__ import annotations
@@ -12,12 +13,21 @@ from typing import Any, Dict, List, Optional
 
 from common.redis_schema import build_kalshi_market_key
 
+from ..market_changelog import (
+    INITIAL_GENERATION,
+    KALSHI_VENUE,
+    fetch_changed_hashes,
+    latest_generation,
+    read_market_changes,
+)
+
 logger = logging.getLogger(__name__)
 
 _KALSHI_SCAN_PATTERN = "markets:kalshi:*"
 _KALSHI_SUBKEY_EXCLUDES = (":trading_signal", ":position_state")
 _RECONCILE_TOLERANCE = 5
 _SETTLED_STATUSES = frozenset({"settled", "closed"})
+_KALSHI_MARKET_KEY_PARTS = 4
 
 
 async def _count_kalshi_keys(redis: Any) -> int:
@@ -45,6 +55,7 @@ class EventMarketIndex:
         self._event_to_tickers: Dict[str, set[str]] = {}
         self._ticker_to_event: Dict[str, str] = {}
         self._market_cache: Dict[str, Dict[str, Any]] = {}
+        self._generation: Optional[str] = None
 
     async def initialize(self, kalshi_store: Any) -> None:
         """Full scan to build index, replacing any prior state."""
@@ -52,6 +63,7 @@ class EventMarketIndex:
         self._event_to_tickers = {}
         self._ticker_to_event = {}
         self._market_cache = {}
+        self._generation = None
         for market in markets:
             market_ticker = market.get("market_ticker") or market.get("ticker")
             event_ticker = market.get("event_ticker")
@@ -155,6 +167,30 @@ class EventMarketIndex:
         return len(self._market_cache)
 
     async def reconcile(self, redis: Any) -> bool:
+        """Catch up with Redis; return True if the caller should re-initialize.
+
+        Applies the markets added or removed since the last reconcile from
+        the Kalshi change log.  The first reconcile after ``initialize`` (or
+        any reconcile while no change log exists) falls back to a SCAN count
+        comparison and records the change-log baseline.
+        """
+        generation = await latest_generation(redis, KALSHI_VENUE)
+        if self._generation is None or generation == INITIAL_GENERATION:
+            diverged = await self._reconcile_by_count(redis)
+            if not diverged:
+                self._generation = generation
+            return diverged
+
+        delta = await read_market_changes(redis, KALSHI_VENUE, self._generation)
+        if delta.truncated:
+            logger.warning("EventMarketIndex change log no longer covers generation %s — caller should re-initialize", self._generation)
+            return True
+        for market_key, raw in await fetch_changed_hashes(redis, delta.keys):
+            self._apply_changed_market(market_key, raw)
+        self._generation = delta.generation
+        return False
+
+    async def _reconcile_by_count(self, redis: Any) -> bool:
         """Compare cache count to Redis; return True if diverged."""
         redis_count = await _count_kalshi_keys(redis)
         if abs(redis_count - self.market_count) <= _RECONCILE_TOLERANCE:
@@ -166,6 +202,27 @@ class EventMarketIndex:
         )
         return True
 
+    def _apply_changed_market(self, market_key: str, raw: Dict[Any, Any]) -> None:
+        """Replace, add or evict one market from a change-log HGETALL result."""
+        parts = market_key.split(":")
+        if len(parts) != _KALSHI_MARKET_KEY_PARTS:
+            return
+        market_ticker = parts[-1]
+        if not raw:
+            self._evict(market_ticker)
+            return
+        decoded = _decode_hash(raw)
+        if str(decoded.get("status", "")).lower() in _SETTLED_STATUSES:
+            self._evict(market_ticker)
+            return
+        event_ticker = decoded.get("event_ticker")
+        if not event_ticker:
+            return
+        decoded["market_ticker"] = market_ticker
+        decoded["market_key"] = market_key
+        self._market_cache[market_ticker] = decoded
+        self._register(str(event_ticker), market_ticker)
+
     def _register(self, event_ticker: str, market_ticker: str) -> None:
         """Internal registration of event<->market mapping."""
         if event_ticker not in self._event_to_tickers:
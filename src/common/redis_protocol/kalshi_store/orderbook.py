@@ -10,6 +10,11 @@ from .connection import RedisConnectionManager
 from .orderbook_helpers import DeltaProcessor, SnapshotProcessor
 from .orderbook_helpers.message_processing import normalizer
 from .orderbook_helpers.message_processing.normalizer import OrderbookMessageContext
+from .orderbook_helpers.trade_price_batcher import (
+    DEFAULT_FLUSH_INTERVAL_MS,
+    DEFAULT_MAX_PENDING_TICKERS,
+    TradePriceBatcher,
+)
 
 if TYPE_CHECKING:
     from .orderbook_helpers.orderbook_cache import OrderbookCache
@@ -38,6 +43,25 @@ class KalshiOrderbookProcessor:
         self._snapshot_processor.set_cache(cache)
         self._delta_processor.set_cache(cache)
 
+    def enable_trade_price_batching(
+        self,
+        apply_batch: Any,
+        *,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        max_pending_tickers: int = DEFAULT_MAX_PENDING_TICKERS,
+    ) -> TradePriceBatcher:
+        """Coalesce cached delta trade price updates into ``apply_batch`` calls.
+
+        The caller owns the returned batcher and must ``start()``/``stop()`` it.
+        """
+        batcher = TradePriceBatcher(apply_batch, flush_interval_ms=flush_interval_ms, max_pending_tickers=max_pending_tickers)
+        self._delta_processor.set_trade_price_batcher(batcher)
+        return batcher
+
+    def enable_server_side_deltas(self) -> None:
+        """Apply uncached deltas with a single Lua round trip instead of sequential Redis calls."""
+        self._delta_processor.enable_server_side_deltas()
+
     def evict_market(self, market_key: str) -> None:
         """Remove a market from the in-memory cache after unsubscribe."""
         if self._cache is not None:
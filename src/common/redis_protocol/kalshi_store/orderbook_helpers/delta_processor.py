@@ -16,7 +16,9 @@ from ...error_types import REDIS_ERRORS
 from ...typing import ensure_awaitable
 from ..utils_coercion import convert_numeric_field
 from .best_price_updater import BestPriceUpdater
+from .delta_script import OrderbookDeltaScript
 from .event_publisher import publish_market_event
+from .fixed_tick_book import PRICE_STRS, serialize_market_fields, tick_from_cents
 from .side_data_updater import SideDataUpdater
 from .snapshot_processor import SnapshotProcessor, _publish_if_event
 from .snapshot_processor_helpers.redis_storage import store_optional_field
@@ -30,6 +32,14 @@ logger = logging.getLogger(__name__)
 class DeltaProcessor(SnapshotProcessor):
     """Processes orderbook delta updates"""
 
+    def __init__(self, update_trade_prices_callback: Any):
+        super().__init__(update_trade_prices_callback)
+        self._delta_script: OrderbookDeltaScript | None = None
+
+    def enable_server_side_deltas(self) -> None:
+        """Apply uncached deltas with the orderbook Lua script in a single round trip."""
+        self._delta_script = OrderbookDeltaScript()
+
     async def process_orderbook_delta(
         self,
         *,
@@ -44,11 +54,13 @@ class DeltaProcessor(SnapshotProcessor):
             _none_guard_value = False
             return _none_guard_value
 
-        side_field, price_str, delta = parsed_inputs
-
         if self._cache is not None:
-            return await self._process_delta_cached(redis, market_key, market_ticker, side_field, price_str, delta, timestamp)
+            return await self._process_delta_cached(redis, market_key, market_ticker, parsed_inputs, timestamp)
+
+        if self._delta_script is not None:
+            return await self._process_delta_server_side(redis, market_key, market_ticker, parsed_inputs, timestamp)
 
+        side_field, price_str, _tick, delta = parsed_inputs
         side_data = await _apply_side_delta(redis, market_key, market_ticker, side_field, price_str, delta)
         if side_data is None:
             _none_guard_value = False
@@ -64,56 +76,98 @@ class DeltaProcessor(SnapshotProcessor):
             raise
         return True
 
+    async def _process_delta_server_side(
+        self,
+        redis: Redis,
+        market_key: str,
+        market_ticker: str,
+        delta_inputs: tuple[str, str, int | None, float],
+        timestamp: str,
+    ) -> bool:
+        """Process delta entirely inside Redis via the orderbook Lua script."""
+        script: OrderbookDeltaScript = self._delta_script  # type: ignore[assignment]
+        side_field, price_str, _tick, delta = delta_inputs
+        try:
+            result = await script.apply(
+                redis,
+                market_key=market_key,
+                market_ticker=market_ticker,
+                side_field=side_field,
+                price_str=price_str,
+                delta=delta,
+                timestamp=timestamp,
+            )
+        except REDIS_ERRORS as exc:
+            logger.error("Redis error applying delta for %s: %s", market_key, exc, exc_info=True)
+            raise
+        logger.debug("MARKET_UPDATE: Ticker=%s, Fields=['%s'], published=%s", market_ticker, side_field, result.published)
+        parsed_yes_bid = convert_numeric_field(result.yes_bid)
+        parsed_yes_ask = convert_numeric_field(result.yes_ask)
+        if parsed_yes_bid is not None and parsed_yes_ask is not None:
+            callback = self.get_update_callback()
+            await callback(market_ticker, parsed_yes_bid, parsed_yes_ask)
+        return True
+
     async def _process_delta_cached(
         self,
         redis: Redis,
         market_key: str,
         market_ticker: str,
-        side_field: str,
-        price_str: str,
-        delta: float,
+        delta_inputs: tuple[str, str, int | None, float],
         timestamp: str,
     ) -> bool:
         """Process delta using in-memory cache with change-detection gating."""
         cache: OrderbookCache = self._cache  # type: ignore[assignment]
-        side_data = SideDataUpdater.apply_delta(cache.get_side_data(market_key, side_field), price_str, delta)
+        side_field = delta_inputs[0]
+        updates = _apply_cached_delta(cache, market_key, delta_inputs)
         logger.debug("MARKET_UPDATE: Ticker=%s, Fields=['%s']", market_ticker, side_field)
-
-        updates: Dict[str, Any] = {side_field: side_data, "timestamp": timestamp}
-        if side_field == "yes_bids":
-            best_price, best_size = _fast_best_bid(side_data)
-            if best_price is not None:
-                updates["yes_bid"] = str(best_price)
-            if best_size is not None:
-                updates["yes_bid_size"] = str(best_size)
+        updates["timestamp"] = timestamp
+        snapshot = cache.update_fields(market_key, updates)
+        price_changed = cache.check_price_changed(market_key)
+
+        write_behind = cache.write_behind
+        if write_behind is None:
+            # Write full state to Redis on every delta
+            await ensure_awaitable(redis.hset(market_key, mapping=serialize_market_fields(snapshot)))
         else:
-            best_price, best_size = _fast_best_ask(side_data)
-            if best_price is not None:
-                updates["yes_ask"] = str(best_price)
-            if best_size is not None:
-                updates["yes_ask_size"] = str(best_size)
-
-        cache.update_fields(market_key, updates)
-        snapshot = cache.get_snapshot(market_key)
-
-        # Write full state to Redis on every delta
-        serialized = {k: orjson.dumps(v) if isinstance(v, dict) else v for k, v in snapshot.items()}  # type: ignore[union-attr]
-        await ensure_awaitable(redis.hset(market_key, mapping=serialized))
+            write_behind.mark_dirty(redis, market_key, (side_field, *updates))
+            if price_changed:
+                # Readers of the stream event must see the new top of book in the hash.
+                await write_behind.flush_market(redis, market_key)
 
         # Only publish to stream when best_bid or best_ask changes
-        if cache.check_price_changed(market_key):
+        if price_changed:
             await _publish_if_event(redis, cache, market_key, market_ticker, timestamp)
 
         await _update_trade_price_cache_from_cache(self, cache, market_key, market_ticker)
         return True
 
 
-_CENTS_PER_DOLLAR = 100
+def _apply_cached_delta(cache: "OrderbookCache", market_key: str, delta_inputs: tuple[str, str, int | None, float]) -> Dict[str, Any]:
+    """Apply a delta to the cached book and return the top-of-book field updates.
+
+    On-grid prices go through the market's FixedTickBook in O(1); off-grid
+    prices fall back to the dict-based side data.
+    """
+    side_field, price_str, tick, delta = delta_inputs
+    book = cache.get_book(market_key) if tick is not None else None
+    updates: Dict[str, Any] = {}
+    if book is not None and tick is not None:
+        best_price, best_size = book.apply_delta(side_field, tick, delta)
+    else:
+        side_data = SideDataUpdater.apply_delta(cache.get_side_data(market_key, side_field), price_str, delta)
+        updates[side_field] = side_data
+        best_price, best_size = _fast_best_bid(side_data) if side_field == "yes_bids" else _fast_best_ask(side_data)
 
-# Pre-computed price strings for the 99 possible cent values to avoid
-# repeated float formatting on every delta message.
-_YES_PRICE_STRS = {i: f"{float(i):.1f}" for i in range(1, 100)}
-_NO_PRICE_STRS = {i: f"{100.0 - i:.1f}" for i in range(1, 100)}
+    prefix = "yes_bid" if side_field == "yes_bids" else "yes_ask"
+    if best_price is not None:
+        updates[prefix] = str(best_price)
+    if best_size is not None:
+        updates[f"{prefix}_size"] = str(best_size)
+    return updates
+
+
+_CENTS_PER_DOLLAR = 100
 
 
 def _fast_best_bid(side_data: Dict[str, Any]) -> tuple[float | None, int | None]:
@@ -140,8 +194,11 @@ def _fast_best_ask(side_data: Dict[str, Any]) -> tuple[float | None, int | None]
     return best_price, best_size
 
 
-def _extract_delta_inputs(msg_data: Dict[str, Any]) -> tuple[str, str, float] | None:
-    """Validate incoming delta payload and return side field, price string, and delta."""
+def _extract_delta_inputs(msg_data: Dict[str, Any]) -> tuple[str, str, int | None, float] | None:
+    """Validate incoming delta payload and return side field, price string, tick, and delta.
+
+    The tick is the yes-side cent price on the 1–99 grid, or None when off-grid.
+    """
     raw_side = msg_data.get("side")
     if not isinstance(raw_side, str) or not raw_side:
         logger.error("Invalid delta message structure: %s", orjson.dumps(msg_data))
@@ -159,8 +216,8 @@ def _extract_delta_inputs(msg_data: Dict[str, Any]) -> tuple[str, str, float] |
         logger.error("Unknown side in delta message: %s", side)
         return None
 
-    side_field, price_str = resolved
-    return side_field, price_str, float(delta)
+    side_field, price_str, tick = resolved
+    return side_field, price_str, tick, float(delta)
 
 
 def _resolve_price_and_delta(msg_data: Dict[str, Any]) -> tuple[float | None, float | None]:
@@ -181,15 +238,14 @@ def _resolve_price_and_delta(msg_data: Dict[str, Any]) -> tuple[float | None, fl
     return None, None
 
 
-def _resolve_side_field(side: str, price: float) -> tuple[str, str] | None:
-    """Return the Redis field and price representation for the provided side."""
-    int_price = int(price)
+def _resolve_side_field(side: str, price: float) -> tuple[str, str, int | None] | None:
+    """Return the Redis field, price representation and yes-side tick for the provided side."""
+    tick = tick_from_cents(price)
     if side == "yes":
-        cached = _YES_PRICE_STRS.get(int_price)
-        return "yes_bids", cached if cached is not None else f"{price:.1f}"
+        return "yes_bids", PRICE_STRS[tick] if tick is not None else f"{price:.1f}", tick
     if side == "no":
-        cached = _NO_PRICE_STRS.get(int_price)
-        return "yes_asks", cached if cached is not None else f"{100.0 - price:.1f}"
+        yes_tick = _CENTS_PER_DOLLAR - tick if tick is not None else None
+        return "yes_asks", PRICE_STRS[yes_tick] if yes_tick is not None else f"{100.0 - price:.1f}", yes_tick
     return None
 
 
@@ -265,5 +321,9 @@ async def _update_trade_price_cache_from_cache(
     parsed_yes_bid = convert_numeric_field(yes_bid_str)
     parsed_yes_ask = convert_numeric_field(yes_ask_str)
     if parsed_yes_bid is not None and parsed_yes_ask is not None:
+        batcher = processor.trade_price_batcher
+        if batcher is not None:
+            batcher.add(market_ticker, parsed_yes_bid, parsed_yes_ask)
+            return
         callback = processor.get_update_callback()
         await callback(market_ticker, parsed_yes_bid, parsed_yes_ask)
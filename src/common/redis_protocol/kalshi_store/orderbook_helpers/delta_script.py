@@ -0,0 +1,72 @@
+"""Server-side orderbook delta application for consumers without an in-process cache.
+
+The ``orderbook_delta.lua`` script applies the side delta, recomputes top of
+book and the owning algo's direction, stamps the timestamp and XADDs the
+exchange event when top of book moved — one EVALSHA round trip per delta
+instead of the multi-step HGET/HSET sequence.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ...streams.constants import EXCHANGE_EVENT_STREAM, STREAM_DEFAULT_MAXLEN
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+    from redis.commands.core import AsyncScript
+
+_SCRIPT_PATH = Path(__file__).resolve().parents[2] / "lua" / "orderbook_delta.lua"
+
+
+@dataclass(frozen=True)
+class DeltaScriptResult:
+    """Top of book after a server-side delta."""
+
+    yes_bid: str | None
+    yes_ask: str | None
+    published: bool
+
+
+def _decode_optional(value: Any) -> str | None:
+    if value is None:
+        return None
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+class OrderbookDeltaScript:
+    """Runs the orderbook delta Lua script via EVALSHA (loading it on NOSCRIPT)."""
+
+    def __init__(self, *, stream: str = EXCHANGE_EVENT_STREAM, maxlen: int = STREAM_DEFAULT_MAXLEN) -> None:
+        self._source = _SCRIPT_PATH.read_text(encoding="utf-8")
+        self._stream = stream
+        self._maxlen = maxlen
+        self._script: AsyncScript | None = None
+
+    async def apply(
+        self,
+        redis: Redis,
+        *,
+        market_key: str,
+        market_ticker: str,
+        side_field: str,
+        price_str: str,
+        delta: float,
+        timestamp: str,
+    ) -> DeltaScriptResult:
+        """Apply one delta atomically and return the resulting best bid/ask."""
+        if self._script is None:
+            self._script = redis.register_script(self._source)
+        raw = await self._script(
+            keys=[market_key, self._stream],
+            args=[side_field, price_str, repr(delta), timestamp, market_ticker, self._maxlen],
+            client=redis,
+        )
+        yes_bid, yes_ask, published = raw
+        return DeltaScriptResult(
+            yes_bid=_decode_optional(yes_bid),
+            yes_ask=_decode_optional(yes_ask),
+            published=bool(published),
+        )
@@ -0,0 +1,174 @@
+"""Array-backed orderbook for Kalshi's fixed 1–99 cent price grid.
+
+Each side keeps one size slot per tick and tracks its best price
+incrementally, so applying a delta and reading top of book never parse
+price strings or scan the full side.  Side dicts keyed by the legacy
+``"50.0"`` price strings are only materialized when a Redis write needs
+the ``yes_bids``/``yes_asks`` JSON.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+import orjson
+from redis.typing import EncodableT, FieldT
+
+from ....utils.numeric import coerce_float_optional
+
+MIN_TICK = 1
+MAX_TICK = 99
+_NUM_TICKS = MAX_TICK - MIN_TICK + 1
+_NO_BEST = 0
+_TICK_EPSILON = 1e-6
+
+SIDE_FIELDS = ("yes_bids", "yes_asks")
+
+# Price strings indexed by tick, matching the keys written by the dict-based path.
+PRICE_STRS: tuple[str, ...] = tuple(f"{float(tick):.1f}" for tick in range(MAX_TICK + 1))
+_TICK_BY_PRICE_STR = {PRICE_STRS[tick]: tick for tick in range(MIN_TICK, MAX_TICK + 1)}
+
+
+def tick_from_cents(price: float) -> int | None:
+    """Return the integer tick for a cent price, or None when it is off the 1–99 grid."""
+    tick = round(price)
+    if tick < MIN_TICK or tick > MAX_TICK or abs(price - tick) > _TICK_EPSILON:
+        return None
+    return tick
+
+
+class FixedTickSide(Mapping[str, float]):
+    """One side of a fixed-tick book with an incrementally maintained best level.
+
+    Reads as a ``{price_str: size}`` mapping so existing cache consumers keep
+    working, but mutation goes through :meth:`apply_delta` only.
+    """
+
+    __slots__ = ("_sizes", "_best", "_is_bid", "_depth")
+
+    def __init__(self, *, is_bid: bool) -> None:
+        self._sizes = [0.0] * _NUM_TICKS
+        self._best = _NO_BEST
+        self._is_bid = is_bid
+        self._depth = 0
+
+    @classmethod
+    def from_levels(cls, levels: Mapping[Any, Any], *, is_bid: bool) -> FixedTickSide | None:
+        """Build a side from a ``{price: size}`` mapping, or None if any price is off-grid."""
+        side = cls(is_bid=is_bid)
+        for price, size in levels.items():
+            price_value = coerce_float_optional(price)
+            tick = tick_from_cents(price_value) if price_value is not None else None
+            if tick is None or not isinstance(size, (int, float)):
+                return None
+            side.apply_delta(tick, float(size))
+        return side
+
+    def apply_delta(self, tick: int, delta: float) -> None:
+        """Add *delta* to the size at *tick*, removing the level when it drops to zero."""
+        index = tick - MIN_TICK
+        current = self._sizes[index]
+        new_size = current + delta
+        if new_size <= 0:
+            if current > 0:
+                self._sizes[index] = 0.0
+                self._depth -= 1
+                if tick == self._best:
+                    self._best = self._next_best(tick)
+            return
+        if current <= 0:
+            self._depth += 1
+        self._sizes[index] = new_size
+        if self._best == _NO_BEST or (tick > self._best if self._is_bid else tick < self._best):
+            self._best = tick
+
+    def best(self) -> tuple[float | None, int | None]:
+        """Return the best price (in cents) and its size, or ``(None, None)`` when empty."""
+        if self._best == _NO_BEST:
+            return None, None
+        return float(self._best), int(self._sizes[self._best - MIN_TICK])
+
+    def to_dict(self) -> dict[str, float]:
+        """Materialize the populated levels as a ``{price_str: size}`` dict."""
+        return {PRICE_STRS[index + MIN_TICK]: size for index, size in enumerate(self._sizes) if size > 0}
+
+    def to_json(self) -> bytes:
+        """Serialize the side to the JSON stored in the Redis market hash."""
+        return orjson.dumps(self.to_dict())
+
+    def _next_best(self, removed_tick: int) -> int:
+        if self._depth == 0:
+            return _NO_BEST
+        sizes = self._sizes
+        if self._is_bid:
+            for tick in range(removed_tick - 1, MIN_TICK - 1, -1):
+                if sizes[tick - MIN_TICK] > 0:
+                    return tick
+        else:
+            for tick in range(removed_tick + 1, MAX_TICK + 1):
+                if sizes[tick - MIN_TICK] > 0:
+                    return tick
+        return _NO_BEST
+
+    def __getitem__(self, price_str: str) -> float:
+        tick = _TICK_BY_PRICE_STR.get(price_str)
+        if tick is None or self._sizes[tick - MIN_TICK] <= 0:
+            raise KeyError(price_str)
+        return self._sizes[tick - MIN_TICK]
+
+    def __iter__(self) -> Iterator[str]:
+        return (PRICE_STRS[index + MIN_TICK] for index, size in enumerate(self._sizes) if size > 0)
+
+    def __len__(self) -> int:
+        return self._depth
+
+
+class FixedTickBook:
+    """Yes-bid and yes-ask sides of one Kalshi market on the fixed tick grid."""
+
+    __slots__ = ("yes_bids", "yes_asks")
+
+    def __init__(self, yes_bids: FixedTickSide | None = None, yes_asks: FixedTickSide | None = None) -> None:
+        self.yes_bids = yes_bids if yes_bids is not None else FixedTickSide(is_bid=True)
+        self.yes_asks = yes_asks if yes_asks is not None else FixedTickSide(is_bid=False)
+
+    @classmethod
+    def from_fields(cls, fields: Mapping[str, Any]) -> FixedTickBook | None:
+        """Build a book from cached ``yes_bids``/``yes_asks`` dicts, or None if any level is off-grid."""
+        sides: list[FixedTickSide | None] = []
+        for field, is_bid in (("yes_bids", True), ("yes_asks", False)):
+            levels = fields.get(field)
+            if levels is None:
+                sides.append(None)
+                continue
+            if not isinstance(levels, Mapping):
+                return None
+            side = FixedTickSide.from_levels(levels, is_bid=is_bid)
+            if side is None:
+                return None
+            sides.append(side)
+        return cls(sides[0], sides[1])
+
+    def side(self, field: str) -> FixedTickSide:
+        """Return the side stored under the given hash field name."""
+        return self.yes_bids if field == "yes_bids" else self.yes_asks
+
+    def apply_delta(self, field: str, tick: int, delta: float) -> tuple[float | None, int | None]:
+        """Apply a delta to one side and return that side's new best price and size."""
+        side = self.side(field)
+        side.apply_delta(tick, delta)
+        return side.best()
+
+
+def serialize_market_fields(fields: Mapping[str, Any]) -> dict[FieldT, EncodableT]:
+    """Encode cached market fields for an HSET mapping, serializing side data to JSON."""
+    serialized: dict[FieldT, EncodableT] = {}
+    for field, value in fields.items():
+        if isinstance(value, FixedTickSide):
+            serialized[field] = value.to_json()
+        elif isinstance(value, dict):
+            serialized[field] = orjson.dumps(value)
+        else:
+            serialized[field] = value
+    return serialized
@@ -5,7 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict
 
-_EMPTY_SIDE_DATA: Dict[str, Any] = {}
+from .fixed_tick_book import SIDE_FIELDS, FixedTickBook
+from .write_behind import DEFAULT_FLUSH_INTERVAL_MS, DEFAULT_MAX_DIRTY_MARKETS, OrderbookWriteBehind
 
 
 @dataclass(frozen=True)
@@ -21,13 +22,16 @@ class MarketUpdate:
 class OrderbookCache:
     """Cache of per-market hash fields. Deltas read/write here instead of Redis.
 
-    Side data fields (yes_bids, yes_asks) are stored as raw Python dicts.
-    All other fields are stored as strings. Serialization to JSON happens
-    only at write time.
+    Side data fields (yes_bids, yes_asks) are FixedTickBook sides when every
+    level is on the 1–99 cent grid, otherwise raw Python dicts.  All other
+    fields are stored as strings.  Serialization to JSON happens only at write
+    time, and with write-behind enabled only for dirty fields.
     """
 
     def __init__(self) -> None:
         self._markets: Dict[str, Dict[str, Any]] = {}
+        self._books: Dict[str, FixedTickBook] = {}
+        self.write_behind: OrderbookWriteBehind | None = None
         self._previous_bests: Dict[str, tuple[Any, Any]] = {}
         self._event_tickers: Dict[str, str] = {}
         self._stream_publish_count = 0
@@ -41,21 +45,62 @@ class OrderbookCache:
         return entry.get(field)
 
     def get_side_data(self, market_key: str, field: str) -> Dict[str, Any]:
-        """Return the orderbook side dict for a field, or empty dict if absent."""
+        """Return the mutable side dict for a field (new empty dict if absent).
+
+        Book-backed markets are first converted to plain dicts for off-grid levels.
+        """
         entry = self._markets.get(market_key)
         if entry is None:
-            return _EMPTY_SIDE_DATA
+            return {}
+        book = self._books.pop(market_key, None)
+        if book is not None:
+            for side_field in SIDE_FIELDS:
+                entry[side_field] = book.side(side_field).to_dict()
         value = entry.get(field)
         if not isinstance(value, dict):
-            return _EMPTY_SIDE_DATA
+            return {}
         return value
 
     def store_snapshot(self, market_key: str, fields: Dict[str, Any]) -> None:
         """Replace all cached fields for a market with a full snapshot.
 
         Takes ownership of *fields* — callers must not mutate the dict after passing it.
+        When every side level is on the tick grid, the side dicts are replaced
+        in place by the sides of a new FixedTickBook.
         """
         self._markets[market_key] = fields
+        self._books.pop(market_key, None)
+        book = FixedTickBook.from_fields(fields) if any(field in fields for field in SIDE_FIELDS) else None
+        if book is not None:
+            self._attach_book(market_key, fields, book)
+
+    def get_book(self, market_key: str) -> FixedTickBook | None:
+        """Return the fixed-tick book for a market, creating an empty one if it has no side data yet.
+
+        Returns None when the market's cached sides are plain dicts (off-grid levels).
+        """
+        book = self._books.get(market_key)
+        if book is not None:
+            return book
+        entry = self._markets.get(market_key, {})
+        if any(field in entry for field in SIDE_FIELDS):
+            return None
+        book = FixedTickBook()
+        self._attach_book(market_key, entry, book)
+        return book
+
+    def _attach_book(self, market_key: str, entry: Dict[str, Any], book: FixedTickBook) -> None:
+        for field in SIDE_FIELDS:
+            entry[field] = book.side(field)
+        self._markets[market_key] = entry
+        self._books[market_key] = book
+
+    def enable_write_behind(
+        self, *, flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS, max_dirty_markets: int = DEFAULT_MAX_DIRTY_MARKETS
+    ) -> OrderbookWriteBehind:
+        """Switch deltas to coalesced dirty-field flushing; the caller owns start()/stop() of the result."""
+        self.write_behind = OrderbookWriteBehind(self, flush_interval_ms=flush_interval_ms, max_dirty_markets=max_dirty_markets)
+        return self.write_behind
 
     def update_fields(self, market_key: str, fields: Dict[str, Any]) -> Dict[str, Any]:
         """Update specific fields and return the full market state by reference.
@@ -117,5 +162,8 @@ class OrderbookCache:
     def remove_market(self, market_key: str) -> None:
         """Remove a market from the cache to free memory after unsubscribe."""
         self._markets.pop(market_key, None)
+        self._books.pop(market_key, None)
+        if self.write_behind is not None:
+            self.write_behind.discard(market_key)
         self._previous_bests.pop(market_key, None)
         self._event_tickers.pop(market_key, None)
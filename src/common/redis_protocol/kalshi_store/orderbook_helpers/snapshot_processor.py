@@ -8,7 +8,6 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING, Any, Dict
 
-import orjson
 from redis.asyncio import Redis
 
 from ....market_filters.kalshi import extract_best_ask, extract_best_bid
@@ -19,10 +18,12 @@ from ...typing import ensure_awaitable
 from ..utils_coercion import coerce_mapping as _canonical_coerce_mapping
 from .best_price_updater import BestPriceUpdater
 from .event_publisher import publish_market_event
+from .fixed_tick_book import serialize_market_fields
 from .snapshot_processor_helpers.redis_storage import build_hash_data, normalize_price_formatting
 
 if TYPE_CHECKING:
     from .orderbook_cache import OrderbookCache
+    from .trade_price_batcher import TradePriceBatcher
 
 logger = logging.getLogger(__name__)
 
@@ -33,11 +34,21 @@ class SnapshotProcessor:
     def __init__(self, update_trade_prices_callback: Any):
         self._update_trade_prices_callback = update_trade_prices_callback
         self._cache: OrderbookCache | None = None
+        self._trade_price_batcher: TradePriceBatcher | None = None
 
     def set_cache(self, cache: OrderbookCache) -> None:
         """Attach the in-memory cache for orderbook tracking."""
         self._cache = cache
 
+    def set_trade_price_batcher(self, batcher: TradePriceBatcher) -> None:
+        """Queue cached trade price updates on ``batcher`` instead of calling the callback."""
+        self._trade_price_batcher = batcher
+
+    @property
+    def trade_price_batcher(self) -> TradePriceBatcher | None:
+        """Batcher for cached trade price updates, if enabled."""
+        return self._trade_price_batcher
+
     def get_update_callback(self) -> Any:
         """Return the callback responsible for publishing trade prices."""
         return self._update_trade_prices_callback
@@ -129,9 +140,16 @@ class SnapshotProcessor:
             for side in ("yes_bids", "yes_asks"):
                 if side in orderbook_sides:
                     cache_fields[side] = orderbook_sides[side]
-            self._cache.store_snapshot(market_key, cache_fields)
-            serialized = {k: orjson.dumps(v) if isinstance(v, dict) else v for k, v in cache_fields.items()}
-            await ensure_awaitable(redis.hset(market_key, mapping=serialized))
+            write_behind = self._cache.write_behind
+            if write_behind is None:
+                # Serialize before the cache takes ownership and swaps in fixed-tick sides.
+                serialized = serialize_market_fields(cache_fields)
+                self._cache.store_snapshot(market_key, cache_fields)
+                await ensure_awaitable(redis.hset(market_key, mapping=serialized))
+            else:
+                self._cache.store_snapshot(market_key, cache_fields)
+                # Serialized from the cache once any in-flight write-behind HSET for the market lands
+                await write_behind.write_market(redis, market_key)
             if self._cache.check_price_changed(market_key):
                 await _publish_if_event(redis, self._cache, market_key, market_ticker, timestamp)
         else:
@@ -0,0 +1,64 @@
+"""Coalesced, batched trade price updates from cached top of book."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Awaitable, Callable, List, Tuple
+
+from ...coalescing_batcher import CoalescingBatcher
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL_MS = 100
+DEFAULT_MAX_PENDING_TICKERS = 500
+
+PriceUpdate = Tuple[str, float, float]
+
+
+class TradePriceBatcher:
+    """Keeps the latest bid/ask per ticker and hands them to ``apply_batch`` in one call.
+
+    Top-of-book changes on a held ticker arrive far faster than trade payloads
+    need rewriting; a CoalescingBatcher keyed by ticker flushes each ticker once
+    per interval (or earlier once ``max_pending_tickers`` are pending).
+    ``apply_batch`` is typically ``TradeStore.update_trade_prices_batch``.
+    """
+
+    def __init__(
+        self,
+        apply_batch: Callable[[List[PriceUpdate]], Awaitable[Any]],
+        *,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        max_pending_tickers: int = DEFAULT_MAX_PENDING_TICKERS,
+    ) -> None:
+        self._apply_batch = apply_batch
+        self._batcher: CoalescingBatcher[str, PriceUpdate] = CoalescingBatcher(
+            self._flush,
+            "trade_price_batcher",
+            flush_interval_ms=flush_interval_ms,
+            max_pending=max_pending_tickers,
+        )
+
+    def add(self, market_ticker: str, yes_bid: float, yes_ask: float) -> None:
+        """Queue the latest prices for a ticker, replacing any pending update."""
+        self._batcher.add(market_ticker, (market_ticker, yes_bid, yes_ask))
+
+    async def start(self) -> None:
+        """Start the periodic flush loop."""
+        await self._batcher.start()
+
+    async def stop(self) -> None:
+        """Stop the flush loop after a final flush."""
+        await self._batcher.stop()
+
+    async def _flush(self, updates: List[PriceUpdate]) -> None:
+        from ...trade_store import TradeStoreError
+
+        try:
+            await self._apply_batch(updates)
+        except TradeStoreError as exc:  # policy_guard: allow-silent-handler
+            # Dropped prices are re-sent on the ticker's next top-of-book change
+            logger.warning("Trade price batch of %d tickers failed: %s", len(updates), exc)
+
+
+__all__ = ["TradePriceBatcher"]
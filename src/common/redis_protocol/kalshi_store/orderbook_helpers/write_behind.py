@@ -0,0 +1,163 @@
+"""Write-behind flushing of dirty orderbook cache fields to Redis."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterable
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from redis.typing import EncodableT, FieldT
+
+from ...coalescing_batcher import CoalescingBatcher
+from ...typing import ensure_awaitable
+from .fixed_tick_book import serialize_market_fields
+
+if TYPE_CHECKING:
+    from .orderbook_cache import OrderbookCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL_MS = 100
+DEFAULT_MAX_DIRTY_MARKETS = 500
+
+
+class OrderbookWriteBehind:
+    """Tracks dirty hash fields per market and flushes them in pipelined partial HSETs.
+
+    Deltas mark the fields they touched; a CoalescingBatcher keyed by market
+    flushes each dirty market once per interval (or earlier once
+    ``max_dirty_markets`` markets are pending), serializing only the dirty
+    fields from the cache's current state.
+
+    At most one HSET per market is in flight.  Immediate writes wait for a
+    batched write of the same market to land, and batches skip markets with
+    an immediate write in flight, so every write serializes the cache's
+    current state after the previous one and an older write can never land
+    on top of a newer one.
+    """
+
+    def __init__(
+        self,
+        cache: OrderbookCache,
+        *,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        max_dirty_markets: int = DEFAULT_MAX_DIRTY_MARKETS,
+    ) -> None:
+        self._cache = cache
+        self._dirty: Dict[str, set[str]] = {}
+        self._in_flight: Dict[str, asyncio.Event] = {}
+        self._redis: Redis | None = None
+        self._batcher: CoalescingBatcher[str, str] = CoalescingBatcher(
+            self._flush_markets,
+            "orderbook_write_behind",
+            flush_interval_ms=flush_interval_ms,
+            max_pending=max_dirty_markets,
+        )
+
+    def mark_dirty(self, redis: Redis, market_key: str, fields: Iterable[str]) -> None:
+        """Record fields that changed for a market and queue it for the next flush."""
+        self._redis = redis
+        dirty = self._dirty.get(market_key)
+        if dirty is None:
+            self._dirty[market_key] = set(fields)
+        else:
+            dirty.update(fields)
+        self._batcher.add(market_key, market_key)
+
+    def discard(self, market_key: str) -> None:
+        """Forget pending fields for a market, e.g. after a full snapshot write."""
+        self._dirty.pop(market_key, None)
+
+    async def flush_market(self, redis: Redis, market_key: str) -> None:
+        """Write a market's dirty fields immediately, ahead of a stream publish."""
+        async with self._exclusive_write(market_key):
+            fields = self._dirty.pop(market_key, None)
+            if not fields:
+                return
+            mapping = self._serialize(market_key, fields)
+            if not mapping:
+                return
+            try:
+                await ensure_awaitable(redis.hset(market_key, mapping=mapping))
+            except RedisError:
+                self._restore({market_key: fields})
+                raise
+
+    async def write_market(self, redis: Redis, market_key: str) -> None:
+        """Write every cached field of a market, e.g. after a snapshot, replacing its pending fields."""
+        async with self._exclusive_write(market_key):
+            self._dirty.pop(market_key, None)
+            snapshot = self._cache.get_snapshot(market_key)
+            if snapshot is None:
+                return
+            await ensure_awaitable(redis.hset(market_key, mapping=serialize_market_fields(snapshot)))
+
+    async def start(self) -> None:
+        """Start the periodic flush loop."""
+        await self._batcher.start()
+
+    async def stop(self) -> None:
+        """Stop the flush loop after a final flush."""
+        await self._batcher.stop()
+
+    @property
+    def dirty_market_count(self) -> int:
+        """Number of markets with fields awaiting a flush."""
+        return len(self._dirty)
+
+    async def _flush_markets(self, market_keys: list[str]) -> None:
+        redis = self._redis
+        if redis is None:
+            return
+        drained: Dict[str, set[str]] = {}
+        pipe = redis.pipeline(transaction=False)
+        for market_key in market_keys:
+            if market_key in self._in_flight:
+                # An immediate write is landing; flush this market on the next cycle instead
+                self._batcher.add(market_key, market_key)
+                continue
+            fields = self._dirty.pop(market_key, None)
+            if not fields:
+                continue
+            mapping = self._serialize(market_key, fields)
+            if mapping:
+                drained[market_key] = fields
+                pipe.hset(market_key, mapping=mapping)
+        if not drained:
+            return
+        for market_key in drained:
+            self._in_flight[market_key] = asyncio.Event()
+        try:
+            await ensure_awaitable(pipe.execute())
+        except RedisError:
+            self._restore(drained)
+            raise
+        finally:
+            for market_key in drained:
+                self._in_flight.pop(market_key).set()
+        logger.debug("Flushed dirty orderbook fields for %d markets", len(drained))
+
+    @asynccontextmanager
+    async def _exclusive_write(self, market_key: str) -> AsyncIterator[None]:
+        """Hold the market's single write slot, waiting for any write already in flight."""
+        while (in_flight := self._in_flight.get(market_key)) is not None:
+            await in_flight.wait()
+        self._in_flight[market_key] = asyncio.Event()
+        try:
+            yield
+        finally:
+            self._in_flight.pop(market_key).set()
+
+    def _serialize(self, market_key: str, fields: set[str]) -> Dict[FieldT, EncodableT]:
+        snapshot = self._cache.get_snapshot(market_key)
+        if snapshot is None:
+            return {}
+        return serialize_market_fields({field: snapshot[field] for field in fields if field in snapshot})
+
+    def _restore(self, drained: Dict[str, set[str]]) -> None:
+        for market_key, fields in drained.items():
+            self._dirty.setdefault(market_key, set()).update(fields)
+            self._batcher.add(market_key, market_key)
@@ -11,6 +11,7 @@ from redis.asyncio import Redis
 
 from ....redis_schema import KalshiMarketDescriptor
 from ...error_types import REDIS_ERRORS
+from ...market_changelog import queue_market_changes
 from ...market_metadata_builder import build_market_metadata
 from ...typing import ensure_awaitable
 from ..connection import RedisConnectionManager
@@ -77,7 +78,12 @@ class MetadataWriter:
             metadata = self._build_kalshi_metadata(market_ticker, market_data, event_data, descriptor, weather_resolver)
 
             # Direct update - only touch Kalshi API fields
-            await ensure_awaitable(redis_client.hset(market_key, mapping=metadata))
+            added_fields = await ensure_awaitable(redis_client.hset(market_key, mapping=metadata))
+            if added_fields:
+                # New market (or new fields): log it so in-memory indexes pick it up incrementally
+                pipe = redis_client.pipeline()
+                queue_market_changes(pipe, [market_key])
+                await ensure_awaitable(pipe.execute())
             logger.debug(f"Updated {len(metadata)} Kalshi API fields for {market_ticker}")
 
         except REDIS_ERRORS as exc:
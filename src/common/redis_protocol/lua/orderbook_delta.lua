@@ -0,0 +1,121 @@
+-- Apply a Kalshi orderbook delta server-side in one round trip
+-- KEYS[1]: market hash key (e.g. markets:kalshi:...)
+-- KEYS[2]: exchange event stream (e.g. stream:exchange_events)
+-- ARGV[1]: side field (yes_bids/yes_asks)
+-- ARGV[2]: price level string (e.g. "45.0")
+-- ARGV[3]: size delta
+-- ARGV[4]: timestamp
+-- ARGV[5]: market ticker
+-- ARGV[6]: approximate stream maxlen
+-- Returns: {yes_bid, yes_ask, published} (bid/ask nil when absent, published 0/1)
+
+local key = KEYS[1]
+local stream = KEYS[2]
+local side_field = ARGV[1]
+local price_str = ARGV[2]
+local delta = tonumber(ARGV[3])
+local timestamp = ARGV[4]
+local market_ticker = ARGV[5]
+local maxlen = ARGV[6]
+local is_bid = side_field == 'yes_bids'
+local best_field = is_bid and 'yes_bid' or 'yes_ask'
+
+-- Truncate toward zero like Python's int(float(value))
+local function to_int(value)
+    local number = tonumber(value)
+    if number == nil then
+        return nil
+    end
+    if number >= 0 then
+        return math.floor(number)
+    end
+    return math.ceil(number)
+end
+
+-- Match Python's str(float) for cent prices ("45.0", "45.5")
+local function format_price(price)
+    if price == math.floor(price) then
+        return string.format('%.1f', price)
+    end
+    return tostring(price)
+end
+
+local previous = redis.call('HMGET', key, 'yes_bid', 'yes_ask')
+
+-- Load the side, tolerating missing or corrupted JSON
+local side = {}
+local side_json = redis.call('HGET', key, side_field)
+if side_json then
+    local ok, decoded = pcall(cjson.decode, side_json)
+    if ok and type(decoded) == 'table' then
+        side = decoded
+    end
+end
+
+local current = tonumber(side[price_str]) or 0
+local new_size = current + delta
+if new_size <= 0 then
+    side[price_str] = nil
+else
+    side[price_str] = new_size
+end
+
+-- Best level: highest bid or lowest ask with a positive integer size
+local best_price = nil
+local best_size = nil
+for level, size in pairs(side) do
+    local price = tonumber(level)
+    local size_int = to_int(size)
+    if price ~= nil and size_int ~= nil and size_int > 0 then
+        if best_price == nil or (is_bid and price > best_price) or ((not is_bid) and price < best_price) then
+            best_price = price
+            best_size = size_int
+        end
+    end
+end
+
+local fields = {side_field, next(side) == nil and '{}' or cjson.encode(side), 'timestamp', timestamp}
+if best_price ~= nil then
+    table.insert(fields, best_field)
+    table.insert(fields, format_price(best_price))
+    table.insert(fields, best_field .. '_size')
+    table.insert(fields, tostring(best_size))
+else
+    redis.call('HDEL', key, best_field, best_field .. '_size')
+end
+redis.call('HSET', key, unpack(fields))
+
+-- Recompute the owning algo's direction from theoretical vs. Kalshi prices
+local algo = redis.call('HGET', key, 'algo')
+local prices = redis.call('HMGET', key, 'yes_bid', 'yes_ask')
+if algo then
+    local theo = redis.call('HMGET', key, algo .. ':t_bid', algo .. ':t_ask')
+    local kalshi_bid = to_int(prices[1])
+    local kalshi_ask = to_int(prices[2])
+    local t_bid = to_int(theo[1])
+    local t_ask = to_int(theo[2])
+    if (t_bid ~= nil or t_ask ~= nil) and kalshi_bid ~= nil and kalshi_ask ~= nil then
+        local buy_edge = t_ask ~= nil and kalshi_ask > 0 and kalshi_ask < t_ask
+        local sell_edge = t_bid ~= nil and kalshi_bid > 0 and kalshi_bid > t_bid
+        local direction = 'NONE'
+        if buy_edge and not sell_edge then
+            direction = 'BUY'
+        elseif sell_edge and not buy_edge then
+            direction = 'SELL'
+        end
+        redis.call('HSET', key, algo .. ':direction', direction)
+    end
+end
+
+-- Publish only when top of book moved
+local published = 0
+if prices[1] ~= previous[1] or prices[2] ~= previous[2] then
+    local event_ticker = redis.call('HGET', key, 'event_ticker')
+    if event_ticker then
+        redis.call('XADD', stream, 'MAXLEN', '~', maxlen, '*',
+            'event_ticker', event_ticker, 'market_ticker', market_ticker, 'timestamp', timestamp)
+        published = 1
+    end
+end
+
+return {prices[1], prices[2], published}
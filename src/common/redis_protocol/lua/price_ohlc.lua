@@ -0,0 +1,44 @@
+-- Record one price tick and fold it into OHLC buckets in one round trip
+-- KEYS[1]: raw history sorted set (history:<currency>)
+-- KEYS[i], i >= 2: bucket sorted set for one resolution (history:<currency>:<resolution>)
+-- ARGV[1]: tick timestamp (integer epoch seconds)
+-- ARGV[2]: price, stored verbatim in the bucket members
+-- ARGV[3]: raw history member
+-- ARGV[2i], ARGV[2i+1]: bucket width and retention seconds for KEYS[i]
+-- Returns: number of buckets updated
+-- Bucket members are 'start|open|high|low|close' scored by the bucket start;
+-- the member for the tick's bucket is replaced, and buckets older than the
+-- retention are trimmed so each tier stays bounded.
+
+local ts = tonumber(ARGV[1])
+local price_str = ARGV[2]
+local price = tonumber(price_str)
+
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[3])
+
+for i = 2, #KEYS do
+    local key = KEYS[i]
+    local width = tonumber(ARGV[2 * i])
+    local retention = tonumber(ARGV[2 * i + 1])
+    local start = string.format('%d', ts - (ts % width))
+    local open, high, low = price_str, price_str, price_str
+    local existing = redis.call('ZRANGEBYSCORE', key, start, start)
+    for _, member in ipairs(existing) do
+        local o, h, l = string.match(member, '^[^|]+|([^|]+)|([^|]+)|([^|]+)|')
+        if o then
+            open = o
+            if tonumber(h) > price then
+                high = h
+            end
+            if tonumber(l) < price then
+                low = l
+            end
+        end
+        redis.call('ZREM', key, member)
+    end
+    redis.call('ZADD', key, start, start .. '|' .. open .. '|' .. high .. '|' .. low .. '|' .. price_str)
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', '(' .. string.format('%d', tonumber(start) - retention))
+    redis.call('EXPIRE', key, retention)
+end
+
+return #KEYS - 1
@@ -0,0 +1,181 @@
+"""Per-venue change log of market keys added to or removed from Redis.
+
+Writers append the touched market key to a capped stream
+(``ops:market_changes:{VENUE}``) in the same pipeline as the hash write or
+delete.  The stream entry ID is the venue's generation: XADD assigns it
+atomically and monotonically, so an in-memory index only needs to remember
+the last ID it applied and ``XRANGE`` the keys changed since, instead of
+SCANning the whole ``markets:*`` keyspace to compare counts.
+
+When the log no longer reaches back to a reader's generation (it was
+trimmed or reset), the delta is flagged ``truncated`` and the reader falls
+back to a full re-initialize.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional, Tuple
+
+from common.redis_schema import MarketChangeLogKey
+
+from .typing import ensure_awaitable
+
+KALSHI_VENUE = "kalshi"
+DERIBIT_VENUE = "deribit"
+MARKET_CHANGELOG_MAXLEN = 10_000
+INITIAL_GENERATION = "0-0"
+
+_MARKET_KEY_PREFIX = "markets:"
+_KEY_FIELD = "key"
+_RESET_FIELD = "reset"
+_TRACKED_VENUES = frozenset({KALSHI_VENUE, DERIBIT_VENUE})
+
+
+def market_changelog_key(venue: str) -> str:
+    """Return the change-log stream key for a venue."""
+    return MarketChangeLogKey(venue).key()
+
+
+def venue_for_market_key(market_key: str) -> Optional[str]:
+    """Return the tracked venue of a ``markets:{venue}:...`` key, or None."""
+    if not market_key.startswith(_MARKET_KEY_PREFIX):
+        return None
+    venue = market_key[len(_MARKET_KEY_PREFIX) :].split(":", 1)[0]
+    if venue not in _TRACKED_VENUES:
+        return None
+    return venue
+
+
+def queue_market_changes(pipe: Any, market_keys: Iterable[str]) -> int:
+    """Queue change-log entries for ``market_keys`` on a pipeline; return entries queued.
+
+    Keys outside the tracked ``markets:{venue}:`` namespaces are ignored, so
+    callers can pass whatever keys they write or delete.
+    """
+    queued = 0
+    for market_key in market_keys:
+        venue = venue_for_market_key(market_key)
+        if venue is None:
+            continue
+        pipe.xadd(
+            market_changelog_key(venue),
+            {_KEY_FIELD: market_key},
+            maxlen=MARKET_CHANGELOG_MAXLEN,
+            approximate=True,
+        )
+        queued += 1
+    return queued
+
+
+def changelog_venues(market_keys: Iterable[str]) -> set[str]:
+    """Return the tracked venues touched by ``market_keys``."""
+    venues: set[str] = set()
+    for market_key in market_keys:
+        venue = venue_for_market_key(market_key)
+        if venue is not None:
+            venues.add(venue)
+    return venues
+
+
+def queue_changelog_reset(pipe: Any, venues: Iterable[str]) -> None:
+    """Queue a reset of venues' change logs after a bulk wipe.
+
+    Bulk removals are not logged key by key.  The log is replaced by a single
+    reset marker instead, which makes every reader's next delta ``truncated``
+    so it re-initializes.
+    """
+    for venue in venues:
+        stream = market_changelog_key(venue)
+        pipe.delete(stream)
+        pipe.xadd(stream, {_RESET_FIELD: "1"}, maxlen=MARKET_CHANGELOG_MAXLEN, approximate=True)
+
+
+@dataclass(frozen=True)
+class MarketChangeDelta:
+    """Market keys changed after a reader's generation."""
+
+    generation: str
+    keys: Tuple[str, ...]
+    truncated: bool = False
+
+
+async def latest_generation(redis: Any, venue: str) -> str:
+    """Return the newest change-log ID for a venue, or ``INITIAL_GENERATION`` if none."""
+    entries = await ensure_awaitable(redis.xrevrange(market_changelog_key(venue), count=1))
+    if not entries:
+        return INITIAL_GENERATION
+    return _decode(entries[0][0])
+
+
+async def read_market_changes(redis: Any, venue: str, since: str) -> MarketChangeDelta:
+    """Return the distinct market keys logged after generation ``since``.
+
+    The entry for ``since`` itself must still be in the log; if it was trimmed
+    away, changes may have been lost and the delta is marked ``truncated``.
+    """
+    stream = market_changelog_key(venue)
+    if since == INITIAL_GENERATION:
+        entries = await ensure_awaitable(redis.xrange(stream, min="-", max="+"))
+        if len(entries) >= MARKET_CHANGELOG_MAXLEN:
+            return MarketChangeDelta(generation=since, keys=(), truncated=True)
+    else:
+        entries = await ensure_awaitable(redis.xrange(stream, min=since, max="+"))
+        if not entries or _decode(entries[0][0]) != since:
+            return MarketChangeDelta(generation=since, keys=(), truncated=True)
+        entries = entries[1:]
+    if not entries:
+        return MarketChangeDelta(generation=since, keys=())
+    generation = _decode(entries[-1][0])
+    keys: dict[str, None] = {}
+    for _, fields in entries:
+        if _field(fields, _RESET_FIELD) is not None:
+            return MarketChangeDelta(generation=generation, keys=(), truncated=True)
+        market_key = _field(fields, _KEY_FIELD)
+        if market_key is not None:
+            keys[market_key] = None
+    return MarketChangeDelta(generation=generation, keys=tuple(keys))
+
+
+async def fetch_changed_hashes(redis: Any, market_keys: Iterable[str]) -> List[Tuple[str, Any]]:
+    """Pipeline HGETALL for changed keys; an empty hash means the key was removed."""
+    keys = list(market_keys)
+    if not keys:
+        return []
+    async with redis.pipeline() as pipe:
+        for key in keys:
+            pipe.hgetall(key)
+        responses = await pipe.execute()
+    return list(zip(keys, responses))
+
+
+def _field(fields: Any, name: str) -> Optional[str]:
+    raw = fields.get(name)
+    if raw is None:
+        raw = fields.get(name.encode("utf-8"))
+    if raw is None:
+        return None
+    return _decode(raw)
+
+
+def _decode(value: Any) -> str:
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode("utf-8")
+    return str(value)
+
+
+__all__ = [
+    "DERIBIT_VENUE",
+    "INITIAL_GENERATION",
+    "KALSHI_VENUE",
+    "MARKET_CHANGELOG_MAXLEN",
+    "MarketChangeDelta",
+    "changelog_venues",
+    "fetch_changed_hashes",
+    "latest_generation",
+    "market_changelog_key",
+    "queue_changelog_reset",
+    "queue_market_changes",
+    "read_market_changes",
+    "venue_for_market_key",
+]
@@ -4,6 +4,7 @@ import logging
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+from common.redis_protocol.market_changelog import queue_market_changes
 from common.redis_protocol.typing import RedisClient, ensure_awaitable
 
 logger = logging.getLogger(__name__)
@@ -111,6 +112,7 @@ class ExpiredMarketCleaner:
             del_pipe = self._redis.pipeline()
             for key_str in keys_to_delete:
                 del_pipe.delete(key_str)
+            queue_market_changes(del_pipe, keys_to_delete)
             await ensure_awaitable(del_pipe.execute())
             for key_str in keys_to_delete:
                 logger.debug("Deleted expired Kalshi market: %s", key_str)
@@ -160,6 +162,7 @@ class ExpiredMarketCleaner:
         pipe = self._redis.pipeline()
         for key_str in keys_to_delete:
             pipe.delete(key_str)
+        queue_market_changes(pipe, keys_to_delete)
         await ensure_awaitable(pipe.execute())
         for key_str in keys_to_delete:
             logger.debug("Deleted expired Deribit %s: %s", instrument_type, key_str)
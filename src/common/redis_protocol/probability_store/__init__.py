@@ -11,6 +11,7 @@ from .exceptions import (
     ProbabilityStoreInitializationError,
     ProbabilityStoreVerificationError,
 )
+from .frame import ProbabilityFrame
 from .probability_data_config import ProbabilityData
 from .store import ProbabilityStore
 from .verification import (
@@ -21,6 +22,7 @@ from .verification import (
 __all__ = [
     "ProbabilityStore",
     "ProbabilityData",
+    "ProbabilityFrame",
     "ProbabilityStoreError",
     "ProbabilityStoreInitializationError",
     "ProbabilityStoreVerificationError",
@@ -0,0 +1,219 @@
+"""Columnar NumPy representation of a currency's probability surface.
+
+A :class:`ProbabilityFrame` holds one row per ``(expiry, strike)`` pair as
+parallel NumPy arrays, pre-sorted by expiry (chronological) then strike.
+Ingestion writes the frame next to the compact hash as a single orjson
+document whose numeric columns are base64-encoded little-endian arrays, so
+readers decode it with ``np.frombuffer`` instead of parsing one JSON payload
+per strike.  The document is text, which keeps it readable by clients
+created with ``decode_responses=True``.
+"""
+
+from __future__ import annotations
+
+import base64
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+import numpy as np
+import orjson
+
+from ..error_types import PARSING_ERRORS
+from .codec import decode_redis_key
+from .exceptions import ProbabilityStoreError
+from .keys import (
+    expiry_sort_key,
+    parse_greater_than_strike,
+    parse_less_than_strike,
+    parse_numeric_strike,
+    parse_range_strike,
+)
+
+FRAME_FORMAT_VERSION = 1
+
+STRIKE_TYPE_GREATER = "greater"
+STRIKE_TYPE_LESS = "less"
+STRIKE_TYPE_BETWEEN = "between"
+STRIKE_TYPE_EXACT = "exact"
+
+# Strike ordering groups, matching keys.strike_sort_key
+_STRIKE_GROUPS = {STRIKE_TYPE_LESS: -1, STRIKE_TYPE_EXACT: 0, STRIKE_TYPE_BETWEEN: 0, STRIKE_TYPE_GREATER: 1}
+
+_INDEX_DTYPE = np.dtype("<i4")
+_FLOAT_DTYPE = np.dtype("<f8")
+
+# Row: (expiry, strike_key, payload)
+FrameRow = Tuple[str, str, Mapping[str, Any]]
+
+
+@dataclass(frozen=True)
+class ProbabilityFrame:
+    """Parallel column arrays for one currency, sorted by expiry then strike.
+
+    ``error`` and ``confidence`` are NaN where the payload has no value.
+    """
+
+    expiry: np.ndarray
+    strike_key: np.ndarray
+    strike_type: np.ndarray
+    strike: np.ndarray
+    probability: np.ndarray
+    error: np.ndarray
+    confidence: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.probability.shape[0])
+
+    @property
+    def expiries(self) -> List[str]:
+        """Distinct expiries in sorted order."""
+        return list(dict.fromkeys(self.expiry.tolist()))
+
+
+def classify_strike(strike_key: str) -> Tuple[str, float]:
+    """Return ``(strike_type, strike_value)`` for a compact-format strike key."""
+    prefix = strike_key[:1]
+    if prefix == ">":
+        return STRIKE_TYPE_GREATER, parse_greater_than_strike(strike_key)
+    if prefix == "<":
+        return STRIKE_TYPE_LESS, parse_less_than_strike(strike_key)
+    if "-" in strike_key[1:]:
+        return STRIKE_TYPE_BETWEEN, parse_range_strike(strike_key)
+    return STRIKE_TYPE_EXACT, parse_numeric_strike(strike_key)
+
+
+def _as_float(value: Any, *, field: str, strike_key: str) -> float:
+    if value is None or value == "NaN":
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError) as exc:
+        raise ProbabilityStoreError(f"Invalid {field} value {value!r} for strike {strike_key}") from exc
+
+
+def iter_frame_rows(probabilities_data: Mapping[str, Mapping[str, Mapping[str, Any]]]) -> Iterable[FrameRow]:
+    """Flatten nested ``expiry -> strike -> payload`` data into frame rows."""
+    for expiry, strikes in probabilities_data.items():
+        for strike_key, payload in strikes.items():
+            yield expiry, str(strike_key), payload
+
+
+def build_probability_frame(rows: Iterable[FrameRow]) -> ProbabilityFrame:
+    """Build a sorted :class:`ProbabilityFrame` from ``(expiry, strike_key, payload)`` rows."""
+    expiries: List[str] = []
+    strike_keys: List[str] = []
+    strike_types: List[str] = []
+    strikes: List[float] = []
+    probabilities: List[float] = []
+    errors: List[float] = []
+    confidences: List[float] = []
+
+    for expiry, strike_key, payload in rows:
+        strike_type, strike_value = classify_strike(strike_key)
+        expiries.append(expiry)
+        strike_keys.append(strike_key)
+        strike_types.append(strike_type)
+        strikes.append(strike_value)
+        probabilities.append(_as_float(payload.get("probability"), field="probability", strike_key=strike_key))
+        errors.append(_as_float(payload.get("error"), field="error", strike_key=strike_key))
+        confidences.append(_as_float(payload.get("confidence"), field="confidence", strike_key=strike_key))
+
+    unique_expiries = sorted(set(expiries), key=expiry_sort_key)
+    expiry_rank = {expiry: rank for rank, expiry in enumerate(unique_expiries)}
+    expiry_ranks = np.fromiter((expiry_rank[expiry] for expiry in expiries), dtype=np.int64, count=len(expiries))
+    strike_groups = np.fromiter((_STRIKE_GROUPS[strike_type] for strike_type in strike_types), dtype=np.int64, count=len(strike_types))
+    strike_values = np.asarray(strikes, dtype=np.float64)
+    order = np.lexsort((strike_values, strike_groups, expiry_ranks))
+
+    return ProbabilityFrame(
+        expiry=np.asarray(expiries, dtype=str)[order],
+        strike_key=np.asarray(strike_keys, dtype=str)[order],
+        strike_type=np.asarray(strike_types, dtype=str)[order],
+        strike=strike_values[order],
+        probability=np.asarray(probabilities, dtype=np.float64)[order],
+        error=np.asarray(errors, dtype=np.float64)[order],
+        confidence=np.asarray(confidences, dtype=np.float64)[order],
+    )
+
+
+def _encode_column(values: np.ndarray, dtype: np.dtype) -> str:
+    return base64.b64encode(np.ascontiguousarray(values, dtype=dtype).tobytes()).decode("ascii")
+
+
+def _decode_column(encoded: str, dtype: np.dtype, rows: int) -> np.ndarray:
+    values = np.frombuffer(base64.b64decode(encoded), dtype=dtype)
+    if values.shape[0] != rows:
+        raise ProbabilityStoreError(f"Probability frame column has {values.shape[0]} rows; expected {rows}")
+    return values
+
+
+def _category_codes(values: np.ndarray) -> Tuple[List[str], np.ndarray]:
+    categories, codes = np.unique(values, return_inverse=True)
+    return categories.tolist(), codes
+
+
+def encode_probability_frame(frame: ProbabilityFrame) -> str:
+    """Serialise a frame to the versioned columnar document stored in Redis."""
+    expiries, expiry_codes = _category_codes(frame.expiry)
+    strike_types, strike_type_codes = _category_codes(frame.strike_type)
+    document: Dict[str, Any] = {
+        "v": FRAME_FORMAT_VERSION,
+        "rows": len(frame),
+        "expiries": expiries,
+        "strike_types": strike_types,
+        "strike_keys": frame.strike_key.tolist(),
+        "columns": {
+            "expiry": _encode_column(expiry_codes, _INDEX_DTYPE),
+            "strike_type": _encode_column(strike_type_codes, _INDEX_DTYPE),
+            "strike": _encode_column(frame.strike, _FLOAT_DTYPE),
+            "probability": _encode_column(frame.probability, _FLOAT_DTYPE),
+            "error": _encode_column(frame.error, _FLOAT_DTYPE),
+            "confidence": _encode_column(frame.confidence, _FLOAT_DTYPE),
+        },
+    }
+    return orjson.dumps(document).decode()
+
+
+def decode_probability_frame(raw: Any) -> ProbabilityFrame:
+    """Decode a document produced by :func:`encode_probability_frame`.
+
+    Raises:
+        ProbabilityStoreError: Unknown format version or malformed document
+    """
+    try:
+        document = orjson.loads(decode_redis_key(raw))
+        version = document["v"]
+        if version != FRAME_FORMAT_VERSION:
+            raise ProbabilityStoreError(f"Unsupported probability frame version {version!r}")
+        rows = int(document["rows"])
+        columns = document["columns"]
+        expiries = np.asarray(document["expiries"], dtype=str)
+        strike_types = np.asarray(document["strike_types"], dtype=str)
+        strike_keys = np.asarray(document["strike_keys"], dtype=str)
+        if strike_keys.shape[0] != rows:
+            raise ProbabilityStoreError(f"Probability frame has {strike_keys.shape[0]} strike keys; expected {rows}")
+        expiry_codes = _decode_column(columns["expiry"], _INDEX_DTYPE, rows)
+        strike_type_codes = _decode_column(columns["strike_type"], _INDEX_DTYPE, rows)
+        return ProbabilityFrame(
+            expiry=np.take(expiries, expiry_codes),
+            strike_key=strike_keys,
+            strike_type=np.take(strike_types, strike_type_codes),
+            strike=_decode_column(columns["strike"], _FLOAT_DTYPE, rows),
+            probability=_decode_column(columns["probability"], _FLOAT_DTYPE, rows),
+            error=_decode_column(columns["error"], _FLOAT_DTYPE, rows),
+            confidence=_decode_column(columns["confidence"], _FLOAT_DTYPE, rows),
+        )
+    except (*PARSING_ERRORS, KeyError, IndexError) as exc:
+        raise ProbabilityStoreError(f"Malformed probability frame: {exc}") from exc
+
+
+__all__ = [
+    "FRAME_FORMAT_VERSION",
+    "ProbabilityFrame",
+    "build_probability_frame",
+    "classify_strike",
+    "decode_probability_frame",
+    "encode_probability_frame",
+    "iter_frame_rows",
+]
@@ -96,6 +96,25 @@ def parse_probability_key(key_str: str) -> Tuple[str, str, str]:
     return expiry, strike_type, strike
 
 
+def event_types_index_key(currency: str) -> str:
+    """Set of event types present for a currency's probability keys."""
+    return f"probabilities_index:{currency.upper()}:event_types"
+
+
+def event_type_index_key(currency: str, event_type: str) -> str:
+    """Set of probability keys for one currency and event type.
+
+    Index keys live outside ``probabilities:{currency}:*`` so key scans and
+    :func:`parse_probability_key` never see them.
+    """
+    return f"probabilities_index:{currency.upper()}:event_type:{event_type}"
+
+
+def probability_frame_key(currency: str) -> str:
+    """Columnar probability frame written alongside ``probabilities:{currency}``."""
+    return f"probabilities_frame:{currency.upper()}"
+
+
 def parse_numeric_strike(strike_key: str) -> float:
     """Parse plain numeric strike."""
     try:
@@ -133,6 +152,9 @@ __all__ = [
     "strike_sort_key",
     "expiry_sort_key",
     "parse_probability_key",
+    "event_types_index_key",
+    "event_type_index_key",
+    "probability_frame_key",
     "parse_numeric_strike",
     "parse_greater_than_strike",
     "parse_less_than_strike",
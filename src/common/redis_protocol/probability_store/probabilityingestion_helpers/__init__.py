@@ -1,6 +1,7 @@
 """Helper modules for ProbabilityIngestion functionality."""
 
 from .compact_store import CompactStore
+from .event_type_index import EventTypeIndexer
 from .factory import IngestionHelpers, create_ingestion_helpers
 from .field_iterator import FieldIterator
 from .human_readable_store import HumanReadableStore
@@ -10,6 +11,7 @@ from .single_store import SingleStore
 
 __all__ = [
     "CompactStore",
+    "EventTypeIndexer",
     "FieldIterator",
     "HumanReadableIngestionStats",
     "HumanReadableStore",
@@ -7,6 +7,8 @@ from redis.asyncio import Redis
 
 from ...error_types import REDIS_ERRORS, SERIALIZATION_ERRORS
 from ..exceptions import ProbabilityStoreError
+from ..frame import build_probability_frame, encode_probability_frame, iter_frame_rows
+from ..keys import probability_frame_key
 from ..pipeline import create_pipeline, execute_pipeline
 from .field_iterator import FieldIterator
 
@@ -32,6 +34,9 @@ class CompactStore:
         """
         Store probabilities in compact format.
 
+        The columnar probability frame is rewritten in the same pipeline so it
+        never disagrees with the hash.
+
         Args:
             currency: Currency code (e.g., "BTC")
             probabilities_data: Nested dict of expiry -> strike -> data
@@ -44,6 +49,7 @@ class CompactStore:
         """
         currency_upper = currency.upper()
         key = f"probabilities:{currency_upper}"
+        frame_document = encode_probability_frame(build_probability_frame(iter_frame_rows(probabilities_data)))
 
         try:
             redis = await self._redis_provider()
@@ -55,6 +61,7 @@ class CompactStore:
                 key,
                 self._field_iterator.iter_probability_fields(probabilities_data),
             )
+            pipeline.set(probability_frame_key(currency_upper), frame_document)
 
             results = await execute_pipeline(pipeline)
             _validate_pipeline_results(results, stats["field_count"], currency_upper)
@@ -86,10 +93,13 @@ def _enqueue_probability_fields(pipeline, key: str, field_iterator):
 
 
 def _validate_pipeline_results(results, field_count: int, currency_upper: str) -> None:
-    expected_operations = 1 + field_count
+    # delete + one hset per field + frame set
+    expected_operations = 2 + field_count
     if len(results) != expected_operations:
         raise ProbabilityStoreError(f"Redis pipeline returned {len(results)} results; expected {expected_operations}")
-    successful_sets = sum(int(bool(res)) for res in results[1:])
+    if not results[-1]:
+        raise ProbabilityStoreError(f"Redis did not store the probability frame for {currency_upper}")
+    successful_sets = sum(int(bool(res)) for res in results[1:-1])
     if successful_sets != field_count:
         raise ProbabilityStoreError(
             "Redis stored {success} entries for {currency}; expected {expected}".format(
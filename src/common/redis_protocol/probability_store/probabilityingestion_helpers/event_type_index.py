@@ -0,0 +1,56 @@
+"""Secondary event-type index maintenance for probability ingestion."""
+
+import logging
+from typing import List, Mapping, Sequence
+
+from redis.asyncio import Redis
+
+from ...typing import ensure_awaitable
+from ..codec import decode_redis_key
+from ..keys import event_type_index_key, event_types_index_key
+
+logger = logging.getLogger(__name__)
+
+
+class EventTypeIndexer:
+    """Maintains per-currency event-type index sets alongside probability keys."""
+
+    async def collect_index_keys(self, redis: Redis, currency: str) -> List[str]:
+        """
+        Collect the index keys currently present for a currency.
+
+        Args:
+            redis: Redis client
+            currency: Currency code (e.g., "BTC")
+
+        Returns:
+            Per-event-type set keys plus the event-type set key, or empty if no index exists
+        """
+        types_key = event_types_index_key(currency)
+        members = await ensure_awaitable(redis.smembers(types_key))
+        if not members:
+            return []
+        return [event_type_index_key(currency, decode_redis_key(member)) for member in members] + [types_key]
+
+    def queue_index_updates(self, pipeline, currency: str, event_type_keys: Mapping[str, Sequence[str]]) -> int:
+        """
+        Queue SADD operations indexing probability keys by event type.
+
+        Args:
+            pipeline: Redis pipeline
+            currency: Currency code (e.g., "BTC")
+            event_type_keys: Mapping of event type -> probability keys
+
+        Returns:
+            Number of operations queued
+        """
+        operations = 0
+        for event_type, keys in event_type_keys.items():
+            if keys:
+                pipeline.sadd(event_type_index_key(currency, event_type), *keys)
+                operations += 1
+        if operations:
+            pipeline.sadd(event_types_index_key(currency), *[event_type for event_type, keys in event_type_keys.items() if keys])
+            operations += 1
+        logger.debug("Queued %s event type index updates for %s", operations, currency)
+        return operations
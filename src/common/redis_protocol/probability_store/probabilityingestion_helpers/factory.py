@@ -6,6 +6,7 @@ from typing import Awaitable, Callable
 from redis.asyncio import Redis
 
 from .compact_store import CompactStore
+from .event_type_index import EventTypeIndexer
 from .field_iterator import FieldIterator
 from .human_readable_store import HumanReadableStore
 from .key_collector import KeyCollector
@@ -19,6 +20,7 @@ class IngestionHelpers:
 
     field_iterator: FieldIterator
     key_collector: KeyCollector
+    event_type_indexer: EventTypeIndexer
     record_enqueuer: RecordEnqueuer
     compact_store: CompactStore
     human_readable_store: HumanReadableStore
@@ -37,6 +39,7 @@ def create_ingestion_helpers(redis_provider: Callable[[], Awaitable[Redis]]) ->
     """
     field_iterator = FieldIterator()
     key_collector = KeyCollector()
+    event_type_indexer = EventTypeIndexer()
     record_enqueuer = RecordEnqueuer()
 
     compact_store = CompactStore(
@@ -48,6 +51,7 @@ def create_ingestion_helpers(redis_provider: Callable[[], Awaitable[Redis]]) ->
         redis_provider=redis_provider,
         key_collector=key_collector,
         record_enqueuer=record_enqueuer,
+        event_type_indexer=event_type_indexer,
     )
 
     single_store = SingleStore(redis_provider=redis_provider)
@@ -55,6 +59,7 @@ def create_ingestion_helpers(redis_provider: Callable[[], Awaitable[Redis]]) ->
     return IngestionHelpers(
         field_iterator=field_iterator,
         key_collector=key_collector,
+        event_type_indexer=event_type_indexer,
         record_enqueuer=record_enqueuer,
         compact_store=compact_store,
         human_readable_store=human_readable_store,
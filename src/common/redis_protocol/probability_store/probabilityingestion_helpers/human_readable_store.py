@@ -1,7 +1,7 @@
 """Human-readable format probability storage."""
 
 import logging
-from typing import Awaitable, Callable, Dict
+from typing import Awaitable, Callable, Dict, Optional
 
 from redis.asyncio import Redis
 
@@ -10,6 +10,7 @@ from ..diagnostics import log_event_ticker_summary
 from ..exceptions import ProbabilityStoreError
 from ..pipeline import create_pipeline, execute_pipeline
 from ..verification import verify_probability_storage
+from .event_type_index import EventTypeIndexer
 from .key_collector import KeyCollector
 from .record_enqueuer import RecordEnqueuer
 
@@ -24,10 +25,12 @@ class HumanReadableStore:
         redis_provider: Callable[[], Awaitable[Redis]],
         key_collector: KeyCollector,
         record_enqueuer: RecordEnqueuer,
+        event_type_indexer: Optional[EventTypeIndexer] = None,
     ) -> None:
         self._redis_provider = redis_provider
         self._key_collector = key_collector
         self._record_enqueuer = record_enqueuer
+        self._event_type_indexer = event_type_indexer if event_type_indexer is not None else EventTypeIndexer()
 
     async def store_probabilities_human_readable(self, currency: str, probabilities_data: Dict[str, Dict[str, Dict[str, float]]]) -> bool:
         currency_upper = currency.upper()
@@ -47,6 +50,11 @@ class HumanReadableStore:
             logger.info("Deleting %s existing keys with prefix %s", len(keys_to_delete), prefix)
             self._key_collector.queue_probability_deletes(pipeline, keys_to_delete)
 
+        # The event-type index is rebuilt together with the keys it points at
+        index_keys = await self._event_type_indexer.collect_index_keys(redis, currency_upper)
+        if index_keys:
+            pipeline.delete(*index_keys)
+
         try:
             stats = self._record_enqueuer.enqueue_human_readable_records(
                 currency=currency_upper,
@@ -55,13 +63,14 @@ class HumanReadableStore:
                 sample_log_limit=5,
                 verification_sample_limit=4,
             )
+            index_operations = self._event_type_indexer.queue_index_updates(pipeline, currency_upper, stats.event_type_keys)
             logger.info(
                 "Executing Redis pipeline with %s hash updates for human-readable probabilities",
                 stats.field_count,
             )
             results = await execute_pipeline(pipeline)
 
-            expected_operations = len(keys_to_delete) + stats.field_count
+            expected_operations = len(keys_to_delete) + int(bool(index_keys)) + stats.field_count + index_operations
         except (
             ValueError,
             TypeError,
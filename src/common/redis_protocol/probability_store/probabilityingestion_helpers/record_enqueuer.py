@@ -2,7 +2,7 @@
 
 import logging
 from collections import Counter
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List
 
 from ...probability_payloads import build_probability_record
@@ -18,6 +18,7 @@ class HumanReadableIngestionStats:
     field_count: int
     sample_keys: List[str]
     event_ticker_counts: Counter[str]
+    event_type_keys: Dict[str, List[str]] = field(default_factory=dict)
 
 
 class RecordEnqueuer:
@@ -49,6 +50,7 @@ class RecordEnqueuer:
         field_count = 0
         sample_keys: List[str] = []
         event_ticker_counts: Counter[str] = Counter()
+        event_type_keys: Dict[str, List[str]] = {}
 
         for expiry, strikes_data in probabilities_data.items():
             for strike_val, raw_data in strikes_data.items():
@@ -82,8 +84,13 @@ class RecordEnqueuer:
                 if record.event_ticker:
                     event_ticker_counts[record.event_ticker] += 1
 
+                event_type = record.fields.get("event_type")
+                if event_type and event_type != "null":
+                    event_type_keys.setdefault(event_type, []).append(record.key)
+
         return HumanReadableIngestionStats(
             field_count=field_count,
             sample_keys=sample_keys,
             event_ticker_counts=event_ticker_counts,
+            event_type_keys=event_type_keys,
         )
@@ -5,6 +5,7 @@ from .event_ticker_lookup import get_event_ticker_for_key
 from .event_type_enumeration import get_all_event_types
 from .event_type_filtering import filter_keys_by_event_type, get_probabilities_by_event_type
 from .factory import ProbabilityRetrievalComponents
+from .frame_retrieval import get_probability_frame
 from .grouped_retrieval import get_probabilities_grouped_by_event_type
 from .human_readable_retrieval import get_probabilities_human_readable
 from .single_probability_retrieval import get_probability_data
@@ -17,6 +18,7 @@ from .sorting_helpers import (
 __all__ = [
     "get_probabilities",
     "get_probabilities_human_readable",
+    "get_probability_frame",
     "get_probability_data",
     "get_probabilities_grouped_by_event_type",
     "get_all_event_types",
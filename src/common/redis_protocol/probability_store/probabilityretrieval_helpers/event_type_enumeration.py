@@ -4,7 +4,7 @@ from __future__ import annotations
 
 
 import logging
-from typing import List
+from typing import Any, Iterable, List, Set
 
 from redis.asyncio import Redis
 
@@ -12,6 +12,8 @@ from ...error_types import REDIS_ERRORS
 from ...typing import ensure_awaitable
 from ..codec import decode_redis_key
 from ..exceptions import ProbabilityDataNotFoundError, ProbabilityStoreError
+from ..keys import event_types_index_key
+from .event_type_filtering import scan_currency_keys
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +21,9 @@ logger = logging.getLogger(__name__)
 async def get_all_event_types(redis: Redis, currency: str) -> List[str]:
     """Get all unique event types for a currency.
 
+    Reads the event-type index set written at ingestion; falls back to a
+    SCAN with one pipelined HGET batch when no index exists.
+
     Args:
         redis: Redis client
         currency: Currency code (e.g., "BTC", "ETH")
@@ -31,31 +36,43 @@ async def get_all_event_types(redis: Redis, currency: str) -> List[str]:
         ProbabilityStoreError: Redis error or no event types found
     """
     currency_upper = currency.upper()
-    prefix = f"probabilities:{currency_upper}:"
 
     try:
-        raw_keys = await redis.keys(f"{prefix}*")
+        indexed = await ensure_awaitable(redis.smembers(event_types_index_key(currency_upper)))
+        event_types = _valid_event_types(indexed)
+        if not event_types:
+            # No index yet (data written before indexing): scan and pipeline the lookups
+            keys = [decode_redis_key(raw_key) for raw_key in await scan_currency_keys(redis, currency_upper)]
     except REDIS_ERRORS as exc:
         raise ProbabilityStoreError(f"Failed to enumerate event types for {currency_upper}: Redis error {exc}") from exc
 
-    if not raw_keys:
+    if event_types:
+        return sorted(event_types)
+    if not keys:
         raise ProbabilityDataNotFoundError(currency_upper, "event types")
 
-    event_types = set()
-    for raw_key in raw_keys:
-        key = decode_redis_key(raw_key)
-        value = await ensure_awaitable(redis.hget(key, "event_type"))
-        if not value:
-            continue
-        decoded = decode_redis_key(value)
-        if decoded == "null":
-            continue
-        event_types.add(decoded)
+    pipe = redis.pipeline()
+    for key in keys:
+        pipe.hget(key, "event_type")
+    values = await ensure_awaitable(pipe.execute())
 
+    event_types = _valid_event_types(values)
     if not event_types:
         raise ProbabilityStoreError(f"No event types found for {currency_upper}")
 
     return sorted(event_types)
 
 
+def _valid_event_types(raw_values: Iterable[Any]) -> Set[str]:
+    event_types: Set[str] = set()
+    for raw_value in raw_values or ():
+        if not raw_value:
+            continue
+        decoded = decode_redis_key(raw_value)
+        if decoded == "null":
+            continue
+        event_types.add(decoded)
+    return event_types
+
+
 __all__ = ["get_all_event_types"]
@@ -3,7 +3,7 @@ from __future__ import annotations
 """Event type filtering operations."""
 
 import logging
-from typing import Any, Iterable, List
+from typing import Any, Iterable, List, Tuple
 
 from redis.asyncio import Redis
 
@@ -12,7 +12,7 @@ from ...typing import ensure_awaitable
 from ..codec import decode_probability_hash, decode_redis_key
 from ..diagnostics import log_event_type_summary
 from ..exceptions import ProbabilityStoreError
-from ..keys import parse_probability_key
+from ..keys import event_type_index_key, parse_probability_key
 from .sorting_helpers import (
     ProbabilityByExpiryGrouped,
     sort_probabilities_by_expiry_and_strike_grouped,
@@ -24,6 +24,10 @@ logger = logging.getLogger(__name__)
 async def get_probabilities_by_event_type(redis: Redis, currency: str, event_type: str) -> ProbabilityByExpiryGrouped:
     """Get probabilities filtered by event type.
 
+    Reads the event-type index set written at ingestion and fetches every
+    hash in one pipelined batch; falls back to a SCAN plus filter when no
+    index exists.
+
     Args:
         redis: Redis client
         currency: Currency code (e.g., "BTC", "ETH")
@@ -37,20 +41,8 @@ async def get_probabilities_by_event_type(redis: Redis, currency: str, event_typ
         ProbabilityStoreError: Redis error or no data found for event type
     """
     currency_upper = currency.upper()
-    prefix = f"probabilities:{currency_upper}:"
-
-    try:
-        raw_keys: list = []
-        scan_cursor = 0
-        while True:
-            scan_cursor, batch = await ensure_awaitable(redis.scan(scan_cursor, match=f"{prefix}*", count=500))
-            raw_keys.extend(batch)
-            if scan_cursor == 0:
-                break
-    except REDIS_ERRORS as exc:
-        raise ProbabilityStoreError(f"Failed to fetch event type {event_type} for {currency_upper}: Redis error {exc}") from exc
 
-    keys = await filter_keys_by_event_type(redis, raw_keys, event_type)
+    keys, from_index = await _resolve_event_type_keys(redis, currency_upper, event_type)
     if not keys:
         raise ProbabilityStoreError(f"No data found for event type '{event_type}' for {currency_upper}")
 
@@ -60,6 +52,11 @@ async def get_probabilities_by_event_type(redis: Redis, currency: str, event_typ
         pipe.hgetall(key)
     all_data = await ensure_awaitable(pipe.execute())
 
+    if from_index:
+        keys, all_data = _drop_stale_index_entries(keys, all_data, event_type)
+        if not keys:
+            raise ProbabilityStoreError(f"No data found for event type '{event_type}' for {currency_upper}")
+
     result: ProbabilityByExpiryGrouped = {}
     for key, data in zip(keys, all_data):
         expiry, strike_type, strike = parse_probability_key(key)
@@ -87,6 +84,45 @@ async def get_probabilities_by_event_type(redis: Redis, currency: str, event_typ
     return sorted_result
 
 
+async def _resolve_event_type_keys(redis: Redis, currency_upper: str, event_type: str) -> Tuple[List[str], bool]:
+    """Return the keys for an event type and whether they came from the index."""
+    try:
+        indexed = await ensure_awaitable(redis.smembers(event_type_index_key(currency_upper, event_type)))
+        if indexed:
+            return sorted(decode_redis_key(member) for member in indexed), True
+        # No index yet (data written before indexing): scan and filter
+        raw_keys = await scan_currency_keys(redis, currency_upper)
+    except REDIS_ERRORS as exc:
+        raise ProbabilityStoreError(f"Failed to fetch event type {event_type} for {currency_upper}: Redis error {exc}") from exc
+    return await filter_keys_by_event_type(redis, raw_keys, event_type), False
+
+
+async def scan_currency_keys(redis: Redis, currency_upper: str) -> List[Any]:
+    """SCAN all per-strike probability keys for a currency."""
+    raw_keys: list = []
+    scan_cursor = 0
+    while True:
+        scan_cursor, batch = await ensure_awaitable(redis.scan(scan_cursor, match=f"probabilities:{currency_upper}:*", count=500))
+        raw_keys.extend(batch)
+        if scan_cursor == 0:
+            break
+    return raw_keys
+
+
+def _drop_stale_index_entries(keys: List[str], all_data: List[Any], event_type: str) -> Tuple[List[str], List[Any]]:
+    """Skip indexed keys that were deleted or re-typed since the index was written."""
+    kept_keys: List[str] = []
+    kept_data: List[Any] = []
+    for key, data in zip(keys, all_data):
+        stored_event_type = data.get("event_type", data.get(b"event_type")) if data else None
+        if not stored_event_type or decode_redis_key(stored_event_type) != event_type:
+            logger.debug("Skipping stale event type index entry %s", key)
+            continue
+        kept_keys.append(key)
+        kept_data.append(data)
+    return kept_keys, kept_data
+
+
 async def filter_keys_by_event_type(redis: Redis, raw_keys: Iterable[Any], event_type: str) -> List[str]:
     """Filter Redis keys by event_type field.
 
@@ -115,4 +151,4 @@ async def filter_keys_by_event_type(redis: Redis, raw_keys: Iterable[Any], event
     return matched
 
 
-__all__ = ["get_probabilities_by_event_type", "filter_keys_by_event_type"]
+__all__ = ["get_probabilities_by_event_type", "filter_keys_by_event_type", "scan_currency_keys"]
@@ -12,6 +12,7 @@ from . import (
     event_ticker_lookup,
     event_type_enumeration,
     event_type_filtering,
+    frame_retrieval,
     grouped_retrieval,
     human_readable_retrieval,
     single_probability_retrieval,
@@ -32,6 +33,11 @@ class ProbabilityRetrievalComponents:
         redis = await self._redis_provider()
         return await basic_retrieval.get_probabilities(redis, currency)
 
+    async def get_probability_frame(self, currency: str):
+        """Delegate to frame_retrieval.get_probability_frame."""
+        redis = await self._redis_provider()
+        return await frame_retrieval.get_probability_frame(redis, currency)
+
     async def get_probabilities_human_readable(self, currency: str):
         """Delegate to human_readable_retrieval.get_probabilities_human_readable."""
         redis = await self._redis_provider()
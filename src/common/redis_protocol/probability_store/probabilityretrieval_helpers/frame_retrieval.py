@@ -0,0 +1,52 @@
+"""Columnar probability frame retrieval."""
+
+import logging
+
+from redis.asyncio import Redis
+
+from ...error_types import REDIS_ERRORS
+from ...typing import ensure_awaitable
+from ..exceptions import ProbabilityDataNotFoundError, ProbabilityStoreError
+from ..frame import ProbabilityFrame, build_probability_frame, decode_probability_frame, iter_frame_rows
+from ..keys import probability_frame_key
+from .basic_retrieval import get_probabilities
+
+logger = logging.getLogger(__name__)
+
+
+async def get_probability_frame(redis: Redis, currency: str) -> ProbabilityFrame:
+    """Get all probabilities for a currency as sorted NumPy columns.
+
+    Reads the columnar frame written by compact ingestion.  Data stored before
+    the frame existed is rebuilt from the `probabilities:{CURRENCY}` hash.
+
+    Args:
+        redis: Redis client
+        currency: Currency code (e.g., "BTC", "ETH")
+
+    Returns:
+        ProbabilityFrame sorted by expiry (chronological) then strike
+
+    Raises:
+        ProbabilityDataNotFoundError: No data found for currency
+        ProbabilityStoreError: Redis error or malformed frame
+    """
+    currency_upper = currency.upper()
+    key = probability_frame_key(currency_upper)
+
+    try:
+        raw_frame = await ensure_awaitable(redis.get(key))
+    except REDIS_ERRORS as exc:
+        raise ProbabilityStoreError(f"Failed to get probability frame for {currency_upper}: Redis error {exc}") from exc
+
+    if raw_frame is None:
+        logger.debug("No probability frame at %s; rebuilding from hash", key)
+        return build_probability_frame(iter_frame_rows(await get_probabilities(redis, currency_upper)))
+
+    frame = decode_probability_frame(raw_frame)
+    if not len(frame):
+        raise ProbabilityDataNotFoundError(currency_upper)
+    return frame
+
+
+__all__ = ["get_probability_frame"]
@@ -13,6 +13,7 @@ from .exceptions import (
     ProbabilityStoreError,
     ProbabilityStoreInitializationError,
 )
+from .frame import ProbabilityFrame
 from .ingestion import ProbabilityIngestion
 from .probability_data_config import ProbabilityData
 from .probabilityretrieval_helpers.factory import ProbabilityRetrievalComponents
@@ -69,6 +70,10 @@ class ProbabilityStore:
     async def get_probabilities(self, currency: str) -> Dict[str, Dict[str, Dict[str, Union[str, float]]]]:
         return await self._retrieval.get_probabilities(currency)
 
+    async def get_probability_frame(self, currency: str) -> ProbabilityFrame:
+        """Return all probabilities for a currency as sorted NumPy columns."""
+        return await self._retrieval.get_probability_frame(currency)
+
     async def get_probabilities_human_readable(self, currency: str) -> Dict[str, Dict[str, ProbabilityByStrikeType]]:
         return await self._retrieval.get_probabilities_human_readable(currency)
 
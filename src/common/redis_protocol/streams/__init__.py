@@ -1,5 +1,6 @@
 """Redis Streams infrastructure for persistent message delivery."""
 
+from .codec import BINARY_MESSAGE_FIELD, decode_stream_message, encode_stream_message
 from .constants import (
     ALGO_EVENT_STREAM_PREFIX,
     ALL_ALGO_EVENT_STREAMS,
@@ -27,12 +28,15 @@ from .constants import (
 from .consumer_group import claim_pending_entries, ensure_consumer_group, reset_group_position
 from .hybrid_runner import HybridConfig, run_hybrid_mode
 from .message_decoder import decode_stream_response
+from .multiplexed_subscriber import MultiplexedStreamSubscriber
 from .publisher import stream_publish
-from .subscriber import MessageHandler, RedisStreamSubscriber, StreamConfig, SubscriberHealthInfo
+from .subscriber import MessageHandler, RedisStreamSubscriber, StreamConfig, StreamRecoveryMode, SubscriberHealthInfo
+from .subscriber_helpers.sharding import offload_handler
 
 __all__ = [
     "ALGO_EVENT_STREAM_PREFIX",
     "ALL_ALGO_EVENT_STREAMS",
+    "BINARY_MESSAGE_FIELD",
     "CLOSE_POSITIONS_STREAM",
     "CROSSARB_CONSUMER_GROUP",
     "DERIBIT_MARKET_STREAM",
@@ -43,6 +47,7 @@ __all__ = [
     "MONITOR_MARKET_CONSUMER_GROUP",
     "MONITOR_PRICE_ALERT_DERIBIT_CONSUMER_GROUP",
     "MessageHandler",
+    "MultiplexedStreamSubscriber",
     "PDF_CONSUMER_GROUP",
     "PENDING_CLAIM_IDLE_MS",
     "POLY_MARKET_STREAM",
@@ -54,12 +59,16 @@ __all__ = [
     "SIGNALS_STRUCTURE_CONSUMER_GROUP",
     "STREAM_DEFAULT_MAXLEN",
     "StreamConfig",
+    "StreamRecoveryMode",
     "SubscriberHealthInfo",
     "TRACKER_CONSUMER_GROUP",
     "TRADE_EVENTS_STREAM",
     "algo_event_stream",
     "claim_pending_entries",
+    "decode_stream_message",
     "decode_stream_response",
+    "encode_stream_message",
+    "offload_handler",
     "ensure_consumer_group",
     "reset_group_position",
     "run_hybrid_mode",
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, List, Tuple
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 from ..retry import RedisFatalError
 from ..typing import ensure_awaitable
+from .codec import binary_message_value, decode_stream_message
 from .constants import PENDING_CLAIM_IDLE_MS, XAUTOCLAIM_MIN_RESULT_LENGTH
 
 if TYPE_CHECKING:
@@ -77,28 +78,54 @@ async def claim_pending_entries(
     Uses XAUTOCLAIM to take ownership of entries that a previous consumer
     abandoned (e.g., after a crash). Returns list of (entry_id, fields) tuples.
     """
-    result: Any = await ensure_awaitable(
-        redis_client.xautoclaim(stream, group, consumer, min_idle_time=idle_ms, start_id="0-0"),
-    )
+    _next_cursor, claimed, _deleted = await claim_pending_page(redis_client, stream, group, consumer, idle_ms=idle_ms)
+    if claimed:
+        logger.info("Claimed %d pending entries from %s/%s", len(claimed), stream, group)
+    return claimed
+
+
+async def claim_pending_page(
+    redis_client: "Redis",
+    stream: str,
+    group: str,
+    consumer: str,
+    *,
+    idle_ms: int = PENDING_CLAIM_IDLE_MS,
+    start_id: str = "0-0",
+    count: Optional[int] = None,
+) -> Tuple[str, List[Tuple[str, dict]], int]:
+    """Claim one XAUTOCLAIM page starting at ``start_id``.
+
+    Returns ``(next_cursor, entries, deleted_count)``; a ``next_cursor`` of
+    ``"0-0"`` means the pending entry list has been fully scanned.  Entries
+    deleted or trimmed from the stream are dropped from the PEL by Redis and
+    only counted, so a page may be empty while the scan is still incomplete.
+    """
+    kwargs: dict[str, Any] = {"min_idle_time": idle_ms, "start_id": start_id}
+    if count is not None:
+        kwargs["count"] = count
+    result: Any = await ensure_awaitable(redis_client.xautoclaim(stream, group, consumer, **kwargs))
     # XAUTOCLAIM returns (next_start_id, [(id, fields), ...], deleted_ids)
     if not result or len(result) < XAUTOCLAIM_MIN_RESULT_LENGTH:
-        return []
+        return "0-0", [], 0
 
-    entries = result[1]
+    next_cursor = result[0].decode("utf-8") if isinstance(result[0], bytes) else str(result[0])
     claimed: List[Tuple[str, dict]] = []
-    for entry_id, fields in entries:
+    for entry_id, fields in result[1]:
         decoded_id = entry_id.decode("utf-8") if isinstance(entry_id, bytes) else entry_id
-        decoded_fields = _decode_fields(fields)
-        claimed.append((decoded_id, decoded_fields))
-
-    if claimed:
-        logger.info("Claimed %d pending entries from %s/%s", len(claimed), stream, group)
-    return claimed
+        claimed.append((decoded_id, _decode_fields(fields)))
+    deleted_count = len(result[2]) if len(result) > XAUTOCLAIM_MIN_RESULT_LENGTH and result[2] else 0
+    return next_cursor, claimed, deleted_count
 
 
 def _decode_fields(fields: Any) -> dict:
-    """Decode bytes keys/values to strings."""
+    """Decode bytes keys/values to strings, unpacking binary-codec messages."""
     if isinstance(fields, dict):
+        raw = binary_message_value(fields)
+        if raw is not None:
+            decoded = decode_stream_message(raw)
+            if decoded is not None:
+                return decoded
         return {
             (k.decode("utf-8") if isinstance(k, bytes) else k): (v.decode("utf-8") if isinstance(v, bytes) else v)
             for k, v in fields.items()
@@ -122,4 +149,4 @@ async def reset_group_position(
     logger.info("Reset group %s position to latest on stream %s", group, stream)
 
 
-__all__ = ["claim_pending_entries", "ensure_consumer_group", "reset_group_position"]
+__all__ = ["claim_pending_entries", "claim_pending_page", "ensure_consumer_group", "reset_group_position"]
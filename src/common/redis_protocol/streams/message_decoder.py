@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, List, Tuple
+from typing import Any, Dict, List, Tuple
+
+from .codec import binary_message_value, decode_stream_message
 
 
 def decode_stream_response(result: Any) -> List[Tuple[str, dict]]:
@@ -12,7 +14,8 @@ def decode_stream_response(result: Any) -> List[Tuple[str, dict]]:
         [[stream_name, [(entry_id, {field: value}), ...]], ...]
 
     Each entry_id and field key/value may be bytes or str depending on
-    the Redis client's decode_responses setting.
+    the Redis client's decode_responses setting.  Binary-codec entries are
+    decoded in one call; see :func:`decode_entry_fields`.
     """
     if not result:
         return []
@@ -20,12 +23,43 @@ def decode_stream_response(result: Any) -> List[Tuple[str, dict]]:
     entries: List[Tuple[str, dict]] = []
     for _stream_name, stream_entries in result:
         for entry_id, fields in stream_entries:
-            decoded_id = _to_str(entry_id)
-            decoded_fields = {_to_str(k): _to_str(v) for k, v in fields.items()}
-            entries.append((decoded_id, decoded_fields))
+            entries.append((_to_str(entry_id), decode_entry_fields(fields)))
     return entries
 
 
+def decode_stream_response_by_stream(result: Any) -> Dict[str, List[Tuple[str, dict]]]:
+    """Convert a multi-stream XREADGROUP response to ``{stream: [(entry_id, fields), ...]}``.
+
+    Used when one XREADGROUP call names several streams, so entries can be
+    routed back to the stream they were read from.
+    """
+    if not result:
+        return {}
+
+    by_stream: Dict[str, List[Tuple[str, dict]]] = {}
+    for stream_name, stream_entries in result:
+        entries = by_stream.setdefault(_to_str(stream_name), [])
+        for entry_id, fields in stream_entries:
+            entries.append((_to_str(entry_id), decode_entry_fields(fields)))
+    return by_stream
+
+
+def decode_entry_fields(fields: Any) -> dict:
+    """Decode one entry's fields, unpacking binary-codec messages.
+
+    Entries published with ``stream_publish(..., binary=True)`` carry a single
+    version-tagged field that decodes straight to typed values.  Legacy
+    entries, and binary entries that fail to decode, get per-field str
+    decoding.
+    """
+    raw = binary_message_value(fields)
+    if raw is not None:
+        decoded = decode_stream_message(raw)
+        if decoded is not None:
+            return decoded
+    return {_to_str(k): _to_str(v) for k, v in fields.items()}
+
+
 def _to_str(value: Any) -> str:
     """Convert bytes to str, pass through str values."""
     if isinstance(value, bytes):
@@ -33,4 +67,4 @@ def _to_str(value: Any) -> str:
     return str(value)
 
 
-__all__ = ["decode_stream_response"]
+__all__ = ["decode_entry_fields", "decode_stream_response", "decode_stream_response_by_stream"]
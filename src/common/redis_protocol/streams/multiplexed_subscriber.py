@@ -0,0 +1,126 @@
+"""Multiplexed Redis Streams subscriber.
+
+Follows many streams with one blocking XREADGROUP per consumer group
+instead of one blocked connection per stream.  Each stream keeps its own
+:class:`RedisStreamSubscriber` (queue, consumers, ACK/retry handling), only
+the reading is shared.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from .subscriber import MessageHandler, RedisStreamSubscriber, StreamConfig, SubscriberHealthInfo
+from .subscriber_helpers.lifecycle import cancel_tasks
+from .subscriber_helpers.reader import StreamRoute, multi_stream_read_loop
+
+logger = logging.getLogger(__name__)
+
+
+class MultiplexedStreamSubscriber:
+    """Read several Redis streams through shared XREADGROUP calls.
+
+    Streams are grouped by ``(group_name, consumer_name)`` since one
+    XREADGROUP can only name a single group and consumer; every group gets
+    one reader task.  Entries are routed to the per-stream queues, so
+    ``queue_size``, ``num_consumers``, ``coalesce`` and handler settings of
+    each :class:`StreamConfig` still apply.
+    """
+
+    def __init__(self, redis_client: Any, *, subscriber_name: str = "multiplexed-subscriber") -> None:
+        self._redis_client = redis_client
+        self._subscriber_name = subscriber_name
+        self._subscribers: Dict[str, RedisStreamSubscriber] = {}
+        self._reader_tasks: List[asyncio.Task[None]] = []
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        """Whether the subscriber is running."""
+        return self._running
+
+    @property
+    def subscribers(self) -> Dict[str, RedisStreamSubscriber]:
+        """Per-stream subscribers keyed by stream name."""
+        return dict(self._subscribers)
+
+    @property
+    def reader_tasks(self) -> List[asyncio.Task[None]]:
+        """Expose shared reader tasks for health monitoring."""
+        return self._reader_tasks
+
+    def add_stream(self, config: StreamConfig, on_message: MessageHandler) -> RedisStreamSubscriber:
+        """Register a stream and its handler; must be called before :meth:`start`."""
+        if self._running:
+            raise RuntimeError(f"{self._subscriber_name} is already running; add streams before start()")
+        if config.stream_name in self._subscribers:
+            raise ValueError(f"Stream {config.stream_name} is already registered with {self._subscriber_name}")
+        subscriber = RedisStreamSubscriber(
+            self._redis_client,
+            on_message,
+            config=config,
+            subscriber_name=f"{self._subscriber_name}[{config.stream_name}]",
+        )
+        self._subscribers[config.stream_name] = subscriber
+        return subscriber
+
+    def get_subscriber(self, stream_name: str) -> Optional[RedisStreamSubscriber]:
+        """Return the subscriber registered for ``stream_name``, if any."""
+        return self._subscribers.get(stream_name)
+
+    def health_info(self) -> Dict[str, SubscriberHealthInfo]:
+        """Return per-stream health snapshots keyed by stream name."""
+        return {stream: subscriber.health_info() for stream, subscriber in self._subscribers.items()}
+
+    async def start(self) -> None:
+        """Start all per-stream consumers and the shared reader tasks."""
+        if self._running:
+            return
+        if not self._subscribers:
+            raise ValueError(f"{self._subscriber_name} has no streams registered")
+
+        for subscriber in self._subscribers.values():
+            await subscriber.start(external_reader=True)
+
+        self._running = True
+        for (group, consumer), routes in self._routes_by_group().items():
+            self._reader_tasks.append(
+                asyncio.create_task(
+                    multi_stream_read_loop(
+                        lambda: self._running,
+                        self._redis_client,
+                        group,
+                        consumer,
+                        routes,
+                        self._subscriber_name,
+                    ),
+                    name=f"{self._subscriber_name}-reader-{group}",
+                )
+            )
+        logger.info(
+            "%s started on %d streams with %d reader(s)",
+            self._subscriber_name,
+            len(self._subscribers),
+            len(self._reader_tasks),
+        )
+
+    async def stop(self) -> None:
+        """Stop the shared readers and every per-stream subscriber."""
+        self._running = False
+        await cancel_tasks(self._reader_tasks)
+        self._reader_tasks = []
+        for subscriber in self._subscribers.values():
+            await subscriber.stop()
+        logger.info("%s stopped", self._subscriber_name)
+
+    def _routes_by_group(self) -> Dict[Tuple[str, str], Dict[str, StreamRoute]]:
+        grouped: Dict[Tuple[str, str], Dict[str, StreamRoute]] = {}
+        for stream, subscriber in self._subscribers.items():
+            config = subscriber.config
+            grouped.setdefault((config.group_name, config.consumer_name), {})[stream] = (config, subscriber.queue)
+        return grouped
+
+
+__all__ = ["MultiplexedStreamSubscriber"]
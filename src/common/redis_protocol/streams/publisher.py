@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any, Dict
 from redis.typing import EncodableT, FieldT
 
 from ..typing import ensure_awaitable
+from .codec import BINARY_MESSAGE_FIELD, encode_stream_message
 from .constants import STREAM_DEFAULT_MAXLEN
 
 if TYPE_CHECKING:
@@ -22,23 +23,30 @@ async def stream_publish(
     fields: Dict[str, Any],
     *,
     maxlen: int = STREAM_DEFAULT_MAXLEN,
+    binary: bool = False,
 ) -> str:
     """Publish a message to a Redis stream.
 
-    All field values are converted to strings (Redis stream requirement).
+    All field values are converted to strings (Redis stream requirement),
+    unless ``binary`` is set, in which case the whole message is stored as
+    one version-tagged orjson field (see :mod:`.codec`).  Subscribers decode
+    both formats.
 
     Args:
         redis_client: Async Redis client.
         stream_name: Target stream name.
         fields: Message fields (values will be str-coerced).
         maxlen: Approximate max stream length for trimming.
+        binary: Encode the message with the binary codec.
 
     Returns:
         The entry ID assigned by Redis.
     """
-    str_fields: Dict[FieldT, EncodableT] = {
-        k: v if isinstance(v, (str, bytes, int, float, memoryview)) else str(v) for k, v in fields.items() if v is not None
-    }
+    str_fields: Dict[FieldT, EncodableT]
+    if binary:
+        str_fields = {BINARY_MESSAGE_FIELD: encode_stream_message(fields)}
+    else:
+        str_fields = {k: v if isinstance(v, (str, bytes, int, float, memoryview)) else str(v) for k, v in fields.items() if v is not None}
 
     entry_id: str = await ensure_awaitable(
         redis_client.xadd(stream_name, str_fields, maxlen=maxlen, approximate=True),
@@ -10,6 +10,7 @@ import asyncio
 import logging
 import time
 from dataclasses import dataclass
+from enum import Enum
 from typing import Any, Awaitable, Callable, Optional, Tuple, Union
 
 from .consumer_group import reset_group_position
@@ -17,9 +18,11 @@ from .subscriber_helpers.consumer import MAX_STREAM_RETRIES, consume_stream_queu
 from .subscriber_helpers.lifecycle import cancel_task, cancel_tasks, send_stop_sentinels
 from .subscriber_helpers.reader import stream_read_loop
 from .subscriber_helpers.recovery import (
+    collect_replay_entries,
     discard_all_pending,
     initialize_consumer_group,
 )
+from .subscriber_helpers.sharding import ShardedQueue
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +34,19 @@ _DEFAULT_QUEUE_SIZE = 10000
 _DEFAULT_NUM_CONSUMERS = 1
 
 
+class StreamRecoveryMode(str, Enum):
+    """How a subscriber treats unACKed and unread entries on start.
+
+    DISCARD ACKs the pending entry list and jumps to the stream tail, so
+    only messages published after start are seen.  REPLAY dispatches the
+    pending entry list and the backlog since the last delivered entry,
+    coalesced to the latest message per ``identifier_field``.
+    """
+
+    DISCARD = "discard"
+    REPLAY = "replay"
+
+
 @dataclass
 class StreamConfig:
     """Configuration for a stream subscriber."""
@@ -46,6 +62,8 @@ class StreamConfig:
     coalesce: bool = False
     max_concurrent_dispatches: int = 1
     handler_timeout_s: float = 0
+    recovery_mode: StreamRecoveryMode = StreamRecoveryMode.DISCARD
+    shard_by_identifier: bool = False
 
 
 @dataclass
@@ -57,13 +75,17 @@ class SubscriberHealthInfo:
     queue_size: int
     queue_maxsize: int
     running: bool
+    shard_queue_sizes: Tuple[int, ...] = ()
 
 
 class RedisStreamSubscriber:
     """Generic Redis Streams subscriber with consumer group support.
 
     Uses an internal asyncio.Queue to decouple stream reading from
-    message processing.
+    message processing.  With ``shard_by_identifier`` the queue is split into
+    ``num_consumers`` shards keyed by identifier hash, one consumer each, so
+    entries for one identifier are handled in order while different
+    identifiers are handled in parallel.
     """
 
     def __init__(
@@ -81,7 +103,11 @@ class RedisStreamSubscriber:
         self._running = False
         self._reader_task: Optional[asyncio.Task[None]] = None
         self._consumer_tasks: list[asyncio.Task[None]] = []
-        self._queue: asyncio.Queue[Union[Tuple[str, str, dict], None]] = asyncio.Queue(maxsize=config.queue_size)
+        self._queue: Union[asyncio.Queue[Union[Tuple[str, str, dict], None]], ShardedQueue]
+        if config.shard_by_identifier:
+            self._queue = ShardedQueue(config.num_consumers, config.queue_size)
+        else:
+            self._queue = asyncio.Queue(maxsize=config.queue_size)
         self._retry_counts: dict[str, int] = {}
         self._last_processed_time: float = 0.0
         self._messages_processed: int = 0
@@ -91,6 +117,16 @@ class RedisStreamSubscriber:
         """Whether the subscriber is running."""
         return self._running
 
+    @property
+    def config(self) -> StreamConfig:
+        """Stream configuration this subscriber was created with."""
+        return self._config
+
+    @property
+    def queue(self) -> Union[asyncio.Queue[Union[Tuple[str, str, dict], None]], ShardedQueue]:
+        """Queue feeding the consumer tasks, filled by the reader."""
+        return self._queue
+
     @property
     def reader_task(self) -> Optional[asyncio.Task[None]]:
         """Expose underlying reader task for health monitoring."""
@@ -109,6 +145,7 @@ class RedisStreamSubscriber:
             queue_size=self._queue.qsize(),
             queue_maxsize=self._queue.maxsize,
             running=self._running,
+            shard_queue_sizes=self._queue.shard_sizes() if isinstance(self._queue, ShardedQueue) else (),
         )
 
     def record_processed(self) -> None:
@@ -116,8 +153,12 @@ class RedisStreamSubscriber:
         self._last_processed_time = time.monotonic()
         self._messages_processed += 1
 
-    async def start(self) -> None:
-        """Start the stream subscriber."""
+    async def start(self, *, external_reader: bool = False) -> None:
+        """Start the stream subscriber.
+
+        With ``external_reader`` no read loop is started; another reader
+        (e.g. :class:`MultiplexedStreamSubscriber`) fills :attr:`queue`.
+        """
         if self._running:
             return
 
@@ -127,27 +168,22 @@ class RedisStreamSubscriber:
             self._config.group_name,
         )
 
-        discarded = await discard_all_pending(
-            self._redis_client,
-            self._config.stream_name,
-            self._config.group_name,
-            self._config.consumer_name,
-        )
-        if discarded:
-            logger.info("%s discarded %d stale pending entries", self._subscriber_name, discarded)
-
-        await reset_group_position(
-            self._redis_client,
-            self._config.stream_name,
-            self._config.group_name,
-        )
+        replay: list[Tuple[str, str, dict]] = []
+        if self._config.recovery_mode == StreamRecoveryMode.REPLAY:
+            replay = await collect_replay_entries(self._redis_client, self._config, self._subscriber_name)
+        else:
+            await self._discard_backlog()
 
         self._running = True
-        self._reader_task = asyncio.create_task(self._read_loop(), name=f"{self._subscriber_name}-reader")
         self._consumer_tasks = [
-            asyncio.create_task(self._consume_queue(), name=f"{self._subscriber_name}-consumer-{i}")
-            for i in range(self._config.num_consumers)
+            asyncio.create_task(self._consume_queue(queue), name=f"{self._subscriber_name}-consumer-{i}")
+            for i, queue in enumerate(self._consumer_queues())
         ]
+        # Consumers are already draining, so a replay larger than queue_size cannot deadlock
+        for entry in replay:
+            await self._queue.put(entry)
+        if not external_reader:
+            self._reader_task = asyncio.create_task(self._read_loop(), name=f"{self._subscriber_name}-reader")
         logger.info(
             "%s started on stream %s (group=%s, consumer=%s)",
             self._subscriber_name,
@@ -159,7 +195,12 @@ class RedisStreamSubscriber:
     async def stop(self) -> None:
         """Stop the stream subscriber and clean up."""
         self._running = False
-        send_stop_sentinels(self._queue, len(self._consumer_tasks), self._subscriber_name)
+        if isinstance(self._queue, ShardedQueue):
+            if self._consumer_tasks:
+                for shard in self._queue.shards:
+                    send_stop_sentinels(shard, 1, self._subscriber_name)
+        else:
+            send_stop_sentinels(self._queue, len(self._consumer_tasks), self._subscriber_name)
         await cancel_task(self._reader_task)
         self._reader_task = None
         await cancel_tasks(self._consumer_tasks)
@@ -167,6 +208,23 @@ class RedisStreamSubscriber:
         self._retry_counts.clear()
         logger.info("%s stopped", self._subscriber_name)
 
+    async def _discard_backlog(self) -> None:
+        """ACK every pending entry and move the group to the stream tail."""
+        discarded = await discard_all_pending(
+            self._redis_client,
+            self._config.stream_name,
+            self._config.group_name,
+            self._config.consumer_name,
+        )
+        if discarded:
+            logger.info("%s discarded %d stale pending entries", self._subscriber_name, discarded)
+
+        await reset_group_position(
+            self._redis_client,
+            self._config.stream_name,
+            self._config.group_name,
+        )
+
     async def _read_loop(self) -> None:
         """Read entries from the stream and enqueue for processing."""
         await stream_read_loop(
@@ -177,13 +235,19 @@ class RedisStreamSubscriber:
             self._subscriber_name,
         )
 
-    async def _consume_queue(self) -> None:
+    def _consumer_queues(self) -> list[asyncio.Queue[Union[Tuple[str, str, dict], None]]]:
+        """Queue each consumer task reads from: its own shard, or the shared queue."""
+        if isinstance(self._queue, ShardedQueue):
+            return list(self._queue.shards)
+        return [self._queue] * self._config.num_consumers
+
+    async def _consume_queue(self, queue: asyncio.Queue[Union[Tuple[str, str, dict], None]]) -> None:
         """Dequeue entries, dispatch to handler, and ACK on success."""
         if self._config.coalesce:
             from .subscriber_helpers.coalescing_consumer import consume_coalescing_stream_queue
 
             await consume_coalescing_stream_queue(
-                self._queue,
+                queue,
                 self._on_message,
                 self._redis_client,
                 self._config,
@@ -193,7 +257,7 @@ class RedisStreamSubscriber:
             )
         else:
             await consume_stream_queue(
-                self._queue,
+                queue,
                 self._on_message,
                 self._redis_client,
                 self._config,
@@ -203,4 +267,11 @@ class RedisStreamSubscriber:
             )
 
 
-__all__ = ["MAX_STREAM_RETRIES", "MessageHandler", "RedisStreamSubscriber", "StreamConfig", "SubscriberHealthInfo"]
+__all__ = [
+    "MAX_STREAM_RETRIES",
+    "MessageHandler",
+    "RedisStreamSubscriber",
+    "StreamConfig",
+    "StreamRecoveryMode",
+    "SubscriberHealthInfo",
+]
@@ -3,21 +3,28 @@
 from .coalescing_consumer import consume_coalescing_stream_queue
 from .consumer import consume_stream_queue
 from .lifecycle import cancel_task, cancel_tasks, send_stop_sentinels
-from .reader import read_stream_entries, stream_read_loop
+from .reader import multi_stream_read_loop, read_multi_stream_entries, read_stream_entries, stream_read_loop
 from .recovery import (
+    collect_replay_entries,
     discard_all_pending,
     initialize_consumer_group,
     recover_and_filter_pending,
     recover_pending_entries,
 )
+from .sharding import ShardedQueue, offload_handler
 
 __all__ = [
+    "ShardedQueue",
     "cancel_task",
     "cancel_tasks",
+    "collect_replay_entries",
     "consume_coalescing_stream_queue",
     "consume_stream_queue",
     "discard_all_pending",
     "initialize_consumer_group",
+    "multi_stream_read_loop",
+    "offload_handler",
+    "read_multi_stream_entries",
     "read_stream_entries",
     "recover_and_filter_pending",
     "recover_pending_entries",
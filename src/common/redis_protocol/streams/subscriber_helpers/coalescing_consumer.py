@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
 from ...retry import with_redis_retry
-from .consumer import extract_payload, handle_consumer_retry
+from .consumer import extract_payload, handle_consumer_retry, retry_in_place
 
 if TYPE_CHECKING:
     from ..subscriber import StreamConfig
@@ -77,24 +77,38 @@ class _DispatchContext:
     acked_ids: list[str] | None = None
 
 
+async def _handle_winner(ctx: _DispatchContext, entry_id: str, identifier: str, fields: dict) -> None:
+    """Run the handler for one winner and record it for the batched ACK."""
+    payload = extract_payload(fields)
+    if ctx.timeout is not None:
+        await asyncio.wait_for(ctx.on_message(identifier, payload), timeout=ctx.timeout)
+    else:
+        await ctx.on_message(identifier, payload)
+    # Collect entry_id for batched xack instead of individual xack per message
+    if ctx.acked_ids is not None:
+        ctx.acked_ids.append(entry_id)
+    ctx.retry_counts.pop(entry_id, None)
+    if ctx.on_success is not None:
+        ctx.on_success()
+
+
 async def _dispatch_single_winner(ctx: _DispatchContext, entry_id: str, identifier: str, fields: dict) -> None:
     """Dispatch a single coalesced winner to the handler."""
     try:
-        payload = extract_payload(fields)
-        if ctx.timeout is not None:
-            await asyncio.wait_for(ctx.on_message(identifier, payload), timeout=ctx.timeout)
-        else:
-            await ctx.on_message(identifier, payload)
-        # Collect entry_id for batched xack instead of individual xack per message
-        if ctx.acked_ids is not None:
-            ctx.acked_ids.append(entry_id)
-        ctx.retry_counts.pop(entry_id, None)
-        if ctx.on_success is not None:
-            ctx.on_success()
+        await _handle_winner(ctx, entry_id, identifier, fields)
     except asyncio.CancelledError:
         raise
     except Exception:  # policy_guard: allow-broad-except policy_guard: allow-silent-handler
         logger.exception("%s coalescing consumer error for entry %s", ctx.subscriber_name, entry_id)
+        if ctx.config.shard_by_identifier:
+            await retry_in_place(
+                entry_id,
+                lambda: _handle_winner(ctx, entry_id, identifier, fields),
+                ctx.redis_client,
+                ctx.config,
+                ctx.subscriber_name,
+            )
+            return
         await handle_consumer_retry(
             entry_id,
             identifier,
@@ -131,7 +145,11 @@ async def consume_coalescing_stream_queue(
     *,
     on_success: Callable[[], None] | None = None,
 ) -> None:
-    """Dequeue entries, coalesce by identifier, and dispatch only the latest."""
+    """Dequeue entries, coalesce by identifier, and dispatch only the latest.
+
+    With ``config.shard_by_identifier`` a failed winner is retried before the
+    batch is finished instead of being re-queued behind newer entries.
+    """
     ctx = _DispatchContext(
         on_message=on_message,
         redis_client=redis_client,
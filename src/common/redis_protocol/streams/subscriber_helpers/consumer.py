@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 from typing import TYPE_CHECKING, Any, Awaitable, Callable
@@ -18,6 +19,7 @@ MessageHandler = Callable[[str, dict], Awaitable[None]]
 
 MAX_STREAM_RETRIES = 3
 _MAX_RETRY_TRACKING_ENTRIES = 1000
+_IN_PLACE_RETRY_BACKOFF_S = 0.1
 
 
 def is_json_object_string(raw: object) -> bool:
@@ -33,9 +35,12 @@ def extract_payload(fields: dict) -> dict:
     """Extract payload from stream entry fields.
 
     If the entry has a 'payload' field containing valid JSON, parse it.
-    Otherwise return the fields dict directly.
+    Binary-codec entries arrive already decoded, so a dict payload is
+    returned as is.  Otherwise return the fields dict directly.
     """
     raw_payload = fields.get("payload")
+    if isinstance(raw_payload, dict):
+        return raw_payload
     if raw_payload is None or not is_json_object_string(raw_payload):
         return fields
     try:
@@ -77,6 +82,33 @@ async def handle_consumer_retry(
         logger.critical("Permanently dropping message %s after %d retries", entry_id, MAX_STREAM_RETRIES)
 
 
+async def retry_in_place(
+    entry_id: str,
+    attempt: Callable[[], Awaitable[None]],
+    redis_client: Any,
+    config: StreamConfig,
+    subscriber_name: str,
+) -> None:
+    """Retry a failed entry inline with linear backoff, ACKing and dropping it once retries run out.
+
+    Used for identifier-sharded queues: re-queueing at the shard tail would
+    let later entries for the same identifier overtake the failed one.
+    """
+    for retry in range(1, MAX_STREAM_RETRIES):
+        await asyncio.sleep(_IN_PLACE_RETRY_BACKOFF_S * retry)
+        logger.warning("Retrying message %s in place (attempt %d)", entry_id, retry)
+        try:
+            await attempt()
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # policy_guard: allow-broad-except policy_guard: allow-silent-handler
+            logger.exception("%s consumer error for entry %s", subscriber_name, entry_id)
+        else:
+            return
+    await redis_client.xack(config.stream_name, config.group_name, entry_id)
+    logger.critical("Permanently dropping message %s after %d retries", entry_id, MAX_STREAM_RETRIES)
+
+
 async def consume_stream_queue(
     queue: asyncio.Queue,
     on_message: MessageHandler,
@@ -87,8 +119,27 @@ async def consume_stream_queue(
     *,
     on_success: Callable[[], None] | None = None,
 ) -> None:
-    """Dequeue entries, dispatch to handler, and ACK on success."""
+    """Dequeue entries, dispatch to handler, and ACK on success.
+
+    Failed entries are re-queued for retry; with ``config.shard_by_identifier``
+    they are retried before the next entry is taken so shard order is kept.
+    """
     timeout = config.handler_timeout_s if config.handler_timeout_s > 0 else None
+
+    async def _process(entry_id: str, identifier: str, fields: dict) -> None:
+        payload = extract_payload(fields)
+        if timeout is not None:
+            await asyncio.wait_for(on_message(identifier, payload), timeout=timeout)
+        else:
+            await on_message(identifier, payload)
+        await with_redis_retry(
+            lambda: redis_client.xack(config.stream_name, config.group_name, entry_id),
+            context=f"xack-{entry_id}",
+        )
+        retry_counts.pop(entry_id, None)
+        if on_success is not None:
+            on_success()
+
     while True:
         item = await queue.get()
         if item is None:
@@ -97,26 +148,21 @@ async def consume_stream_queue(
         entry_id = None
         try:
             entry_id, identifier, fields = item
-            payload = extract_payload(fields)
-            if timeout is not None:
-                await asyncio.wait_for(on_message(identifier, payload), timeout=timeout)
-            else:
-                await on_message(identifier, payload)
-            await with_redis_retry(
-                lambda: redis_client.xack(config.stream_name, config.group_name, entry_id),
-                context=f"xack-{entry_id}",
-            )
-            retry_counts.pop(entry_id, None)
-            if on_success is not None:
-                on_success()
+            await _process(entry_id, identifier, fields)
         except asyncio.CancelledError:
             raise
         except Exception:  # policy_guard: allow-broad-except policy_guard: allow-silent-handler
             logger.exception("%s consumer error for entry %s", subscriber_name, entry_id)
-            if entry_id is not None:
+            if entry_id is None:
+                continue
+            if config.shard_by_identifier:
+                await retry_in_place(
+                    entry_id, functools.partial(_process, entry_id, identifier, fields), redis_client, config, subscriber_name
+                )
+            else:
                 await handle_consumer_retry(entry_id, identifier, fields, queue, redis_client, config, retry_counts)
         finally:
             queue.task_done()
 
 
-__all__ = ["MAX_STREAM_RETRIES", "consume_stream_queue", "extract_payload", "is_json_object_string"]
+__all__ = ["MAX_STREAM_RETRIES", "consume_stream_queue", "extract_payload", "is_json_object_string", "retry_in_place"]
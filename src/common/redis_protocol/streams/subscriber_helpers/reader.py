@@ -4,9 +4,15 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Any, Callable, List, Tuple
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Mapping, Optional, Sequence, Tuple
 
-from common.redis_protocol.streams.message_decoder import decode_stream_response
+from common.redis_protocol.streams.message_decoder import (
+    decode_stream_response,
+    decode_stream_response_by_stream,
+)
+
+from .sharding import EntryQueue
 
 if TYPE_CHECKING:
     from ..subscriber import StreamConfig
@@ -16,6 +22,12 @@ logger = logging.getLogger(__name__)
 _DEFAULT_BATCH_SIZE = 100
 _DEFAULT_BLOCK_MS = 5000
 _MISSING_IDENTIFIER = ""
+_ALL_QUEUES_FULL_BACKOFF_S = 0.05
+
+# Per-stream routing target for the multiplexed read loop: (config, queue)
+StreamRoute = Tuple["StreamConfig", EntryQueue]
+# Queue entry produced by the read loops: (entry_id, identifier, fields)
+_RoutedEntry = Tuple[str, str, dict]
 
 
 async def read_stream_entries(
@@ -25,12 +37,13 @@ async def read_stream_entries(
     consumer: str,
     *,
     count: int = _DEFAULT_BATCH_SIZE,
-    block_ms: int = _DEFAULT_BLOCK_MS,
+    block_ms: Optional[int] = _DEFAULT_BLOCK_MS,
 ) -> List[Tuple[str, dict]]:
     """Read new entries from a stream using XREADGROUP.
 
     Reads entries assigned to this consumer that haven't been ACK'd yet
-    (using ">" as the start ID to get only new entries).
+    (using ">" as the start ID to get only new entries).  ``block_ms=None``
+    returns immediately when the stream has nothing new.
     """
     result: Any = await redis_client.xreadgroup(group, consumer, {stream: ">"}, count=count, block=block_ms)
     return decode_stream_response(result)
@@ -40,7 +53,7 @@ async def stream_read_loop(
     is_running: Callable[[], bool],
     redis_client: Any,
     config: StreamConfig,
-    queue: asyncio.Queue,
+    queue: EntryQueue,
     subscriber_name: str,
 ) -> None:
     """Read entries from the stream and enqueue for processing."""
@@ -66,4 +79,91 @@ async def stream_read_loop(
             await asyncio.sleep(1)
 
 
-__all__ = ["read_stream_entries", "stream_read_loop"]
+async def read_multi_stream_entries(
+    redis_client: Any,
+    streams: Sequence[str],
+    group: str,
+    consumer: str,
+    *,
+    count: int = _DEFAULT_BATCH_SIZE,
+    block_ms: int = _DEFAULT_BLOCK_MS,
+) -> Dict[str, List[Tuple[str, dict]]]:
+    """Read new entries from several streams of one consumer group in a single XREADGROUP.
+
+    ``count`` applies per stream, as in Redis.  Returns entries grouped by stream name.
+    """
+    result: Any = await redis_client.xreadgroup(group, consumer, {stream: ">" for stream in streams}, count=count, block=block_ms)
+    return decode_stream_response_by_stream(result)
+
+
+def _drain_backlogs(routes: Mapping[str, StreamRoute], backlogs: Mapping[str, Deque[_RoutedEntry]]) -> None:
+    """Move backlogged entries into their stream's queue until it is full, without waiting."""
+    for stream, backlog in backlogs.items():
+        queue = routes[stream][1]
+        while backlog:
+            try:
+                queue.put_nowait(backlog[0])
+            except asyncio.QueueFull:  # Retried on the next loop pass  # policy_guard: allow-silent-handler
+                break
+            backlog.popleft()
+
+
+async def multi_stream_read_loop(
+    is_running: Callable[[], bool],
+    redis_client: Any,
+    group: str,
+    consumer: str,
+    routes: Mapping[str, StreamRoute],
+    subscriber_name: str,
+) -> None:
+    """Read several streams with one blocking XREADGROUP and route entries to per-stream queues.
+
+    Entries are handed over with ``put_nowait``; whatever does not fit waits in
+    a per-stream backlog, and a stream is left out of reads while it has a
+    backlog or a full queue.  A slow handler therefore only backs up its own
+    stream and never blocks delivery to the others.  The read uses the largest
+    ``batch_size`` and smallest ``block_ms`` among the streams being read;
+    identifiers are extracted with each stream's own ``identifier_field``.
+    """
+    backlogs: Dict[str, Deque[_RoutedEntry]] = {stream: deque() for stream in routes}
+    while is_running():
+        try:
+            _drain_backlogs(routes, backlogs)
+            ready = [stream for stream, (_config, queue) in routes.items() if not backlogs[stream] and not queue.full()]
+            if not ready:
+                await asyncio.sleep(_ALL_QUEUES_FULL_BACKOFF_S)
+                continue
+            entries_by_stream = await read_multi_stream_entries(
+                redis_client,
+                ready,
+                group,
+                consumer,
+                count=max(routes[stream][0].batch_size for stream in ready),
+                block_ms=min(routes[stream][0].block_ms for stream in ready),
+            )
+            if not entries_by_stream:
+                await asyncio.sleep(0)
+            for stream, entries in entries_by_stream.items():
+                route = routes.get(stream)
+                if route is None:
+                    logger.warning("%s received entries for unrouted stream %s", subscriber_name, stream)
+                    continue
+                identifier_field = route[0].identifier_field
+                backlogs[stream].extend(
+                    (entry_id, fields.get(identifier_field, _MISSING_IDENTIFIER), fields) for entry_id, fields in entries
+                )
+            _drain_backlogs(routes, backlogs)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # policy_guard: allow-broad-except policy_guard: allow-silent-handler
+            logger.warning("%s read error, retrying: %s", subscriber_name, exc)
+            await asyncio.sleep(1)
+
+
+__all__ = [
+    "StreamRoute",
+    "multi_stream_read_loop",
+    "read_multi_stream_entries",
+    "read_stream_entries",
+    "stream_read_loop",
+]
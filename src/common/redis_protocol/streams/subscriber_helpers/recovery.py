@@ -9,9 +9,9 @@ from typing import TYPE_CHECKING, Any, List, Tuple
 
 from common.redis_protocol.streams.constants import PENDING_CLAIM_IDLE_MS
 from common.redis_protocol.streams.consumer_group import claim_pending_entries as _claim_pending_entries
-from common.redis_protocol.streams.consumer_group import (
-    ensure_consumer_group,
-)
+from common.redis_protocol.streams.consumer_group import claim_pending_page, ensure_consumer_group
+
+from .reader import read_stream_entries
 
 if TYPE_CHECKING:
     from ..subscriber import StreamConfig
@@ -163,6 +163,124 @@ async def purge_stale_pending(
 
 
 _XPENDING_BATCH_SIZE = 1000
+_REPLAY_ACK_BATCH_SIZE = 1000
+
+
+class _ReplayCoalescer:
+    """Keep the newest entry per identifier while replaying a backlog.
+
+    Entries without an identifier have nothing to coalesce on, so every one
+    of them is kept and replayed in stream order.
+    """
+
+    def __init__(self, identifier_field: str) -> None:
+        self._identifier_field = identifier_field
+        self.latest: dict[str, tuple[str, str, dict]] = {}
+        self.unidentified: list[tuple[str, str, dict]] = []
+        self.superseded_ids: list[str] = []
+        self.seen = 0
+
+    def add(self, entries: List[Tuple[str, dict]]) -> None:
+        for entry_id, fields in entries:
+            self.seen += 1
+            identifier = fields.get(self._identifier_field, _MISSING_IDENTIFIER)
+            if identifier == _MISSING_IDENTIFIER:
+                self.unidentified.append((entry_id, identifier, fields))
+                continue
+            previous = self.latest.get(identifier)
+            if previous is not None:
+                # PEL entries are claimed before the backlog is read, so keep the newer ID
+                if _entry_sort_key(previous[0]) > _entry_sort_key(entry_id):
+                    self.superseded_ids.append(entry_id)
+                    continue
+                self.superseded_ids.append(previous[0])
+            self.latest[identifier] = (entry_id, identifier, fields)
+
+
+async def _claim_abandoned_pel(redis_client: Any, config: StreamConfig, coalescer: _ReplayCoalescer) -> int:
+    """Feed every claimable PEL page to ``coalescer``; return the number of deleted IDs skipped."""
+    deleted = 0
+    cursor = "0-0"
+    while True:
+        # Pages of deleted or trimmed IDs come back empty; only the cursor says the scan is done
+        cursor, claimed, deleted_count = await claim_pending_page(
+            redis_client,
+            config.stream_name,
+            config.group_name,
+            config.consumer_name,
+            idle_ms=PENDING_CLAIM_IDLE_MS,
+            start_id=cursor,
+            count=config.batch_size,
+        )
+        coalescer.add(claimed)
+        deleted += deleted_count
+        if cursor == "0-0":
+            return deleted
+
+
+async def collect_replay_entries(
+    redis_client: Any,
+    config: StreamConfig,
+    subscriber_name: str,
+) -> List[Tuple[str, str, dict]]:
+    """Collect unACKed and unread entries, coalesced to the latest per identifier.
+
+    Claims pending entries idle for at least ``PENDING_CLAIM_IDLE_MS`` with
+    paginated XAUTOCLAIM (entries still in flight on another live consumer
+    are left alone), then drains the backlog after the group's last
+    delivered ID with non-blocking XREADGROUP.  Superseded entries are ACKed immediately; the
+    returned winners (oldest first) must be dispatched and ACKed by the
+    caller, so catch-up cost scales with distinct identifiers rather than
+    backlog length.
+    """
+    from ...retry import with_redis_retry
+
+    coalescer = _ReplayCoalescer(config.identifier_field)
+    deleted = await _claim_abandoned_pel(redis_client, config, coalescer)
+
+    while True:
+        entries = await read_stream_entries(
+            redis_client,
+            config.stream_name,
+            config.group_name,
+            config.consumer_name,
+            count=config.batch_size,
+            block_ms=None,
+        )
+        if not entries:
+            break
+        coalescer.add(entries)
+
+    superseded = coalescer.superseded_ids
+    for start in range(0, len(superseded), _REPLAY_ACK_BATCH_SIZE):
+        batch = superseded[start : start + _REPLAY_ACK_BATCH_SIZE]
+        await with_redis_retry(
+            lambda ids=batch: redis_client.xack(config.stream_name, config.group_name, *ids),
+            context="xack-replay-superseded",
+        )
+
+    winners = sorted([*coalescer.latest.values(), *coalescer.unidentified], key=lambda entry: _entry_sort_key(entry[0]))
+    if coalescer.seen:
+        logger.info(
+            "%s replaying %d of %d unACKed entries from %s (%d superseded)",
+            subscriber_name,
+            len(winners),
+            coalescer.seen,
+            config.stream_name,
+            len(superseded),
+        )
+    if deleted:
+        logger.warning("%s dropped %d pending entries deleted from %s before replay", subscriber_name, deleted, config.stream_name)
+    return winners
+
+
+def _entry_sort_key(entry_id: str) -> tuple[int, int]:
+    """Order entry IDs numerically by ``(timestamp_ms, seq)``."""
+    _, _, seq = entry_id.partition("-")
+    try:
+        return parse_entry_timestamp_ms(entry_id), int(seq)
+    except ValueError:  # Expected data validation or parsing failure  # policy_guard: allow-silent-handler
+        return parse_entry_timestamp_ms(entry_id), 0
 
 
 async def discard_all_pending(
@@ -213,6 +331,7 @@ async def discard_all_pending(
 
 
 __all__ = [
+    "collect_replay_entries",
     "discard_all_pending",
     "initialize_consumer_group",
     "parse_entry_timestamp_ms",
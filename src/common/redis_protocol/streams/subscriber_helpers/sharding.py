@@ -0,0 +1,104 @@
+"""Identifier-sharded queues and process-pool handler offload."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import Executor
+from typing import Any, Awaitable, Callable, List, Optional, Protocol, Tuple
+
+logger = logging.getLogger(__name__)
+
+MessageHandler = Callable[[str, dict], Awaitable[None]]
+
+# Queue entry: (entry_id, identifier, fields) or None stop sentinel
+_QueueEntry = Optional[Tuple[str, str, dict]]
+
+
+class EntryQueue(Protocol):
+    """Producer side of a subscriber queue: an ``asyncio.Queue`` or a :class:`ShardedQueue`."""
+
+    async def put(self, item: Tuple[str, str, dict]) -> None: ...
+
+    def put_nowait(self, item: Tuple[str, str, dict]) -> None: ...
+
+    def full(self) -> bool: ...
+
+    def qsize(self) -> int: ...
+
+
+class ShardedQueue:
+    """Route queue entries to one of N shard queues by identifier hash.
+
+    Exposes the subset of the ``asyncio.Queue`` interface used by the stream
+    readers, so it can replace the single subscriber queue.  All entries for
+    an identifier land on the same shard, which keeps them in order while
+    different identifiers are consumed in parallel.  Stop sentinels are not
+    routed; send them per shard via :attr:`shards`.
+    """
+
+    def __init__(self, num_shards: int, maxsize: int) -> None:
+        if num_shards < 1:
+            raise ValueError(f"num_shards must be >= 1, got {num_shards}")
+        self._shards: List[asyncio.Queue[_QueueEntry]] = [asyncio.Queue(maxsize=maxsize) for _ in range(num_shards)]
+
+    @property
+    def shards(self) -> List[asyncio.Queue[_QueueEntry]]:
+        """Per-shard queues, one per consumer task."""
+        return self._shards
+
+    @property
+    def maxsize(self) -> int:
+        """Combined capacity of all shards."""
+        return sum(shard.maxsize for shard in self._shards)
+
+    def shard_for(self, identifier: str) -> asyncio.Queue[_QueueEntry]:
+        """Return the shard queue that owns ``identifier``."""
+        return self._shards[hash(identifier) % len(self._shards)]
+
+    async def put(self, item: Tuple[str, str, dict]) -> None:
+        """Enqueue an entry on its identifier's shard, waiting if that shard is full."""
+        await self.shard_for(item[1]).put(item)
+
+    def put_nowait(self, item: Tuple[str, str, dict]) -> None:
+        """Enqueue without waiting; raises ``asyncio.QueueFull`` if the shard is full."""
+        self.shard_for(item[1]).put_nowait(item)
+
+    def qsize(self) -> int:
+        """Total entries waiting across all shards."""
+        return sum(shard.qsize() for shard in self._shards)
+
+    def shard_sizes(self) -> Tuple[int, ...]:
+        """Entries waiting on each shard."""
+        return tuple(shard.qsize() for shard in self._shards)
+
+    def full(self) -> bool:
+        """Whether any shard is full, i.e. a read could block on ``put``."""
+        return any(shard.full() for shard in self._shards)
+
+    def empty(self) -> bool:
+        """Whether every shard is empty."""
+        return all(shard.empty() for shard in self._shards)
+
+    async def join(self) -> None:
+        """Wait until every shard has been fully processed."""
+        for shard in self._shards:
+            await shard.join()
+
+
+def offload_handler(func: Callable[[str, dict], Any], executor: Executor) -> MessageHandler:
+    """Wrap a blocking, picklable ``func(identifier, payload)`` as a :data:`MessageHandler`.
+
+    The call runs on ``executor`` (typically a ``ProcessPoolExecutor``) so
+    CPU-bound handlers on different shards run in parallel instead of
+    serializing on the event loop.
+    """
+
+    async def _handler(identifier: str, payload: dict) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(executor, func, identifier, payload)
+
+    return _handler
+
+
+__all__ = ["EntryQueue", "ShardedQueue", "offload_handler"]
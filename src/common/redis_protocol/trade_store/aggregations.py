@@ -8,8 +8,6 @@ TradeStore class so unit tests can focus on specific business rules.
 """
 
 
-import asyncio
-import itertools
 from datetime import date, timedelta
 from typing import Callable, List
 
@@ -47,10 +45,10 @@ class TradeQueryService:
 
         num_days = (end_date - start_date).days + 1
         dates = [start_date + timedelta(days=i) for i in range(num_days)]
-        date_order_ids = await asyncio.gather(*(self._repository.load_all_for_date(d) for d in dates))
+        date_order_ids = await self._repository.load_all_for_dates(dates)
 
         all_pairs = [(d, oid) for d, order_ids in zip(dates, date_order_ids) for oid in order_ids]
-        trade_results = await asyncio.gather(*[self._repository.get(d, oid) for d, oid in all_pairs])
+        trade_results = await self._repository.get_many([self._keys.trade(d, oid) for d, oid in all_pairs])
 
         trades: List[TradeRecord] = []
         for (current, order_id), trade in zip(all_pairs, trade_results):
@@ -70,10 +68,9 @@ class TradeQueryService:
     async def trades_closed_today(self) -> List[TradeRecord]:
         today = self._timezone_aware_date(self._timezone)
         yesterday = today - timedelta(days=1)
-        today_trades = await self.trades_by_date_range(today, today)
-        yesterday_trades = await self.trades_by_date_range(yesterday, yesterday)
+        trades = await self.trades_by_date_range(yesterday, today)
 
-        closed_today = [trade for trade in itertools.chain(today_trades, yesterday_trades) if get_trade_close_date(trade) == today]
+        closed_today = [trade for trade in trades if get_trade_close_date(trade) == today]
         self._logger.debug("Found %s trades closing on %s", len(closed_today), today)
         return closed_today
 
@@ -91,7 +88,7 @@ class TradeQueryService:
         return trades
 
     async def _collect_trades_by_id(self, order_ids: List[str], *, context: str) -> List[TradeRecord]:
-        results = await asyncio.gather(*(self._repository.get_by_order_id(oid) for oid in order_ids))
+        results = await self._repository.get_many_by_order_id(order_ids)
         trades: List[TradeRecord] = []
         for order_id, trade in zip(order_ids, results):
             if trade is None:
@@ -34,6 +34,10 @@ class TradeKeyBuilder:
         """Key for the market category index."""
         return f"{self.trade_prefix}:by_category:{category}"
 
+    def ticker(self, market_ticker: str) -> str:
+        """Key for the open-trade index of a market ticker (members are trade keys)."""
+        return f"{self.trade_prefix}:by_ticker:{market_ticker}"
+
     def date_index(self, trade_date: date) -> str:
         """Key for the trade IDs associated with a given date."""
         return f"{self.trade_prefix}:by_date:{trade_date.isoformat()}"
@@ -42,6 +46,10 @@ class TradeKeyBuilder:
         """Key for daily P&L summary snapshots."""
         return f"{self.trade_prefix}:daily_summary:{trade_date.isoformat()}"
 
+    def daily_aggregates(self, trade_date: date) -> str:
+        """Key for the running P&L aggregate hash of a day."""
+        return f"{self.trade_prefix}:aggregates:{trade_date.isoformat()}"
+
     def order_index(self, order_id: str) -> str:
         """Key used to locate the primary trade entry from an order id."""
         return f"{self.order_index_prefix}:{order_id}"
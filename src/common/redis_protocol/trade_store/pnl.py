@@ -3,8 +3,8 @@ from __future__ import annotations
 """
 Persistence helpers for P&L snapshots.
 
-Daily summaries and unrealised P&L snapshots are stored alongside trades but
-live on separate key spaces. This module keeps the wiring outside the main
+Daily summaries, unrealised P&L snapshots and the running per-day aggregates
+are stored alongside trades but live on separate key spaces. This module keeps the wiring outside the main
 TradeStore to make error handling explicit and discoverable.
 """
 
@@ -17,6 +17,7 @@ from ...data_models.trade_record import PnLReport
 from ..typing import RedisClient, ensure_awaitable
 from .errors import TradeStoreError
 from .keys import TradeKeyBuilder
+from .pnl_aggregates import DailyPnLAggregates, parse_daily_aggregates
 
 
 class PnLStore:
@@ -107,5 +108,26 @@ class PnLStore:
         )
         return history
 
+    async def get_daily_aggregates(self, start_date: date, end_date: date) -> List[DailyPnLAggregates]:
+        """Read the per-day aggregate hashes for a date range in one round trip.
+
+        Days without any stored trades are omitted.
+        """
+        trade_dates: List[date] = []
+        current = start_date
+        while current <= end_date:
+            trade_dates.append(current)
+            current += timedelta(days=1)
+        if not trade_dates:
+            return []
+
+        client = await self._redis_provider()
+        async with client.pipeline(transaction=False) as pipe:
+            for trade_date in trade_dates:
+                pipe.hgetall(self._keys.daily_aggregates(trade_date))
+            results = await ensure_awaitable(pipe.execute())
+
+        return [parse_daily_aggregates(trade_date, raw) for trade_date, raw in zip(trade_dates, results) if raw]
+
 
 __all__ = ["PnLStore"]
@@ -0,0 +1,172 @@
+"""
+Running per-day P&L aggregates maintained alongside trade payloads.
+
+Each day has one hash (``trades:aggregates:{date}``) whose fields are
+``{scope}:{metric}`` counters, where the scope is ``total`` or one of
+``rule:{rule}``, ``station:{station}`` and ``category:{category}``.  Opening
+metrics (trades, quantity, cost, fees) count on the trade date; settlement
+metrics (settled, realized P&L, wins) count on the close date from
+:func:`get_trade_close_date`, matching the closed-trade reports.  The
+repository queues HINCRBY deltas in the same MULTI as the trade write or
+settlement, so reports read one hash per day instead of decoding every
+trade.  Deltas are computed against the previously stored record, which
+keeps re-stores and re-settlements idempotent.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from ...data_models.trade_record import TradeRecord, get_trade_close_date
+from .errors import TradeStoreError
+
+OPENING_METRICS = (
+    "trades",
+    "quantity",
+    "cost_cents",
+    "fee_cents",
+)
+SETTLEMENT_METRICS = (
+    "settled",
+    "realized_pnl_cents",
+    "wins",
+)
+AGGREGATE_METRICS = OPENING_METRICS + SETTLEMENT_METRICS
+
+TOTAL_SCOPE = "total"
+RULE_SCOPE = "rule"
+STATION_SCOPE = "station"
+CATEGORY_SCOPE = "category"
+
+
+@dataclass(frozen=True)
+class PnLAggregate:
+    """Summed trade metrics for one scope of one day."""
+
+    trades: int = 0
+    quantity: int = 0
+    cost_cents: int = 0
+    fee_cents: int = 0
+    settled: int = 0
+    realized_pnl_cents: int = 0
+    wins: int = 0
+
+    @property
+    def win_rate(self) -> float:
+        """Share of settled trades with positive realised P&L."""
+        if not self.settled:
+            return 0.0
+        return self.wins / self.settled
+
+    def __add__(self, other: PnLAggregate) -> PnLAggregate:
+        return PnLAggregate(**{metric: getattr(self, metric) + getattr(other, metric) for metric in AGGREGATE_METRICS})
+
+
+@dataclass(frozen=True)
+class DailyPnLAggregates:
+    """All aggregates stored for a single day."""
+
+    trade_date: date
+    total: PnLAggregate
+    by_rule: Dict[str, PnLAggregate] = field(default_factory=dict)
+    by_station: Dict[str, PnLAggregate] = field(default_factory=dict)
+    by_category: Dict[str, PnLAggregate] = field(default_factory=dict)
+
+
+def trade_aggregate_fields(trade: TradeRecord) -> Dict[date, Dict[str, int]]:
+    """Return the hash fields and amounts ``trade`` contributes, keyed by the day they count on."""
+    scopes = [TOTAL_SCOPE, f"{RULE_SCOPE}:{trade.trade_rule}", f"{CATEGORY_SCOPE}:{trade.market_category}"]
+    if trade.weather_station:
+        scopes.append(f"{STATION_SCOPE}:{trade.weather_station}")
+    opening = {
+        "trades": 1,
+        "quantity": trade.quantity,
+        "cost_cents": trade.cost_cents,
+        "fee_cents": trade.fee_cents,
+    }
+    days: Dict[date, Dict[str, int]] = {}
+    _add_scoped(days.setdefault(trade.trade_timestamp.date(), {}), scopes, opening)
+    realized = trade.realised_pnl_cents()
+    if trade.is_settled:
+        settlement = {
+            "settled": 1,
+            "realized_pnl_cents": realized or 0,
+            "wins": 1 if realized is not None and realized > 0 else 0,
+        }
+        _add_scoped(days.setdefault(get_trade_close_date(trade), {}), scopes, settlement)
+    return {day: fields for day, fields in days.items() if fields}
+
+
+def aggregate_deltas(trade: TradeRecord, previous: Optional[TradeRecord]) -> Dict[date, Dict[str, int]]:
+    """Return the non-zero field increments per day that replace ``previous`` with ``trade``."""
+    deltas = trade_aggregate_fields(trade)
+    if previous is not None:
+        for day, fields in trade_aggregate_fields(previous).items():
+            day_deltas = deltas.setdefault(day, {})
+            for field_name, amount in fields.items():
+                day_deltas[field_name] = day_deltas.get(field_name, 0) - amount
+    changed = {day: {field_name: amount for field_name, amount in fields.items() if amount} for day, fields in deltas.items()}
+    return {day: fields for day, fields in changed.items() if fields}
+
+
+def _add_scoped(fields: Dict[str, int], scopes: Iterable[str], contribution: Mapping[str, int]) -> None:
+    for scope in scopes:
+        for metric, amount in contribution.items():
+            if amount:
+                fields[f"{scope}:{metric}"] = fields.get(f"{scope}:{metric}", 0) + amount
+
+
+def queue_aggregate_deltas(pipe: Any, key: str, deltas: Mapping[str, int]) -> None:
+    """Queue HINCRBY commands for ``deltas`` on a pipeline."""
+    for field_name, amount in deltas.items():
+        pipe.hincrby(key, field_name, amount)
+
+
+def parse_daily_aggregates(trade_date: date, raw: Mapping[Any, Any]) -> DailyPnLAggregates:
+    """Build :class:`DailyPnLAggregates` from an aggregate hash's HGETALL result."""
+    scoped: Dict[str, Dict[str, int]] = {}
+    for raw_field, raw_value in raw.items():
+        field_name = _decode(raw_field)
+        scope, _, metric = field_name.rpartition(":")
+        if metric not in AGGREGATE_METRICS or not scope:
+            raise TradeStoreError(f"Unexpected P&L aggregate field {field_name!r} for {trade_date}")
+        try:
+            scoped.setdefault(scope, {})[metric] = int(_decode(raw_value))
+        except ValueError as exc:
+            raise TradeStoreError(f"Invalid P&L aggregate value for {field_name!r} on {trade_date}") from exc
+
+    total = PnLAggregate(**scoped.pop(TOTAL_SCOPE, {}))
+    breakdowns: Dict[str, Dict[str, PnLAggregate]] = {RULE_SCOPE: {}, STATION_SCOPE: {}, CATEGORY_SCOPE: {}}
+    for scope, metrics in scoped.items():
+        kind, _, name = scope.partition(":")
+        if kind not in breakdowns or not name:
+            raise TradeStoreError(f"Unexpected P&L aggregate scope {scope!r} for {trade_date}")
+        breakdowns[kind][name] = PnLAggregate(**metrics)
+    return DailyPnLAggregates(
+        trade_date=trade_date,
+        total=total,
+        by_rule=breakdowns[RULE_SCOPE],
+        by_station=breakdowns[STATION_SCOPE],
+        by_category=breakdowns[CATEGORY_SCOPE],
+    )
+
+
+def _decode(value: Any) -> str:
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode("utf-8")
+    return str(value)
+
+
+__all__ = [
+    "AGGREGATE_METRICS",
+    "DailyPnLAggregates",
+    "OPENING_METRICS",
+    "PnLAggregate",
+    "SETTLEMENT_METRICS",
+    "aggregate_deltas",
+    "parse_daily_aggregates",
+    "queue_aggregate_deltas",
+    "trade_aggregate_fields",
+]
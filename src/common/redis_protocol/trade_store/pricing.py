@@ -8,23 +8,22 @@ update rules while ensuring Redis writes remain centralised.
 """
 
 
-import asyncio
 from datetime import date, datetime, timedelta
-from typing import Callable
+from typing import Any, Callable, Iterable, List, Tuple
 
 from redis import WatchError
 
-from ...data_models.trade_record import TradeRecord
-from ..typing import ensure_awaitable
-from .errors import TradeStoreError
+from ..typing import RedisClient, ensure_awaitable
 from .records import TradeRecordRepository
 
-_WATCH_MAX_RETRIES = 10
-_WATCH_BASE_DELAY = 0.01
+# A conflicting write only costs the retry of one ticker's trades
+_MAX_TICKER_ATTEMPTS = 3
+
+PriceUpdate = Tuple[str, float, float]
 
 
 class TradePriceUpdater:
-    """Apply pricing updates across recent trades for a market ticker."""
+    """Apply pricing updates to the open trades of market tickers."""
 
     def __init__(
         self,
@@ -41,79 +40,105 @@ class TradePriceUpdater:
         self._now = current_time_provider
         self._logger = logger
 
-    async def _load_matching_trades(self, search_date: date, market_ticker: str) -> list[TradeRecord]:
-        """Load trades for a date that match the given market ticker."""
-        order_ids = await self._repository.load_all_for_date(search_date)
-        if not order_ids:
-            return []
-        client = await self._repository.redis_client()
-        trade_keys = [self._repository.build_trade_key(search_date, oid) for oid in order_ids]
-        async with client.pipeline() as pipe:
-            for key in trade_keys:
-                pipe.get(key)
-            results = await ensure_awaitable(pipe.execute())
-        matching: list[TradeRecord] = []
-        for order_id, trade_json in zip(order_ids, results):
-            if not trade_json:
-                raise TradeStoreError(f"Trade {order_id} expected for {search_date} but payload missing")
-            trade = self._repository.decode_trade(trade_json)
-            if trade.market_ticker == market_ticker:
-                matching.append(trade)
-        return matching
-
     async def update_market_prices(
         self,
         market_ticker: str,
         *,
         yes_bid: float,
         yes_ask: float,
-        lookback_days: int = 7,
     ) -> int:
+        return await self.update_prices_batch([(market_ticker, yes_bid, yes_ask)])
+
+    async def update_prices_batch(self, updates: Iterable[PriceUpdate]) -> int:
+        """Apply many ``(ticker, yes_bid, yes_ask)`` updates; the last update per ticker wins.
+
+        Trades are found through the ``trades:by_ticker`` open-trade index: one
+        pipelined SMEMBERS pass skips every ticker without open trades, so the
+        cost scales with open trades rather than with updates.  Each remaining
+        ticker is read, patched through the trade codec and written back in
+        its own WATCH/MULTI transaction.  A conflicting write retries only that
+        ticker, and a ticker that keeps conflicting is skipped until its next
+        update instead of failing the batch.
+        """
+        latest = {market_ticker: (yes_bid, yes_ask) for market_ticker, yes_bid, yes_ask in updates}
+        if not latest:
+            return 0
+
+        client = await self._repository.redis_client()
+        index_keys = {market_ticker: self._repository.build_ticker_index_key(market_ticker) for market_ticker in latest}
+        members = await _read_batch(client, "smembers", list(index_keys.values()))
+        held = [market_ticker for market_ticker, trade_keys in zip(index_keys, members) if trade_keys]
+
+        updated_count = 0
+        for market_ticker in held:
+            yes_bid, yes_ask = latest[market_ticker]
+            updated_count += await self._apply_ticker(client, market_ticker, index_keys[market_ticker], yes_bid, yes_ask)
+
+        self._logger.debug("Updated prices for %s trades across %s markets", updated_count, len(latest))
+        return updated_count
+
+    async def reindex_open_trades(self, lookback_days: int = 7) -> int:
+        """Backfill ticker indexes from the date indexes, e.g. for trades stored before they existed."""
         if lookback_days <= 0:
             raise TypeError("lookback_days must be positive")
 
         today = self._timezone_date(self._timezone)
-        updated_count = 0
-
+        indexed_count = 0
         for days_back in range(lookback_days):
-            search_date = today - timedelta(days=days_back)
-            for trade in await self._load_matching_trades(search_date, market_ticker):
-                await self._apply_price_update(trade, yes_bid=yes_bid, yes_ask=yes_ask)
-                updated_count += 1
+            indexed_count += await self._repository.index_open_trades(today - timedelta(days=days_back))
 
-        self._logger.debug("Updated prices for %s trades in market %s", updated_count, market_ticker)
-        return updated_count
+        self._logger.info("Indexed %s open trades by ticker over %s days", indexed_count, lookback_days)
+        return indexed_count
 
-    async def _apply_price_update(
-        self,
-        trade: TradeRecord,
-        *,
-        yes_bid: float,
-        yes_ask: float,
-    ) -> None:
-        client = await self._repository.redis_client()
-        trade_key = self._repository.build_trade_key(trade.trade_timestamp.date(), trade.order_id)
-        for watch_attempt in range(_WATCH_MAX_RETRIES):
+    async def _apply_ticker(self, client: RedisClient, market_ticker: str, index_key: str, yes_bid: float, yes_ask: float) -> int:
+        for _attempt in range(_MAX_TICKER_ATTEMPTS):
             try:
-                async with client.pipeline() as pipe:
-                    await ensure_awaitable(pipe.watch(trade_key))
-                    trade_json = await ensure_awaitable(pipe.get(trade_key))
-                    if not trade_json:
-                        await ensure_awaitable(pipe.unwatch())
-                        raise TradeStoreError(f"Trade key {trade_key} missing for order {trade.order_id}")
-                    current_trade = self._repository.decode_trade(trade_json)
-                    current_trade.last_yes_bid = yes_bid
-                    current_trade.last_yes_ask = yes_ask
-                    current_trade.last_price_update = self._now()
-                    updated_payload = self._repository.encode_trade(current_trade)
-                    pipe.multi()
-                    pipe.set(trade_key, updated_payload)
-                    await ensure_awaitable(pipe.execute())
-                break
-            except WatchError as exc:
-                if watch_attempt >= _WATCH_MAX_RETRIES - 1:
-                    raise TradeStoreError(f"Optimistic lock failed after {_WATCH_MAX_RETRIES} retries for order {trade.order_id}") from exc
-                await asyncio.sleep(_WATCH_BASE_DELAY * (2**watch_attempt))
+                return await self._apply_ticker_watched(client, index_key, yes_bid, yes_ask)
+            except WatchError:  # Concurrent store/settle on this ticker; re-read it  # policy_guard: allow-silent-handler
+                continue
+        self._logger.warning(
+            "Skipped price update for %s after %s conflicting writes; it will be retried on the next update",
+            market_ticker,
+            _MAX_TICKER_ATTEMPTS,
+        )
+        return 0
+
+    async def _apply_ticker_watched(self, client: RedisClient, index_key: str, yes_bid: float, yes_ask: float) -> int:
+        async with client.pipeline() as pipe:
+            await ensure_awaitable(pipe.watch(index_key))
+            trade_keys = sorted(_decode(member) for member in await ensure_awaitable(pipe.smembers(index_key)))
+            if not trade_keys:
+                return 0
+            await ensure_awaitable(pipe.watch(*trade_keys))
+            payloads = await ensure_awaitable(pipe.mget(trade_keys))
+
+            timestamp = self._now()
+            pipe.multi()
+            updated = 0
+            for trade_key, trade_json in zip(trade_keys, payloads):
+                trade = self._repository.decode_trade(trade_json) if trade_json else None
+                if trade is None or trade.is_settled:
+                    # Stale index member: payload gone or trade settled since it was indexed
+                    pipe.srem(index_key, trade_key)
+                    continue
+                trade.last_yes_bid = yes_bid
+                trade.last_yes_ask = yes_ask
+                trade.last_price_update = timestamp
+                pipe.set(trade_key, self._repository.encode_trade(trade))
+                updated += 1
+            await ensure_awaitable(pipe.execute())
+        return updated
+
+
+async def _read_batch(client: RedisClient, command: str, keys: List[str]) -> List[Any]:
+    async with client.pipeline(transaction=False) as pipe:
+        for key in keys:
+            getattr(pipe, command)(key)
+        return await ensure_awaitable(pipe.execute())
+
+
+def _decode(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
 
 
 __all__ = ["TradePriceUpdater"]
@@ -0,0 +1,65 @@
+"""LRU of decoded trade records keyed by trade key and payload version.
+
+Readers such as the PnL reporter re-read the same day's trades every few
+seconds.  Fetching the payloads is one batched round trip; decoding and
+validating each one is the dominant cost.  The raw payload doubles as the
+version stamp: any rewrite (settlement, price refresh) changes it and
+misses the cache, so entries can never go stale.
+"""
+
+from __future__ import annotations
+
+import copy
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+from ...data_models.trade_record import TradeRecord
+
+DEFAULT_RECORD_CACHE_SIZE = 4096
+
+
+class DecodedTradeCache:
+    """Bounded LRU mapping trade key -> (payload, decoded record)."""
+
+    def __init__(self, maxsize: int = DEFAULT_RECORD_CACHE_SIZE) -> None:
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, Tuple[str, TradeRecord]] = OrderedDict()
+
+    def decode(self, trade_key: str, payload: Any, decoder: Callable[[Any], TradeRecord]) -> TradeRecord:
+        """Return the record for ``payload``, decoding only when the payload changed.
+
+        A shallow copy is returned so callers mutating the record (e.g. to
+        settle it) cannot corrupt the cached entry.
+        """
+        version = payload.decode("utf-8") if isinstance(payload, (bytes, bytearray)) else str(payload)
+        cached = self._lookup(trade_key, version)
+        if cached is None:
+            cached = decoder(version)
+            self._entries[trade_key] = (version, cached)
+            self._entries.move_to_end(trade_key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return copy.copy(cached)
+
+    def invalidate(self, trade_key: str) -> None:
+        """Forget one trade key."""
+        self._entries.pop(trade_key, None)
+
+    def clear(self) -> None:
+        """Forget every cached record."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, trade_key: str, version: str) -> Optional[TradeRecord]:
+        entry = self._entries.get(trade_key)
+        if entry is None or entry[0] != version:
+            return None
+        self._entries.move_to_end(trade_key)
+        return entry[1]
+
+
+__all__ = ["DEFAULT_RECORD_CACHE_SIZE", "DecodedTradeCache"]
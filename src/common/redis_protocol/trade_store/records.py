@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+import copy
+from datetime import date, datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, TypeVar
 
 from redis import WatchError
 
@@ -11,6 +12,8 @@ from ..typing import RedisClient, ensure_awaitable
 from .codec import TradeRecordCodec
 from .errors import TradeStoreError
 from .keys import TradeKeyBuilder
+from .pnl_aggregates import aggregate_deltas, queue_aggregate_deltas, trade_aggregate_fields
+from .record_cache import DecodedTradeCache
 
 
 def normalize_order_ids(raw_ids: Any) -> List[str]:
@@ -26,6 +29,11 @@ def normalize_order_ids(raw_ids: Any) -> List[str]:
 
 _WATCH_MAX_RETRIES = 10
 _WATCH_BASE_DELAY = 0.01
+_FETCH_CHUNK_SIZE = 500
+# Trades settling within this many days of being opened are counted when rebuilding a day's settlements
+_SETTLEMENT_LOOKBACK_DAYS = 7
+
+_T = TypeVar("_T")
 
 
 class TradeRecordRepository:
@@ -36,18 +44,36 @@ class TradeRecordRepository:
         key_builder: TradeKeyBuilder,
         codec: TradeRecordCodec,
         logger,
+        record_cache: Optional[DecodedTradeCache] = None,
     ) -> None:
         self._redis_provider = redis_provider
         self._keys = key_builder
         self._codec = codec
         self._logger = logger
+        self._record_cache = record_cache if record_cache is not None else DecodedTradeCache()
 
     async def store(self, trade: TradeRecord) -> bool:
         client = await self._redis_provider()
+        trade_date = trade.trade_timestamp.date()
+        trade_key = self._keys.trade(trade_date, trade.order_id)
+        results = await self._retry_on_watch_conflict(
+            lambda: self._store_watched(client, trade, trade_key),
+            trade.order_id,
+        )
+        failed_ops = [idx for idx, result in enumerate(results) if result is None or result is False]
+        if failed_ops:
+            raise TradeStoreError(f"Redis pipeline operations failed at indices: {failed_ops}")
+        self._logger.debug("Stored trade %s for %s", trade.order_id, trade_date)
+        return True
+
+    async def _store_watched(self, client: RedisClient, trade: TradeRecord, trade_key: str) -> List[Any]:
+        trade_date = trade.trade_timestamp.date()
         trade_json = self._codec.encode(trade)
         async with client.pipeline() as pipe:
-            trade_date = trade.trade_timestamp.date()
-            trade_key = self._keys.trade(trade_date, trade.order_id)
+            await ensure_awaitable(pipe.watch(trade_key))
+            previous_json = await ensure_awaitable(pipe.get(trade_key))
+            previous = self._codec.decode(previous_json) if previous_json else None
+            pipe.multi()
             pipe.set(trade_key, trade_json)
             pipe.sadd(self._keys.date_index(trade_date), trade.order_id)
             if trade.weather_station:
@@ -55,12 +81,12 @@ class TradeRecordRepository:
             pipe.sadd(self._keys.category(trade.market_category), trade.order_id)
             pipe.sadd(self._keys.rule(trade.trade_rule), trade.order_id)
             pipe.set(self._keys.order_index(trade.order_id), trade_key)
-            results = await ensure_awaitable(pipe.execute())
-        failed_ops = [idx for idx, result in enumerate(results) if result is None or result is False]
-        if failed_ops:
-            raise TradeStoreError(f"Redis pipeline operations failed at indices: {failed_ops}")
-        self._logger.debug("Stored trade %s for %s", trade.order_id, trade_date)
-        return True
+            if trade.is_settled:
+                pipe.srem(self._keys.ticker(trade.market_ticker), trade_key)
+            else:
+                pipe.sadd(self._keys.ticker(trade.market_ticker), trade_key)
+            self._queue_aggregates(pipe, aggregate_deltas(trade, previous))
+            return await ensure_awaitable(pipe.execute())
 
     async def get(self, trade_date, order_id: str) -> Optional[TradeRecord]:
         client = await self._redis_provider()
@@ -68,7 +94,7 @@ class TradeRecordRepository:
         trade_json = await ensure_awaitable(client.get(trade_key))
         if not trade_json:
             return None
-        return self._codec.decode(trade_json)
+        return self._record_cache.decode(trade_key, trade_json, self._codec.decode)
 
     async def get_by_order_id(self, order_id: str) -> Optional[TradeRecord]:
         client = await self._redis_provider()
@@ -78,7 +104,31 @@ class TradeRecordRepository:
         trade_json = await ensure_awaitable(client.get(trade_key))
         if not trade_json:
             raise TradeStoreError(f"Indexed trade payload missing for order {order_id}: {trade_key!r}")
-        return self._codec.decode(trade_json)
+        return self._record_cache.decode(_decode_key(trade_key), trade_json, self._codec.decode)
+
+    async def get_many(self, trade_keys: Sequence[str]) -> List[Optional[TradeRecord]]:
+        """Fetch trades in chunked pipelines; None where a payload is missing."""
+        payloads = await self._get_values(trade_keys)
+        return [
+            self._record_cache.decode(trade_key, trade_json, self._codec.decode) if trade_json else None
+            for trade_key, trade_json in zip(trade_keys, payloads)
+        ]
+
+    async def get_many_by_order_id(self, order_ids: Sequence[str]) -> List[Optional[TradeRecord]]:
+        """Resolve order ids through the order index with two batched reads; None if unindexed."""
+        indexed_keys = await self._get_values([self._keys.order_index(order_id) for order_id in order_ids])
+        trade_keys = [_decode_key(trade_key) for trade_key in indexed_keys if trade_key is not None]
+        trades = iter(await self.get_many(trade_keys))
+        results: List[Optional[TradeRecord]] = []
+        for order_id, trade_key in zip(order_ids, indexed_keys):
+            if trade_key is None:
+                results.append(None)
+                continue
+            trade = next(trades)
+            if trade is None:
+                raise TradeStoreError(f"Indexed trade payload missing for order {order_id}: {trade_key!r}")
+            results.append(trade)
+        return results
 
     async def mark_settled(
         self,
@@ -89,32 +139,43 @@ class TradeRecordRepository:
         timestamp_provider: Callable[[], datetime],
     ) -> bool:
         client = await self._redis_provider()
-        order_index_key = self._keys.order_index(order_id)
+
+        async def settle() -> None:
+            order_index_key = self._keys.order_index(order_id)
+            trade_key = await ensure_awaitable(client.get(order_index_key))
+            if not trade_key:
+                raise TradeStoreError(f"Order id {order_id} not indexed; cannot mark settled")
+            async with client.pipeline() as pipe:
+                await ensure_awaitable(pipe.watch(order_index_key, trade_key))
+                trade_json = await ensure_awaitable(pipe.get(trade_key))
+                if not trade_json:
+                    await ensure_awaitable(pipe.unwatch())
+                    raise TradeStoreError(f"Trade key {trade_key} missing for order {order_id}")
+                trade_record = self._codec.decode(trade_json)
+                previous = copy.copy(trade_record)
+                trade_record.settlement_price_cents = settlement_price_cents
+                trade_record.settlement_time = settled_at or timestamp_provider()
+                updated_payload = self._codec.encode(trade_record)
+                pipe.multi()
+                pipe.set(trade_key, updated_payload)
+                pipe.srem(self._keys.ticker(trade_record.market_ticker), trade_key)
+                # Settlement metrics move to the close date; opening metrics stay on the trade date
+                self._queue_aggregates(pipe, aggregate_deltas(trade_record, previous))
+                await ensure_awaitable(pipe.execute())
+
+        await self._retry_on_watch_conflict(settle, order_id)
+        self._logger.info("Marked trade %s as settled at %s", order_id, settlement_price_cents)
+        return True
+
+    async def _retry_on_watch_conflict(self, attempt: Callable[[], Awaitable[_T]], order_id: str) -> _T:
         for watch_attempt in range(_WATCH_MAX_RETRIES):
             try:
-                trade_key = await ensure_awaitable(client.get(order_index_key))
-                if not trade_key:
-                    raise TradeStoreError(f"Order id {order_id} not indexed; cannot mark settled")
-                async with client.pipeline() as pipe:
-                    await ensure_awaitable(pipe.watch(order_index_key, trade_key))
-                    trade_json = await ensure_awaitable(pipe.get(trade_key))
-                    if not trade_json:
-                        await ensure_awaitable(pipe.unwatch())
-                        raise TradeStoreError(f"Trade key {trade_key} missing for order {order_id}")
-                    trade_record = self._codec.decode(trade_json)
-                    trade_record.settlement_price_cents = settlement_price_cents
-                    trade_record.settlement_time = settled_at or timestamp_provider()
-                    updated_payload = self._codec.encode(trade_record)
-                    pipe.multi()
-                    pipe.set(trade_key, updated_payload)
-                    await ensure_awaitable(pipe.execute())
-                break
+                return await attempt()
             except WatchError as exc:
                 if watch_attempt >= _WATCH_MAX_RETRIES - 1:
                     raise TradeStoreError(f"Optimistic lock failed after {_WATCH_MAX_RETRIES} retries for order {order_id}") from exc
                 await asyncio.sleep(_WATCH_BASE_DELAY * (2**watch_attempt))
-        self._logger.info("Marked trade %s as settled at %s", order_id, settlement_price_cents)
-        return True
+        raise TradeStoreError(f"Optimistic lock retries exhausted for order {order_id}")
 
     async def redis_client(self) -> RedisClient:
         return await self._redis_provider()
@@ -122,6 +183,79 @@ class TradeRecordRepository:
     def build_trade_key(self, trade_date, order_id: str) -> str:
         return self._keys.trade(trade_date, order_id)
 
+    def build_ticker_index_key(self, market_ticker: str) -> str:
+        return self._keys.ticker(market_ticker)
+
+    async def index_open_trades(self, trade_date) -> int:
+        """Add a date's unsettled trades to their ticker indexes; returns trades indexed."""
+        order_ids = await self.load_all_for_date(trade_date)
+        if not order_ids:
+            return 0
+        client = await self._redis_provider()
+        trade_keys = [self._keys.trade(trade_date, order_id) for order_id in order_ids]
+        async with client.pipeline() as pipe:
+            for trade_key in trade_keys:
+                pipe.get(trade_key)
+            payloads = await ensure_awaitable(pipe.execute())
+        open_trades: Dict[str, List[str]] = {}
+        for order_id, trade_key, trade_json in zip(order_ids, trade_keys, payloads):
+            if not trade_json:
+                raise TradeStoreError(f"Trade {order_id} expected for {trade_date} but payload missing")
+            trade = self._codec.decode(trade_json)
+            if not trade.is_settled:
+                open_trades.setdefault(trade.market_ticker, []).append(trade_key)
+        if open_trades:
+            async with client.pipeline() as pipe:
+                for market_ticker, keys in open_trades.items():
+                    pipe.sadd(self._keys.ticker(market_ticker), *keys)
+                await ensure_awaitable(pipe.execute())
+        return sum(len(keys) for keys in open_trades.values())
+
+    async def rebuild_daily_aggregates(self, start_date: date, end_date: date) -> int:
+        """Recompute the P&L aggregate hashes of a date range from stored trades; returns trades counted.
+
+        Backfills days written before aggregates were maintained.  Settlement
+        metrics belong to a trade's close date, so trades opened up to
+        ``_SETTLEMENT_LOOKBACK_DAYS`` before ``start_date`` are read as well.
+        Trades stored while the rebuild runs may be counted twice or missed, so
+        run it for closed days or re-run it once writes settle.
+        """
+        trade_dates: List[date] = []
+        current = start_date - timedelta(days=_SETTLEMENT_LOOKBACK_DAYS)
+        while current <= end_date:
+            trade_dates.append(current)
+            current += timedelta(days=1)
+        date_order_ids = await self.load_all_for_dates(trade_dates)
+        pairs = [(trade_date, order_id) for trade_date, order_ids in zip(trade_dates, date_order_ids) for order_id in order_ids]
+        trades = await self.get_many([self._keys.trade(trade_date, order_id) for trade_date, order_id in pairs])
+        missing = [order_id for (_trade_date, order_id), trade in zip(pairs, trades) if trade is None]
+        if missing:
+            raise TradeStoreError(f"Trades {missing} expected for {start_date} to {end_date} but payloads missing")
+
+        totals: Dict[date, Dict[str, int]] = {day: {} for day in trade_dates if day >= start_date}
+        counted = 0
+        for trade in (trade for trade in trades if trade is not None):
+            in_range = {day: fields for day, fields in trade_aggregate_fields(trade).items() if day in totals}
+            if in_range:
+                counted += 1
+            for day, fields in in_range.items():
+                for field_name, amount in fields.items():
+                    totals[day][field_name] = totals[day].get(field_name, 0) + amount
+
+        client = await self._redis_provider()
+        async with client.pipeline() as pipe:
+            for day, fields in totals.items():
+                aggregates_key = self._keys.daily_aggregates(day)
+                pipe.delete(aggregates_key)
+                if fields:
+                    pipe.hset(aggregates_key, mapping={field_name: str(amount) for field_name, amount in fields.items()})
+            await ensure_awaitable(pipe.execute())
+        return counted
+
+    def _queue_aggregates(self, pipe: Any, deltas_by_day: Dict[date, Dict[str, int]]) -> None:
+        for day, deltas in deltas_by_day.items():
+            queue_aggregate_deltas(pipe, self._keys.daily_aggregates(day), deltas)
+
     def decode_trade(self, trade_json: Any) -> TradeRecord:
         return self._codec.decode(trade_json)
 
@@ -138,6 +272,17 @@ class TradeRecordRepository:
         order_ids = await ensure_awaitable(client.smembers(self._keys.date_index(trade_date)))
         return normalize_order_ids(order_ids)
 
+    async def load_all_for_dates(self, trade_dates: Sequence[date]) -> List[List[str]]:
+        """Pipeline the per-day SMEMBERS for several dates into one round trip."""
+        if not trade_dates:
+            return []
+        client = await self._redis_provider()
+        async with client.pipeline(transaction=False) as pipe:
+            for trade_date in trade_dates:
+                pipe.smembers(self._keys.date_index(trade_date))
+            responses = await ensure_awaitable(pipe.execute())
+        return [normalize_order_ids(order_ids) for order_ids in responses]
+
     async def load_index(self, key: str) -> List[str]:
         client = await self._redis_provider()
         order_ids = await ensure_awaitable(client.smembers(key))
@@ -150,5 +295,21 @@ class TradeRecordRepository:
             raise TradeStoreError(f"Trade payload missing for key {trade_key}")
         return self._codec.to_mapping(trade_json)
 
+    async def _get_values(self, keys: Sequence[str]) -> List[Any]:
+        if not keys:
+            return []
+        client = await self._redis_provider()
+        values: List[Any] = []
+        for start in range(0, len(keys), _FETCH_CHUNK_SIZE):
+            async with client.pipeline(transaction=False) as pipe:
+                for key in keys[start : start + _FETCH_CHUNK_SIZE]:
+                    pipe.get(key)
+                values.extend(await ensure_awaitable(pipe.execute()))
+        return values
+
+
+def _decode_key(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
 
 __all__ = ["TradeRecordRepository"]
@@ -8,7 +8,7 @@ management and fail-fast wiring, keeping each responsibility discoverable.
 
 import logging
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from redis.asyncio import Redis
 
@@ -58,7 +58,7 @@ class TradeStore:
         return await self._connection_mgr.get_redis(lambda: self.redis)
 
     async def initialize(self) -> bool:
-        """Initialize Redis connection."""
+        """Initialize Redis connection and backfill the open-trade ticker index."""
 
         async def _acquire_pool(allow_reuse: bool):
             return await self._pool_acquirer.acquire_pool(
@@ -68,11 +68,15 @@ class TradeStore:
                 original_redis_class=ORIGINAL_REDIS_CLASS,
             )
 
-        return await self._connection_mgr.initialize(
+        initialized = await self._connection_mgr.initialize(
             redis_setter=lambda v: setattr(self, "_redis_client", v),
             settings_resolver=self._connection_mgr.resolve_connection_settings,
             pool_acquirer=_acquire_pool,
         )
+        if initialized:
+            # Index trades stored before the ticker index existed, off the price-update path
+            await self.rebuild_ticker_index()
+        return initialized
 
     async def close(self) -> None:
         """Close Redis connection cleanly."""
@@ -163,6 +167,18 @@ class TradeStore:
     async def get_daily_summary(self, trade_date: date) -> Optional[Dict[str, Any]]:
         return await self._executor.run_with_redis_guard("get_daily_summary", lambda: self._pnl.get_daily_summary(trade_date))
 
+    async def get_pnl_aggregates(self, start_date: date, end_date: date) -> List[Any]:
+        return await self._executor.run_with_redis_guard(
+            "get_pnl_aggregates",
+            lambda: self._pnl.get_daily_aggregates(start_date, end_date),
+        )
+
+    async def rebuild_pnl_aggregates(self, start_date: date, end_date: date) -> int:
+        return await self._executor.run_with_redis_guard(
+            "rebuild_pnl_aggregates",
+            lambda: self._repository.rebuild_daily_aggregates(start_date, end_date),
+        )
+
     async def store_unrealized_pnl_data(self, redis_key: str, data: Dict[str, Any]) -> bool:
         return await self._executor.run_with_redis_guard(
             "store_unrealized_pnl_data",
@@ -184,5 +200,18 @@ class TradeStore:
             lambda: self._price_updater.update_market_prices(market_ticker, yes_bid=yes_bid, yes_ask=yes_ask),
         )
 
+    async def update_trade_prices_batch(self, updates: Iterable[Tuple[str, float, float]]) -> int:
+        batch = list(updates)
+        return await self._executor.run_with_redis_guard(
+            "update_trade_prices_batch",
+            lambda: self._price_updater.update_prices_batch(batch),
+        )
+
+    async def rebuild_ticker_index(self, lookback_days: int = 7) -> int:
+        return await self._executor.run_with_redis_guard(
+            "rebuild_ticker_index",
+            lambda: self._price_updater.reindex_open_trades(lookback_days),
+        )
+
 
 __all__ = ["TradeStore", "OrderMetadataError", "TradeStoreError", "TradeStoreShutdownError"]
@@ -21,10 +21,12 @@ from .markets import (
 )
 from .namespaces import RedisNamespace, sanitize_segment
 from .operations import (
+    MarketChangeLogKey,
     MetricStreamKey,
     ServiceStatusKey,
     SubscriptionKey,
     SubscriptionType,
+    SyncCheckpointKey,
 )
 from .trades import TradeIndexKey, TradeRecordKey, TradeSummaryKey
 from .validators import register_namespace, validate_registered_key
@@ -33,6 +35,7 @@ from .weather import (
     WeatherDailyHighKey,
     WeatherDailyLowKey,
     WeatherHistoryKey,
+    WeatherRollupKey,
     WeatherStationKey,
     ensure_uppercase_icao,
 )
@@ -62,6 +65,7 @@ __all__ = [
     "WeatherAlertKey",
     "WeatherDailyHighKey",
     "WeatherDailyLowKey",
+    "WeatherRollupKey",
     "ensure_uppercase_icao",
     "TradeRecordKey",
     "TradeIndexKey",
@@ -70,5 +74,7 @@ __all__ = [
     "SubscriptionType",
     "ServiceStatusKey",
     "MetricStreamKey",
+    "MarketChangeLogKey",
+    "SyncCheckpointKey",
     "RedisSchemaConfig",
 ]
@@ -13,6 +13,8 @@ from .validators import register_namespace
 register_namespace("ops:subscriptions:", "Per-service subscription registries")
 register_namespace("ops:status:", "Service lifecycle states")
 register_namespace("ops:metrics:", "Operational metrics streams")
+register_namespace("ops:market_changes:", "Per-venue change log of added/removed market keys")
+register_namespace("ops:sync_checkpoints:", "Resumable pagination checkpoints for exchange list endpoints")
 
 
 class SubscriptionType(str, Enum):
@@ -64,3 +66,28 @@ class MetricStreamKey:
             segments.append(sanitize_segment(self.window))
         builder = KeyBuilder(RedisNamespace.OPERATIONS, tuple(segments))
         return builder.render()
+
+
+@dataclass(frozen=True)
+class MarketChangeLogKey:
+    """Stream key logging market keys added to or removed from a venue namespace."""
+
+    venue: str
+
+    def key(self) -> str:
+        segments = ["market_changes", sanitize_segment(self.venue)]
+        builder = KeyBuilder(RedisNamespace.OPERATIONS, tuple(segments))
+        return builder.render()
+
+
+@dataclass(frozen=True)
+class SyncCheckpointKey:
+    """Hash key holding the incremental-sync checkpoint of one paginated feed."""
+
+    source: str
+    feed: str
+
+    def key(self) -> str:
+        segments = ["sync_checkpoints", sanitize_segment(self.source), sanitize_segment(self.feed)]
+        builder = KeyBuilder(RedisNamespace.OPERATIONS, tuple(segments))
+        return builder.render()
@@ -16,6 +16,7 @@ register_namespace("weather:station_history:", "Historical weather observations"
 register_namespace("weather:station_alerts:", "Active weather station alerts")
 register_namespace("weather:daily_high:", "Daily high temperatures by station and date")
 register_namespace("weather:daily_low:", "Daily low temperatures by station and date")
+register_namespace("weather:station_rollup:", "Hourly and daily temperature rollups by station and UTC date")
 
 _ICAO_RE = re.compile(r"^[A-Z0-9_.\-]+$")
 
@@ -106,3 +107,17 @@ class WeatherDailyLowKey:
         segments = ["daily_low", sanitize_segment(icao, case="unchanged"), self.date_str]
         builder = KeyBuilder(RedisNamespace.WEATHER, tuple(segments))
         return builder.render()
+
+
+@dataclass(frozen=True)
+class WeatherRollupKey:
+    """Key for a station's temperature rollups on one UTC date (sorted set scored by temperature)."""
+
+    icao: str
+    date_str: str  # Format: YYYY-MM-DD
+
+    def key(self) -> str:
+        icao = ensure_uppercase_icao(self.icao)
+        segments = ["station_rollup", sanitize_segment(icao, case="unchanged"), self.date_str]
+        builder = KeyBuilder(RedisNamespace.WEATHER, tuple(segments))
+        return builder.render()
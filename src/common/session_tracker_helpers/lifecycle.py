@@ -125,6 +125,19 @@ class SessionActivityTracker:
         session_info.request_count += 1
         session_info.last_activity = time.time()
 
+    def track_connection(self, session_id: str, *, reused: bool, connect_seconds: float = 0.0) -> None:
+        """Record whether a request reused a pooled connection or opened a new one."""
+        session_info = self.sessions.get(session_id)
+        if not session_info:
+            logger.warning("Connection for unknown session: %s", session_id)
+            return
+        if reused:
+            session_info.reused_connections += 1
+            return
+        session_info.new_connections += 1
+        session_info.connect_seconds += connect_seconds
+        session_info.max_connect_seconds = max(session_info.max_connect_seconds, connect_seconds)
+
 
 class SessionQueries:
     """Provides read-only access to tracked session metadata."""
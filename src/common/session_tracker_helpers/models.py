@@ -18,3 +18,15 @@ class SessionInfo:
     is_closed: bool = False
     last_activity: float = field(default_factory=time.time)
     request_count: int = 0
+    new_connections: int = 0
+    reused_connections: int = 0
+    connect_seconds: float = 0.0
+    max_connect_seconds: float = 0.0
+
+    @property
+    def connection_reuse_ratio(self) -> float:
+        """Share of requests served on an already-open (keep-alive) connection."""
+        total = self.new_connections + self.reused_connections
+        if not total:
+            return 0.0
+        return self.reused_connections / total
@@ -44,5 +44,6 @@ class SessionReporter:
                 logger.warning(
                     f"  - {session_info.session_id} ({session_info.service_name}): "
                     f"age={duration:.1f}s, last_activity={last_activity_ago:.1f}s ago, "
-                    f"requests={session_info.request_count}"
+                    f"requests={session_info.request_count}, "
+                    f"connections={session_info.new_connections} new/{session_info.reused_connections} reused"
                 )
@@ -50,6 +50,10 @@ class SessionTrackerActivityMixin:
         """Track activity on a session (e.g., HTTP request made)."""
         self._activity.track_activity(session_id)
 
+    def track_session_connection(self, session_id: str, *, reused: bool, connect_seconds: float = 0.0) -> None:
+        """Track a pooled connection reuse or a new connection (TCP + TLS handshake)."""
+        self._activity.track_connection(session_id, reused=reused, connect_seconds=connect_seconds)
+
     def track_session_closure(self, session_id: str) -> None:
         """Track explicit closure of a session."""
         self._lifecycle.track_closure(session_id)
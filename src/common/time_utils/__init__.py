@@ -44,9 +44,12 @@ from .local import (
     is_after_local_midnight,
 )
 from .solar import calculate_solar_noon_utc, is_after_solar_noon
+from .solar_cache import SolarDay, SolarDayCache
 from .twilight import (
+    TwilightArrays,
     calculate_dawn_utc,
     calculate_dusk_utc,
+    calculate_twilight_batch,
     is_after_midpoint_noon_to_dusk,
     is_between_dawn_and_dusk,
 )
@@ -96,4 +99,8 @@ __all__ = [
     "calculate_dusk_utc",
     "is_between_dawn_and_dusk",
     "is_after_midpoint_noon_to_dusk",
+    "calculate_twilight_batch",
+    "TwilightArrays",
+    "SolarDay",
+    "SolarDayCache",
 ]
@@ -0,0 +1,136 @@
+"""Per-station memo of daily solar and twilight times.
+
+Status reporting and weather features ask for the same station's sunrise,
+dawn and dusk many times a day.  :class:`SolarDayCache` computes each
+(station, UTC date) once.  When a date is first requested, the whole known
+station set is filled in one vectorised batch.  Dates more than a day older
+than the newest requested date are evicted, which keeps the yesterday/today/tomorrow
+window that midnight-adjacent daylight checks need.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from common.utils.solar import compute_solar_times_batch, seconds_of_day_to_time
+
+from .base import AstronomicalComputationError, logger
+from .twilight import _NEAR_MIDNIGHT_HOURS, _validate_coordinates, calculate_twilight_batch
+
+_HOURS_PER_DAY = 24
+_RETAINED_PAST_DAYS = 1
+
+
+@dataclass(frozen=True)
+class SolarDay:
+    """Solar times for one station on one UTC date.
+
+    ``sunrise``/``solar_noon``/``sunset`` follow :func:`common.utils.solar.compute_solar_times`
+    (the diurnal-feature model); ``dawn``/``twilight_noon``/``dusk`` follow
+    :mod:`common.time_utils.twilight`.  ``dawn``/``dusk`` are ``None`` where
+    civil twilight does not occur.
+    """
+
+    sunrise: time
+    solar_noon: time
+    sunset: time
+    dawn: Optional[datetime]
+    twilight_noon: datetime
+    dusk: Optional[datetime]
+
+
+class SolarDayCache:
+    """Memoised :class:`SolarDay` values keyed by station and UTC date."""
+
+    def __init__(self) -> None:
+        self._stations: Dict[str, Tuple[float, float]] = {}
+        self._days: Dict[Tuple[str, date], SolarDay] = {}
+        self._latest_day: Optional[date] = None
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def get(self, station_id: str, latitude: float, longitude: float, day: date) -> SolarDay:
+        """Return the cached day for a station, computing the date for all stations on a miss.
+
+        Coordinates are validated before the station joins the batch, so one
+        bad station cannot fail the lookups of the others.
+        """
+        if self._stations.get(station_id) != (latitude, longitude):
+            _validate_coordinates(latitude, longitude)
+            self._stations[station_id] = (latitude, longitude)
+            self._forget_station(station_id)
+        self._roll_over(day)
+        cached = self._days.get((station_id, day))
+        if cached is None:
+            self._fill_day(day)
+            cached = self._days[(station_id, day)]
+        return cached
+
+    def is_between_dawn_and_dusk(self, station_id: str, latitude: float, longitude: float, current_time: Optional[datetime] = None) -> bool:
+        """Cached equivalent of :func:`common.time_utils.is_between_dawn_and_dusk`."""
+        current_time = current_time or datetime.now(timezone.utc)
+        if current_time.tzinfo is None:
+            current_time = current_time.replace(tzinfo=timezone.utc)
+        today = current_time.astimezone(timezone.utc).date()
+
+        if self._in_twilight_window(station_id, latitude, longitude, today, current_time):
+            return True
+
+        hour = current_time.hour
+        if hour < _NEAR_MIDNIGHT_HOURS or hour >= (_HOURS_PER_DAY - _NEAR_MIDNIGHT_HOURS):
+            for neighbour in (today - timedelta(days=1), today + timedelta(days=1)):
+                if self._in_twilight_window(station_id, latitude, longitude, neighbour, current_time):
+                    return True
+        return False
+
+    def _in_twilight_window(self, station_id: str, latitude: float, longitude: float, day: date, current_time: datetime) -> bool:
+        solar_day = self.get(station_id, latitude, longitude, day)
+        if solar_day.dawn is None or solar_day.dusk is None:
+            raise AstronomicalComputationError(f"Polar day prevents twilight calculation for lat={latitude}, lon={longitude}, date={day}")
+        return solar_day.dawn <= current_time <= solar_day.dusk
+
+    def _roll_over(self, day: date) -> None:
+        if self._latest_day is not None and day <= self._latest_day:
+            return
+        self._latest_day = day
+        cutoff = day - timedelta(days=_RETAINED_PAST_DAYS)
+        stale = [key for key in self._days if key[1] < cutoff]
+        for key in stale:
+            del self._days[key]
+        if stale:
+            logger.debug("Evicted %d cached solar days before %s", len(stale), cutoff)
+
+    def _forget_station(self, station_id: str) -> None:
+        for key in [key for key in self._days if key[0] == station_id]:
+            del self._days[key]
+
+    def _fill_day(self, day: date) -> None:
+        station_ids = [station_id for station_id in self._stations if (station_id, day) not in self._days]
+        latitudes = np.array([self._stations[station_id][0] for station_id in station_ids], dtype=np.float64)
+        longitudes = np.array([self._stations[station_id][1] for station_id in station_ids], dtype=np.float64)
+        solar = compute_solar_times_batch(latitudes, longitudes, [day])
+        twilight = calculate_twilight_batch(latitudes, longitudes, [day])
+        for index, station_id in enumerate(station_ids):
+            self._days[(station_id, day)] = SolarDay(
+                sunrise=seconds_of_day_to_time(solar.sunrise[index]),
+                solar_noon=seconds_of_day_to_time(solar.solar_noon[index]),
+                sunset=seconds_of_day_to_time(solar.sunset[index]),
+                dawn=_epoch_to_datetime(twilight.dawn[index]),
+                twilight_noon=datetime.fromtimestamp(float(twilight.solar_noon[index]), tz=timezone.utc),
+                dusk=_epoch_to_datetime(twilight.dusk[index]),
+            )
+
+
+def _epoch_to_datetime(seconds: float) -> Optional[datetime]:
+    if math.isnan(seconds):
+        return None
+    return datetime.fromtimestamp(float(seconds), tz=timezone.utc)
+
+
+__all__ = ["SolarDay", "SolarDayCache"]
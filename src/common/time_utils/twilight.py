@@ -6,7 +6,12 @@ from common.truthy import pick_if
 
 import math
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import NamedTuple, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from common.utils.solar import DatesLike, day_of_year_array
 
 from .base import EARTH_AXIAL_TILT_DEG, AstronomicalComputationError, logger
 from .solar import calculate_solar_noon_utc
@@ -113,6 +118,70 @@ def _log_twilight(latitude: float, longitude: float, date_utc: datetime, result:
     )
 
 
+class TwilightArrays(NamedTuple):
+    """Dawn, solar noon, and dusk as UTC epoch seconds (NaN where polar day/night)."""
+
+    dawn: np.ndarray
+    solar_noon: np.ndarray
+    dusk: np.ndarray
+
+
+def calculate_twilight_batch(
+    latitudes: npt.ArrayLike,
+    longitudes: npt.ArrayLike,
+    dates: DatesLike,
+) -> TwilightArrays:
+    """Vectorised :func:`calculate_dawn_utc`, :func:`calculate_solar_noon_utc` and :func:`calculate_dusk_utc`.
+
+    ``dates`` are UTC calendar days; inputs broadcast against each other.
+    Values match the scalar functions to the second.  Where the scalar
+    functions raise :class:`AstronomicalComputationError` the dawn/dusk entry
+    is NaN instead.
+    """
+    lat = np.asarray(latitudes, dtype=np.float64)
+    lon = np.asarray(longitudes, dtype=np.float64)
+    days = np.asarray(dates, dtype="datetime64[D]")
+    lat, lon, days = np.broadcast_arrays(lat, lon, days)
+    _validate_coordinate_arrays(lat, lon)
+
+    day_of_year = day_of_year_array(days)
+    declination = EARTH_AXIAL_TILT_DEG * np.sin(np.radians(360 * (284 + day_of_year) / 365))
+    lat_rad = np.radians(lat)
+    decl_rad = np.radians(declination)
+    cos_hour_angle = (math.sin(math.radians(-6.0)) - np.sin(lat_rad) * np.sin(decl_rad)) / (np.cos(lat_rad) * np.cos(decl_rad))
+    has_twilight = (cos_hour_angle >= -1) & (cos_hour_angle <= 1)
+    hour_angle = np.degrees(np.arccos(np.where(has_twilight, cos_hour_angle, 0.0)))
+
+    B = 2 * math.pi * (day_of_year - 81) / 365
+    equation_of_time = 9.87 * np.sin(2 * B) - 7.53 * np.cos(B) - 1.5 * np.sin(B)
+    longitude_correction = -4 * lon
+
+    midnight = days.astype("datetime64[s]").astype(np.int64).astype(np.float64)
+    dawn_minutes = (12 * 60 + -hour_angle * 4) + longitude_correction + equation_of_time
+    dusk_minutes = (12 * 60 + hour_angle * 4) + longitude_correction + equation_of_time
+    noon_minutes = 12 * 60 + longitude_correction + equation_of_time
+
+    return TwilightArrays(
+        dawn=np.where(has_twilight, midnight + _minutes_to_truncated_seconds(dawn_minutes), np.nan),
+        solar_noon=midnight + _minutes_to_truncated_seconds(noon_minutes),
+        dusk=np.where(has_twilight, midnight + _minutes_to_truncated_seconds(dusk_minutes), np.nan),
+    )
+
+
+def _validate_coordinate_arrays(lat: np.ndarray, lon: np.ndarray) -> None:
+    bad_lat = (lat < _CONST_NEG_90) | (lat > _CONST_90)
+    if bad_lat.any():
+        raise ValueError(f"Latitude {lat[bad_lat].flat[0]} is out of valid range [-90, 90]")
+    bad_lon = (lon < _CONST_NEG_180) | (lon > _CONST_180)
+    if bad_lon.any():
+        raise ValueError(f"Longitude {lon[bad_lon].flat[0]} is out of valid range [-180, 180]")
+
+
+def _minutes_to_truncated_seconds(minutes: np.ndarray) -> np.ndarray:
+    """Seconds after midnight, truncated the way ``_build_twilight_datetime`` does."""
+    return np.floor_divide(minutes, 60) * 3600 + np.floor(np.mod(minutes, 60)) * 60 + np.floor(np.mod(minutes, 1) * 60)
+
+
 _NEAR_MIDNIGHT_HOURS = 3
 
 
@@ -192,7 +261,9 @@ def is_after_midpoint_noon_to_dusk(latitude: float, longitude: float, current_ti
 
 
 __all__ = [
+    "TwilightArrays",
     "calculate_dawn_utc",
+    "calculate_twilight_batch",
     "calculate_dusk_utc",
     "is_after_midpoint_noon_to_dusk",
     "is_between_dawn_and_dusk",
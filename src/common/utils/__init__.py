@@ -15,17 +15,21 @@ ARCHITECTURAL NOTE: The system uses a hybrid approach:
 from typing import List
 
 from .solar import (
+    SolarTimeArrays,
     SolarTimes,
     compute_day_of_year_encoding,
     compute_solar_diurnal,
     compute_solar_diurnal_from_iso,
     compute_solar_times,
+    compute_solar_times_batch,
 )
 
 __all__: List[str] = [
+    "SolarTimeArrays",
     "SolarTimes",
     "compute_day_of_year_encoding",
     "compute_solar_diurnal",
     "compute_solar_diurnal_from_iso",
     "compute_solar_times",
+    "compute_solar_times_batch",
 ]
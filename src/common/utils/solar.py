@@ -13,7 +13,10 @@ from __future__ import annotations
 import math
 import re
 from datetime import date, datetime, time
-from typing import NamedTuple, Optional
+from typing import NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+import numpy.typing as npt
 
 
 class SolarTimes(NamedTuple):
@@ -114,6 +117,88 @@ def compute_solar_times(latitude: float, longitude: float, d: date) -> SolarTime
     )
 
 
+# ---------------------------------------------------------------------------
+# Public API — batched solar times
+# ---------------------------------------------------------------------------
+
+_SECONDS_PER_HOUR = 3600
+_SECONDS_PER_MINUTE = 60
+
+DatesLike = Union[Sequence[date], npt.ArrayLike]
+
+
+class SolarTimeArrays(NamedTuple):
+    """Sunrise, solar noon, and sunset as seconds after UTC midnight."""
+
+    sunrise: np.ndarray
+    solar_noon: np.ndarray
+    sunset: np.ndarray
+
+
+def day_of_year_array(dates: DatesLike) -> np.ndarray:
+    """Return the 1-based day of year for each date as an int64 array."""
+    days = np.asarray(dates, dtype="datetime64[D]")
+    return (days - days.astype("datetime64[Y]")).astype(np.int64) + 1
+
+
+def _hours_to_seconds_of_day(hours: np.ndarray) -> np.ndarray:
+    """Vectorised ``hours_to_time``: wrap at 24h and truncate to whole seconds."""
+    wrapped = np.mod(hours, 24)
+    whole_hours = np.floor(wrapped)
+    minutes = np.floor((wrapped - whole_hours) * 60)
+    seconds = np.floor(((wrapped - whole_hours) * 60 - minutes) * 60)
+    return (whole_hours * _SECONDS_PER_HOUR + minutes * _SECONDS_PER_MINUTE + seconds).astype(np.int64)
+
+
+def compute_solar_times_batch(
+    latitudes: npt.ArrayLike,
+    longitudes: npt.ArrayLike,
+    dates: DatesLike,
+) -> SolarTimeArrays:
+    """Vectorised :func:`compute_solar_times` over stations and dates.
+
+    Inputs broadcast against each other, so ``lat[:, None]``/``lon[:, None]``
+    with a 1-D ``dates`` yields a station x date grid.  Each field holds the
+    same wall-clock value as the scalar function, expressed as integer seconds
+    after UTC midnight (``time(h, m, s)`` <-> ``h * 3600 + m * 60 + s``).
+    """
+    lat, lon, day_of_year = np.broadcast_arrays(
+        np.asarray(latitudes, dtype=np.float64),
+        np.asarray(longitudes, dtype=np.float64),
+        day_of_year_array(dates),
+    )
+    lat_rad = np.radians(lat)
+
+    declination = math.radians(-_AXIAL_TILT_DEG) * np.cos(2 * math.pi * (day_of_year + 10) / 365)
+    b = 2 * math.pi * (day_of_year - 81) / 365
+    eot = 9.87 * np.sin(2 * b) - 7.53 * np.cos(b) - 1.5 * np.sin(b)
+
+    cos_ha = -np.tan(lat_rad) * np.tan(declination)
+    hour_angle = np.where(
+        cos_ha < -1,
+        math.pi,  # Polar day - sun never sets
+        np.where(cos_ha > 1, 0.0, np.arccos(np.clip(cos_ha, -1.0, 1.0))),
+    )
+
+    solar_noon_utc = 12.0 - (lon / 15.0) - (eot / 60.0)
+    day_length_hours = 2 * np.degrees(hour_angle) / 15.0
+    sunrise_utc = solar_noon_utc - day_length_hours / 2
+    sunset_utc = solar_noon_utc + day_length_hours / 2
+
+    return SolarTimeArrays(
+        sunrise=_hours_to_seconds_of_day(sunrise_utc),
+        solar_noon=_hours_to_seconds_of_day(solar_noon_utc),
+        sunset=_hours_to_seconds_of_day(sunset_utc),
+    )
+
+
+def seconds_of_day_to_time(seconds: int) -> time:
+    """Convert an entry of :class:`SolarTimeArrays` back to a ``time``."""
+    hours, remainder = divmod(int(seconds), _SECONDS_PER_HOUR)
+    minutes, secs = divmod(remainder, _SECONDS_PER_MINUTE)
+    return time(hours, minutes, secs)
+
+
 # ---------------------------------------------------------------------------
 # Public API — diurnal fraction
 # ---------------------------------------------------------------------------
@@ -227,8 +312,12 @@ def compute_solar_diurnal_from_iso(
 
 
 __all__ = [
+    "SolarTimeArrays",
     "SolarTimes",
     "compute_solar_times",
+    "compute_solar_times_batch",
+    "day_of_year_array",
+    "seconds_of_day_to_time",
     "compute_solar_diurnal",
     "compute_solar_diurnal_from_iso",
     "compute_day_of_year_encoding",
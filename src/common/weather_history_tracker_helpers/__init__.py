@@ -1,9 +1,16 @@
 """Helper modules for WeatherHistoryTracker slim coordinator pattern"""
 
+from .observation_codec import ObservationArrays, decode_observations, encode_observation
 from .observation_recorder import WeatherObservationRecorder
+from .rollups import HourlyRollup, StationRollups
 from .statistics_retriever import WeatherStatisticsRetriever
 
 __all__ = [
+    "HourlyRollup",
+    "ObservationArrays",
+    "StationRollups",
     "WeatherObservationRecorder",
     "WeatherStatisticsRetriever",
+    "decode_observations",
+    "encode_observation",
 ]
@@ -0,0 +1,99 @@
+"""Compact encoding for weather history sorted-set members.
+
+Observations are stored as ``"<epoch_seconds>:<temp_f>"`` members scored by
+the epoch second, the same ``timestamp:value`` shape the service history sets
+use.  :func:`decode_observations` turns a ``ZRANGEBYSCORE ... WITHSCORES``
+reply into NumPy arrays in one vectorised pass; legacy JSON members written
+before the compact format are still understood.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Temperature bounds in Fahrenheit — shared with the recorder and retriever
+_TEMP_MAX = 200
+_TEMP_MIN = -200
+_SEPARATOR = ":"
+_LEGACY_PREFIX = "{"
+
+
+class ObservationArrays(NamedTuple):
+    """Observation timestamps (epoch seconds) and temperatures, ascending by time."""
+
+    timestamps: np.ndarray
+    temps_f: np.ndarray
+
+    def to_pairs(self) -> List[Tuple[int, float]]:
+        return list(zip(self.timestamps.tolist(), self.temps_f.tolist()))
+
+
+def empty_observations() -> ObservationArrays:
+    return ObservationArrays(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64))
+
+
+def encode_observation(timestamp: int, temp_f: float) -> str:
+    """Sorted-set member for one observation."""
+    return f"{int(timestamp)}{_SEPARATOR}{float(temp_f)!r}"
+
+
+def decode_observations(entries: Sequence[Tuple[bytes | str, float]]) -> ObservationArrays:
+    """Decode ``(member, score)`` pairs, dropping unparseable or out-of-range temperatures.
+
+    Entries must already be ordered by score, as sorted-set range replies are.
+    """
+    if not entries:
+        return empty_observations()
+
+    members = [member.decode("utf-8") if isinstance(member, bytes) else member for member, _ in entries]
+    timestamps = np.fromiter((score for _, score in entries), dtype=np.float64, count=len(entries)).astype(np.int64)
+    temps = np.full(len(members), np.nan)
+
+    legacy = np.fromiter((member.startswith(_LEGACY_PREFIX) for member in members), dtype=bool, count=len(members))
+    compact_index = np.flatnonzero(~legacy)
+    if compact_index.size:
+        values = np.char.partition(np.array([members[i] for i in compact_index]), _SEPARATOR)[:, 2]
+        temps[compact_index] = _parse_floats(values)
+    for index in np.flatnonzero(legacy):
+        temps[index] = _parse_legacy(members[index])
+
+    valid = (temps >= _TEMP_MIN) & (temps <= _TEMP_MAX)
+    invalid_count = int(len(temps) - np.count_nonzero(valid))
+    if invalid_count:
+        logger.warning("%d invalid temperature entries (missing temp/out of range)", invalid_count)
+    return ObservationArrays(timestamps[valid], temps[valid])
+
+
+def _parse_floats(values: np.ndarray) -> np.ndarray:
+    try:
+        return values.astype(np.float64)
+    except ValueError:
+        # A malformed member spoils the bulk cast; fall back to per-value parsing
+        return np.array([_parse_float(value) for value in values.tolist()], dtype=np.float64)
+
+
+def _parse_float(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:  # policy_guard: allow-silent-handler
+        return float("nan")
+
+
+def _parse_legacy(member: str) -> float:
+    try:
+        return float(json.loads(member)["temp_f"])
+    except (  # policy_guard: allow-silent-handler
+        ValueError,
+        KeyError,
+        TypeError,
+    ):
+        return float("nan")
+
+
+__all__ = ["ObservationArrays", "decode_observations", "empty_observations", "encode_observation"]
@@ -2,19 +2,18 @@
 
 from __future__ import annotations
 
-import json
 import logging
+from datetime import datetime, timezone
 
 from common.exceptions import ValidationError
 from common.redis_protocol.typing import RedisClient, ensure_awaitable
 from common.redis_schema import WeatherHistoryKey, ensure_uppercase_icao
 from common.time_utils import get_current_utc
 
-logger = logging.getLogger(__name__)
+from .observation_codec import _TEMP_MAX, _TEMP_MIN, encode_observation
+from .rollups import queue_rollup_updates
 
-# Temperature bounds in Fahrenheit — shared with statistics_retriever
-_TEMP_MAX = 200
-_TEMP_MIN = -200
+logger = logging.getLogger(__name__)
 
 
 class WeatherObservationRecorder:
@@ -46,18 +45,21 @@ class WeatherObservationRecorder:
             temp_f: Temperature in Fahrenheit
 
         Returns:
-            Tuple of (datetime_str, timestamp, json_payload)
+            Tuple of (datetime_str, timestamp, compact "timestamp:temp_f" member)
         """
         current_utc = get_current_utc()
         datetime_str = current_utc.isoformat()
         timestamp = int(current_utc.timestamp())
-        payload = json.dumps({"temp_f": temp_f, "observed_at": datetime_str})
+        payload = encode_observation(timestamp, temp_f)
         return datetime_str, timestamp, payload
 
     @staticmethod
     async def record_observation(client: RedisClient, station_icao: str, temp_f: float) -> tuple[bool, str]:
         """
-        Record temperature observation to Redis sorted set.
+        Record temperature observation to Redis sorted set and update its rollups.
+
+        The raw member and the hourly/daily rollup updates go out in one
+        MULTI/EXEC round trip.
 
         Args:
             client: Redis client instance
@@ -73,15 +75,18 @@ class WeatherObservationRecorder:
 
             # Build payload
             datetime_str, timestamp, payload = WeatherObservationRecorder.build_observation_payload(temp_f)
+            observed_at = datetime.fromtimestamp(timestamp, tz=timezone.utc)
 
-            # Store in Redis (retention handled by weather service)
+            # Store in Redis (raw retention handled by weather service, rollups expire on their own)
             redis_key = WeatherHistoryKey(icao=station_icao).key()
-            await ensure_awaitable(client.zadd(redis_key, {payload: timestamp}))
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.zadd(redis_key, {payload: timestamp})
+                queue_rollup_updates(pipe, station_icao, observed_at, float(temp_f))
+                await ensure_awaitable(pipe.execute())
 
             logger.debug(f"Recorded {station_icao} temperature history: {temp_f:.1f}°F at {datetime_str}")
 
         except (  # policy_guard: allow-silent-handler
-            json.JSONDecodeError,
             ValueError,
             TypeError,
         ):
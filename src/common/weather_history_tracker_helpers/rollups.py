@@ -0,0 +1,121 @@
+"""Hourly and daily temperature rollups maintained alongside raw observations.
+
+Each station/UTC-date pair has one sorted set (``WeatherRollupKey``) whose
+members name the statistic and whose scores hold the temperature:
+
+- ``"HH:min"``/``"HH:max"`` — written with ``ZADD LT``/``ZADD GT`` so Redis keeps
+  the extreme atomically, without a read-modify-write;
+- ``"HH:last"`` — overwritten by every observation in the hour;
+- ``"high"`` — the UTC day's high so far (``ZADD GT``).
+
+The UTC day starts in the local afternoon/evening for US stations, so the
+``"high"`` member (``StationRollups.utc_day_high_f``) is not the station's
+local daily high; derive that from the hourly rollups of the local day.
+
+Rule evaluation can then read 24h of hourly rollups for every station with
+one pipelined ``ZRANGE`` per day key instead of decoding raw history.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from common.redis_schema import WeatherRollupKey
+
+_ROLLUP_TTL_SECONDS = 3 * 24 * 3600
+_UTC_DAY_HIGH_MEMBER = "high"
+_MIN = "min"
+_MAX = "max"
+_LAST = "last"
+
+
+@dataclass(frozen=True)
+class HourlyRollup:
+    """Temperature extremes and latest reading for one UTC hour."""
+
+    hour_start: int
+    min_f: float
+    max_f: float
+    last_f: float
+
+
+@dataclass(frozen=True)
+class StationRollups:
+    """Hourly rollups in a lookback window plus the current UTC day's high so far."""
+
+    hourly: List[HourlyRollup]
+    utc_day_high_f: Optional[float]
+
+
+def rollup_key(station_icao: str, moment: datetime) -> str:
+    return WeatherRollupKey(icao=station_icao, date_str=moment.strftime("%Y-%m-%d")).key()
+
+
+def queue_rollup_updates(pipe: Any, station_icao: str, observed_at: datetime, temp_f: float) -> None:
+    """Queue the rollup writes for one observation on ``pipe``."""
+    observed_utc = observed_at.astimezone(timezone.utc)
+    key = rollup_key(station_icao, observed_utc)
+    hour = f"{observed_utc.hour:02d}"
+    pipe.zadd(key, {f"{hour}:{_MIN}": temp_f}, lt=True)
+    pipe.zadd(key, {f"{hour}:{_MAX}": temp_f}, gt=True)
+    pipe.zadd(key, {f"{hour}:{_LAST}": temp_f})
+    pipe.zadd(key, {_UTC_DAY_HIGH_MEMBER: temp_f}, gt=True)
+    pipe.expire(key, _ROLLUP_TTL_SECONDS)
+
+
+def rollup_days(now: datetime, hours: int) -> List[datetime]:
+    """UTC midnights of every day touched by the ``hours`` window ending at ``now``."""
+    now_utc = now.astimezone(timezone.utc)
+    day = (now_utc - timedelta(hours=hours)).replace(hour=0, minute=0, second=0, microsecond=0)
+    days = []
+    while day <= now_utc:
+        days.append(day)
+        day += timedelta(days=1)
+    return days
+
+
+def parse_station_rollups(
+    days: Sequence[datetime],
+    replies: Sequence[Sequence[Tuple[bytes | str, float]]],
+    cutoff_ts: float,
+) -> StationRollups:
+    """Build :class:`StationRollups` from ``ZRANGE ... WITHSCORES`` replies, one per day in ``days``."""
+    hourly: List[HourlyRollup] = []
+    utc_day_high: Optional[float] = None
+    today = days[-1] if days else None
+    for day, entries in zip(days, replies):
+        fields: Dict[Tuple[int, str], float] = {}
+        for member, score in entries or []:
+            name = member.decode("utf-8") if isinstance(member, bytes) else member
+            if name == _UTC_DAY_HIGH_MEMBER:
+                if day == today:
+                    utc_day_high = float(score)
+                continue
+            hour, _, stat = name.partition(":")
+            fields[(int(hour), stat)] = float(score)
+        day_start = int(day.timestamp())
+        for hour in sorted({hour for hour, _ in fields}):
+            hour_start = day_start + hour * 3600
+            if hour_start + 3600 <= cutoff_ts:
+                continue
+            hourly.append(
+                HourlyRollup(
+                    hour_start=hour_start,
+                    min_f=fields[(hour, _MIN)],
+                    max_f=fields[(hour, _MAX)],
+                    last_f=fields[(hour, _LAST)],
+                )
+            )
+    return StationRollups(hourly=hourly, utc_day_high_f=utc_day_high)
+
+
+__all__ = [
+    "HourlyRollup",
+    "StationRollups",
+    "parse_station_rollups",
+    "queue_rollup_updates",
+    "rollup_days",
+    "rollup_key",
+]
@@ -2,17 +2,17 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from datetime import timedelta
-from typing import List, Tuple
+from typing import Dict, List, Sequence, Tuple
 
 from common.exceptions import ValidationError
 from common.redis_protocol.typing import RedisClient, ensure_awaitable
 from common.redis_schema import WeatherHistoryKey, ensure_uppercase_icao
 from common.time_utils import get_current_utc
 
-from .observation_recorder import _TEMP_MAX, _TEMP_MIN
+from .observation_codec import ObservationArrays, decode_observations, empty_observations
+from .rollups import StationRollups, parse_station_rollups, rollup_days, rollup_key
 
 logger = logging.getLogger(__name__)
 
@@ -20,26 +20,6 @@ logger = logging.getLogger(__name__)
 class WeatherStatisticsRetriever:
     """Retrieves and processes weather station temperature history"""
 
-    @staticmethod
-    def _parse_entry(payload: bytes | str, score: float) -> Tuple[int, float] | None:
-        """Parse temperature entry from Redis sorted set"""
-        try:
-            if isinstance(payload, bytes):
-                payload = payload.decode("utf-8")
-            data = json.loads(payload)
-            temp_f = float(data["temp_f"])
-        except (  # policy_guard: allow-silent-handler
-            ValueError,
-            KeyError,
-            json.JSONDecodeError,
-            TypeError,
-        ):
-            return None
-        else:
-            if _TEMP_MIN <= temp_f <= _TEMP_MAX:
-                return (int(score), temp_f)
-            return None
-
     @staticmethod
     def _validate_station_input(station_icao: object) -> str:
         """Validate and normalize station ICAO code."""
@@ -47,6 +27,12 @@ class WeatherStatisticsRetriever:
             raise ValidationError(f"Invalid station_icao: {station_icao}")
         return ensure_uppercase_icao(station_icao)
 
+    @staticmethod
+    def _validate_stations(station_icaos: Sequence[object]) -> List[str]:
+        """Validate, normalize and de-duplicate station ICAO codes, keeping their order."""
+        normalized = [WeatherStatisticsRetriever._validate_station_input(station) for station in station_icaos]
+        return list(dict.fromkeys(normalized))
+
     @staticmethod
     async def _fetch_redis_entries(client: RedisClient, station_icao: str, cutoff_ts: float) -> List[Tuple[bytes | str, float]]:
         """Fetch temperature entries within the time window from Redis for station."""
@@ -58,20 +44,22 @@ class WeatherStatisticsRetriever:
         return entries
 
     @staticmethod
-    def _filter_and_parse_entries(entries: List[Tuple[bytes | str, float]]) -> List[Tuple[int, float]]:
-        """Filter entries by timestamp and parse temperature data."""
-        invalid_count = 0
-        temperature_history = []
-        for payload, score in entries:
-            parsed = WeatherStatisticsRetriever._parse_entry(payload, score)
-            if parsed is None:
-                invalid_count += 1
-                continue
-            temperature_history.append(parsed)
-        temperature_history.sort(key=lambda x: x[0])
-        if invalid_count > 0:
-            logger.warning("%d invalid temperature entries (missing temp/out of range)", invalid_count)
-        return temperature_history
+    async def get_history_arrays(client: RedisClient, station_icao: str, hours: int = 24) -> ObservationArrays:
+        """
+        Get temperature history for a weather station as NumPy arrays.
+
+        Args:
+            client: Redis client instance
+            station_icao: Weather station ICAO code (e.g., 'KAUS', 'KMDW')
+            hours: Number of hours of history to retrieve
+
+        Returns:
+            ObservationArrays of timestamps and temperatures, ascending by timestamp
+        """
+        station_icao = WeatherStatisticsRetriever._validate_station_input(station_icao)
+        cutoff_ts = (get_current_utc() - timedelta(hours=hours)).timestamp()
+        entries = await WeatherStatisticsRetriever._fetch_redis_entries(client, station_icao, cutoff_ts)
+        return decode_observations(entries)
 
     @staticmethod
     async def get_history(client: RedisClient, station_icao: str, hours: int = 24) -> List[Tuple[int, float]]:
@@ -86,11 +74,63 @@ class WeatherStatisticsRetriever:
         Returns:
             List of (timestamp, temp_f) tuples sorted by timestamp
         """
-        station_icao = WeatherStatisticsRetriever._validate_station_input(station_icao)
+        history = await WeatherStatisticsRetriever.get_history_arrays(client, station_icao, hours)
+        return history.to_pairs()
+
+    @staticmethod
+    async def get_history_batch(client: RedisClient, station_icaos: Sequence[str], hours: int = 24) -> Dict[str, ObservationArrays]:
+        """
+        Get temperature history for several stations in one pipelined round trip.
+
+        Args:
+            client: Redis client instance
+            station_icaos: Weather station ICAO codes
+            hours: Number of hours of history to retrieve
+
+        Returns:
+            Mapping of normalized ICAO code to ObservationArrays (empty when a station has no history)
+        """
+        stations = WeatherStatisticsRetriever._validate_stations(station_icaos)
+        if not stations:
+            return {}
         cutoff_ts = (get_current_utc() - timedelta(hours=hours)).timestamp()
-        entries = await WeatherStatisticsRetriever._fetch_redis_entries(client, station_icao, cutoff_ts)
+        async with client.pipeline(transaction=False) as pipe:
+            for station in stations:
+                pipe.zrangebyscore(WeatherHistoryKey(icao=station).key(), cutoff_ts, "+inf", withscores=True)
+            replies = await ensure_awaitable(pipe.execute())
 
-        if not entries:
-            return []
+        histories: Dict[str, ObservationArrays] = {}
+        for station, entries in zip(stations, replies):
+            histories[station] = decode_observations(entries) if entries else empty_observations()
+        return histories
 
-        return WeatherStatisticsRetriever._filter_and_parse_entries(entries)
+    @staticmethod
+    async def get_rollups_batch(client: RedisClient, station_icaos: Sequence[str], hours: int = 24) -> Dict[str, StationRollups]:
+        """
+        Get hourly min/max/last rollups and the UTC day's high so far for several stations.
+
+        Args:
+            client: Redis client instance
+            station_icaos: Weather station ICAO codes
+            hours: Number of hours of hourly rollups to return
+
+        Returns:
+            Mapping of normalized ICAO code to StationRollups, hourly entries ascending by hour
+        """
+        stations = WeatherStatisticsRetriever._validate_stations(station_icaos)
+        if not stations:
+            return {}
+        now = get_current_utc()
+        cutoff_ts = (now - timedelta(hours=hours)).timestamp()
+        days = rollup_days(now, hours)
+        async with client.pipeline(transaction=False) as pipe:
+            for station in stations:
+                for day in days:
+                    pipe.zrange(rollup_key(station, day), 0, -1, withscores=True)
+            replies = await ensure_awaitable(pipe.execute())
+
+        per_station = len(days)
+        return {
+            station: parse_station_rollups(days, replies[index * per_station : (index + 1) * per_station], cutoff_ts)
+            for index, station in enumerate(stations)
+        }
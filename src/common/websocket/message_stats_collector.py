@@ -11,9 +11,11 @@ import logging
 import time
 from typing import Optional
 
+from ..metric_sink import MetricSink, SortedSetSample, get_shared_metric_sink
 from ..price_history_utils import build_history_member
+from ..redis_protocol.config import HISTORY_RETENTION_SECONDS
 from ..redis_protocol.error_types import REDIS_ERRORS
-from ..redis_protocol.typing import RedisClient, ensure_awaitable
+from ..redis_protocol.typing import RedisClient
 from ..redis_utils import RedisOperationError, get_redis_connection
 
 logger = logging.getLogger(__name__)
@@ -26,6 +28,7 @@ async def _write_message_count_to_redis(
     service_name: str,
     message_count: int,
     current_time: float,
+    metric_sink: Optional[MetricSink] = None,
 ) -> None:
     try:
         int_ts = int(current_time)
@@ -33,10 +36,9 @@ async def _write_message_count_to_redis(
         score = float(int_ts)
         member = build_history_member(int_ts, float(message_count))
 
-        pipe = redis_client.pipeline()
-        pipe.zremrangebyscore(history_key, score, score)
-        pipe.zadd(history_key, {member: score})
-        await ensure_awaitable(pipe.execute())
+        # The sink keeps one sample per key and second, replacing the old same-second ZREMRANGEBYSCORE
+        sink = metric_sink if metric_sink is not None else get_shared_metric_sink()
+        await sink.record(redis_client, SortedSetSample(history_key, member, score, retention_seconds=HISTORY_RETENTION_SECONDS))
 
         logger.debug(f"{service_name.upper()}_HISTORY: Recorded {message_count} messages at ts={int_ts}")
 
@@ -94,7 +96,12 @@ class MessageStatsCollector:
     silently continuing with degraded functionality.
     """
 
-    def __init__(self, service_name: str, silent_failure_threshold_seconds: int = 120):
+    def __init__(
+        self,
+        service_name: str,
+        silent_failure_threshold_seconds: int = 120,
+        metric_sink: Optional[MetricSink] = None,
+    ):
         self.service_name = service_name
         self.silent_failure_threshold_seconds = silent_failure_threshold_seconds
         self._message_count = 0
@@ -102,6 +109,7 @@ class MessageStatsCollector:
         self._last_nonzero_update_time = time.time()
         self.current_rate = 0
         self._redis_client: Optional[RedisClient] = None
+        self._metric_sink = metric_sink if metric_sink is not None else get_shared_metric_sink()
 
     @property
     def last_nonzero_update_time(self) -> float:
@@ -144,7 +152,7 @@ class MessageStatsCollector:
         if self._redis_client is None:
             self._redis_client = await get_redis_connection()
         assert self._redis_client is not None, "Redis connection could not be established"
-        await _write_message_count_to_redis(self._redis_client, self.service_name, message_count, current_time)
+        await _write_message_count_to_redis(self._redis_client, self.service_name, message_count, current_time, self._metric_sink)
 
     def reset(self) -> None:
         self._message_count = 0
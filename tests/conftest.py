@@ -40,6 +40,8 @@ class FakeRedis:
         self._sets: dict[str, set[str]] = {}
         self._hashes: dict[str, dict[str, str]] = {}
         self._sorted_sets: dict[str, dict[str, float]] = {}
+        self._streams: dict[str, list[tuple[str, dict[str, str]]]] = {}
+        self._stream_sequence = 0
         self.published: list[tuple[str, str]] = []
 
     async def set(self, key: str, value: str | bytes) -> bool:
@@ -51,6 +53,10 @@ class FakeRedis:
         """Get a string value."""
         return self._data.get(key)
 
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        """Get several string values."""
+        return [self._data.get(key) for key in keys]
+
     async def sadd(self, key: str, *members: str) -> int:
         """Add members to a set."""
         if key not in self._sets:
@@ -177,6 +183,9 @@ class FakeRedis:
             if k in self._sorted_sets:
                 del self._sorted_sets[k]
                 found = True
+            if k in self._streams:
+                del self._streams[k]
+                found = True
             if found:
                 deleted += 1
         return deleted
@@ -249,6 +258,36 @@ class FakeRedis:
             return filtered
         return [m for m, _ in filtered]
 
+    async def xadd(self, name: str, fields: dict[str, str], maxlen: int | None = None, approximate: bool = True, **kwargs) -> str:
+        """Append an entry to a stream, trimming exactly to maxlen."""
+        self._stream_sequence += 1
+        entry_id = f"{self._stream_sequence}-0"
+        entries = self._streams.setdefault(name, [])
+        entries.append((entry_id, dict(fields)))
+        if maxlen is not None and len(entries) > maxlen:
+            del entries[: len(entries) - maxlen]
+        return entry_id
+
+    async def xrange(self, name: str, min: str = "-", max: str = "+", count: int | None = None) -> list:
+        """Return stream entries between two IDs (inclusive)."""
+        low = (0, 0) if min == "-" else _stream_id(min)
+        high = None if max == "+" else _stream_id(max)
+        entries = [
+            (entry_id, fields)
+            for entry_id, fields in self._streams.get(name, [])
+            if _stream_id(entry_id) >= low and (high is None or _stream_id(entry_id) <= high)
+        ]
+        return entries[:count] if count is not None else entries
+
+    async def xrevrange(self, name: str, max: str = "+", min: str = "-", count: int | None = None) -> list:
+        """Return stream entries newest first."""
+        entries = list(reversed(await self.xrange(name, min=min, max=max)))
+        return entries[:count] if count is not None else entries
+
+    async def xlen(self, name: str) -> int:
+        """Return the number of entries in a stream."""
+        return len(self._streams.get(name, []))
+
     async def ping(self) -> str:
         """Ping the Redis server."""
         return "PONG"
@@ -354,6 +393,11 @@ async def _cleanup_process_monitor_between_tests():
     process_monitor._global_process_monitor = None
 
 
+def _stream_id(entry_id: str) -> tuple[int, int]:
+    millis, _, sequence = entry_id.partition("-")
+    return int(millis), int(sequence or 0)
+
+
 class FakeRedisPipeline:
     """Redis pipeline mock."""
 
@@ -382,6 +426,13 @@ class FakeRedisPipeline:
         self.commands.append(("get", (key,)))
         return self
 
+    def mget(self, keys: list[str]) -> Any:
+        """Pipeline mget. Returns coroutine when watching, buffers otherwise."""
+        if self._watching:
+            return self.fake_redis.mget(keys)
+        self.commands.append(("mget", (keys,)))
+        return self
+
     def set(self, key: str, value: str | bytes) -> "FakeRedisPipeline":
         """Pipeline set."""
         self.commands.append(("set", (key, value)))
@@ -458,6 +509,13 @@ class FakeRedisPipeline:
         self.commands.append(("exists", keys))
         return self
 
+    def smembers(self, key: str) -> Any:
+        """Pipeline smembers. Returns coroutine when watching, buffers otherwise."""
+        if self._watching:
+            return self.fake_redis.smembers(key)
+        self.commands.append(("smembers", (key,)))
+        return self
+
     def srem(self, key: str, *members: str) -> "FakeRedisPipeline":
         """Pipeline srem."""
         self.commands.append(("srem", (key, members)))
@@ -468,10 +526,16 @@ class FakeRedisPipeline:
         self.commands.append(("publish", (channel, message)))
         return self
 
+    def xadd(self, name: str, fields: dict[str, str], maxlen: int | None = None, approximate: bool = True) -> "FakeRedisPipeline":
+        """Pipeline xadd."""
+        self.commands.append(("xadd", (name, fields, maxlen)))
+        return self
+
     async def _execute_command(self, cmd: str, args: tuple) -> Any:
         """Execute a single command. Dispatch based on command type."""
         dispatcher = {
             "get": lambda: self.fake_redis.get(args[0]),
+            "mget": lambda: self.fake_redis.mget(args[0]),
             "set": lambda: self.fake_redis.set(args[0], args[1]),
             "sadd": lambda: self.fake_redis.sadd(args[0], *args[1]),
             "hset": lambda: self.fake_redis.hset(args[0], args[1]),
@@ -484,7 +548,9 @@ class FakeRedisPipeline:
             "delete": lambda: self.fake_redis.delete(*args),
             "exists": lambda: self.fake_redis.exists(*args),
             "srem": lambda: self.fake_redis.srem(args[0], *args[1]),
+            "smembers": lambda: self.fake_redis.smembers(args[0]),
             "publish": lambda: self.fake_redis.publish(args[0], args[1]),
+            "xadd": lambda: self.fake_redis.xadd(args[0], args[1], maxlen=args[2]),
         }
         handler = dispatcher.get(cmd)
         return await handler() if handler else None
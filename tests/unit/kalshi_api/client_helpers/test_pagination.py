@@ -0,0 +1,125 @@
+"""Tests for kalshi_api pagination."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from common.kalshi_api.client_helpers.errors import KalshiClientError
+from common.kalshi_api.client_helpers.pagination import PaginationOperations
+from common.kalshi_api.client_helpers.sync_checkpoint import RedisSyncCheckpoint, SyncCheckpoint
+
+
+def _pages(field, *pages):
+    responses = []
+    for index, items in enumerate(pages):
+        cursor = f"c{index + 1}" if index + 1 < len(pages) else ""
+        responses.append({field: items, "cursor": cursor})
+    return responses
+
+
+@pytest.fixture
+def mock_client():
+    client = MagicMock()
+    client.api_request = AsyncMock()
+    return client
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+@pytest.mark.asyncio
+async def test_iter_fills_follows_cursor_until_exhausted(mock_client):
+    mock_client.api_request.side_effect = _pages("fills", [{"trade_id": "a"}, {"trade_id": "b"}], [{"trade_id": "c"}])
+    ops = PaginationOperations(mock_client)
+
+    fills = await _collect(ops.iter_fills(ticker="ABC", page_size=2))
+
+    assert [fill["trade_id"] for fill in fills] == ["a", "b", "c"]
+    calls = mock_client.api_request.call_args_list
+    assert calls[0].kwargs["params"] == {"ticker": "ABC", "limit": 2}
+    assert calls[1].kwargs["params"] == {"ticker": "ABC", "limit": 2, "cursor": "c1"}
+    assert calls[0].kwargs["path"] == "/trade-api/v2/portfolio/fills"
+
+
+@pytest.mark.asyncio
+async def test_next_page_is_prefetched_before_current_page_is_consumed(mock_client):
+    mock_client.api_request.side_effect = _pages("markets", [{"ticker": "A"}], [{"ticker": "B"}])
+    ops = PaginationOperations(mock_client)
+    iterator = ops.iter_markets(status="open")
+
+    first = await iterator.__anext__()
+    await asyncio.sleep(0)
+
+    assert first == {"ticker": "A"}
+    assert mock_client.api_request.await_count == 2
+    await iterator.aclose()
+
+
+@pytest.mark.asyncio
+async def test_closing_early_cancels_prefetch(mock_client):
+    started = asyncio.Event()
+
+    async def api_request(**kwargs):
+        if "cursor" in kwargs["params"]:
+            started.set()
+            await asyncio.sleep(10)
+        return {"orders": [{"order_id": "1"}], "cursor": "next"}
+
+    mock_client.api_request.side_effect = api_request
+    iterator = PaginationOperations(mock_client).iter_orders()
+
+    assert await iterator.__anext__() == {"order_id": "1"}
+    await started.wait()
+    await asyncio.wait_for(iterator.aclose(), timeout=1.0)
+
+
+@pytest.mark.asyncio
+async def test_repeated_cursor_raises(mock_client):
+    mock_client.api_request.return_value = {"market_positions": [], "cursor": "same"}
+    iterator = PaginationOperations(mock_client).iter_positions()
+
+    with pytest.raises(KalshiClientError, match="did not advance"):
+        await _collect(iterator)
+
+
+@pytest.mark.asyncio
+async def test_non_list_page_raises(mock_client):
+    mock_client.api_request.return_value = {"fills": {"bad": True}, "cursor": ""}
+
+    with pytest.raises(KalshiClientError, match="not a list"):
+        await _collect(PaginationOperations(mock_client).iter_fills())
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_advances_per_page_and_resumes_incrementally(mock_client, fake_redis):
+    checkpoint = RedisSyncCheckpoint(fake_redis, "fills")
+    mock_client.api_request.side_effect = _pages("fills", [{"trade_id": "a", "ts": 100}], [{"trade_id": "b", "ts": 150}])
+    ops = PaginationOperations(mock_client)
+
+    iterator = ops.iter_fills(min_ts=50, checkpoint=checkpoint)
+    assert (await iterator.__anext__())["trade_id"] == "a"
+    assert (await iterator.__anext__())["trade_id"] == "b"
+    assert await checkpoint.load() == SyncCheckpoint(min_ts=50, cursor="c1", high_water_ts=100)
+    await _collect(iterator)
+    assert await checkpoint.load() == SyncCheckpoint(min_ts=50, cursor=None, high_water_ts=150)
+
+    mock_client.api_request.reset_mock(side_effect=True)
+    mock_client.api_request.return_value = {"fills": [], "cursor": ""}
+    await _collect(ops.iter_fills(min_ts=50, checkpoint=checkpoint))
+
+    assert mock_client.api_request.call_args.kwargs["params"] == {"min_ts": 150}
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_resumes_interrupted_pass_from_cursor(mock_client, fake_redis):
+    checkpoint = RedisSyncCheckpoint(fake_redis, "orders")
+    await checkpoint.save(SyncCheckpoint(min_ts=10, cursor="c7", high_water_ts=40))
+    mock_client.api_request.return_value = {"orders": [{"order_id": "x", "created_time": "2024-01-01T00:00:00Z"}], "cursor": ""}
+
+    orders = await _collect(PaginationOperations(mock_client).iter_orders(min_ts=99, checkpoint=checkpoint))
+
+    assert orders == [{"order_id": "x", "created_time": "2024-01-01T00:00:00Z"}]
+    assert mock_client.api_request.call_args.kwargs["params"] == {"min_ts": 10, "cursor": "c7"}
+    assert await checkpoint.load() == SyncCheckpoint(min_ts=10, cursor=None, high_water_ts=1704067200)
@@ -0,0 +1,42 @@
+"""Tests for kalshi_api sync_checkpoint."""
+
+import pytest
+
+from common.kalshi_api.client_helpers.errors import KalshiClientError
+from common.kalshi_api.client_helpers.sync_checkpoint import RedisSyncCheckpoint, SyncCheckpoint
+
+
+@pytest.mark.asyncio
+async def test_load_missing_checkpoint_is_empty(fake_redis):
+    assert await RedisSyncCheckpoint(fake_redis, "fills").load() == SyncCheckpoint()
+
+
+@pytest.mark.asyncio
+async def test_save_round_trips_and_drops_cleared_fields(fake_redis):
+    checkpoint = RedisSyncCheckpoint(fake_redis, "fills")
+
+    await checkpoint.save(SyncCheckpoint(min_ts=5, cursor="abc", high_water_ts=9))
+    await checkpoint.save(SyncCheckpoint(min_ts=5, cursor=None, high_water_ts=12))
+
+    assert checkpoint.key == "ops:sync_checkpoints:KALSHI:FILLS"
+    assert await fake_redis.hgetall(checkpoint.key) == {"min_ts": "5", "high_water_ts": "12"}
+    assert await checkpoint.load() == SyncCheckpoint(min_ts=5, high_water_ts=12)
+
+
+@pytest.mark.asyncio
+async def test_reset_forgets_checkpoint(fake_redis):
+    checkpoint = RedisSyncCheckpoint(fake_redis, "orders")
+    await checkpoint.save(SyncCheckpoint(high_water_ts=3))
+
+    await checkpoint.reset()
+
+    assert await checkpoint.load() == SyncCheckpoint()
+
+
+@pytest.mark.asyncio
+async def test_load_rejects_corrupt_values(fake_redis):
+    checkpoint = RedisSyncCheckpoint(fake_redis, "fills")
+    await fake_redis.hset(checkpoint.key, mapping={"high_water_ts": "soon"})
+
+    with pytest.raises(KalshiClientError, match="Invalid high_water_ts"):
+        await checkpoint.load()
@@ -1,10 +1,13 @@
 """Tests for kalshi_api authentication."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
 from cryptography.hazmat.primitives.asymmetric import rsa
 
+from common.kalshi_api import authentication
 from common.kalshi_api.authentication import AuthenticationHelper
 from common.kalshi_api.client_helpers.errors import KalshiClientError
 
@@ -42,3 +45,45 @@ def test_create_auth_headers_success():
     assert headers["KALSHI-ACCESS-TIMESTAMP"] == "1234567890123"
 
     mock_private_key.sign.assert_called_once()
+
+
+def test_create_auth_headers_reuses_padding_and_hash():
+    mock_private_key = MagicMock(spec=rsa.RSAPrivateKey)
+    mock_private_key.sign.return_value = b"signature_bytes"
+    auth = AuthenticationHelper("key", mock_private_key)
+
+    auth.create_auth_headers("GET", "/a")
+    auth.create_auth_headers("POST", "/b")
+
+    first, second = mock_private_key.sign.call_args_list
+    assert first.args[1] is second.args[1] is authentication._SIGNATURE_PADDING
+    assert first.args[2] is second.args[2] is authentication._SIGNATURE_HASH
+    assert auth.metrics.stats["signatures"] == 2
+
+
+@pytest.mark.asyncio
+async def test_create_auth_headers_async_signs_on_executor():
+    mock_private_key = MagicMock(spec=rsa.RSAPrivateKey)
+    signing_threads = []
+    mock_private_key.sign.side_effect = lambda *args: signing_threads.append(threading.current_thread().name) or b"sig"
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="test-signing") as executor:
+        auth = AuthenticationHelper("key", mock_private_key, signing_executor=executor)
+        headers = await auth.create_auth_headers_async("DELETE", "/trade-api/v2/portfolio/orders/abc")
+
+    assert headers["KALSHI-ACCESS-KEY"] == "key"
+    assert signing_threads[0].startswith("test-signing")
+    stats = auth.metrics.stats
+    assert stats["signatures"] == 1
+    assert stats["offloaded_signatures"] == 1
+    assert stats["max_offload_ms"] >= stats["max_sign_ms"]
+
+
+@pytest.mark.asyncio
+async def test_create_auth_headers_async_propagates_key_errors():
+    auth = AuthenticationHelper("key", "not_an_rsa_key")
+
+    with pytest.raises(KalshiClientError, match="not RSA"):
+        await auth.create_auth_headers_async("GET", "/api/test")
+
+    assert auth.metrics.stats["offloaded_signatures"] == 0
@@ -30,6 +30,7 @@ from common.kalshi_api.client_bindings import (
     _get_trade_store,
     _initialize,
     _is_market_open_impl,
+    _iter_fills_impl,
     _normalise_fill,
     _parse_order_fill_impl,
     _parse_order_response_impl,
@@ -365,6 +366,20 @@ class TestHelperFunctions:
         with pytest.raises(KalshiClientError):
             _auth_headers_impl(client, "GET", "/path")
 
+    def test_iter_fills_impl_delegates(self):
+        client = MagicMock()
+        client._pagination_ops.iter_fills.return_value = "iterator"
+
+        assert _iter_fills_impl(client, ticker="ABC") == "iterator"
+        client._pagination_ops.iter_fills.assert_called_once_with(ticker="ABC")
+
+    def test_iter_fills_impl_not_initialized(self):
+        client = MagicMock()
+        client._pagination_ops = None
+
+        with pytest.raises(KalshiClientError, match="Pagination operations not initialized"):
+            _iter_fills_impl(client)
+
     @pytest.mark.asyncio
     async def test_fetch_order_metadata_impl(self):
         mock_manager = AsyncMock()
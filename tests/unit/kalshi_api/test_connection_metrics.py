@@ -0,0 +1,57 @@
+"""Tests for kalshi_api connection_metrics."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+
+from common.kalshi_api.connection_metrics import ConnectionStats, ConnectionTracer
+
+
+@pytest.fixture
+def stats():
+    return ConnectionStats()
+
+
+def test_trace_config_registers_connection_hooks(stats):
+    trace_config = ConnectionTracer(stats, lambda: None).trace_config()
+
+    assert isinstance(trace_config, aiohttp.TraceConfig)
+    assert len(trace_config.on_connection_create_end) == 1
+    assert len(trace_config.on_connection_reuseconn) == 1
+
+
+@pytest.mark.asyncio
+async def test_new_connection_is_timed_and_forwarded(stats):
+    tracer = ConnectionTracer(stats, lambda: "session_0007")
+    ctx = SimpleNamespace()
+
+    with (
+        patch("common.kalshi_api.connection_metrics.perf_counter", side_effect=[10.0, 10.2]),
+        patch("common.kalshi_api.connection_metrics.session_tracker") as tracker,
+    ):
+        await tracer._on_create_start(None, ctx, None)
+        await tracer._on_create_end(None, ctx, None)
+
+    assert stats.new_connections == 1
+    assert stats.max_connect_seconds == pytest.approx(0.2)
+    assert stats.as_dict()["mean_connect_ms"] == pytest.approx(200.0)
+    tracker.track_session_connection.assert_called_once()
+    assert tracker.track_session_connection.call_args.kwargs["reused"] is False
+
+
+@pytest.mark.asyncio
+async def test_reused_connection_updates_ratio(stats):
+    tracer = ConnectionTracer(stats, lambda: None)
+    tracer.record_new_connection(0.1)
+
+    with patch("common.kalshi_api.connection_metrics.session_tracker") as tracker:
+        await tracer._on_reuse(None, SimpleNamespace(), None)
+        await tracer._on_reuse(None, SimpleNamespace(), None)
+        await tracer._on_queued(None, SimpleNamespace(), None)
+
+    assert stats.reused_connections == 2
+    assert stats.queued_requests == 1
+    assert stats.reuse_ratio == pytest.approx(2 / 3)
+    tracker.track_session_connection.assert_not_called()
@@ -21,7 +21,7 @@ def mock_session_manager():
 @pytest.fixture
 def mock_auth_helper():
     helper = MagicMock()
-    helper.create_auth_headers.return_value = {"Authorization": "Bearer token"}
+    helper.create_auth_headers_async = AsyncMock(return_value={"Authorization": "Bearer token"})
     return helper
 
 
@@ -86,7 +86,7 @@ async def test_execute_request_success(executor, mock_session_manager, mock_auth
 
     assert result == {"success": True}
     mock_session_manager.initialize.assert_called_once()
-    mock_auth_helper.create_auth_headers.assert_called_once()
+    mock_auth_helper.create_auth_headers_async.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -112,7 +112,7 @@ async def test_execute_request_with_existing_headers(executor, mock_session_mana
         operation_name="test_op",
     )
 
-    mock_auth_helper.create_auth_headers.assert_not_called()
+    mock_auth_helper.create_auth_headers_async.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -380,3 +380,47 @@ async def test_execute_request_server_error_max_retries(mock_session_manager, mo
         )
 
     assert "server error 503" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_execute_request_throttles_and_reports_rate_limits(mock_session_manager, mock_auth_helper):
+    throttle = MagicMock()
+    throttle.acquire = AsyncMock()
+    executor = RequestExecutor(
+        session_manager=mock_session_manager,
+        auth_helper=mock_auth_helper,
+        max_retries=1,
+        backoff_base=0.001,
+        backoff_max=0.01,
+        throttle=throttle,
+    )
+
+    mock_rate_limited_response = MagicMock()
+    mock_rate_limited_response.status = 429
+    mock_success_response = MagicMock()
+    mock_success_response.status = 200
+    mock_success_response.text = AsyncMock(return_value='{"order": {}}')
+    mock_success_response.json = AsyncMock(return_value={"order": {}})
+
+    mock_cm_429 = MagicMock()
+    mock_cm_429.__aenter__ = AsyncMock(return_value=mock_rate_limited_response)
+    mock_cm_429.__aexit__ = AsyncMock(return_value=None)
+    mock_cm_200 = MagicMock()
+    mock_cm_200.__aenter__ = AsyncMock(return_value=mock_success_response)
+    mock_cm_200.__aexit__ = AsyncMock(return_value=None)
+
+    mock_session = MagicMock()
+    mock_session.request.side_effect = [mock_cm_429, mock_cm_200]
+    mock_session_manager.get_session.return_value = mock_session
+
+    await executor.execute_request(
+        method_upper="POST",
+        url="https://api.kalshi.com/trade-api/v2/portfolio/orders",
+        request_kwargs={},
+        path="/trade-api/v2/portfolio/orders",
+        operation_name="create_order",
+    )
+
+    assert throttle.acquire.await_count == 2
+    throttle.acquire.assert_awaited_with("POST", "/trade-api/v2/portfolio/orders")
+    throttle.record_rate_limit.assert_called_once_with("POST")
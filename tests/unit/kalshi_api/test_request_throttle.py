@@ -0,0 +1,45 @@
+"""Tests for kalshi_api request_throttle."""
+
+import pytest
+
+from common.kalshi_api.request_throttle import (
+    KALSHI_RATE_TIERS,
+    KalshiRequestThrottle,
+    get_shared_throttle,
+    is_write_request,
+    request_priority,
+)
+from common.token_bucket import RequestPriority
+
+
+def test_mutating_methods_use_write_budget():
+    assert is_write_request("POST")
+    assert is_write_request("DELETE")
+    assert not is_write_request("GET")
+
+
+def test_order_writes_are_urgent_and_portfolio_polling_is_background():
+    assert request_priority("POST", "/trade-api/v2/portfolio/orders") == RequestPriority.URGENT
+    assert request_priority("DELETE", "/trade-api/v2/portfolio/orders/abc") == RequestPriority.URGENT
+    assert request_priority("GET", "/trade-api/v2/portfolio/orders") == RequestPriority.BACKGROUND
+    assert request_priority("GET", "/trade-api/v2/portfolio/fills") == RequestPriority.BACKGROUND
+    assert request_priority("GET", "/trade-api/v2/markets") == RequestPriority.NORMAL
+
+
+def test_shared_throttle_is_reused_per_tier():
+    assert get_shared_throttle("basic") is get_shared_throttle("BASIC")
+    assert get_shared_throttle("basic") is not get_shared_throttle("premier")
+
+
+def test_shared_throttle_rejects_unknown_tier():
+    with pytest.raises(ValueError, match="Unknown Kalshi rate tier"):
+        get_shared_throttle("platinum")
+
+
+def test_rate_limit_drains_only_the_metering_bucket():
+    throttle = KalshiRequestThrottle(KALSHI_RATE_TIERS["basic"])
+
+    throttle.record_rate_limit("POST")
+
+    assert throttle._write_bucket.available_tokens < 1
+    assert throttle._read_bucket.available_tokens == KALSHI_RATE_TIERS["basic"].read_per_second
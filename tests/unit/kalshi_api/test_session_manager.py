@@ -37,6 +37,37 @@ async def test_initialize_creates_session(session_manager):
         assert session_manager._session is not None
 
 
+@pytest.mark.asyncio
+async def test_initialize_applies_connector_profile():
+    config = KalshiConfig(connection_limit_per_host=8, dns_cache_ttl_seconds=60, keepalive_timeout_seconds=45.0)
+    manager = SessionManager(config)
+    with (
+        patch("common.kalshi_api.session_manager.aiohttp.TCPConnector") as mock_connector,
+        patch("common.kalshi_api.session_manager.aiohttp.ClientSession") as mock_session,
+    ):
+        mock_session.return_value = MagicMock(closed=False)
+
+        await manager.initialize()
+
+    connector_kwargs = mock_connector.call_args.kwargs
+    assert connector_kwargs["limit_per_host"] == 8
+    assert connector_kwargs["ttl_dns_cache"] == 60
+    assert connector_kwargs["keepalive_timeout"] == 45.0
+    assert len(mock_session.call_args.kwargs["trace_configs"]) == 1
+    assert manager._session_id is not None
+
+
+@pytest.mark.asyncio
+async def test_initialize_skips_lock_when_session_ready(session_manager):
+    session_manager._session = MagicMock(closed=False)
+    lock = MagicMock()
+    session_manager.set_session_lock(lock)
+
+    await session_manager.initialize()
+
+    lock.__aenter__.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_initialize_skips_if_session_exists(session_manager):
     mock_session = MagicMock()
@@ -60,6 +91,18 @@ async def test_close_closes_session(session_manager):
     assert session_manager._session is None
 
 
+@pytest.mark.asyncio
+async def test_close_reports_session_closure(session_manager):
+    session_manager._session = AsyncMock()
+    session_manager._session_id = "session_kalshi"
+
+    with patch("common.kalshi_api.session_manager.session_tracker") as tracker:
+        await session_manager.close()
+
+    tracker.track_session_closure.assert_called_once_with("session_kalshi")
+    assert session_manager._session_id is None
+
+
 @pytest.mark.asyncio
 async def test_close_no_session(session_manager):
     await session_manager.close()  # Should not raise
@@ -108,3 +151,11 @@ def test_set_session_lock(session_manager):
     session_manager.set_session_lock(new_lock)
 
     assert session_manager._session_lock is new_lock
+
+
+def test_connection_stats_start_empty(session_manager):
+    stats = session_manager.connection_stats
+
+    assert stats["new_connections"] == 0
+    assert stats["reused_connections"] == 0
+    assert stats["reuse_ratio"] == 0.0
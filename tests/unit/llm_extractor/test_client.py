@@ -29,6 +29,26 @@ class TestAnthropicClientInit:
         assert client._api_key == "sk-ant-env"
 
 
+class TestAnthropicClientRateLimits:
+    """Tests for AnthropicClient 429 accounting."""
+
+    @pytest.mark.asyncio
+    async def test_counts_rate_limited_responses(self) -> None:
+        """Test that each 429 reported by the transport is counted."""
+        client = AnthropicClient(model="claude-haiku-4-5", max_tokens=4096, api_key="sk-ant-test")
+        response = {"content": [{"type": "text", "text": "}"}], "usage": {"input_tokens": 1, "output_tokens": 1}}
+
+        async def fake_request(_payload, _headers, on_rate_limited):
+            on_rate_limited()
+            on_rate_limited()
+            return response
+
+        with patch("common.llm_extractor.client.request_with_retries", side_effect=fake_request):
+            await client.send_message("system prompt", "user content")
+
+        assert client.get_rate_limited_count() == 2
+
+
 class TestAnthropicClientSendMessage:
     """Tests for AnthropicClient.send_message."""
 
@@ -116,12 +116,14 @@ class TestRequestWithRetries:
                 mock_session.__aexit__ = AsyncMock()
                 mock_session_cls.return_value = mock_session
 
-                result = await request_with_retries({"model": "test"}, {"x-api-key": "key"})
+                on_rate_limited = MagicMock()
+                result = await request_with_retries({"model": "test"}, {"x-api-key": "key"}, on_rate_limited)
 
         assert result["content"][0]["text"] == "OK"
         expected_calls = 1 + 1  # rate-limited + success
         assert call_count == expected_calls
         mock_sleep.assert_called_once()
+        on_rate_limited.assert_called_once_with()
 
     @pytest.mark.asyncio
     async def test_retries_on_server_error(self) -> None:
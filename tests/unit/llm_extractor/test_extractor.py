@@ -1,5 +1,6 @@
 """Tests for llm_extractor extractor module."""
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -66,11 +67,14 @@ class TestKalshiUnderlyingExtractor:
         extractor = KalshiUnderlyingExtractor(api_key="sk-ant-test")
         markets = [{"id": "m1", "title": "BTC above 100k", "category": "Crypto", "rules_primary": ""}]
 
+        mock_pipe = MagicMock()
+        mock_pipe.execute = AsyncMock(return_value=["BTC"])
         mock_redis = AsyncMock()
-        mock_redis.hgetall = AsyncMock(return_value={"underlying": "BTC"})
+        mock_redis.pipeline = MagicMock(return_value=mock_pipe)
 
         results = await extractor.extract_underlyings(markets, mock_redis)
         assert results == {"m1": "BTC"}
+        mock_pipe.hget.assert_called_once_with("market:extracted:kalshi:m1", "underlying")
 
     @pytest.mark.asyncio
     async def test_calls_api_for_uncached_markets(self) -> None:
@@ -79,11 +83,10 @@ class TestKalshiUnderlyingExtractor:
         markets = [{"id": "m1", "title": "ETH above 5k", "category": "Crypto", "rules_primary": ""}]
 
         mock_redis = AsyncMock()
-        mock_redis.hgetall = AsyncMock(return_value={})
         mock_pipe = MagicMock()
         mock_pipe.hset = MagicMock(return_value=mock_pipe)
         mock_pipe.expire = MagicMock(return_value=mock_pipe)
-        mock_pipe.execute = AsyncMock(return_value=[])
+        mock_pipe.execute = AsyncMock(side_effect=[[None], []])
         mock_redis.pipeline = MagicMock(return_value=mock_pipe)
 
         # Batch response format
@@ -95,6 +98,32 @@ class TestKalshiUnderlyingExtractor:
         assert results == {"m1": "ETH"}
         mock_pipe.hset.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_iter_underlyings_streams_cached_then_extracted(self) -> None:
+        """Test that cached results stream first and each batch follows as it completes."""
+        extractor = KalshiUnderlyingExtractor(api_key="sk-ant-test")
+        markets = [
+            {"id": "m1", "title": "BTC above 100k", "category": "Crypto", "rules_primary": ""},
+            {"id": "m2", "title": "ETH above 5k", "category": "Crypto", "rules_primary": ""},
+        ]
+
+        mock_pipe = MagicMock()
+        mock_pipe.execute = AsyncMock(return_value=["BTC", None])
+        mock_redis = AsyncMock()
+        mock_redis.pipeline = MagicMock(return_value=mock_pipe)
+
+        with patch(
+            "common.llm_extractor.extractor.extract_kalshi_batch_with_retry",
+            new_callable=AsyncMock,
+            return_value={"m2": "ETH"},
+        ) as mock_extract:
+            streamed = [pair async for pair in extractor.iter_underlyings(markets, mock_redis)]
+
+        assert streamed == [("m1", "BTC"), ("m2", "ETH")]
+        batch, existing = mock_extract.call_args.args[1:3]
+        assert [m["id"] for m in batch] == ["m2"]
+        assert existing == ["BTC"]
+
 
 class TestKalshiDedupExtractorInit:
     """Tests for KalshiDedupExtractor initialization."""
@@ -116,7 +145,7 @@ class TestKalshiDedupExtractor:
 
         cached_mapping = json.dumps({"BITCOIN": "BTC"})
         mock_redis = AsyncMock()
-        mock_redis.get = AsyncMock(return_value=cached_mapping)
+        mock_redis.mget = AsyncMock(return_value=[cached_mapping])
 
         results = await extractor.dedup_underlyings(underlyings_by_category, mock_redis)
         assert results == {"BITCOIN": "BTC"}
@@ -128,7 +157,7 @@ class TestKalshiDedupExtractor:
         underlyings_by_category = {"Crypto": {"BTC", "BITCOIN"}}
 
         mock_redis = AsyncMock()
-        mock_redis.get = AsyncMock(return_value=None)
+        mock_redis.mget = AsyncMock(return_value=[None])
         mock_redis.set = AsyncMock()
 
         api_response = _msg(json.dumps({"groups": [{"canonical": "BTC", "aliases": ["BITCOIN"]}]}))
@@ -138,6 +167,54 @@ class TestKalshiDedupExtractor:
 
         assert results == {"BITCOIN": "BTC"}
 
+    @pytest.mark.asyncio
+    async def test_cache_key_is_stable_and_content_addressed(self) -> None:
+        """Test that the cache key ignores set order and tracks the inputs."""
+        extractor = KalshiDedupExtractor(api_key="sk-ant-test")
+
+        key = extractor._cache_key("Crypto", ["BTC", "BITCOIN"])
+
+        assert key == extractor._cache_key("Crypto", ["BITCOIN", "BTC"])
+        assert key.startswith("crossarb:dedup:Crypto:")
+        assert len(key.rsplit(":", 1)[1]) == 64
+        assert key != extractor._cache_key("Crypto", ["BTC", "XBT"])
+
+    @pytest.mark.asyncio
+    async def test_looks_up_all_categories_in_one_mget(self) -> None:
+        """Test that every category is checked with a single MGET."""
+        extractor = KalshiDedupExtractor(api_key="sk-ant-test")
+        underlyings_by_category = {"Crypto": {"BTC", "BITCOIN"}, "Index": {"SPX", "INX"}}
+
+        mock_redis = AsyncMock()
+        mock_redis.mget = AsyncMock(return_value=[json.dumps({"BITCOIN": "BTC"}), json.dumps({"INX": "SPX"})])
+
+        results = await extractor.dedup_underlyings(underlyings_by_category, mock_redis)
+
+        assert results == {"BITCOIN": "BTC", "INX": "SPX"}
+        mock_redis.mget.assert_awaited_once()
+        assert len(mock_redis.mget.call_args.args[0]) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_call(self) -> None:
+        """Test that concurrent identical dedups trigger one API call."""
+        extractor = KalshiDedupExtractor(api_key="sk-ant-test")
+        underlyings_by_category = {"Crypto": {"BTC", "BITCOIN"}}
+
+        mock_redis = AsyncMock()
+        mock_redis.mget = AsyncMock(return_value=[None])
+        mock_redis.set = AsyncMock()
+
+        api_response = _msg(json.dumps({"groups": [{"canonical": "BTC", "aliases": ["BITCOIN"]}]}))
+
+        with patch.object(extractor._client, "send_message", new_callable=AsyncMock, return_value=api_response) as mock_send:
+            first, second = await asyncio.gather(
+                extractor.dedup_underlyings(underlyings_by_category, mock_redis),
+                extractor.dedup_underlyings(underlyings_by_category, mock_redis),
+            )
+
+        assert first == second == {"BITCOIN": "BTC"}
+        mock_send.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_skips_single_underlying_categories(self) -> None:
         """Test that categories with only one underlying are skipped."""
@@ -16,6 +16,7 @@ from common.llm_extractor._extractor_helpers import (
     get_redis_key,
     get_ttl,
     load_kalshi_cached,
+    load_kalshi_cached_batch,
     load_poly_cached_batch,
     store_kalshi_cached_batch,
     store_poly_cached_batch,
@@ -78,6 +79,32 @@ class TestLoadKalshiCached:
         assert result is None
 
 
+class TestLoadKalshiCachedBatch:
+    """Tests for load_kalshi_cached_batch."""
+
+    @pytest.mark.asyncio
+    async def test_loads_all_markets_in_one_pipeline(self) -> None:
+        """Test that every market is read in a single round trip."""
+        mock_pipe = MagicMock()
+        mock_pipe.execute = AsyncMock(return_value=["BTC", None])
+        mock_redis = MagicMock()
+        mock_redis.pipeline = MagicMock(return_value=mock_pipe)
+
+        result = await load_kalshi_cached_batch(["m1", "m2"], mock_redis)
+
+        assert result == {"m1": "BTC"}
+        assert mock_pipe.hget.call_count == 2
+        mock_pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_skips_empty_market_list(self) -> None:
+        """Test that no pipeline is opened for an empty list."""
+        mock_redis = MagicMock()
+
+        assert await load_kalshi_cached_batch([], mock_redis) == {}
+        mock_redis.pipeline.assert_not_called()
+
+
 class TestStoreKalshiCachedBatch:
     """Tests for store_kalshi_cached_batch."""
 
@@ -0,0 +1,129 @@
+"""Tests for llm_extractor scheduler module."""
+
+import asyncio
+
+import pytest
+
+from common.llm_extractor._scheduler import AdaptiveConcurrency, stream_completed
+
+
+def _concurrency(initial: int = 2, maximum: int = 4) -> AdaptiveConcurrency:
+    return AdaptiveConcurrency(initial, maximum=maximum, latency_target_seconds=10.0)
+
+
+class TestAdaptiveConcurrency:
+    """Tests for AdaptiveConcurrency."""
+
+    def test_grows_about_one_slot_per_window_of_fast_completions(self) -> None:
+        """Test additive increase after ``limit`` healthy completions."""
+        concurrency = _concurrency()
+        concurrency.record_success(1.0)
+        concurrency.record_success(1.0)
+        assert concurrency.limit == 2
+        concurrency.record_success(1.0)
+        assert concurrency.limit == 3
+
+    def test_never_exceeds_maximum(self) -> None:
+        """Test that growth stops at the ceiling."""
+        concurrency = _concurrency(initial=4, maximum=4)
+        for _ in range(10):
+            concurrency.record_success(1.0)
+        assert concurrency.limit == 4
+
+    def test_halves_on_rate_limit_down_to_minimum(self) -> None:
+        """Test multiplicative decrease after 429s."""
+        concurrency = _concurrency(initial=4)
+        concurrency.record_rate_limited()
+        assert concurrency.limit == 2
+        concurrency.record_rate_limited()
+        concurrency.record_rate_limited()
+        assert concurrency.limit == 1
+
+    def test_slow_completion_shrinks(self) -> None:
+        """Test that batches past the latency target back off."""
+        concurrency = _concurrency(initial=4)
+        concurrency.record_success(30.0)
+        assert concurrency.limit == 2
+
+    def test_rejects_invalid_bounds(self) -> None:
+        """Test that an initial limit above the maximum is rejected."""
+        with pytest.raises(ValueError):
+            AdaptiveConcurrency(5, maximum=4, latency_target_seconds=10.0)
+
+
+class TestStreamCompleted:
+    """Tests for stream_completed."""
+
+    @pytest.mark.asyncio
+    async def test_slow_item_does_not_block_others(self) -> None:
+        """Test that results stream in completion order while a slot stays busy."""
+        release_slow = asyncio.Event()
+
+        async def worker(item: str) -> str:
+            if item == "slow":
+                await release_slow.wait()
+            return item
+
+        results = []
+        async for result in stream_completed(["slow", "a", "b", "c"], worker, _concurrency(), rate_limited_count=lambda: 0):
+            results.append(result)
+            if len(results) == 3:
+                release_slow.set()
+
+        assert results == ["a", "b", "c", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_keeps_limit_in_flight(self) -> None:
+        """Test that no more than ``limit`` workers run at once."""
+        running = 0
+        peak = 0
+
+        async def worker(item: int) -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return item
+
+        concurrency = AdaptiveConcurrency(2, maximum=2, latency_target_seconds=10.0)
+        results = [r async for r in stream_completed(range(6), worker, concurrency, rate_limited_count=lambda: 0)]
+
+        assert sorted(results) == list(range(6))
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limits_shrink_concurrency(self) -> None:
+        """Test that a rising 429 count halves the limit."""
+        rate_limits = iter([0, 3, 3, 3, 3])
+        concurrency = _concurrency(initial=4)
+
+        async def worker(item: int) -> int:
+            return item
+
+        results = [r async for r in stream_completed(range(2), worker, concurrency, rate_limited_count=lambda: next(rate_limits))]
+
+        assert sorted(results) == [0, 1]
+        assert concurrency.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_closing_early_cancels_in_flight(self) -> None:
+        """Test that abandoning the stream cancels pending workers."""
+        cancelled = []
+
+        async def worker(item: int) -> int:
+            if item == 0:
+                return item
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(item)
+                raise
+            return item
+
+        stream = stream_completed(range(3), worker, _concurrency(initial=3), rate_limited_count=lambda: 0)
+        assert await stream.__anext__() == 0
+        await stream.aclose()
+        await asyncio.sleep(0)
+
+        assert sorted(cancelled) == [1, 2]
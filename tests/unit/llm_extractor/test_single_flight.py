@@ -0,0 +1,69 @@
+"""Tests for llm_extractor single-flight helper."""
+
+import asyncio
+
+import pytest
+
+from common.llm_extractor._single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight.run."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_call(self) -> None:
+        """Test that identical keys run the call once."""
+        flight: SingleFlight[str] = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def call() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "result"
+
+        waiters = [asyncio.ensure_future(flight.run("key", call)) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert flight.inflight == 1
+        release.set()
+
+        assert await asyncio.gather(*waiters) == ["result", "result", "result"]
+        assert calls == 1
+        assert flight.inflight == 0
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_and_clears_key(self) -> None:
+        """Test that errors reach every caller and the key can be retried."""
+        flight: SingleFlight[str] = SingleFlight()
+
+        async def failing() -> str:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await flight.run("key", failing)
+
+        async def succeeding() -> str:
+            return "ok"
+
+        assert await flight.run("key", succeeding) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_call(self) -> None:
+        """Test that cancelling one waiter leaves the others running."""
+        flight: SingleFlight[str] = SingleFlight()
+        release = asyncio.Event()
+
+        async def call() -> str:
+            await release.wait()
+            return "done"
+
+        first = asyncio.ensure_future(flight.run("key", call))
+        second = asyncio.ensure_future(flight.run("key", call))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
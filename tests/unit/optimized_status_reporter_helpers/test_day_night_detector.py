@@ -161,30 +161,25 @@ class TestDayNightDetector:
         detector._station_coordinates = {}  # Explicitly ensure empty
         assert detector.get_day_night_icon("KNYC") == ""
 
-    @patch(
-        "common.optimized_status_reporter_helpers.day_night_detector.is_between_dawn_and_dusk",
-        return_value=True,
-    )
-    def test_get_day_night_icon_daytime(self, mock_is_between_dawn_and_dusk, detector_with_coordinates):
+    def test_get_day_night_icon_daytime(self, detector_with_coordinates):
         """Test returns empty string for daytime."""
-        assert detector_with_coordinates.get_day_night_icon("KNYC") == ""
-        mock_is_between_dawn_and_dusk.assert_called_once_with(40.71, -74.01)
-
-    @patch(
-        "common.optimized_status_reporter_helpers.day_night_detector.is_between_dawn_and_dusk",
-        return_value=False,
-    )
-    def test_get_day_night_icon_nighttime(self, mock_is_between_dawn_and_dusk, detector_with_coordinates, mock_moon_phase_calculator):
+        solar_days = detector_with_coordinates._solar_days
+        with patch.object(solar_days, "is_between_dawn_and_dusk", return_value=True) as mock_is_between_dawn_and_dusk:
+            assert detector_with_coordinates.get_day_night_icon("KNYC") == ""
+        mock_is_between_dawn_and_dusk.assert_called_once_with("KNYC", 40.71, -74.01)
+
+    def test_get_day_night_icon_nighttime(self, detector_with_coordinates, mock_moon_phase_calculator):
         """Test returns moon phase emoji for nighttime."""
-        assert detector_with_coordinates.get_day_night_icon("KNYC") == "🌕"
-        mock_is_between_dawn_and_dusk.assert_called_once_with(40.71, -74.01)
+        solar_days = detector_with_coordinates._solar_days
+        with patch.object(solar_days, "is_between_dawn_and_dusk", return_value=False) as mock_is_between_dawn_and_dusk:
+            assert detector_with_coordinates.get_day_night_icon("KNYC") == "🌕"
+        mock_is_between_dawn_and_dusk.assert_called_once_with("KNYC", 40.71, -74.01)
         mock_moon_phase_calculator.get_moon_phase_emoji.assert_called_once()
 
-    @patch(
-        "common.optimized_status_reporter_helpers.day_night_detector.is_between_dawn_and_dusk",
-        side_effect=ValueError("Test error"),
-    )
-    def test_get_day_night_icon_exception_handling(self, mock_is_between_dawn_and_dusk, detector_with_coordinates):
+    def test_get_day_night_icon_exception_handling(self, detector_with_coordinates):
         """Test get_day_night_icon returns empty string on exception."""
-        assert detector_with_coordinates.get_day_night_icon("KNYC") == ""
-        mock_is_between_dawn_and_dusk.assert_called_once_with(40.71, -74.01)
+        with patch.object(
+            detector_with_coordinates._solar_days, "is_between_dawn_and_dusk", side_effect=ValueError("Test error")
+        ) as mock_is_between_dawn_and_dusk:
+            assert detector_with_coordinates.get_day_night_icon("KNYC") == ""
+        mock_is_between_dawn_and_dusk.assert_called_once_with("KNYC", 40.71, -74.01)
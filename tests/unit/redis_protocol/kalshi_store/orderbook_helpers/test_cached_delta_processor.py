@@ -128,3 +128,47 @@ class TestProcessDeltaCached:
             timestamp="200",
         )
         redis_mock.xadd.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_removing_best_bid_level_promotes_next(self, processor: DeltaProcessor, cache: OrderbookCache) -> None:
+        cache.store_snapshot("market:key", {"yes_bids": {"50.0": 10.0, "45.0": 3.0}, "yes_bid": "50.0", "timestamp": "0"})
+        redis_mock = AsyncMock()
+        await processor.process_orderbook_delta(
+            redis=redis_mock,
+            market_key="market:key",
+            market_ticker="TICKER",
+            msg_data={"side": "yes", "price": 50, "delta": -10},
+            timestamp="200",
+        )
+        assert cache.get_field("market:key", "yes_bid") == "45.0"
+        assert cache.get_field("market:key", "yes_bid_size") == "3"
+        written = redis_mock.hset.call_args.kwargs["mapping"]
+        assert written["yes_bids"] == b'{"45.0":3.0}'
+
+    @pytest.mark.asyncio
+    async def test_no_side_delta_maps_to_yes_ask_tick(self, processor: DeltaProcessor, cache: OrderbookCache) -> None:
+        redis_mock = AsyncMock()
+        await processor.process_orderbook_delta(
+            redis=redis_mock,
+            market_key="market:key",
+            market_ticker="TICKER",
+            msg_data={"side": "no", "price_dollars": "0.43", "delta_fp": "7"},
+            timestamp="200",
+        )
+        assert cache.get_field("market:key", "yes_ask") == "57.0"
+        assert cache.get_field("market:key", "yes_ask_size") == "7"
+
+    @pytest.mark.asyncio
+    async def test_off_grid_delta_falls_back_to_dict_sides(self, processor: DeltaProcessor, cache: OrderbookCache) -> None:
+        cache.store_snapshot("market:key", {"yes_bids": {"50.0": 10.0}, "yes_asks": {}, "timestamp": "0"})
+        redis_mock = AsyncMock()
+        await processor.process_orderbook_delta(
+            redis=redis_mock,
+            market_key="market:key",
+            market_ticker="TICKER",
+            msg_data={"side": "yes", "price": 50.5, "delta": 2},
+            timestamp="200",
+        )
+        assert cache.get_book("market:key") is None
+        assert cache.get_field("market:key", "yes_bids") == {"50.0": 10.0, "50.5": 2.0}
+        assert cache.get_field("market:key", "yes_bid") == "50.5"
@@ -0,0 +1,83 @@
+"""Tests for the server-side orderbook delta script path."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from common.redis_protocol.kalshi_store.orderbook_helpers.delta_processor import DeltaProcessor
+from common.redis_protocol.kalshi_store.orderbook_helpers.delta_script import (
+    _SCRIPT_PATH,
+    DeltaScriptResult,
+    OrderbookDeltaScript,
+)
+from common.redis_protocol.streams.constants import EXCHANGE_EVENT_STREAM
+
+
+def _redis_with_script(result: list) -> tuple[MagicMock, AsyncMock]:
+    script = AsyncMock(return_value=result)
+    redis = MagicMock()
+    redis.register_script = MagicMock(return_value=script)
+    return redis, script
+
+
+class TestOrderbookDeltaScript:
+    def test_script_file_ships_with_package(self) -> None:
+        assert _SCRIPT_PATH.is_file()
+        assert "XADD" in _SCRIPT_PATH.read_text(encoding="utf-8")
+
+    @pytest.mark.asyncio
+    async def test_apply_passes_keys_and_args(self) -> None:
+        redis, script = _redis_with_script([b"55.0", b"60.0", 1])
+        delta_script = OrderbookDeltaScript(maxlen=1000)
+
+        result = await delta_script.apply(
+            redis, market_key="m", market_ticker="T", side_field="yes_bids", price_str="55.0", delta=3.0, timestamp="9"
+        )
+
+        assert result == DeltaScriptResult(yes_bid="55.0", yes_ask="60.0", published=True)
+        script.assert_awaited_once_with(
+            keys=["m", EXCHANGE_EVENT_STREAM],
+            args=["yes_bids", "55.0", "3.0", "9", "T", 1000],
+            client=redis,
+        )
+
+    @pytest.mark.asyncio
+    async def test_script_registered_once(self) -> None:
+        redis, _script = _redis_with_script([None, None, 0])
+        delta_script = OrderbookDeltaScript()
+        for _ in range(2):
+            result = await delta_script.apply(
+                redis, market_key="m", market_ticker="T", side_field="yes_asks", price_str="60.0", delta=-1.0, timestamp="9"
+            )
+        assert result == DeltaScriptResult(yes_bid=None, yes_ask=None, published=False)
+        redis.register_script.assert_called_once()
+
+
+class TestServerSideDeltaProcessor:
+    @pytest.mark.asyncio
+    async def test_delta_uses_script_and_updates_trade_prices(self) -> None:
+        callback = AsyncMock()
+        processor = DeltaProcessor(callback)
+        processor.enable_server_side_deltas()
+        redis, script = _redis_with_script([b"55.0", b"60.0", 1])
+
+        result = await processor.process_orderbook_delta(
+            redis=redis, market_key="m", market_ticker="T", msg_data={"side": "no", "price": 40, "delta": 2}, timestamp="9"
+        )
+
+        assert result is True
+        assert script.await_args.kwargs["args"][:3] == ["yes_asks", "60.0", "2.0"]
+        callback.assert_awaited_once_with("T", 55.0, 60.0)
+
+    @pytest.mark.asyncio
+    async def test_missing_side_skips_trade_price_update(self) -> None:
+        callback = AsyncMock()
+        processor = DeltaProcessor(callback)
+        processor.enable_server_side_deltas()
+        redis, _script = _redis_with_script([b"55.0", None, 0])
+
+        await processor.process_orderbook_delta(
+            redis=redis, market_key="m", market_ticker="T", msg_data={"side": "yes", "price": 55, "delta": 2}, timestamp="9"
+        )
+
+        callback.assert_not_awaited()
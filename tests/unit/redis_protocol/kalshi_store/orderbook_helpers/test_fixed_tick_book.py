@@ -0,0 +1,116 @@
+"""Tests for the fixed-tick orderbook."""
+
+import orjson
+
+from common.redis_protocol.kalshi_store.orderbook_helpers.fixed_tick_book import (
+    FixedTickBook,
+    FixedTickSide,
+    serialize_market_fields,
+    tick_from_cents,
+)
+from common.redis_protocol.kalshi_store.orderbook_helpers.orderbook_cache import OrderbookCache
+
+
+class TestTickFromCents:
+    def test_integer_price(self) -> None:
+        assert tick_from_cents(47.0) == 47
+
+    def test_float_rounding_noise(self) -> None:
+        assert tick_from_cents(0.57 * 100) == 57
+
+    def test_off_grid_price(self) -> None:
+        assert tick_from_cents(47.5) is None
+
+    def test_out_of_range(self) -> None:
+        assert tick_from_cents(0.0) is None
+        assert tick_from_cents(100.0) is None
+
+
+class TestFixedTickSide:
+    def test_empty_side_has_no_best(self) -> None:
+        side = FixedTickSide(is_bid=True)
+        assert side.best() == (None, None)
+        assert len(side) == 0
+
+    def test_bid_best_is_highest(self) -> None:
+        side = FixedTickSide(is_bid=True)
+        side.apply_delta(40, 5.0)
+        side.apply_delta(45, 3.0)
+        side.apply_delta(42, 7.0)
+        assert side.best() == (45.0, 3)
+
+    def test_ask_best_is_lowest(self) -> None:
+        side = FixedTickSide(is_bid=False)
+        side.apply_delta(60, 5.0)
+        side.apply_delta(55, 3.0)
+        side.apply_delta(58, 7.0)
+        assert side.best() == (55.0, 3)
+
+    def test_removing_best_level_falls_back_to_next(self) -> None:
+        side = FixedTickSide(is_bid=True)
+        side.apply_delta(40, 5.0)
+        side.apply_delta(45, 3.0)
+        side.apply_delta(45, -3.0)
+        assert side.best() == (40.0, 5)
+        assert len(side) == 1
+
+    def test_removing_last_level_empties_side(self) -> None:
+        side = FixedTickSide(is_bid=False)
+        side.apply_delta(60, 2.0)
+        side.apply_delta(60, -5.0)
+        assert side.best() == (None, None)
+        assert side.to_dict() == {}
+
+    def test_negative_delta_on_empty_level_is_ignored(self) -> None:
+        side = FixedTickSide(is_bid=True)
+        side.apply_delta(30, -1.0)
+        assert len(side) == 0
+
+    def test_mapping_view_uses_price_strings(self) -> None:
+        side = FixedTickSide(is_bid=True)
+        side.apply_delta(50, 10.0)
+        side.apply_delta(5, 1.0)
+        assert dict(side) == {"5.0": 1.0, "50.0": 10.0}
+        assert side["50.0"] == 10.0
+        assert "51.0" not in side
+
+    def test_to_json_matches_dict_format(self) -> None:
+        side = FixedTickSide(is_bid=True)
+        side.apply_delta(50, 10.0)
+        assert orjson.loads(side.to_json()) == {"50.0": 10.0}
+
+    def test_from_levels_accepts_integer_strings(self) -> None:
+        side = FixedTickSide.from_levels({"50": 10.0, "45.0": 2.0}, is_bid=True)
+        assert side is not None
+        assert side.best() == (50.0, 10)
+
+    def test_from_levels_rejects_off_grid(self) -> None:
+        assert FixedTickSide.from_levels({"50.5": 10.0}, is_bid=True) is None
+
+
+class TestFixedTickBook:
+    def test_apply_delta_returns_side_best(self) -> None:
+        book = FixedTickBook()
+        assert book.apply_delta("yes_bids", 48, 4.0) == (48.0, 4)
+        assert book.apply_delta("yes_asks", 52, 6.0) == (52.0, 6)
+        assert book.yes_bids.best() == (48.0, 4)
+
+    def test_from_fields_builds_both_sides(self) -> None:
+        book = FixedTickBook.from_fields({"yes_bids": {"40.0": 1.0}, "yes_asks": {"60.0": 2.0}})
+        assert book is not None
+        assert book.yes_bids.best() == (40.0, 1)
+        assert book.yes_asks.best() == (60.0, 2)
+
+    def test_from_fields_rejects_off_grid(self) -> None:
+        assert FixedTickBook.from_fields({"yes_bids": {"40.5": 1.0}}) is None
+
+
+class TestSerializeMarketFields:
+    def test_serializes_book_and_dict_sides(self) -> None:
+        cache = OrderbookCache()
+        cache.store_snapshot("key1", {"yes_bids": {"50.0": 10.0}, "yes_asks": {}, "yes_bid": "50.0"})
+        serialized = serialize_market_fields(cache.get_snapshot("key1") or {})
+        assert orjson.loads(serialized["yes_bids"]) == {"50.0": 10.0}
+        assert orjson.loads(serialized["yes_asks"]) == {}
+        assert serialized["yes_bid"] == "50.0"
+        assert orjson.loads(serialize_market_fields({"yes_bids": {"50.5": 1.0}})["yes_bids"]) == {"50.5": 1.0}
@@ -1,5 +1,6 @@
 """Tests for OrderbookCache and MarketUpdate."""
 
+from common.redis_protocol.kalshi_store.orderbook_helpers.fixed_tick_book import FixedTickSide
 from common.redis_protocol.kalshi_store.orderbook_helpers.orderbook_cache import (
     MarketUpdate,
     OrderbookCache,
@@ -63,6 +64,48 @@ class TestOrderbookCache:
         assert cache.get_snapshot("key1") is original
 
 
+class TestOrderbookCacheBooks:
+    def test_snapshot_sides_become_book_backed(self) -> None:
+        cache = OrderbookCache()
+        cache.store_snapshot("key1", {"yes_bids": {"50": 10.0}, "yes_asks": {"60.0": 5.0}})
+        book = cache.get_book("key1")
+        assert book is not None
+        assert book.yes_bids.best() == (50.0, 10)
+        assert isinstance(cache.get_field("key1", "yes_bids"), FixedTickSide)
+
+    def test_get_book_creates_book_for_unseen_market(self) -> None:
+        cache = OrderbookCache()
+        book = cache.get_book("key1")
+        assert book is not None
+        assert cache.get_book("key1") is book
+
+    def test_off_grid_snapshot_has_no_book(self) -> None:
+        cache = OrderbookCache()
+        cache.store_snapshot("key1", {"yes_bids": {"50.5": 10.0}})
+        assert cache.get_book("key1") is None
+        assert cache.get_side_data("key1", "yes_bids") == {"50.5": 10.0}
+
+    def test_get_side_data_converts_book_to_dicts(self) -> None:
+        cache = OrderbookCache()
+        cache.store_snapshot("key1", {"yes_bids": {"50.0": 10.0}, "yes_asks": {}})
+        side = cache.get_side_data("key1", "yes_bids")
+        side["50.5"] = 1.0
+        assert cache.get_book("key1") is None
+        assert cache.get_field("key1", "yes_bids") == {"50.0": 10.0, "50.5": 1.0}
+
+    def test_get_side_data_missing_returns_fresh_dict(self) -> None:
+        cache = OrderbookCache()
+        first = cache.get_side_data("key1", "yes_bids")
+        first["1.0"] = 1.0
+        assert cache.get_side_data("key2", "yes_bids") == {}
+
+    def test_remove_market_drops_book(self) -> None:
+        cache = OrderbookCache()
+        book = cache.get_book("key1")
+        cache.remove_market("key1")
+        assert cache.get_book("key1") is not book
+
+
 class TestMarketUpdate:
     def test_fields(self) -> None:
         update = MarketUpdate(
@@ -0,0 +1,57 @@
+"""Tests for coalesced trade price batching."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from common.redis_protocol.kalshi_store.orderbook_helpers.delta_processor import DeltaProcessor
+from common.redis_protocol.kalshi_store.orderbook_helpers.orderbook_cache import OrderbookCache
+from common.redis_protocol.kalshi_store.orderbook_helpers.trade_price_batcher import TradePriceBatcher
+from common.redis_protocol.trade_store import TradeStoreError
+
+
+class TestTradePriceBatcher:
+    @pytest.mark.asyncio
+    async def test_flush_keeps_latest_price_per_ticker(self) -> None:
+        apply_batch = AsyncMock()
+        batcher = TradePriceBatcher(apply_batch)
+        batcher.add("A", 50.0, 60.0)
+        batcher.add("B", 10.0, 20.0)
+        batcher.add("A", 51.0, 61.0)
+
+        await batcher._batcher._flush()
+
+        apply_batch.assert_awaited_once_with([("A", 51.0, 61.0), ("B", 10.0, 20.0)])
+
+    @pytest.mark.asyncio
+    async def test_trade_store_error_is_logged_not_raised(self) -> None:
+        apply_batch = AsyncMock(side_effect=TradeStoreError("boom"))
+        batcher = TradePriceBatcher(apply_batch)
+        batcher.add("A", 50.0, 60.0)
+
+        await batcher._batcher._flush()
+
+        apply_batch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_delta_queues_on_batcher_instead_of_callback(self) -> None:
+        callback = AsyncMock()
+        processor = DeltaProcessor(callback)
+        cache = OrderbookCache()
+        processor.set_cache(cache)
+        apply_batch = AsyncMock()
+        batcher = TradePriceBatcher(apply_batch)
+        processor.set_trade_price_batcher(batcher)
+        cache.store_snapshot("market:key", {"yes_bids": {}, "yes_bid": "50", "yes_ask": "60", "timestamp": "0"})
+
+        await processor.process_orderbook_delta(
+            redis=AsyncMock(),
+            market_key="market:key",
+            market_ticker="TICKER",
+            msg_data={"side": "yes", "price": 55, "delta": 10},
+            timestamp="100",
+        )
+        await batcher._batcher._flush()
+
+        callback.assert_not_awaited()
+        apply_batch.assert_awaited_once_with([("TICKER", 55.0, 60.0)])
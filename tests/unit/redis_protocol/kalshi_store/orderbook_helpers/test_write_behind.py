@@ -0,0 +1,208 @@
+"""Tests for write-behind flushing of cached orderbook fields."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+import pytest
+from redis.exceptions import RedisError
+
+from common.redis_protocol.kalshi_store.orderbook_helpers.delta_processor import DeltaProcessor
+from common.redis_protocol.kalshi_store.orderbook_helpers.orderbook_cache import OrderbookCache
+
+
+def _redis_with_pipeline() -> tuple[MagicMock, MagicMock]:
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    redis = MagicMock()
+    redis.pipeline = MagicMock(return_value=pipe)
+    redis.hset = AsyncMock()
+    redis.hget = AsyncMock(return_value=None)
+    redis.xadd = AsyncMock()
+    return redis, pipe
+
+
+class TestOrderbookWriteBehind:
+    @pytest.mark.asyncio
+    async def test_flush_writes_only_dirty_fields(self) -> None:
+        cache = OrderbookCache()
+        write_behind = cache.enable_write_behind()
+        cache.store_snapshot("m1", {"yes_bids": {"50.0": 1.0}, "yes_asks": {}, "yes_bid": "50.0", "timestamp": "1"})
+        redis, pipe = _redis_with_pipeline()
+        write_behind.mark_dirty(redis, "m1", ["timestamp"])
+        write_behind.mark_dirty(redis, "m1", ["yes_bids"])
+
+        await write_behind._batcher._flush()
+
+        pipe.hset.assert_called_once()
+        mapping = pipe.hset.call_args.kwargs["mapping"]
+        assert set(mapping) == {"timestamp", "yes_bids"}
+        assert orjson.loads(mapping["yes_bids"]) == {"50.0": 1.0}
+        assert write_behind.dirty_market_count == 0
+
+    @pytest.mark.asyncio
+    async def test_flush_pipelines_many_markets(self) -> None:
+        cache = OrderbookCache()
+        write_behind = cache.enable_write_behind()
+        redis, pipe = _redis_with_pipeline()
+        for key in ("m1", "m2", "m3"):
+            cache.update_fields(key, {"timestamp": "1"})
+            write_behind.mark_dirty(redis, key, ["timestamp"])
+
+        await write_behind._batcher._flush()
+
+        assert pipe.hset.call_count == 3
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_fields_dirty(self) -> None:
+        cache = OrderbookCache()
+        write_behind = cache.enable_write_behind()
+        redis, pipe = _redis_with_pipeline()
+        pipe.execute = AsyncMock(side_effect=RedisError("down"))
+        cache.update_fields("m1", {"timestamp": "1"})
+        write_behind.mark_dirty(redis, "m1", ["timestamp"])
+
+        with pytest.raises(RedisError):
+            await write_behind._batcher._flush()
+
+        assert write_behind.dirty_market_count == 1
+        assert "m1" in write_behind._batcher._pending
+
+    @pytest.mark.asyncio
+    async def test_flush_market_writes_immediately(self) -> None:
+        cache = OrderbookCache()
+        write_behind = cache.enable_write_behind()
+        redis, pipe = _redis_with_pipeline()
+        cache.update_fields("m1", {"yes_bid": "50.0"})
+        write_behind.mark_dirty(redis, "m1", ["yes_bid"])
+
+        await write_behind.flush_market(redis, "m1")
+        await write_behind._batcher._flush()
+
+        redis.hset.assert_awaited_once_with("m1", mapping={"yes_bid": "50.0"})
+        pipe.hset.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_flush_market_waits_for_in_flight_batch(self) -> None:
+        cache = OrderbookCache()
+        write_behind = cache.enable_write_behind()
+        redis, pipe = _redis_with_pipeline()
+        landed: list[str] = []
+        release = asyncio.Event()
+
+        async def slow_execute():
+            await release.wait()
+            landed.append(pipe.hset.call_args.kwargs["mapping"]["yes_bid"])
+
+        async def record_hset(_key, mapping):
+            landed.append(mapping["yes_bid"])
+
+        pipe.execute = AsyncMock(side_effect=slow_execute)
+        redis.hset = AsyncMock(side_effect=record_hset)
+        cache.update_fields("m1", {"yes_bid": "50.0"})
+        write_behind.mark_dirty(redis, "m1", ["yes_bid"])
+        batch = asyncio.create_task(write_behind._batcher._flush())
+        await asyncio.sleep(0)
+
+        cache.update_fields("m1", {"yes_bid": "55.0"})
+        write_behind.mark_dirty(redis, "m1", ["yes_bid"])
+        immediate = asyncio.create_task(write_behind.flush_market(redis, "m1"))
+        await asyncio.sleep(0)
+        redis.hset.assert_not_awaited()
+
+        release.set()
+        await asyncio.gather(batch, immediate)
+
+        assert landed == ["50.0", "55.0"]
+        assert write_behind.dirty_market_count == 0
+
+    @pytest.mark.asyncio
+    async def test_batch_skips_market_with_immediate_write_in_flight(self) -> None:
+        cache = OrderbookCache()
+        write_behind = cache.enable_write_behind()
+        redis, pipe = _redis_with_pipeline()
+        release = asyncio.Event()
+
+        async def slow_hset(_key, mapping):
+            await release.wait()
+
+        redis.hset = AsyncMock(side_effect=slow_hset)
+        cache.update_fields("m1", {"yes_bid": "50.0", "timestamp": "1"})
+        write_behind.mark_dirty(redis, "m1", ["yes_bid"])
+        immediate = asyncio.create_task(write_behind.flush_market(redis, "m1"))
+        await asyncio.sleep(0)
+        write_behind.mark_dirty(redis, "m1", ["timestamp"])
+
+        await write_behind._batcher._flush()
+
+        pipe.hset.assert_not_called()
+        assert "m1" in write_behind._batcher._pending
+        release.set()
+        await immediate
+        await write_behind._batcher._flush()
+        pipe.hset.assert_called_once_with("m1", mapping={"timestamp": "1"})
+
+    @pytest.mark.asyncio
+    async def test_write_market_replaces_pending_fields_with_cached_state(self) -> None:
+        cache = OrderbookCache()
+        write_behind = cache.enable_write_behind()
+        redis, pipe = _redis_with_pipeline()
+        cache.store_snapshot("m1", {"yes_bids": {"50.0": 1.0}, "yes_asks": {}, "yes_bid": "50.0", "timestamp": "1"})
+        write_behind.mark_dirty(redis, "m1", ["timestamp"])
+
+        await write_behind.write_market(redis, "m1")
+        await write_behind._batcher._flush()
+
+        mapping = redis.hset.call_args.kwargs["mapping"]
+        assert set(mapping) == {"yes_bids", "yes_asks", "yes_bid", "timestamp"}
+        assert orjson.loads(mapping["yes_bids"]) == {"50.0": 1.0}
+        pipe.hset.assert_not_called()
+
+    def test_remove_market_discards_dirty_fields(self) -> None:
+        cache = OrderbookCache()
+        write_behind = cache.enable_write_behind()
+        cache.update_fields("m1", {"timestamp": "1"})
+        write_behind.mark_dirty(MagicMock(), "m1", ["timestamp"])
+        cache.remove_market("m1")
+        assert write_behind.dirty_market_count == 0
+
+
+class TestDeltaWriteBehind:
+    @pytest.mark.asyncio
+    async def test_size_only_delta_defers_write(self) -> None:
+        cache = OrderbookCache()
+        write_behind = cache.enable_write_behind()
+        processor = DeltaProcessor(AsyncMock())
+        processor.set_cache(cache)
+        cache.store_snapshot("m1", {"yes_bids": {"50.0": 10.0}, "yes_asks": {}, "yes_bid": "50.0", "timestamp": "0"})
+        cache.check_price_changed("m1")
+        redis, _pipe = _redis_with_pipeline()
+
+        await processor.process_orderbook_delta(
+            redis=redis, market_key="m1", market_ticker="T", msg_data={"side": "yes", "price": 50, "delta": 5}, timestamp="2"
+        )
+
+        redis.hset.assert_not_called()
+        redis.xadd.assert_not_called()
+        assert write_behind._dirty["m1"] == {"yes_bids", "yes_bid", "yes_bid_size", "timestamp"}
+
+    @pytest.mark.asyncio
+    async def test_price_change_flushes_before_publish(self) -> None:
+        cache = OrderbookCache()
+        write_behind = cache.enable_write_behind()
+        processor = DeltaProcessor(AsyncMock())
+        processor.set_cache(cache)
+        cache.store_snapshot("m1", {"yes_bids": {"50.0": 10.0}, "yes_asks": {}, "yes_bid": "50.0", "timestamp": "0"})
+        cache.check_price_changed("m1")
+        cache.set_event_ticker("m1", "EVENT")
+        redis, _pipe = _redis_with_pipeline()
+
+        await processor.process_orderbook_delta(
+            redis=redis, market_key="m1", market_ticker="T", msg_data={"side": "yes", "price": 55, "delta": 5}, timestamp="2"
+        )
+
+        redis.hset.assert_awaited_once()
+        assert redis.hset.call_args.kwargs["mapping"]["yes_bid"] == "55.0"
+        redis.xadd.assert_awaited_once()
+        assert write_behind.dirty_market_count == 0
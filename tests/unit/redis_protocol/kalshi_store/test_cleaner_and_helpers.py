@@ -34,6 +34,9 @@ class _FakePipeline:
     def delete(self, *args) -> None:
         self.commands.append(("delete",) + args)
 
+    def xadd(self, name, fields, **kwargs) -> None:
+        self.commands.append(("xadd", name, fields))
+
     async def execute(self) -> None:
         self.executed = True
 
@@ -181,6 +184,9 @@ async def test_market_remover_remove_market_and_all_keys(monkeypatch):
     assert op_name == "remove all Kalshi keys"
     assert ("delete", "kalshi:abc") in commands
     assert ("delete", "markets:kalshi:def") in commands
+    # Bulk removal of market keys resets the Kalshi change log
+    assert ("delete", "ops:market_changes:KALSHI") in commands
+    assert ("xadd", "ops:market_changes:KALSHI", {"reset": "1"}) in commands
 
 
 @pytest.mark.asyncio
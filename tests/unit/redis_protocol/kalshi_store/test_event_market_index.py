@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from common.redis_protocol.kalshi_store.event_market_index import EventMarketIndex
+from common.redis_protocol.market_changelog import KALSHI_VENUE, market_changelog_key, queue_market_changes
 
 
 def _make_market(event_ticker: str, market_ticker: str) -> dict:
@@ -202,6 +203,7 @@ def _mock_redis_scan(key_count: int) -> MagicMock:
         return 0, keys
 
     redis.scan = AsyncMock(side_effect=mock_scan)
+    redis.xrevrange = AsyncMock(return_value=[])
     return redis
 
 
@@ -273,6 +275,7 @@ class TestReconcile:
             return 0, keys
 
         redis.scan = AsyncMock(side_effect=mock_scan)
+        redis.xrevrange = AsyncMock(return_value=[])
         assert await index.reconcile(redis) is False
 
 
@@ -409,6 +412,7 @@ class TestCountKalshiKeysBytes:
             return 0, keys
 
         redis.scan = AsyncMock(side_effect=mock_scan)
+        redis.xrevrange = AsyncMock(return_value=[])
         assert await index.reconcile(redis) is False
 
     @pytest.mark.asyncio
@@ -431,4 +435,67 @@ class TestCountKalshiKeysBytes:
             return 0, keys
 
         redis.scan = AsyncMock(side_effect=mock_scan)
+        redis.xrevrange = AsyncMock(return_value=[])
         assert await index.reconcile(redis) is False
+
+
+class TestIncrementalReconcile:
+    """Tests for change-log driven reconcile."""
+
+    @staticmethod
+    async def _write(redis, market_key: str, fields: dict | None) -> None:
+        pipe = redis.pipeline()
+        if fields is None:
+            pipe.delete(market_key)
+        else:
+            pipe.hset(market_key, mapping=fields)
+        queue_market_changes(pipe, [market_key])
+        await pipe.execute()
+
+    @pytest.mark.asyncio
+    async def test_applies_added_and_removed_markets(self, fake_redis):
+        await self._write(fake_redis, "markets:kalshi:binary:MKT-1", _make_market("EVT-A", "MKT-1"))
+        store = MagicMock()
+        store.get_all_markets = AsyncMock(return_value=[_make_market("EVT-A", "MKT-1")])
+        index = EventMarketIndex()
+        await index.initialize(store)
+        assert await index.reconcile(fake_redis) is False
+
+        await self._write(fake_redis, "markets:kalshi:binary:MKT-2", _make_market("EVT-B", "MKT-2"))
+        await self._write(fake_redis, "markets:kalshi:binary:MKT-1", None)
+        fake_redis.scan = AsyncMock(side_effect=AssertionError("incremental reconcile must not SCAN"))
+
+        assert await index.reconcile(fake_redis) is False
+        assert index.get_all_tickers() == ["MKT-2"]
+        assert index.get_event_market_tickers("EVT-B") == {"MKT-2"}
+        assert index.get_event_market_tickers("EVT-A") == set()
+
+    @pytest.mark.asyncio
+    async def test_settled_market_in_delta_is_evicted(self, fake_redis):
+        await self._write(fake_redis, "markets:kalshi:binary:MKT-1", _make_market("EVT-A", "MKT-1"))
+        store = MagicMock()
+        store.get_all_markets = AsyncMock(return_value=[_make_market("EVT-A", "MKT-1")])
+        index = EventMarketIndex()
+        await index.initialize(store)
+        await index.reconcile(fake_redis)
+
+        await self._write(fake_redis, "markets:kalshi:binary:MKT-1", {"status": "settled"})
+
+        assert await index.reconcile(fake_redis) is False
+        assert index.market_count == 0
+
+    @pytest.mark.asyncio
+    async def test_lost_generation_requests_reinitialize(self, fake_redis, caplog):
+        await self._write(fake_redis, "markets:kalshi:binary:MKT-1", _make_market("EVT-A", "MKT-1"))
+        store = MagicMock()
+        store.get_all_markets = AsyncMock(return_value=[_make_market("EVT-A", "MKT-1")])
+        index = EventMarketIndex()
+        await index.initialize(store)
+        await index.reconcile(fake_redis)
+
+        await fake_redis.delete(market_changelog_key(KALSHI_VENUE))
+        await self._write(fake_redis, "markets:kalshi:binary:MKT-2", _make_market("EVT-B", "MKT-2"))
+
+        with caplog.at_level(logging.WARNING):
+            assert await index.reconcile(fake_redis) is True
+        assert "change log" in caplog.text
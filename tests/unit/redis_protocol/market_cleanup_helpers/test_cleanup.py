@@ -96,6 +96,8 @@ class TestCleanupKalshiMarkets:
 
         assert result == 1
         delete_pipe.delete.assert_called_once_with("markets:kalshi:test:TICKER1")
+        delete_pipe.xadd.assert_called_once()
+        assert delete_pipe.xadd.call_args.args == ("ops:market_changes:KALSHI", {"key": "markets:kalshi:test:TICKER1"})
 
     @pytest.mark.asyncio
     async def test_does_not_delete_non_expired_markets(self) -> None:
@@ -181,6 +183,7 @@ class TestCleanupDeribitOptions:
 
         assert result == 1
         mock_pipe.delete.assert_called_once()
+        assert mock_pipe.xadd.call_args.args[0] == "ops:market_changes:DERIBIT"
 
     @pytest.mark.asyncio
     async def test_does_not_delete_non_expired_options(self) -> None:
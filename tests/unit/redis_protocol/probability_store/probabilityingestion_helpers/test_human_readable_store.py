@@ -24,20 +24,30 @@ class _FakeCollector:
 
 
 class _FakeEnqueuer:
-    def __init__(self, *, raise_exc: Exception | None = None):
+    def __init__(self, *, raise_exc: Exception | None = None, event_type_keys=None):
         self.raise_exc = raise_exc
+        self.event_type_keys = event_type_keys or {}
         self.calls = 0
 
     def enqueue_human_readable_records(self, **kwargs):
         if self.raise_exc:
             raise self.raise_exc
         self.calls += 1
-        return SimpleNamespace(field_count=2, sample_keys=["k1", "k2"], event_ticker_counts={"ev": 2})
+        return SimpleNamespace(
+            field_count=2,
+            sample_keys=["k1", "k2"],
+            event_ticker_counts={"ev": 2},
+            event_type_keys=self.event_type_keys,
+        )
 
 
 class _StubRedis:
-    def __init__(self):
+    def __init__(self, index_members=None):
         self.closed = False
+        self.index_members = set(index_members or ())
+
+    async def smembers(self, _key):
+        return set(self.index_members)
 
     async def aclose(self):
         self.closed = True
@@ -144,3 +154,51 @@ async def test_store_probabilities_human_readable_handles_failures(monkeypatch):
 
     assert failure_context["data"] == {"2025-01-01": {}}
     assert failure_context["connectivity"][1] == "BTC"
+
+
+class _RecordingPipeline:
+    def __init__(self):
+        self.calls: list = []
+
+    def delete(self, *keys):
+        self.calls.append(("delete", keys))
+
+    def sadd(self, key, *members):
+        self.calls.append(("sadd", key, set(members)))
+
+
+@pytest.mark.asyncio
+async def test_store_probabilities_human_readable_rebuilds_event_type_index(monkeypatch):
+    collector = _FakeCollector()
+    enqueuer = _FakeEnqueuer(event_type_keys={"rain": ["k1", "k2"]})
+    redis_client = _StubRedis(index_members={"old"})
+    pipeline = _RecordingPipeline()
+
+    async def _provider():
+        return redis_client
+
+    store = HumanReadableStore(_provider, collector, enqueuer)
+
+    async def _create_pipeline(_redis):
+        return pipeline
+
+    async def _execute(_pipeline):
+        # index delete + 2 hash sets + 2 index SADDs
+        return [1, 1, 1, 1, 1]
+
+    async def _verify(*_args):
+        return None
+
+    prefix = "common.redis_protocol.probability_store.probabilityingestion_helpers.human_readable_store"
+    monkeypatch.setattr(f"{prefix}.create_pipeline", _create_pipeline)
+    monkeypatch.setattr(f"{prefix}.execute_pipeline", _execute)
+    monkeypatch.setattr(f"{prefix}.verify_probability_storage", _verify)
+    monkeypatch.setattr(f"{prefix}.log_event_ticker_summary", lambda *args: None)
+
+    assert await store.store_probabilities_human_readable("btc", {"2024-01-01": {"10": {}}}) is True
+
+    assert pipeline.calls == [
+        ("delete", ("probabilities_index:BTC:event_type:old", "probabilities_index:BTC:event_types")),
+        ("sadd", "probabilities_index:BTC:event_type:rain", {"k1", "k2"}),
+        ("sadd", "probabilities_index:BTC:event_types", {"rain"}),
+    ]
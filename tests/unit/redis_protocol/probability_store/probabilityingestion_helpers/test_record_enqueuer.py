@@ -60,6 +60,33 @@ class TestRecordEnqueuer:
         assert "k1" in stats.sample_keys
         assert stats.event_ticker_counts["ev1"] == 1
 
+    def test_collects_event_type_keys(self) -> None:
+        enqueuer = RecordEnqueuer()
+        records = [
+            _make_record(key="k1", fields={"probability": "0.5", "event_type": "rain"}),
+            _make_record(key="k2", fields={"probability": "0.4", "event_type": "null"}),
+            _make_record(key="k3", fields={"probability": "0.3", "event_type": "rain"}),
+        ]
+
+        with (
+            patch(
+                "common.redis_protocol.probability_store.probabilityingestion_helpers.record_enqueuer.build_probability_record",
+                side_effect=records,
+            ),
+            patch(
+                "common.redis_protocol.probability_store.probabilityingestion_helpers.record_enqueuer.log_probability_diagnostics",
+            ),
+        ):
+            stats = enqueuer.enqueue_human_readable_records(
+                currency="BTC",
+                probabilities_data={"2025-01-01": {"1": {}, "2": {}, "3": {}}},
+                pipeline=_FakePipeline(),
+                sample_log_limit=5,
+                verification_sample_limit=5,
+            )
+
+        assert stats.event_type_keys == {"rain": ["k1", "k3"]}
+
     def test_skips_empty_fields(self) -> None:
         enqueuer = RecordEnqueuer()
         pipeline = _FakePipeline()
@@ -74,8 +74,14 @@ class TestGetProbabilitiesByEventType:
 
     @pytest.mark.asyncio
     async def test_raises_on_no_data(self) -> None:
+        call_count = 0
+
         async def fake_ensure(coro):
+            nonlocal call_count
             _close_if_coro(coro)
+            call_count += 1
+            if call_count == 1:
+                return set()
             return (0, [])
 
         redis = MagicMock()
@@ -123,6 +129,8 @@ class TestGetProbabilitiesByEventType:
             _close_if_coro(coro)
             call_count += 1
             if call_count == 1:
+                return set()
+            if call_count == 2:
                 return (0, [b"probabilities:BTC:2025-01-01:call:50000"])
             return [raw_hash_data]
 
@@ -156,3 +164,29 @@ class TestGetProbabilitiesByEventType:
             result = await get_probabilities_by_event_type(redis_client, "BTC", "btc_above_50k")
 
         assert "2025-01-01" in result
+
+
+class TestGetProbabilitiesByEventTypeIndexed:
+    """Tests for the event-type index path of get_probabilities_by_event_type."""
+
+    @pytest.mark.asyncio
+    async def test_reads_index_and_skips_stale_members(self, fake_redis) -> None:
+        await fake_redis.hset("probabilities:BTC:2025-01-01:call:100", mapping={"probability": "0.5", "event_type": "rain"})
+        await fake_redis.hset("probabilities:BTC:2025-01-01:call:200", mapping={"probability": "0.4", "event_type": "snow"})
+        await fake_redis.sadd(
+            "probabilities_index:BTC:event_type:rain",
+            "probabilities:BTC:2025-01-01:call:100",
+            "probabilities:BTC:2025-01-01:call:200",
+            "probabilities:BTC:2025-01-01:call:300",
+        )
+
+        result = await get_probabilities_by_event_type(fake_redis, "btc", "rain")
+
+        assert list(result["2025-01-01"]["call"]) == ["100"]
+
+    @pytest.mark.asyncio
+    async def test_raises_when_all_members_stale(self, fake_redis) -> None:
+        await fake_redis.sadd("probabilities_index:BTC:event_type:rain", "probabilities:BTC:2025-01-01:call:300")
+
+        with pytest.raises(ProbabilityStoreError, match="No data found for event type"):
+            await get_probabilities_by_event_type(fake_redis, "btc", "rain")
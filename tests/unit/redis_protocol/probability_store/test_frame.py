@@ -0,0 +1,121 @@
+"""Unit tests for probability_store frame module."""
+
+from __future__ import annotations
+
+import math
+from decimal import Decimal
+
+import numpy as np
+import orjson
+import pytest
+
+from common.redis_protocol.probability_store.exceptions import ProbabilityStoreError
+from common.redis_protocol.probability_store.frame import (
+    build_probability_frame,
+    classify_strike,
+    decode_probability_frame,
+    encode_probability_frame,
+    iter_frame_rows,
+)
+
+_PAYLOAD = {
+    "2025-01-02T00:00:00Z": {
+        ">2000": {"probability": 0.1},
+        "1500": {"probability": Decimal("0.5"), "error": 0.01},
+        "<1000": {"probability": 0.9, "confidence": "NaN"},
+        "1000-1500": {"probability": 0.3, "confidence": 0.8},
+    },
+    "2025-01-01T00:00:00Z": {
+        "100": {"probability": 0.7, "confidence": 0.95},
+    },
+}
+
+
+class TestClassifyStrike:
+    """Tests for classify_strike."""
+
+    @pytest.mark.parametrize(
+        ("strike_key", "expected"),
+        [
+            (">2000", ("greater", 2000.0)),
+            ("<1000", ("less", 1000.0)),
+            ("1000-1500", ("between", 1000.0)),
+            ("1500.5", ("exact", 1500.5)),
+        ],
+    )
+    def test_classifies_strike_keys(self, strike_key, expected) -> None:
+        assert classify_strike(strike_key) == expected
+
+    def test_rejects_invalid_key(self) -> None:
+        with pytest.raises(ProbabilityStoreError):
+            classify_strike("abc")
+
+
+class TestBuildProbabilityFrame:
+    """Tests for build_probability_frame."""
+
+    def test_sorts_by_expiry_then_strike(self) -> None:
+        frame = build_probability_frame(iter_frame_rows(_PAYLOAD))
+
+        assert len(frame) == 5
+        assert frame.expiries == ["2025-01-01T00:00:00Z", "2025-01-02T00:00:00Z"]
+        assert frame.strike_key.tolist() == ["100", "<1000", "1000-1500", "1500", ">2000"]
+        assert frame.strike_type.tolist() == ["exact", "less", "between", "exact", "greater"]
+        np.testing.assert_allclose(frame.strike, [100.0, 1000.0, 1000.0, 1500.0, 2000.0])
+        np.testing.assert_allclose(frame.probability, [0.7, 0.9, 0.3, 0.5, 0.1])
+
+    def test_missing_values_are_nan(self) -> None:
+        frame = build_probability_frame(iter_frame_rows(_PAYLOAD))
+
+        assert np.isnan(frame.error).tolist() == [True, True, True, False, True]
+        assert np.isnan(frame.confidence).tolist() == [False, True, False, True, True]
+
+    def test_rejects_non_numeric_probability(self) -> None:
+        with pytest.raises(ProbabilityStoreError):
+            build_probability_frame([("2025-01-01", "100", {"probability": "high"})])
+
+
+class TestFrameCodec:
+    """Tests for encode/decode_probability_frame."""
+
+    def test_roundtrip(self) -> None:
+        frame = build_probability_frame(iter_frame_rows(_PAYLOAD))
+
+        decoded = decode_probability_frame(encode_probability_frame(frame).encode())
+
+        for column in ("expiry", "strike_key", "strike_type"):
+            assert getattr(decoded, column).tolist() == getattr(frame, column).tolist()
+        for column in ("strike", "probability", "error", "confidence"):
+            np.testing.assert_array_equal(getattr(decoded, column), getattr(frame, column))
+
+    def test_roundtrip_empty(self) -> None:
+        decoded = decode_probability_frame(encode_probability_frame(build_probability_frame([])))
+
+        assert len(decoded) == 0
+        assert decoded.expiries == []
+
+    def test_rejects_unknown_version(self) -> None:
+        document = orjson.loads(encode_probability_frame(build_probability_frame([])))
+        document["v"] = 99
+
+        with pytest.raises(ProbabilityStoreError, match="version"):
+            decode_probability_frame(orjson.dumps(document))
+
+    def test_rejects_truncated_column(self) -> None:
+        document = orjson.loads(encode_probability_frame(build_probability_frame(iter_frame_rows(_PAYLOAD))))
+        document["columns"]["probability"] = ""
+
+        with pytest.raises(ProbabilityStoreError):
+            decode_probability_frame(orjson.dumps(document))
+
+    @pytest.mark.parametrize("raw", ["not json", "[]", '{"v": 1}'])
+    def test_rejects_malformed_document(self, raw) -> None:
+        with pytest.raises(ProbabilityStoreError, match="Malformed"):
+            decode_probability_frame(raw)
+
+    def test_confidence_nan_survives(self) -> None:
+        frame = build_probability_frame([("2025-01-01", "100", {"probability": 0.5, "confidence": math.nan})])
+
+        decoded = decode_probability_frame(encode_probability_frame(frame))
+
+        assert math.isnan(decoded.confidence[0])
@@ -69,6 +69,10 @@ class TestExtractPayload:
         result = extract_payload(fields)
         assert result == fields
 
+    def test_payload_already_decoded_dict(self):
+        fields = {"ticker": "AAPL", "payload": {"ticker": "AAPL", "price": 150}}
+        assert extract_payload(fields) == {"ticker": "AAPL", "price": 150}
+
 
 class TestHandleConsumerRetry:
     """Tests for handle_consumer_retry."""
@@ -149,3 +153,43 @@ class TestConsumeStreamQueue:
         await consume_stream_queue(queue, handler, redis_client, config, "test", {})
 
         handler.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_sharded_retry_keeps_entry_order(self, monkeypatch):
+        monkeypatch.setattr("common.redis_protocol.streams.subscriber_helpers.consumer._IN_PLACE_RETRY_BACKOFF_S", 0)
+        queue: asyncio.Queue = asyncio.Queue()
+        queue.put_nowait(("entry-1", "TICKER", {"seq": "1"}))
+        queue.put_nowait(("entry-2", "TICKER", {"seq": "2"}))
+        queue.put_nowait(None)
+        seen = []
+
+        async def handler(_identifier, payload):
+            seen.append(payload["seq"])
+            if len(seen) == 1:
+                raise RuntimeError("transient")
+
+        redis_client = MagicMock()
+        redis_client.xack = AsyncMock()
+        config = StreamConfig(stream_name="s", group_name="g", consumer_name="c", shard_by_identifier=True)
+
+        await consume_stream_queue(queue, handler, redis_client, config, "test", {})
+
+        assert seen == ["1", "1", "2"]
+        assert [call.args[2] for call in redis_client.xack.call_args_list] == ["entry-1", "entry-2"]
+
+    @pytest.mark.asyncio
+    async def test_sharded_retry_drops_after_max_retries(self, monkeypatch):
+        monkeypatch.setattr("common.redis_protocol.streams.subscriber_helpers.consumer._IN_PLACE_RETRY_BACKOFF_S", 0)
+        queue: asyncio.Queue = asyncio.Queue()
+        queue.put_nowait(("entry-1", "TICKER", {"seq": "1"}))
+        queue.put_nowait(None)
+        handler = AsyncMock(side_effect=RuntimeError("handler failed"))
+        redis_client = MagicMock()
+        redis_client.xack = AsyncMock()
+        config = StreamConfig(stream_name="s", group_name="g", consumer_name="c", shard_by_identifier=True)
+
+        await consume_stream_queue(queue, handler, redis_client, config, "test", {})
+
+        assert handler.await_count == MAX_STREAM_RETRIES
+        assert queue.empty()
+        redis_client.xack.assert_called_once_with("s", "g", "entry-1")
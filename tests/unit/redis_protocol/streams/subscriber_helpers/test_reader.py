@@ -6,7 +6,12 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from common.redis_protocol.streams.subscriber import StreamConfig
-from common.redis_protocol.streams.subscriber_helpers.reader import read_stream_entries, stream_read_loop
+from common.redis_protocol.streams.subscriber_helpers.reader import (
+    multi_stream_read_loop,
+    read_multi_stream_entries,
+    read_stream_entries,
+    stream_read_loop,
+)
 
 
 class TestReadStreamEntries:
@@ -144,3 +149,112 @@ class TestStreamReadLoop:
         assert queue.qsize() == 1
         _, identifier, _ = queue.get_nowait()
         assert identifier == "GOOG"
+
+
+class TestReadMultiStreamEntries:
+    """Tests for read_multi_stream_entries."""
+
+    @pytest.mark.asyncio
+    async def test_issues_single_xreadgroup_for_all_streams(self):
+        redis_client = MagicMock()
+        redis_client.xreadgroup = AsyncMock(
+            return_value=[
+                [b"stream:a", [(b"1-0", {b"ticker": b"AAPL"})]],
+                [b"stream:b", [(b"2-0", {b"ticker": b"MSFT"})]],
+            ]
+        )
+
+        result = await read_multi_stream_entries(redis_client, ["stream:a", "stream:b"], "grp", "con", count=10, block_ms=200)
+
+        redis_client.xreadgroup.assert_called_once_with("grp", "con", {"stream:a": ">", "stream:b": ">"}, count=10, block=200)
+        assert result == {"stream:a": [("1-0", {"ticker": "AAPL"})], "stream:b": [("2-0", {"ticker": "MSFT"})]}
+
+
+class TestMultiStreamReadLoop:
+    """Tests for multi_stream_read_loop."""
+
+    @pytest.fixture
+    def configs(self):
+        return {
+            "stream:a": StreamConfig(stream_name="stream:a", group_name="g", consumer_name="c", batch_size=10, block_ms=500),
+            "stream:b": StreamConfig(
+                stream_name="stream:b", group_name="g", consumer_name="c", identifier_field="symbol", batch_size=50, block_ms=100
+            ),
+        }
+
+    @pytest.mark.asyncio
+    async def test_routes_entries_to_stream_queues(self, configs):
+        call_count = {"n": 0}
+        calls = []
+
+        async def mock_xreadgroup(_group, _consumer, streams, count, block):
+            call_count["n"] += 1
+            calls.append((dict(streams), count, block))
+            if call_count["n"] == 1:
+                return [
+                    [b"stream:a", [(b"1-0", {b"ticker": b"AAPL"})]],
+                    [b"stream:b", [(b"2-0", {b"symbol": b"GOOG"})]],
+                ]
+            return None
+
+        redis_client = MagicMock()
+        redis_client.xreadgroup = AsyncMock(side_effect=mock_xreadgroup)
+        queues = {name: asyncio.Queue(maxsize=10) for name in configs}
+        routes = {name: (configs[name], queues[name]) for name in configs}
+
+        await multi_stream_read_loop(lambda: call_count["n"] < 2, redis_client, "g", "c", routes, "test")
+
+        assert calls[0] == ({"stream:a": ">", "stream:b": ">"}, 50, 100)
+        assert queues["stream:a"].get_nowait() == ("1-0", "AAPL", {"ticker": "AAPL"})
+        assert queues["stream:b"].get_nowait() == ("2-0", "GOOG", {"symbol": "GOOG"})
+
+    @pytest.mark.asyncio
+    async def test_skips_streams_with_full_queue(self, configs):
+        call_count = {"n": 0}
+        requested = []
+
+        async def mock_xreadgroup(_group, _consumer, streams, count, block):
+            call_count["n"] += 1
+            requested.append(list(streams))
+
+        redis_client = MagicMock()
+        redis_client.xreadgroup = AsyncMock(side_effect=mock_xreadgroup)
+        full_queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        full_queue.put_nowait(("0-0", "X", {}))
+        routes = {"stream:a": (configs["stream:a"], full_queue), "stream:b": (configs["stream:b"], asyncio.Queue(maxsize=10))}
+
+        await multi_stream_read_loop(lambda: call_count["n"] < 1, redis_client, "g", "c", routes, "test")
+
+        assert requested == [["stream:b"]]
+
+    @pytest.mark.asyncio
+    async def test_slow_stream_backlog_does_not_block_other_streams(self, configs):
+        call_count = {"n": 0}
+        requested = []
+
+        async def mock_xreadgroup(_group, _consumer, streams, count, block):
+            call_count["n"] += 1
+            requested.append(list(streams))
+            if call_count["n"] == 1:
+                return [
+                    [b"stream:a", [(b"1-0", {b"ticker": b"A1"}), (b"1-1", {b"ticker": b"A2"}), (b"1-2", {b"ticker": b"A3"})]],
+                    [b"stream:b", [(b"2-0", {b"symbol": b"B1"})]],
+                ]
+            if call_count["n"] == 2:
+                return [[b"stream:b", [(b"2-1", {b"symbol": b"B2"})]]]
+            return None
+
+        redis_client = MagicMock()
+        redis_client.xreadgroup = AsyncMock(side_effect=mock_xreadgroup)
+        slow_queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        fast_queue: asyncio.Queue = asyncio.Queue(maxsize=10)
+        routes = {"stream:a": (configs["stream:a"], slow_queue), "stream:b": (configs["stream:b"], fast_queue)}
+
+        await asyncio.wait_for(
+            multi_stream_read_loop(lambda: call_count["n"] < 2, redis_client, "g", "c", routes, "test"),
+            timeout=1.0,
+        )
+
+        assert requested == [["stream:a", "stream:b"], ["stream:b"]]
+        assert [fast_queue.get_nowait()[1] for _ in range(fast_queue.qsize())] == ["B1", "B2"]
+        assert slow_queue.get_nowait()[1] == "A1"
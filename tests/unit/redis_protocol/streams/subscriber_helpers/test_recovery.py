@@ -6,8 +6,10 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from common.redis_protocol.streams.constants import PENDING_CLAIM_IDLE_MS
 from common.redis_protocol.streams.subscriber import StreamConfig
 from common.redis_protocol.streams.subscriber_helpers.recovery import (
+    collect_replay_entries,
     initialize_consumer_group,
     parse_entry_timestamp_ms,
     purge_stale_pending,
@@ -186,3 +188,91 @@ class TestPurgeStale:
 
         assert purged == 0
         redis_client.xack.assert_not_called()
+
+
+class TestCollectReplayEntries:
+    """Tests for collect_replay_entries."""
+
+    @pytest.fixture
+    def config(self):
+        return StreamConfig(stream_name="s", group_name="g", consumer_name="c", batch_size=2)
+
+    @pytest.mark.asyncio
+    async def test_paginates_pel_and_backlog_and_coalesces(self, config):
+        redis_client = MagicMock()
+        redis_client.xautoclaim = AsyncMock(
+            side_effect=[
+                (b"5-0", [(b"1-0", {b"ticker": b"A"}), (b"2-0", {b"ticker": b"B"})], []),
+                (b"0-0", [(b"5-0", {b"ticker": b"A"})], []),
+            ]
+        )
+        redis_client.xreadgroup = AsyncMock(
+            side_effect=[
+                [[b"s", [(b"6-0", {b"ticker": b"C"}), (b"7-0", {b"ticker": b"A"})]]],
+                [[b"s", [(b"8-0", {b"ticker": b"B"})]]],
+                None,
+            ]
+        )
+        redis_client.xack = AsyncMock()
+
+        winners = await collect_replay_entries(redis_client, config, "test")
+
+        assert [(entry_id, identifier) for entry_id, identifier, _ in winners] == [("6-0", "C"), ("7-0", "A"), ("8-0", "B")]
+        assert redis_client.xautoclaim.call_args_list[1].kwargs["start_id"] == "5-0"
+        assert redis_client.xautoclaim.call_args_list[0].kwargs["min_idle_time"] == PENDING_CLAIM_IDLE_MS
+        assert redis_client.xreadgroup.call_args.kwargs["block"] is None
+        acked = set(redis_client.xack.call_args.args[2:])
+        assert acked == {"1-0", "2-0", "5-0"}
+
+    @pytest.mark.asyncio
+    async def test_keeps_claiming_past_pages_of_deleted_entries(self, config):
+        redis_client = MagicMock()
+        redis_client.xautoclaim = AsyncMock(
+            side_effect=[
+                (b"3-0", [], [b"1-0", b"2-0"]),
+                (b"0-0", [(b"4-0", {b"ticker": b"A"})], []),
+            ]
+        )
+        redis_client.xreadgroup = AsyncMock(return_value=None)
+        redis_client.xack = AsyncMock()
+
+        winners = await collect_replay_entries(redis_client, config, "test")
+
+        assert [entry_id for entry_id, _, _ in winners] == ["4-0"]
+        assert redis_client.xautoclaim.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_keeps_newer_entry_when_older_arrives_later(self, config):
+        redis_client = MagicMock()
+        redis_client.xautoclaim = AsyncMock(return_value=(b"0-0", [(b"9-0", {b"ticker": b"A"})], []))
+        redis_client.xreadgroup = AsyncMock(side_effect=[[[b"s", [(b"3-0", {b"ticker": b"A"})]]], None])
+        redis_client.xack = AsyncMock()
+
+        winners = await collect_replay_entries(redis_client, config, "test")
+
+        assert [entry_id for entry_id, _, _ in winners] == ["9-0"]
+        redis_client.xack.assert_called_once_with("s", "g", "3-0")
+
+    @pytest.mark.asyncio
+    async def test_empty_backlog(self, config):
+        redis_client = MagicMock()
+        redis_client.xautoclaim = AsyncMock(return_value=(b"0-0", [], []))
+        redis_client.xreadgroup = AsyncMock(return_value=None)
+        redis_client.xack = AsyncMock()
+
+        assert await collect_replay_entries(redis_client, config, "test") == []
+        redis_client.xack.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_entries_without_identifier_are_not_coalesced(self, config):
+        redis_client = MagicMock()
+        redis_client.xautoclaim = AsyncMock(return_value=(b"0-0", [(b"1-0", {b"other": b"x"})], []))
+        redis_client.xreadgroup = AsyncMock(
+            side_effect=[[[b"s", [(b"2-0", {b"ticker": b"A"}), (b"3-0", {b"other": b"y"}), (b"4-0", {b"other": b"z"})]]], None]
+        )
+        redis_client.xack = AsyncMock()
+
+        winners = await collect_replay_entries(redis_client, config, "test")
+
+        assert [(entry_id, identifier) for entry_id, identifier, _ in winners] == [("1-0", ""), ("2-0", "A"), ("3-0", ""), ("4-0", "")]
+        redis_client.xack.assert_not_called()
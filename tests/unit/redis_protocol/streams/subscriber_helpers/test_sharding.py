@@ -0,0 +1,61 @@
+"""Tests for subscriber_helpers.sharding module."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from common.redis_protocol.streams.subscriber_helpers.sharding import ShardedQueue, offload_handler
+
+
+class TestShardedQueue:
+    """Tests for ShardedQueue."""
+
+    def test_rejects_zero_shards(self):
+        with pytest.raises(ValueError):
+            ShardedQueue(0, 10)
+
+    @pytest.mark.asyncio
+    async def test_same_identifier_same_shard_in_order(self):
+        queue = ShardedQueue(4, 10)
+        for i in range(3):
+            await queue.put((f"{i}-0", "AAPL", {}))
+
+        shard = queue.shard_for("AAPL")
+        assert [shard.get_nowait()[0] for _ in range(3)] == ["0-0", "1-0", "2-0"]
+
+    def test_sizes_and_capacity(self):
+        queue = ShardedQueue(3, 5)
+        queue.put_nowait(("1-0", "AAPL", {}))
+        queue.put_nowait(("2-0", "MSFT", {}))
+
+        assert queue.maxsize == 15
+        assert queue.qsize() == 2
+        assert sum(queue.shard_sizes()) == 2
+        assert len(queue.shard_sizes()) == 3
+        assert not queue.empty()
+
+    def test_full_when_any_shard_full(self):
+        queue = ShardedQueue(2, 1)
+        queue.put_nowait(("1-0", "AAPL", {}))
+
+        assert queue.full()
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait(("2-0", "AAPL", {}))
+
+
+class TestOffloadHandler:
+    """Tests for offload_handler."""
+
+    @pytest.mark.asyncio
+    async def test_runs_function_on_executor(self):
+        calls = []
+
+        def work(identifier, payload):
+            calls.append((identifier, payload))
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            handler = offload_handler(work, executor)
+            await handler("AAPL", {"price": 1})
+
+        assert calls == [("AAPL", {"price": 1})]
@@ -0,0 +1,61 @@
+"""Tests for the binary stream message codec."""
+
+import orjson
+
+from common.redis_protocol.streams.codec import (
+    BINARY_CODEC_VERSION,
+    BINARY_MESSAGE_FIELD,
+    binary_message_value,
+    decode_stream_message,
+    encode_stream_message,
+)
+
+
+class TestEncodeStreamMessage:
+    """Tests for encode_stream_message."""
+
+    def test_prefixes_version_tag(self):
+        blob = encode_stream_message({"ticker": "AAPL"})
+
+        assert blob[0] == BINARY_CODEC_VERSION
+        assert orjson.loads(blob[1:]) == {"ticker": "AAPL"}
+
+    def test_drops_none_values(self):
+        blob = encode_stream_message({"ticker": "AAPL", "price": None})
+
+        assert orjson.loads(blob[1:]) == {"ticker": "AAPL"}
+
+
+class TestDecodeStreamMessage:
+    """Tests for decode_stream_message."""
+
+    def test_round_trip_preserves_types(self):
+        fields = {"ticker": "AAPL", "price": 99.5, "count": 3, "payload": {"side": "yes"}}
+
+        assert decode_stream_message(encode_stream_message(fields)) == fields
+
+    def test_decodes_str_blob(self):
+        blob = encode_stream_message({"ticker": "AAPL"}).decode("utf-8")
+
+        assert decode_stream_message(blob) == {"ticker": "AAPL"}
+
+    def test_unknown_version_returns_none(self):
+        assert decode_stream_message(b"\x7f{}") is None
+
+    def test_malformed_body_returns_none(self):
+        assert decode_stream_message(bytes([BINARY_CODEC_VERSION]) + b"{not json") is None
+
+    def test_non_object_returns_none(self):
+        assert decode_stream_message(bytes([BINARY_CODEC_VERSION]) + b"[1, 2]") is None
+
+
+class TestBinaryMessageValue:
+    """Tests for binary_message_value."""
+
+    def test_detects_str_and_bytes_field(self):
+        assert binary_message_value({BINARY_MESSAGE_FIELD: "x"}) == "x"
+        assert binary_message_value({BINARY_MESSAGE_FIELD.encode(): b"x"}) == b"x"
+
+    def test_ignores_legacy_fields(self):
+        assert binary_message_value({"ticker": "AAPL"}) is None
+        assert binary_message_value({BINARY_MESSAGE_FIELD: "x", "ticker": "AAPL"}) is None
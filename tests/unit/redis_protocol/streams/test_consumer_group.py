@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from common.redis_protocol.retry import RedisRetryError
+from common.redis_protocol.streams.codec import BINARY_MESSAGE_FIELD, encode_stream_message
 from common.redis_protocol.streams.consumer_group import (
     claim_pending_entries,
     ensure_consumer_group,
@@ -117,3 +118,12 @@ class TestClaimPendingEntries:
 
         assert result[0][0] == "1234-0"
         assert result[0][1] == {"ticker": "AAPL"}
+
+    @pytest.mark.asyncio
+    async def test_decodes_binary_codec_entries(self, mock_redis):
+        blob = encode_stream_message({"ticker": "AAPL", "price": 150})
+        mock_redis.xautoclaim = AsyncMock(return_value=(b"0-0", [(b"1234-0", {BINARY_MESSAGE_FIELD.encode(): blob})], []))
+
+        result = await claim_pending_entries(mock_redis, "stream:test", "group", "consumer")
+
+        assert result == [("1234-0", {"ticker": "AAPL", "price": 150})]
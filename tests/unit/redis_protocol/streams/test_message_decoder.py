@@ -1,6 +1,11 @@
 """Tests for message decoder."""
 
-from common.redis_protocol.streams.message_decoder import decode_stream_response
+from common.redis_protocol.streams.codec import BINARY_MESSAGE_FIELD, encode_stream_message
+from common.redis_protocol.streams.message_decoder import (
+    decode_entry_fields,
+    decode_stream_response,
+    decode_stream_response_by_stream,
+)
 
 
 class TestDecodeStreamResponse:
@@ -73,3 +78,39 @@ class TestDecodeStreamResponse:
         result = decode_stream_response(raw)
 
         assert result == []
+
+
+class TestDecodeStreamResponseByStream:
+    """Tests for decode_stream_response_by_stream function."""
+
+    def test_groups_entries_by_stream(self):
+        raw = [
+            [b"stream:a", [(b"1-0", {b"ticker": b"AAPL"}), (b"2-0", {b"ticker": b"MSFT"})]],
+            [b"stream:b", [(b"3-0", {b"ticker": b"GOOG"})]],
+        ]
+
+        result = decode_stream_response_by_stream(raw)
+
+        assert result == {
+            "stream:a": [("1-0", {"ticker": "AAPL"}), ("2-0", {"ticker": "MSFT"})],
+            "stream:b": [("3-0", {"ticker": "GOOG"})],
+        }
+
+    def test_empty_response(self):
+        assert decode_stream_response_by_stream(None) == {}
+        assert decode_stream_response_by_stream([]) == {}
+
+
+class TestBinaryCodecEntries:
+    """Binary-codec entries decode in one call; legacy entries keep working."""
+
+    def test_decodes_binary_entry(self):
+        blob = encode_stream_message({"ticker": "AAPL", "price": 150})
+        raw = [[b"stream:test", [(b"1-0", {BINARY_MESSAGE_FIELD.encode(): blob}), (b"2-0", {b"ticker": b"MSFT"})]]]
+
+        result = decode_stream_response(raw)
+
+        assert result == [("1-0", {"ticker": "AAPL", "price": 150}), ("2-0", {"ticker": "MSFT"})]
+
+    def test_falls_back_on_undecodable_binary_entry(self):
+        assert decode_entry_fields({BINARY_MESSAGE_FIELD: b"\x7fjunk"}) == {BINARY_MESSAGE_FIELD: "\x7fjunk"}
@@ -0,0 +1,104 @@
+"""Tests for MultiplexedStreamSubscriber."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from common.redis_protocol.streams.multiplexed_subscriber import MultiplexedStreamSubscriber
+from common.redis_protocol.streams.subscriber import StreamConfig
+
+
+@pytest.fixture
+def mock_redis():
+    redis = MagicMock()
+    redis.xgroup_create = AsyncMock(return_value=True)
+    redis.xautoclaim = AsyncMock(return_value=(b"0-0", [], []))
+    redis.xreadgroup = AsyncMock(return_value=None)
+    redis.xack = AsyncMock(return_value=1)
+    redis.xgroup_setid = AsyncMock(return_value=True)
+    redis.xpending_range = AsyncMock(return_value=[])
+    return redis
+
+
+def _config(stream: str, group: str = "group") -> StreamConfig:
+    return StreamConfig(stream_name=stream, group_name=group, consumer_name="consumer", block_ms=10)
+
+
+class TestMultiplexedStreamSubscriber:
+    """Tests for MultiplexedStreamSubscriber lifecycle and routing."""
+
+    def test_rejects_duplicate_stream(self, mock_redis):
+        multiplexed = MultiplexedStreamSubscriber(mock_redis)
+        multiplexed.add_stream(_config("stream:a"), AsyncMock())
+
+        with pytest.raises(ValueError):
+            multiplexed.add_stream(_config("stream:a"), AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_start_requires_streams(self, mock_redis):
+        with pytest.raises(ValueError):
+            await MultiplexedStreamSubscriber(mock_redis).start()
+
+    @pytest.mark.asyncio
+    async def test_one_reader_per_consumer_group(self, mock_redis):
+        multiplexed = MultiplexedStreamSubscriber(mock_redis, subscriber_name="test")
+        multiplexed.add_stream(_config("stream:a"), AsyncMock())
+        multiplexed.add_stream(_config("stream:b"), AsyncMock())
+        multiplexed.add_stream(_config("stream:c", group="other"), AsyncMock())
+
+        await multiplexed.start()
+        try:
+            assert multiplexed.running
+            assert len(multiplexed.reader_tasks) == 2
+            assert all(sub.reader_task is None for sub in multiplexed.subscribers.values())
+        finally:
+            await multiplexed.stop()
+
+        assert not multiplexed.running
+        assert multiplexed.reader_tasks == []
+
+    @pytest.mark.asyncio
+    async def test_dispatches_to_stream_handlers(self, mock_redis):
+        delivered = {"n": 0}
+
+        async def mock_xreadgroup(_group, _consumer, _streams, count, block):
+            delivered["n"] += 1
+            if delivered["n"] == 1:
+                return [
+                    [b"stream:a", [(b"1-0", {b"ticker": b"AAPL"})]],
+                    [b"stream:b", [(b"2-0", {b"ticker": b"MSFT"})]],
+                ]
+            await asyncio.sleep(0.01)
+            return None
+
+        mock_redis.xreadgroup = AsyncMock(side_effect=mock_xreadgroup)
+        handler_a = AsyncMock()
+        handler_b = AsyncMock()
+        multiplexed = MultiplexedStreamSubscriber(mock_redis, subscriber_name="test")
+        multiplexed.add_stream(_config("stream:a"), handler_a)
+        multiplexed.add_stream(_config("stream:b"), handler_b)
+
+        await multiplexed.start()
+        try:
+            for _ in range(50):
+                if handler_a.await_count and handler_b.await_count:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await multiplexed.stop()
+
+        handler_a.assert_awaited_with("AAPL", {"ticker": "AAPL"})
+        handler_b.assert_awaited_with("MSFT", {"ticker": "MSFT"})
+        assert multiplexed.health_info()["stream:a"].messages_processed == 1
+
+    @pytest.mark.asyncio
+    async def test_add_stream_after_start_raises(self, mock_redis):
+        multiplexed = MultiplexedStreamSubscriber(mock_redis)
+        multiplexed.add_stream(_config("stream:a"), AsyncMock())
+        await multiplexed.start()
+        try:
+            with pytest.raises(RuntimeError):
+                multiplexed.add_stream(_config("stream:b"), AsyncMock())
+        finally:
+            await multiplexed.stop()
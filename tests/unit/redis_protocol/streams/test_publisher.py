@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from common.redis_protocol.streams.codec import BINARY_MESSAGE_FIELD, decode_stream_message
 from common.redis_protocol.streams.constants import STREAM_DEFAULT_MAXLEN
 from common.redis_protocol.streams.publisher import stream_publish
 
@@ -67,3 +68,11 @@ class TestStreamPublish:
 
         call_args = mock_redis.xadd.call_args
         assert call_args[1]["maxlen"] == custom_maxlen
+
+    @pytest.mark.asyncio
+    async def test_binary_packs_message_into_single_field(self, mock_redis):
+        await stream_publish(mock_redis, "stream:test", {"ticker": "AAPL", "price": 99.5, "skip": None}, binary=True)
+
+        fields = mock_redis.xadd.call_args[0][1]
+        assert list(fields) == [BINARY_MESSAGE_FIELD]
+        assert decode_stream_message(fields[BINARY_MESSAGE_FIELD]) == {"ticker": "AAPL", "price": 99.5}
@@ -8,6 +8,7 @@ import pytest
 from common.redis_protocol.streams.subscriber import (
     RedisStreamSubscriber,
     StreamConfig,
+    StreamRecoveryMode,
     SubscriberHealthInfo,
 )
 
@@ -35,6 +36,14 @@ class TestStreamConfig:
         )
         assert config.coalesce is False
 
+    def test_default_recovery_mode_is_discard(self):
+        config = StreamConfig(
+            stream_name="stream:test",
+            group_name="group",
+            consumer_name="consumer",
+        )
+        assert config.recovery_mode == StreamRecoveryMode.DISCARD
+
 
 class TestRedisStreamSubscriber:
     """Tests for RedisStreamSubscriber lifecycle."""
@@ -89,6 +98,43 @@ class TestRedisStreamSubscriber:
         mock_redis.xack.assert_called()
         handler.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_replay_mode_dispatches_latest_per_identifier(self, mock_redis, config, handler):
+        config.recovery_mode = StreamRecoveryMode.REPLAY
+        mock_redis.xautoclaim = AsyncMock(return_value=(b"0-0", [(b"1-0", {b"ticker": b"AAPL", b"price": b"1"})], []))
+        mock_redis.xreadgroup = AsyncMock(side_effect=[[[b"stream:test", [(b"2-0", {b"ticker": b"AAPL", b"price": b"2"})]]], None, None])
+        subscriber = RedisStreamSubscriber(mock_redis, handler, config=config, subscriber_name="test")
+        await subscriber.start()
+        await subscriber.queue.join()
+        await subscriber.stop()
+
+        handler.assert_awaited_once_with("AAPL", {"ticker": "AAPL", "price": "2"})
+        mock_redis.xgroup_setid.assert_not_called()
+        mock_redis.xpending_range.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_sharded_mode_one_consumer_per_shard(self, mock_redis, config):
+        config.shard_by_identifier = True
+        config.num_consumers = 3
+        seen: list[tuple[str, str]] = []
+
+        async def handler(identifier, payload):
+            seen.append((identifier, payload["seq"]))
+
+        subscriber = RedisStreamSubscriber(mock_redis, handler, config=config, subscriber_name="test")
+        await subscriber.start()
+        for seq in range(5):
+            for ticker in ("AAPL", "MSFT", "GOOG"):
+                await subscriber.queue.put((f"{seq}-0", ticker, {"ticker": ticker, "seq": str(seq)}))
+        await subscriber.queue.join()
+        info = subscriber.health_info()
+        await subscriber.stop()
+
+        assert len(info.shard_queue_sizes) == 3
+        for ticker in ("AAPL", "MSFT", "GOOG"):
+            assert [seq for ident, seq in seen if ident == ticker] == ["0", "1", "2", "3", "4"]
+        assert subscriber.consumer_tasks == []
+
     @pytest.mark.asyncio
     async def test_stop_is_idempotent(self, mock_redis, config, handler):
         subscriber = RedisStreamSubscriber(mock_redis, handler, config=config, subscriber_name="test")
@@ -156,3 +156,20 @@ class TestTimer:
         await asyncio.sleep(FLUSH_WAIT_S)
         await batcher.stop()
         assert call_count >= 1
+
+    @pytest.mark.asyncio
+    async def test_custom_interval_and_size_threshold(self) -> None:
+        received: list[list[str]] = []
+
+        async def process(batch: list[str]) -> None:
+            received.append(batch)
+
+        batcher: CoalescingBatcher[str, str] = CoalescingBatcher(process, "test", flush_interval_ms=60_000, max_pending=2)
+        await batcher.start()
+        batcher.add("a", "v1")
+        await asyncio.sleep(0.01)
+        assert received == []
+        batcher.add("b", "v2")
+        await asyncio.sleep(0.01)
+        await batcher.stop()
+        assert sorted(received[0]) == ["v1", "v2"]
@@ -219,6 +219,7 @@ class TestHistorySettings:
 
         assert config.HISTORY_KEY_PREFIX == "history:"
         assert config.HISTORY_TTL_SECONDS == 7200  # 2 hours (consumers look back 65 minutes max)
+        assert config.HISTORY_RETENTION_SECONDS == 86400
 
 
 class TestModuleExports:
@@ -238,6 +239,7 @@ class TestModuleExports:
             "DERIBIT_SUBSCRIPTION_CHANNEL",
             "DERIBIT_SUBSCRIPTION_KEY",
             "HISTORY_KEY_PREFIX",
+            "HISTORY_RETENTION_SECONDS",
             "HISTORY_TTL_SECONDS",
             "KALSHI_BALANCE_KEY",
             "KALSHI_MARKET_PREFIX",
@@ -3,9 +3,11 @@
 import logging
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 
 from common.redis_protocol.deribit_instrument_index import DeribitInstrumentIndex
+from common.redis_protocol.market_changelog import DERIBIT_VENUE, market_changelog_key, queue_market_changes
 
 
 def _mock_market_store(scan_results: dict[str, dict]) -> MagicMock:
@@ -165,6 +167,70 @@ class TestDeribitInstrumentIndex:
         assert len(futures) == 1
 
 
+class TestDeribitOptionChainIndex:
+    """Tests for the per-currency option chain kept by the index."""
+
+    @staticmethod
+    def _seed(index: DeribitInstrumentIndex) -> None:
+        for strike, bid in (("60000", "0.02"), ("40000", "0.20"), ("50000", "0.10")):
+            index.apply_stream_update(
+                f"markets:deribit:option:BTC:2025-03-28:{strike}:c",
+                {"best_bid": bid, "best_ask": "0.3", "mark_iv": "55"},
+            )
+        index.apply_stream_update(
+            "markets:deribit:option:BTC:2025-03-28:50000:p",
+            {"best_bid": "0.05", "best_ask": "0.06"},
+        )
+
+    def test_slice_sorted_by_strike(self):
+        index = DeribitInstrumentIndex()
+        self._seed(index)
+
+        chain = index.get_option_chain_slice("btc", "2025-03-28")
+
+        assert chain is not None
+        assert chain.strikes.tolist() == [40000.0, 50000.0, 60000.0]
+        assert chain.call("best_bid").tolist() == [0.20, 0.10, 0.02]
+        assert chain.put("best_bid")[1] == 0.05
+        assert np.isnan(chain.put("best_bid")[0])
+
+    def test_stream_update_overwrites_in_place(self):
+        index = DeribitInstrumentIndex()
+        self._seed(index)
+
+        index.apply_stream_update("markets:deribit:option:BTC:2025-03-28:50000:c", {"best_bid": "0.12"})
+
+        chain = index.get_option_chain_slice("BTC", "2025-03-28")
+        assert chain.call("best_bid")[1] == 0.12
+        assert chain.call("mark_iv")[1] == 55.0
+
+    def test_nearest_strikes_around_spot(self):
+        index = DeribitInstrumentIndex()
+        self._seed(index)
+
+        chain = index.get_nearest_strikes("BTC", "2025-03-28", spot=58000.0, count=2)
+
+        assert chain.strikes.tolist() == [50000.0, 60000.0]
+
+    def test_expiries_and_missing_lookups(self):
+        index = DeribitInstrumentIndex()
+        self._seed(index)
+        index.apply_stream_update("markets:deribit:option:BTC:2025-01-31:50000:c", {"best_bid": "0.1"})
+
+        assert index.get_option_expiries("BTC") == ["2025-01-31", "2025-03-28"]
+        assert index.get_option_expiries("ETH") == []
+        assert index.get_option_chain_slice("BTC", "2099-01-01") is None
+        assert index.get_nearest_strikes("ETH", "2025-03-28", 1.0, 3) is None
+
+    def test_unparseable_option_key_is_indexed_but_not_chained(self):
+        index = DeribitInstrumentIndex()
+
+        index.apply_stream_update("markets:deribit:option:BTC:key-0", {"best_bid": "1"})
+
+        assert len(index.get_options_by_currency("BTC")) == 1
+        assert index.get_option_expiries("BTC") == []
+
+
 def _mock_deribit_redis(btc_count: int, eth_count: int) -> MagicMock:
     """Build a mock redis that returns per-currency key counts from SCAN."""
     redis = MagicMock()
@@ -179,6 +245,7 @@ def _mock_deribit_redis(btc_count: int, eth_count: int) -> MagicMock:
         return 0, keys
 
     redis.scan = AsyncMock(side_effect=mock_scan)
+    redis.xrevrange = AsyncMock(return_value=[])
     return redis
 
 
@@ -270,3 +337,81 @@ class TestDeribitReconcile:
 
         assert index.instrument_count < count_after_first
         assert index.instrument_count == 1
+
+
+class TestDeribitIncrementalReconcile:
+    """Tests for change-log driven reconcile."""
+
+    @staticmethod
+    async def _write(redis, instrument_key: str, fields: dict | None) -> None:
+        pipe = redis.pipeline()
+        if fields is None:
+            pipe.delete(instrument_key)
+        else:
+            pipe.hset(instrument_key, mapping=fields)
+        queue_market_changes(pipe, [instrument_key])
+        await pipe.execute()
+
+    @pytest.mark.asyncio
+    async def test_applies_added_and_removed_instruments(self, fake_redis):
+        call_key = "markets:deribit:option:BTC:2025-03-28:50000:c"
+        put_key = "markets:deribit:option:BTC:2025-03-28:50000:p"
+        index = DeribitInstrumentIndex()
+        await self._write(fake_redis, call_key, {"best_bid": "0.1"})
+        index.apply_stream_update(call_key, {"best_bid": "0.1"})
+        assert await index.reconcile(fake_redis) is False
+
+        await self._write(fake_redis, put_key, {"best_bid": "0.05"})
+        await self._write(fake_redis, call_key, None)
+        await self._write(fake_redis, "markets:deribit:option:SOL:2025-03-28:100:c", {"best_bid": "1"})
+        fake_redis.scan = AsyncMock(side_effect=AssertionError("incremental reconcile must not SCAN"))
+
+        assert await index.reconcile(fake_redis) is False
+        assert [entry["instrument_key"] for entry in index.get_options_by_currency("BTC")] == [put_key]
+        assert index.get_options_by_currency("SOL") == []
+        chain = index.get_option_chain_slice("BTC", "2025-03-28")
+        assert chain.strikes.tolist() == [50000.0]
+        assert np.isnan(chain.call("best_bid")[0])
+        assert chain.put("best_bid")[0] == 0.05
+
+    @pytest.mark.asyncio
+    async def test_removing_last_instrument_drops_expiry(self, fake_redis):
+        call_key = "markets:deribit:option:BTC:2025-03-28:50000:c"
+        index = DeribitInstrumentIndex()
+        await self._write(fake_redis, call_key, {"best_bid": "0.1"})
+        index.apply_stream_update(call_key, {"best_bid": "0.1"})
+        await index.reconcile(fake_redis)
+
+        await self._write(fake_redis, call_key, None)
+
+        assert await index.reconcile(fake_redis) is False
+        assert index.instrument_count == 0
+        assert index.get_option_expiries("BTC") == []
+
+    @pytest.mark.asyncio
+    async def test_lost_generation_requests_reinitialize(self, fake_redis):
+        call_key = "markets:deribit:option:BTC:2025-03-28:50000:c"
+        index = DeribitInstrumentIndex()
+        await self._write(fake_redis, call_key, {"best_bid": "0.1"})
+        index.apply_stream_update(call_key, {"best_bid": "0.1"})
+        await index.reconcile(fake_redis)
+
+        await fake_redis.delete(market_changelog_key(DERIBIT_VENUE))
+        await self._write(fake_redis, call_key, {"best_bid": "0.2"})
+
+        assert await index.reconcile(fake_redis) is True
+
+    @pytest.mark.asyncio
+    async def test_logged_delete_does_not_hide_unlogged_additions(self, fake_redis):
+        call_key = "markets:deribit:option:BTC:2025-03-28:50000:c"
+        index = DeribitInstrumentIndex()
+        await fake_redis.hset(call_key, mapping={"best_bid": "0.1"})
+        index.apply_stream_update(call_key, {"best_bid": "0.1"})
+        assert await index.reconcile(fake_redis) is False
+
+        # Only the expiry cleaner logs Deribit changes; the additions are unlogged
+        await self._write(fake_redis, call_key, None)
+        for strike in range(60000, 67000, 1000):
+            await fake_redis.hset(f"markets:deribit:option:BTC:2025-03-28:{strike}:c", mapping={"best_bid": "0.1"})
+
+        assert await index.reconcile(fake_redis) is True
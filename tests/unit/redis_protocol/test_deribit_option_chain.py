@@ -0,0 +1,74 @@
+"""Tests for deribit_option_chain."""
+
+import numpy as np
+import pytest
+
+from common.redis_protocol.deribit_option_chain import CALL, PUT, ExpiryChain, parse_option_coordinates
+
+
+class TestExpiryChain:
+    """Tests for ExpiryChain."""
+
+    def test_inserts_new_strikes_in_order(self):
+        chain = ExpiryChain()
+        for strike in (300.0, 100.0, 200.0):
+            chain.update(strike, CALL, {"best_bid": str(strike / 100)})
+
+        snapshot = chain.snapshot("2025-03-28")
+
+        assert snapshot.strikes.tolist() == [100.0, 200.0, 300.0]
+        assert snapshot.call("best_bid").tolist() == [1.0, 2.0, 3.0]
+        assert np.isnan(snapshot.puts).all()
+
+    def test_ignores_non_chain_fields_and_bad_values(self):
+        chain = ExpiryChain()
+
+        chain.update(100.0, PUT, {"best_ask": "oops", "mark_iv": "40", "timestamp": "1"})
+
+        snapshot = chain.snapshot("2025-03-28")
+        assert np.isnan(snapshot.put("best_ask")[0])
+        assert snapshot.put("mark_iv")[0] == 40.0
+
+    def test_snapshot_is_a_copy(self):
+        chain = ExpiryChain()
+        chain.update(100.0, CALL, {"best_bid": "1"})
+        snapshot = chain.snapshot("2025-03-28")
+
+        chain.update(100.0, CALL, {"best_bid": "2"})
+
+        assert snapshot.call("best_bid")[0] == 1.0
+
+    @pytest.mark.parametrize(
+        ("spot", "count", "expected"),
+        [
+            (250.0, 2, [200.0, 300.0]),
+            (50.0, 3, [100.0, 200.0, 300.0]),
+            (900.0, 2, [400.0, 500.0]),
+            (250.0, 10, [100.0, 200.0, 300.0, 400.0, 500.0]),
+        ],
+    )
+    def test_nearest_window_is_clamped(self, spot, count, expected):
+        chain = ExpiryChain()
+        for strike in (100.0, 200.0, 300.0, 400.0, 500.0):
+            chain.update(strike, CALL, {"best_bid": "1"})
+
+        assert chain.nearest("2025-03-28", spot, count).strikes.tolist() == expected
+
+
+class TestParseOptionCoordinates:
+    """Tests for parse_option_coordinates."""
+
+    def test_prefers_hash_fields(self):
+        fields = {"expiry_iso": "2025-03-28", "strike": "50000", "option_kind": "put"}
+
+        assert parse_option_coordinates("markets:deribit:option:BTC:x", fields) == ("2025-03-28", 50000.0, PUT)
+
+    def test_falls_back_to_key(self):
+        assert parse_option_coordinates("markets:deribit:option:BTC:2025-03-28:50000:c", {}) == ("2025-03-28", 50000.0, CALL)
+
+    @pytest.mark.parametrize(
+        "key",
+        ["markets:deribit:option:BTC:key-0", "markets:deribit:option:BTC:2025-03-28:abc:c", "markets:deribit:option:BTC:2025-03-28:1:x"],
+    )
+    def test_unparseable_returns_none(self, key):
+        assert parse_option_coordinates(key, {}) is None
@@ -0,0 +1,121 @@
+"""Tests for the per-venue market change log."""
+
+import pytest
+
+from common.redis_protocol.market_changelog import (
+    INITIAL_GENERATION,
+    KALSHI_VENUE,
+    fetch_changed_hashes,
+    latest_generation,
+    market_changelog_key,
+    queue_changelog_reset,
+    queue_market_changes,
+    read_market_changes,
+    venue_for_market_key,
+)
+
+
+async def _log(redis, *keys: str) -> None:
+    pipe = redis.pipeline()
+    queue_market_changes(pipe, keys)
+    await pipe.execute()
+
+
+@pytest.mark.parametrize(
+    ("key", "expected"),
+    [
+        ("markets:kalshi:binary:KXBTC-1", "kalshi"),
+        ("markets:deribit:option:BTC:2025-03-28:50000:c", "deribit"),
+        ("markets:polymarket:x", None),
+        ("kalshi:market:KXBTC-1", None),
+    ],
+)
+def test_venue_for_market_key(key, expected):
+    assert venue_for_market_key(key) == expected
+
+
+@pytest.mark.asyncio
+async def test_queue_ignores_untracked_keys(fake_redis):
+    pipe = fake_redis.pipeline()
+
+    queued = queue_market_changes(pipe, ["markets:kalshi:binary:A", "snap:A"])
+    await pipe.execute()
+
+    assert queued == 1
+    assert await fake_redis.xlen(market_changelog_key(KALSHI_VENUE)) == 1
+
+
+@pytest.mark.asyncio
+async def test_latest_generation_defaults_to_initial(fake_redis):
+    assert await latest_generation(fake_redis, KALSHI_VENUE) == INITIAL_GENERATION
+
+    await _log(fake_redis, "markets:kalshi:binary:A")
+
+    assert await latest_generation(fake_redis, KALSHI_VENUE) != INITIAL_GENERATION
+
+
+@pytest.mark.asyncio
+async def test_read_changes_since_generation_dedupes_keys(fake_redis):
+    await _log(fake_redis, "markets:kalshi:binary:A")
+    since = await latest_generation(fake_redis, KALSHI_VENUE)
+    await _log(fake_redis, "markets:kalshi:binary:B", "markets:kalshi:binary:C", "markets:kalshi:binary:B")
+
+    delta = await read_market_changes(fake_redis, KALSHI_VENUE, since)
+
+    assert not delta.truncated
+    assert delta.keys == ("markets:kalshi:binary:B", "markets:kalshi:binary:C")
+    assert delta.generation == await latest_generation(fake_redis, KALSHI_VENUE)
+
+
+@pytest.mark.asyncio
+async def test_read_changes_up_to_date_returns_empty(fake_redis):
+    await _log(fake_redis, "markets:kalshi:binary:A")
+    since = await latest_generation(fake_redis, KALSHI_VENUE)
+
+    delta = await read_market_changes(fake_redis, KALSHI_VENUE, since)
+
+    assert delta.keys == ()
+    assert delta.generation == since
+    assert not delta.truncated
+
+
+@pytest.mark.asyncio
+async def test_read_changes_from_initial_generation(fake_redis):
+    await _log(fake_redis, "markets:kalshi:binary:A")
+
+    delta = await read_market_changes(fake_redis, KALSHI_VENUE, INITIAL_GENERATION)
+
+    assert delta.keys == ("markets:kalshi:binary:A",)
+
+
+@pytest.mark.asyncio
+async def test_trimmed_generation_is_truncated(fake_redis):
+    await _log(fake_redis, "markets:kalshi:binary:A")
+    since = await latest_generation(fake_redis, KALSHI_VENUE)
+    await fake_redis.delete(market_changelog_key(KALSHI_VENUE))
+    await _log(fake_redis, "markets:kalshi:binary:B")
+
+    delta = await read_market_changes(fake_redis, KALSHI_VENUE, since)
+
+    assert delta.truncated
+
+
+@pytest.mark.asyncio
+async def test_reset_marker_truncates_initial_readers(fake_redis):
+    pipe = fake_redis.pipeline()
+    queue_changelog_reset(pipe, [KALSHI_VENUE])
+    await pipe.execute()
+
+    delta = await read_market_changes(fake_redis, KALSHI_VENUE, INITIAL_GENERATION)
+
+    assert delta.truncated
+
+
+@pytest.mark.asyncio
+async def test_fetch_changed_hashes(fake_redis):
+    await fake_redis.hset("markets:kalshi:binary:A", mapping={"event_ticker": "EVT"})
+
+    results = await fetch_changed_hashes(fake_redis, ["markets:kalshi:binary:A", "markets:kalshi:binary:GONE"])
+
+    assert results == [("markets:kalshi:binary:A", {"event_ticker": "EVT"}), ("markets:kalshi:binary:GONE", {})]
+    assert await fetch_changed_hashes(fake_redis, []) == []
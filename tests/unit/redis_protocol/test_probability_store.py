@@ -85,6 +85,48 @@ async def test_store_probabilities_large_snapshot(probability_store: Probability
     assert roundtrip[sample_expiry]["10005"]["probability"] == pytest.approx(0.08)
 
 
+@pytest.mark.asyncio
+async def test_store_probabilities_writes_probability_frame(probability_store: ProbabilityStore, fake_redis):
+    payload = {
+        "2025-01-02T00:00:00Z": {
+            ">2000": {"probability": 0.1},
+            "1500": {"probability": Decimal("0.5"), "error": 0.01},
+        },
+        "2025-01-01T00:00:00Z": {"100": {"probability": 0.7, "confidence": 0.95}},
+    }
+
+    await probability_store.store_probabilities("btc", payload)
+    assert await fake_redis.get("probabilities_frame:BTC") is not None
+
+    frame = await probability_store.get_probability_frame("btc")
+
+    assert frame.expiry.tolist() == ["2025-01-01T00:00:00Z", "2025-01-02T00:00:00Z", "2025-01-02T00:00:00Z"]
+    assert frame.strike_key.tolist() == ["100", "1500", ">2000"]
+    assert frame.strike_type.tolist() == ["exact", "exact", "greater"]
+    assert frame.probability.tolist() == [0.7, 0.5, 0.1]
+    assert frame.confidence[0] == pytest.approx(0.95)
+    assert math.isnan(frame.confidence[1])
+
+
+@pytest.mark.asyncio
+async def test_get_probability_frame_rebuilds_from_hash(probability_store: ProbabilityStore, fake_redis):
+    await fake_redis.hset("probabilities:ETH", "2025-01-01T00:00:00Z:200", '{"probability": 0.2}')
+    await fake_redis.hset("probabilities:ETH", "2025-01-01T00:00:00Z:100", '{"probability": 0.4}')
+
+    frame = await probability_store.get_probability_frame("eth")
+
+    assert frame.strike.tolist() == [100.0, 200.0]
+    assert frame.probability.tolist() == [0.4, 0.2]
+
+
+@pytest.mark.asyncio
+async def test_get_probability_frame_empty_snapshot_not_found(probability_store: ProbabilityStore):
+    await probability_store.store_probabilities("eth", {})
+
+    with pytest.raises(ProbabilityDataNotFoundError):
+        await probability_store.get_probability_frame("eth")
+
+
 @pytest.mark.asyncio
 async def test_store_probability_partial_update(probability_store: ProbabilityStore, fake_redis):
     data = ProbabilityData(
@@ -243,3 +285,27 @@ async def test_get_probabilities_by_event_type_filters_and_sorts(probability_sto
     assert first_expiry["call"]["110"]["probability"] == pytest.approx(0.5)
     second_expiry = result["2025-06-02T00:00:00Z"]
     assert second_expiry["call"]["120"]["probability"] == pytest.approx(0.7)
+
+
+@pytest.mark.asyncio
+async def test_human_readable_ingestion_maintains_event_type_index(probability_store: ProbabilityStore, fake_redis, stub_schema_config):
+    payload = {
+        "2025-07-01T00:00:00Z": {
+            "100": {"strike_type": "greater", "probability": 0.6, "event_type": "rain", "event_ticker": "EV-1"},
+            "200": {"strike_type": "greater", "probability": 0.4, "event_type": "snow", "event_ticker": "EV-2"},
+        }
+    }
+    await probability_store.store_probabilities_human_readable("btc", payload)
+
+    assert fake_redis.dump_set("probabilities_index:BTC:event_types") == {"rain", "snow"}
+    assert fake_redis.dump_set("probabilities_index:BTC:event_type:rain") == {"probabilities:BTC:2025-07-01T00:00:00Z:greater:100"}
+    assert await probability_store.get_all_event_types("btc") == ["rain", "snow"]
+    rain = await probability_store.get_probabilities_by_event_type("btc", "rain")
+    assert rain["2025-07-01T00:00:00Z"]["greater"]["100"]["probability"] == pytest.approx(0.6)
+
+    await probability_store.store_probabilities_human_readable(
+        "btc", {"2025-07-02T00:00:00Z": {"300": {**payload["2025-07-01T00:00:00Z"]["200"]}}}
+    )
+
+    assert fake_redis.dump_set("probabilities_index:BTC:event_types") == {"snow"}
+    assert fake_redis.dump_set("probabilities_index:BTC:event_type:rain") == set()
@@ -27,13 +27,17 @@ class PipelineStub:
         self.commands.append(("hset", key, field, value))
         return self
 
+    def set(self, key: str, value: str):
+        self.commands.append(("set", key, value))
+        return self
+
     async def execute(self):
         self.executed = True
         results = []
         for command in self.commands:
             if command[0] == "delete":
                 results.append(0)
-            elif command[0] == "hset":
+            elif command[0] in ("hset", "set"):
                 results.append(1)
             else:
                 results.append(0)
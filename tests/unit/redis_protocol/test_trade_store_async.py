@@ -301,32 +301,48 @@ async def test_get_trade_by_order_id_raises_on_empty_trade_reason(monkeypatch, f
         await store.get_trade_by_order_id(trade.order_id)
 
 
-@pytest.mark.asyncio
-async def test_store_trade_detects_pipeline_failure(monkeypatch):
-    class BrokenPipeline:
-        async def __aenter__(self):
-            return self
+class _BrokenPipeline:
+    """Pipeline whose EXEC reports one failed command."""
 
-        async def __aexit__(self, _exc_type, _exc, _tb):
-            return False
+    async def __aenter__(self):
+        return self
 
-        def set(self, *args, **kwargs):
-            return self
+    async def __aexit__(self, _exc_type, _exc, _tb):
+        return False
 
-        def sadd(self, *args, **kwargs):
-            return self
+    async def watch(self, *keys):
+        return None
 
-        async def execute(self):
-            return [True, None, True, True, True]
+    async def get(self, key):
+        return None
+
+    def multi(self):
+        return None
+
+    def set(self, *args, **kwargs):
+        return self
+
+    def sadd(self, *args, **kwargs):
+        return self
+
+    def hincrby(self, *args, **kwargs):
+        return self
+
+    async def execute(self):
+        return [True, None, True, True, True]
 
-    class BrokenRedis:
-        async def ping(self):
-            return True
 
-        def pipeline(self):
-            return BrokenPipeline()
+class _BrokenRedis:
+    async def ping(self):
+        return True
 
-    store = TradeStore(redis=BrokenRedis())
+    def pipeline(self):
+        return _BrokenPipeline()
+
+
+@pytest.mark.asyncio
+async def test_store_trade_detects_pipeline_failure(monkeypatch):
+    store = TradeStore(redis=_BrokenRedis())
     store.redis = store.redis
     store._base_connection.initialized = True  # type: ignore[attr-defined]
     store._connection_mgr.ensure_redis_connection = AsyncMock(return_value=True)
@@ -537,7 +553,7 @@ async def test_get_trades_by_date_range_propagates_errors(monkeypatch, fake_redi
     store, _ = _build_store(monkeypatch, fake_redis_client_factory)
     await store.store_trade(_make_trade())
 
-    store._repository.get = AsyncMock(side_effect=TradeStoreError("fetch fail"))  # type: ignore[attr-defined]
+    store._repository.get_many = AsyncMock(side_effect=TradeStoreError("fetch fail"))  # type: ignore[attr-defined]
 
     store._queries._start_date_loader = lambda: date(2024, 1, 1)  # type: ignore[attr-defined]
 
@@ -805,6 +821,27 @@ async def test_get_unrealized_pnl_history_handles_errors(monkeypatch, fake_redis
         await store.get_unrealized_pnl_history(date(2024, 1, 12), date(2024, 1, 13))
 
 
+@pytest.mark.asyncio
+async def test_store_trade_indexes_open_trade_by_ticker(monkeypatch, fake_redis_client_factory):
+    store, fake = _build_store(monkeypatch, fake_redis_client_factory)
+    trade = _make_trade()
+
+    await store.store_trade(trade)
+
+    assert fake.dump_set(KEYS.ticker(trade.market_ticker)) == {_trade_key(trade)}
+
+
+@pytest.mark.asyncio
+async def test_mark_trade_settled_removes_ticker_index_entry(monkeypatch, fake_redis_client_factory):
+    store, fake = _build_store(monkeypatch, fake_redis_client_factory)
+    trade = _make_trade()
+    await store.store_trade(trade)
+
+    await store.mark_trade_settled(trade.order_id, settlement_price_cents=75)
+
+    assert fake.dump_set(KEYS.ticker(trade.market_ticker)) == set()
+
+
 @pytest.mark.asyncio
 async def test_update_trade_prices_updates_records(monkeypatch, fake_redis_client_factory):
     store, fake = _build_store(monkeypatch, fake_redis_client_factory)
@@ -812,8 +849,6 @@ async def test_update_trade_prices_updates_records(monkeypatch, fake_redis_clien
     trade.trade_timestamp = datetime(2024, 1, 14, tzinfo=timezone.utc)
     await store.store_trade(trade)
 
-    store._price_updater._timezone_date = lambda tz: date(2024, 1, 14)  # type: ignore[attr-defined]
-
     updated = await store.update_trade_prices(trade.market_ticker, yes_bid=70.0, yes_ask=80.0)
     assert updated == 1
 
@@ -821,6 +856,80 @@ async def test_update_trade_prices_updates_records(monkeypatch, fake_redis_clien
     payload = orjson.loads(await fake.get(trade_key))
     assert payload["last_yes_bid"] == _VAL_70_0
     assert payload["last_yes_ask"] == _VAL_80_0
+    assert payload["order_id"] == trade.order_id
+
+
+@pytest.mark.asyncio
+async def test_update_trade_prices_batch_coalesces_per_ticker(monkeypatch, fake_redis_client_factory):
+    store, fake = _build_store(monkeypatch, fake_redis_client_factory)
+    first = _make_trade(order_id="order-a")
+    second = _make_trade(order_id="order-b", market_ticker="KXHIGHNYC-24JAN02-B101")
+    settled = _make_trade(order_id="order-c", settlement_price_cents=100)
+    for trade in (first, second, settled):
+        await store.store_trade(trade)
+
+    updated = await store.update_trade_prices_batch(
+        [
+            (first.market_ticker, 10.0, 20.0),
+            (second.market_ticker, 30.0, 40.0),
+            (first.market_ticker, 11.0, 21.0),
+        ]
+    )
+
+    assert updated == _TEST_COUNT_2
+    assert orjson.loads(await fake.get(_trade_key(first)))["last_yes_bid"] == 11.0
+    assert orjson.loads(await fake.get(_trade_key(second)))["last_yes_ask"] == 40.0
+    assert "last_yes_bid" not in orjson.loads(await fake.get(_trade_key(settled)))
+
+
+@pytest.mark.asyncio
+async def test_update_trade_prices_batch_empty_skips_redis(monkeypatch, fake_redis_client_factory):
+    store, _ = _build_store(monkeypatch, fake_redis_client_factory)
+    store._repository._redis_provider = AsyncMock(side_effect=AssertionError("unexpected Redis access"))  # type: ignore[attr-defined]
+
+    assert await store.update_trade_prices_batch([]) == 0
+
+
+@pytest.mark.asyncio
+async def test_rebuild_ticker_index_backfills_open_trades(monkeypatch, fake_redis_client_factory):
+    store, fake = _build_store(monkeypatch, fake_redis_client_factory)
+    open_trade = _make_trade(order_id="open")
+    settled_trade = _make_trade(order_id="settled", settlement_price_cents=100)
+    for trade in (open_trade, settled_trade):
+        await store.store_trade(trade)
+    await fake.delete(KEYS.ticker(open_trade.market_ticker))
+    store._price_updater._timezone_date = lambda tz: date(2024, 1, 3)  # type: ignore[attr-defined]
+
+    indexed = await store.rebuild_ticker_index(lookback_days=2)
+
+    assert indexed == 1
+    assert fake.dump_set(KEYS.ticker(open_trade.market_ticker)) == {_trade_key(open_trade)}
+
+
+@pytest.mark.asyncio
+async def test_initialize_backfills_ticker_index(monkeypatch, fake_redis_client_factory):
+    store, fake = _build_store(monkeypatch, fake_redis_client_factory)
+    trade = _make_trade(order_id="pre-index")
+    await store.store_trade(trade)
+    await fake.delete(KEYS.ticker(trade.market_ticker))
+    store._price_updater._timezone_date = lambda tz: date(2024, 1, 2)  # type: ignore[attr-defined]
+    store._connection_mgr.initialize = AsyncMock(return_value=True)  # type: ignore[method-assign]
+
+    assert await store.initialize() is True
+
+    assert fake.dump_set(KEYS.ticker(trade.market_ticker)) == {_trade_key(trade)}
+    assert await store.update_trade_prices(trade.market_ticker, yes_bid=70.0, yes_ask=80.0) == 1
+
+
+@pytest.mark.asyncio
+async def test_update_trade_prices_prunes_stale_index_members(monkeypatch, fake_redis_client_factory):
+    store, fake = _build_store(monkeypatch, fake_redis_client_factory)
+    trade = _make_trade(order_id="gone")
+    await store.store_trade(trade)
+    await fake.delete(_trade_key(trade))
+
+    assert await store.update_trade_prices(trade.market_ticker, yes_bid=70.0, yes_ask=80.0) == 0
+    assert fake.dump_set(KEYS.ticker(trade.market_ticker)) == set()
 
 
 @pytest.mark.asyncio
@@ -831,3 +940,141 @@ async def test_update_trade_prices_raises_on_error(monkeypatch, fake_redis_clien
 
     with pytest.raises(TradeStoreError, match="update_trade_prices failed"):
         await store.update_trade_prices("KXHIGHNYC-24JAN02-B100", 70.0, 80.0)
+
+
+@pytest.mark.asyncio
+async def test_get_trades_by_date_range_reuses_decoded_records(monkeypatch, fake_redis_client_factory):
+    store, _ = _build_store(monkeypatch, fake_redis_client_factory)
+    await store.store_trade(_make_trade(order_id="order-a"))
+    await store.store_trade(_make_trade(order_id="order-b"))
+    store._queries._start_date_loader = lambda: date(2024, 1, 1)  # type: ignore[attr-defined]
+    from common.redis_protocol.trade_store import codec as codec_module
+
+    decode_calls = []
+    original_decode = codec_module._decode_trade_record
+    monkeypatch.setattr(codec_module, "_decode_trade_record", lambda payload: decode_calls.append(payload) or original_decode(payload))
+
+    first = await store.get_trades_by_date_range(date(2024, 1, 2), date(2024, 1, 2))
+    second = await store.get_trades_by_date_range(date(2024, 1, 2), date(2024, 1, 2))
+
+    assert len(decode_calls) == 2
+    assert {t.order_id for t in first} == {t.order_id for t in second} == {"order-a", "order-b"}
+
+
+@pytest.mark.asyncio
+async def test_get_trades_by_date_range_redecodes_rewritten_payload(monkeypatch, fake_redis_client_factory):
+    store, _ = _build_store(monkeypatch, fake_redis_client_factory)
+    trade = _make_trade()
+    await store.store_trade(trade)
+    store._queries._start_date_loader = lambda: date(2024, 1, 1)  # type: ignore[attr-defined]
+    await store.get_trades_by_date_range(date(2024, 1, 2), date(2024, 1, 2))
+
+    await store.mark_trade_settled(trade.order_id, settlement_price_cents=100)
+    trades = await store.get_trades_by_date_range(date(2024, 1, 2), date(2024, 1, 2))
+
+    assert trades[0].settlement_price_cents == 100
+
+
+@pytest.mark.asyncio
+async def test_get_trades_by_rule_batches_index_lookups(monkeypatch, fake_redis_client_factory):
+    store, fake = _build_store(monkeypatch, fake_redis_client_factory)
+    for order_id in ("order-a", "order-b", "order-c"):
+        await store.store_trade(_make_trade(order_id=order_id))
+    await fake.delete(KEYS.order_index("order-c"))
+
+    with pytest.raises(TradeStoreError, match="order-c"):
+        await store.get_trades_by_rule("rule_3")
+
+    await fake.sadd(KEYS.rule("rule_4"), "order-a", "order-b")
+    trades = await store.get_trades_by_rule("rule_4")
+    assert sorted(t.order_id for t in trades) == ["order-a", "order-b"]
+
+
+@pytest.mark.asyncio
+async def test_store_trade_updates_daily_aggregates(monkeypatch, fake_redis_client_factory):
+    store, fake = _build_store(monkeypatch, fake_redis_client_factory)
+    await store.store_trade(_make_trade(order_id="order-a"))
+    await store.store_trade(_make_trade(order_id="order-b", trade_rule="rule_4", weather_station="CHI"))
+    await store.store_trade(_make_trade(order_id="order-a"))
+
+    (day,) = await store.get_pnl_aggregates(date(2024, 1, 1), date(2024, 1, 3))
+
+    assert day.trade_date == date(2024, 1, 2)
+    assert (day.total.trades, day.total.quantity, day.total.cost_cents, day.total.fee_cents) == (2, 4, 250, 10)
+    assert day.total.settled == 0
+    assert day.by_rule["rule_3"].trades == 1
+    assert day.by_station["CHI"].cost_cents == 125
+    assert day.by_category["weather"].trades == _TEST_COUNT_2
+
+
+@pytest.mark.asyncio
+async def test_mark_trade_settled_updates_daily_aggregates(monkeypatch, fake_redis_client_factory):
+    store, _ = _build_store(monkeypatch, fake_redis_client_factory)
+    await store.store_trade(_make_trade(order_id="winner"))
+    await store.store_trade(_make_trade(order_id="loser", trade_rule="rule_4"))
+
+    settled_at = datetime(2024, 1, 2, 20, 0, tzinfo=timezone.utc)
+    await store.mark_trade_settled("winner", settlement_price_cents=100, settled_at=settled_at)
+    await store.mark_trade_settled("loser", settlement_price_cents=0, settled_at=settled_at)
+    await store.mark_trade_settled("loser", settlement_price_cents=0, settled_at=settled_at)
+
+    (day,) = await store.get_pnl_aggregates(date(2024, 1, 2), date(2024, 1, 2))
+    assert day.total.settled == _TEST_COUNT_2
+    assert day.total.realized_pnl_cents == (200 - 125) + (0 - 125)
+    assert day.total.wins == 1
+    assert day.total.win_rate == 0.5
+    assert day.by_rule["rule_4"].realized_pnl_cents == -125
+    assert day.by_rule["rule_4"].wins == 0
+
+
+@pytest.mark.asyncio
+async def test_settlement_metrics_count_on_close_date(monkeypatch, fake_redis_client_factory):
+    store, _ = _build_store(monkeypatch, fake_redis_client_factory)
+    await store.store_trade(_make_trade(order_id="overnight"))
+
+    await store.mark_trade_settled("overnight", settlement_price_cents=100, settled_at=datetime(2024, 1, 3, 9, 0, tzinfo=timezone.utc))
+
+    opened, closed = await store.get_pnl_aggregates(date(2024, 1, 2), date(2024, 1, 3))
+    assert (opened.trade_date, opened.total.trades, opened.total.cost_cents, opened.total.settled) == (date(2024, 1, 2), 1, 125, 0)
+    assert (closed.trade_date, closed.total.trades, closed.total.settled) == (date(2024, 1, 3), 0, 1)
+    assert (closed.total.realized_pnl_cents, closed.total.wins) == (200 - 125, 1)
+    assert closed.by_rule["rule_3"].settled == 1
+
+
+@pytest.mark.asyncio
+async def test_rebuild_pnl_aggregates_counts_settlements_on_close_date(monkeypatch, fake_redis_client_factory):
+    store, fake = _build_store(monkeypatch, fake_redis_client_factory)
+    await store.store_trade(_make_trade(order_id="overnight"))
+    await store.mark_trade_settled("overnight", settlement_price_cents=0, settled_at=datetime(2024, 1, 3, 9, 0, tzinfo=timezone.utc))
+    expected = await store.get_pnl_aggregates(date(2024, 1, 3), date(2024, 1, 3))
+    await fake.delete(KEYS.daily_aggregates(date(2024, 1, 3)))
+
+    assert await store.rebuild_pnl_aggregates(date(2024, 1, 3), date(2024, 1, 3)) == 1
+
+    assert await store.get_pnl_aggregates(date(2024, 1, 3), date(2024, 1, 3)) == expected
+    assert expected[0].total.realized_pnl_cents == -125
+
+
+@pytest.mark.asyncio
+async def test_rebuild_pnl_aggregates_backfills_missing_days(monkeypatch, fake_redis_client_factory):
+    store, fake = _build_store(monkeypatch, fake_redis_client_factory)
+    await store.store_trade(_make_trade(order_id="open"))
+    await store.store_trade(_make_trade(order_id="settled", settlement_price_cents=100))
+    expected = await store.get_pnl_aggregates(date(2024, 1, 2), date(2024, 1, 2))
+    await fake.delete(KEYS.daily_aggregates(date(2024, 1, 2)))
+    assert await store.get_pnl_aggregates(date(2024, 1, 2), date(2024, 1, 2)) == []
+
+    rebuilt = await store.rebuild_pnl_aggregates(date(2024, 1, 1), date(2024, 1, 2))
+
+    assert rebuilt == _TEST_COUNT_2
+    assert await store.get_pnl_aggregates(date(2024, 1, 2), date(2024, 1, 2)) == expected
+    assert expected[0].total.settled == 1
+
+
+@pytest.mark.asyncio
+async def test_get_pnl_aggregates_rejects_unknown_fields(monkeypatch, fake_redis_client_factory):
+    store, fake = _build_store(monkeypatch, fake_redis_client_factory)
+    await fake.hset(KEYS.daily_aggregates(date(2024, 1, 2)), mapping={"total:bogus": "1"})
+
+    with pytest.raises(TradeStoreError, match="Unexpected P&L aggregate field"):
+        await store.get_pnl_aggregates(date(2024, 1, 2), date(2024, 1, 2))
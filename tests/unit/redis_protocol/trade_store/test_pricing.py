@@ -0,0 +1,158 @@
+"""Tests for TradePriceUpdater's per-ticker WATCH/MULTI price batches."""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, timezone
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from redis import WatchError
+
+from common.data_models.trade_record import TradeRecord, TradeSide
+from common.redis_protocol.trade_store.codec import TradeRecordCodec
+from common.redis_protocol.trade_store.keys import TradeKeyBuilder
+from common.redis_protocol.trade_store.pricing import TradePriceUpdater
+from common.redis_protocol.trade_store.records import TradeRecordRepository
+
+_KEYS = TradeKeyBuilder()
+_CODEC = TradeRecordCodec()
+_LOGGER = logging.getLogger("test")
+_NOW = datetime(2024, 1, 2, 16, 0, tzinfo=timezone.utc)
+_OTHER_TICKER = "KXHIGHNYC-24JAN02-B101"
+
+
+def _make_trade(**overrides: Any) -> TradeRecord:
+    payload = {
+        "order_id": "order-1",
+        "market_ticker": "KXHIGHNYC-24JAN02-B100",
+        "trade_timestamp": datetime(2024, 1, 2, 15, 30, tzinfo=timezone.utc),
+        "trade_side": TradeSide.YES,
+        "quantity": 2,
+        "price_cents": 60,
+        "fee_cents": 5,
+        "cost_cents": 125,
+        "market_category": "weather",
+        "weather_station": "NYC",
+        "trade_rule": "rule_3",
+        "trade_reason": "Reasonable trade",
+    }
+    payload.update(overrides)
+    return TradeRecord(**payload)
+
+
+def _trade_key(trade: TradeRecord) -> str:
+    return _KEYS.trade(trade.trade_timestamp.date(), trade.order_id)
+
+
+def _fail_transactions(monkeypatch, fake_redis, trade_key: str, failures: int) -> list[str]:
+    """Make the next ``failures`` transactions writing ``trade_key`` raise WatchError; return every committed write."""
+    create_pipeline = fake_redis.pipeline
+    remaining = [failures]
+    committed: list[str] = []
+
+    def pipeline(transaction: bool = True):
+        pipe = create_pipeline(transaction=transaction)
+        execute = pipe.execute
+
+        async def execute_or_conflict():
+            written = [args[0] for command, args in pipe.commands if command == "set"]
+            if trade_key in written and remaining[0] > 0:
+                remaining[0] -= 1
+                pipe.commands.clear()
+                raise WatchError("watched key changed")
+            committed.extend(written)
+            return await execute()
+
+        pipe.execute = execute_or_conflict
+        return pipe
+
+    monkeypatch.setattr(fake_redis, "pipeline", pipeline)
+    return committed
+
+
+@pytest.fixture
+def repository(fake_redis) -> TradeRecordRepository:
+    return TradeRecordRepository(AsyncMock(return_value=fake_redis), key_builder=_KEYS, codec=_CODEC, logger=_LOGGER)
+
+
+@pytest.fixture
+def updater(repository) -> TradePriceUpdater:
+    return TradePriceUpdater(
+        repository,
+        timezone="UTC",
+        timezone_aware_date_loader=lambda _tz: date(2024, 1, 2),
+        current_time_provider=lambda: _NOW,
+        logger=_LOGGER,
+    )
+
+
+class TestUpdatePricesBatch:
+    @pytest.mark.asyncio
+    async def test_patches_prices_and_keeps_other_fields(self, fake_redis, repository, updater) -> None:
+        trade = _make_trade(last_yes_bid=44.0)
+        await repository.store(trade)
+        before = _CODEC.to_mapping(await fake_redis.get(_trade_key(trade)))
+
+        assert await updater.update_prices_batch([(trade.market_ticker, 45.0, 47.5)]) == 1
+
+        after = _CODEC.to_mapping(await fake_redis.get(_trade_key(trade)))
+        assert after["last_yes_bid"] == 45.0
+        assert after["last_yes_ask"] == 47.5
+        assert after["last_price_update"] == _NOW.isoformat()
+        unchanged = {key: value for key, value in before.items() if not key.startswith("last_")}
+        assert {key: after[key] for key in unchanged} == unchanged
+
+    @pytest.mark.asyncio
+    async def test_tickers_without_open_trades_skip_transactions(self, fake_redis, updater, monkeypatch) -> None:
+        create_pipeline = fake_redis.pipeline
+        transactional = []
+
+        def pipeline(transaction: bool = True):
+            transactional.append(transaction)
+            return create_pipeline(transaction=transaction)
+
+        monkeypatch.setattr(fake_redis, "pipeline", pipeline)
+
+        assert await updater.update_prices_batch([("KXHIGHNYC-24JAN02-B100", 10.0, 20.0), (_OTHER_TICKER, 30.0, 40.0)]) == 0
+        assert transactional == [False]
+
+    @pytest.mark.asyncio
+    async def test_prunes_settled_trades_from_index(self, fake_redis, repository, updater) -> None:
+        trade = _make_trade()
+        await repository.store(trade)
+        settled = _make_trade(settlement_price_cents=100)
+        await fake_redis.set(_trade_key(trade), _CODEC.encode(settled))
+
+        assert await updater.update_prices_batch([(trade.market_ticker, 10.0, 20.0)]) == 0
+        assert fake_redis.dump_set(_KEYS.ticker(trade.market_ticker)) == set()
+        assert _CODEC.decode(await fake_redis.get(_trade_key(trade))).last_yes_bid is None
+
+    @pytest.mark.asyncio
+    async def test_conflict_retries_only_the_conflicting_ticker(self, fake_redis, repository, updater, monkeypatch) -> None:
+        contended = _make_trade()
+        quiet = _make_trade(order_id="order-2", market_ticker=_OTHER_TICKER)
+        for trade in (contended, quiet):
+            await repository.store(trade)
+        committed = _fail_transactions(monkeypatch, fake_redis, _trade_key(contended), failures=1)
+
+        updated = await updater.update_prices_batch([(contended.market_ticker, 10.0, 20.0), (quiet.market_ticker, 30.0, 40.0)])
+
+        assert updated == 2
+        assert committed == [_trade_key(contended), _trade_key(quiet)]
+        assert _CODEC.decode(await fake_redis.get(_trade_key(contended))).last_yes_bid == 10.0
+
+    @pytest.mark.asyncio
+    async def test_persistently_conflicting_ticker_is_skipped(self, fake_redis, repository, updater, monkeypatch) -> None:
+        contended = _make_trade()
+        quiet = _make_trade(order_id="order-2", market_ticker=_OTHER_TICKER)
+        for trade in (contended, quiet):
+            await repository.store(trade)
+        _fail_transactions(monkeypatch, fake_redis, _trade_key(contended), failures=100)
+
+        updated = await updater.update_prices_batch([(contended.market_ticker, 10.0, 20.0), (quiet.market_ticker, 30.0, 40.0)])
+
+        assert updated == 1
+        assert _CODEC.decode(await fake_redis.get(_trade_key(contended))).last_yes_bid is None
+        assert _CODEC.decode(await fake_redis.get(_trade_key(quiet))).last_yes_bid == 30.0
@@ -0,0 +1,94 @@
+"""Tests for the decoded trade record LRU."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from common.data_models.trade_record import TradeRecord, TradeSide
+from common.redis_protocol.trade_store.record_cache import DecodedTradeCache
+
+
+def _record(order_id: str = "order-1") -> TradeRecord:
+    return TradeRecord(
+        order_id=order_id,
+        market_ticker="KXHIGHNYC-24JAN02-B100",
+        trade_timestamp=datetime(2024, 1, 2, 15, 30, tzinfo=timezone.utc),
+        trade_side=TradeSide.YES,
+        quantity=2,
+        price_cents=60,
+        fee_cents=5,
+        cost_cents=125,
+        market_category="weather",
+        weather_station="NYC",
+        trade_rule="rule_3",
+        trade_reason="Reasonable trade",
+    )
+
+
+def test_unchanged_payload_is_decoded_once():
+    cache = DecodedTradeCache()
+    decoder = MagicMock(return_value=_record())
+
+    first = cache.decode("trades:a", b'{"v": 1}', decoder)
+    second = cache.decode("trades:a", '{"v": 1}', decoder)
+
+    decoder.assert_called_once_with('{"v": 1}')
+    assert first == second
+    assert first is not second
+
+
+def test_changed_payload_is_redecoded():
+    cache = DecodedTradeCache()
+    decoder = MagicMock(side_effect=[_record("a"), _record("b")])
+
+    cache.decode("trades:a", "v1", decoder)
+    updated = cache.decode("trades:a", "v2", decoder)
+
+    assert decoder.call_count == 2
+    assert updated.order_id == "b"
+
+
+def test_mutating_result_does_not_touch_cache():
+    cache = DecodedTradeCache()
+    decoder = MagicMock(return_value=_record())
+
+    cache.decode("trades:a", "v1", decoder).settlement_price_cents = 100
+
+    assert cache.decode("trades:a", "v1", decoder).settlement_price_cents is None
+
+
+def test_evicts_least_recently_used():
+    cache = DecodedTradeCache(maxsize=2)
+    decoder = MagicMock(side_effect=lambda payload: _record(payload))
+
+    cache.decode("trades:a", "a", decoder)
+    cache.decode("trades:b", "b", decoder)
+    cache.decode("trades:a", "a", decoder)
+    cache.decode("trades:c", "c", decoder)
+    cache.decode("trades:a", "a", decoder)
+
+    assert len(cache) == 2
+    assert decoder.call_count == 3
+    cache.decode("trades:b", "b", decoder)
+    assert decoder.call_count == 4
+
+
+def test_invalidate_and_clear():
+    cache = DecodedTradeCache()
+    decoder = MagicMock(return_value=_record())
+    cache.decode("trades:a", "v1", decoder)
+
+    cache.invalidate("trades:a")
+    cache.decode("trades:a", "v1", decoder)
+    cache.clear()
+
+    assert decoder.call_count == 2
+    assert len(cache) == 0
+
+
+def test_rejects_non_positive_size():
+    with pytest.raises(ValueError):
+        DecodedTradeCache(maxsize=0)
@@ -3,10 +3,12 @@ from __future__ import annotations
 import pytest
 
 from common.redis_schema.operations import (
+    MarketChangeLogKey,
     MetricStreamKey,
     ServiceStatusKey,
     SubscriptionKey,
     SubscriptionType,
+    SyncCheckpointKey,
 )
 from common.redis_schema.validators import register_namespace, validate_registered_key
 
@@ -41,3 +43,6 @@ def test_operations_key_builders():
 
     metric = MetricStreamKey("Weather", "latency", "5m")
     assert metric.key() == "ops:metrics:WEATHER:LATENCY:5M"
+
+    assert MarketChangeLogKey("kalshi").key() == "ops:market_changes:KALSHI"
+    assert SyncCheckpointKey("kalshi", "fills").key() == "ops:sync_checkpoints:KALSHI:FILLS"
@@ -6,6 +6,7 @@ from common.exceptions import ValidationError
 from common.redis_schema.weather import (
     WeatherAlertKey,
     WeatherHistoryKey,
+    WeatherRollupKey,
     WeatherStationKey,
     ensure_uppercase_icao,
 )
@@ -115,3 +116,18 @@ class TestWeatherAlertKey:
         key1 = WeatherAlertKey(icao="KAUS", alert_type="temp")
         key2 = WeatherAlertKey(icao="KAUS", alert_type="wind")
         assert key1.key() != key2.key()
+
+
+class TestWeatherRollupKey:
+    """Tests for WeatherRollupKey dataclass."""
+
+    def test_key_generation(self):
+        """Key method returns properly formatted Redis key."""
+        key = WeatherRollupKey(icao="KAUS", date_str="2025-01-01")
+        assert key.key() == "weather:station_rollup:KAUS:2025-01-01"
+
+    def test_key_validates_icao(self):
+        """Key method validates the ICAO code."""
+        key = WeatherRollupKey(icao="kaus", date_str="2025-01-01")
+        with pytest.raises(TypeError, match="must be uppercase"):
+            key.key()
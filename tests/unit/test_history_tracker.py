@@ -14,41 +14,65 @@ from common.history_tracker import (
     PriceHistoryTracker,
     WeatherHistoryTracker,
 )
+from common.metric_sink import MetricSink
 
 _VAL_72_5 = 72.5
 
-from common.redis_schema import WeatherHistoryKey
+from common.redis_schema import WeatherHistoryKey, WeatherRollupKey
 
 
 # HistoryTracker -----------------------------------------------------------------
+def _with_pipeline(redis: MagicMock, *, execute_result=None, execute_error: Exception | None = None) -> MagicMock:
+    pipe = MagicMock()
+    pipe.__aenter__.return_value = pipe
+    pipe.execute = AsyncMock(return_value=execute_result or [], side_effect=execute_error)
+    redis.pipeline = MagicMock(return_value=pipe)
+    return pipe
+
+
 @pytest.mark.asyncio
 async def test_record_service_update_success(monkeypatch):
     redis = MagicMock()
-    redis.zadd = AsyncMock(return_value=1)
-    redis.expire = AsyncMock(return_value=True)
+    pipe = _with_pipeline(redis)
 
     monkeypatch.setattr("common.history_tracker.get_redis_connection", AsyncMock(return_value=redis))
     monkeypatch.setattr("common.history_tracker.time.time", lambda: 1_700_000_000)
 
-    tracker = HistoryTracker()
+    tracker = HistoryTracker(metric_sink=MetricSink())
     result = await tracker.record_service_update("kalshi", 12.5)
 
     assert result is True
-    redis.zadd.assert_awaited_once_with(f"{HISTORY_KEY_PREFIX}kalshi", {"1700000000:12.5": 1_700_000_000})
+    pipe.zadd.assert_called_once_with(f"{HISTORY_KEY_PREFIX}kalshi", {"1700000000:12.5": 1_700_000_000})
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_record_service_update_buffers_within_flush_interval(monkeypatch):
+    redis = MagicMock()
+    pipe = _with_pipeline(redis)
+    monkeypatch.setattr("common.history_tracker.get_redis_connection", AsyncMock(return_value=redis))
+    monkeypatch.setattr("common.history_tracker.time.time", lambda: 1_700_000_000)
+
+    sink = MetricSink(flush_interval_seconds=60.0)
+    tracker = HistoryTracker(metric_sink=sink)
+    await tracker.record_service_update("kalshi", 12.5)
+    await tracker.record_service_update("deribit", 3.0)
+
+    pipe.execute.assert_awaited_once()
+    assert sink.stats.buffered == 1
 
 
 @pytest.mark.asyncio
 async def test_record_service_update_failure(monkeypatch):
     redis = MagicMock()
-    redis.zadd = AsyncMock(side_effect=RuntimeError("boom"))
-    redis.expire = AsyncMock()
+    pipe = _with_pipeline(redis, execute_error=RuntimeError("boom"))
     monkeypatch.setattr("common.history_tracker.get_redis_connection", AsyncMock(return_value=redis))
     monkeypatch.setattr("common.history_tracker.time.time", lambda: 1_700_000_000)
 
-    tracker = HistoryTracker()
+    tracker = HistoryTracker(metric_sink=MetricSink())
     with pytest.raises(RuntimeError, match="Failed to record deribit history"):
         await tracker.record_service_update("deribit", 8.0)
-    redis.expire.assert_not_called()
+    pipe.expire.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -85,6 +109,8 @@ def _make_price_redis(*, zadd_result=1, zrangebyscore_result: List[Tuple[str, fl
     redis.close = AsyncMock(return_value=None)
     redis.zadd = AsyncMock(return_value=zadd_result)
     redis.zrangebyscore = AsyncMock(return_value=zrangebyscore_result or [])
+    pipe = _with_pipeline(redis)
+    pipe.register_script = MagicMock(return_value=AsyncMock(return_value=pipe))
     return redis
 
 
@@ -95,13 +121,38 @@ async def test_record_price_update_success(monkeypatch):
     redis = _make_price_redis()
     monkeypatch.setattr("common.history_tracker.get_redis_connection", AsyncMock(return_value=redis))
     fixed_now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
-    monkeypatch.setattr("common.time_utils.get_current_utc", lambda: fixed_now)
+    monkeypatch.setattr("common.price_history_recorder.get_current_utc", lambda: fixed_now)
 
-    tracker = PriceHistoryTracker()
+    tracker = PriceHistoryTracker(metric_sink=MetricSink())
     result = await tracker.record_price_update("BTC", 45_000)
 
     assert result is True
-    redis.zadd.assert_called_once()
+    ts = int(fixed_now.timestamp())
+    pipe = redis.pipeline.return_value
+    script = pipe.register_script.return_value
+    script.assert_awaited_once_with(
+        keys=["history:btc", "history:btc:1m", "history:btc:1h"],
+        args=[ts, "45000.0", build_history_member(ts, 45000.0), 60, 7 * 24 * 3600, 3600, 90 * 24 * 3600],
+        client=pipe,
+    )
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_cleanup_flushes_buffered_price_ticks(monkeypatch):
+    redis = _make_price_redis()
+    redis.aclose = AsyncMock(return_value=None)
+    monkeypatch.setattr("common.history_tracker.get_redis_connection", AsyncMock(return_value=redis))
+    tracker = PriceHistoryTracker(metric_sink=MetricSink(flush_interval_seconds=60.0))
+    await tracker.record_price_update("BTC", 45_000)
+    await tracker.record_price_update("ETH", 2_500)
+    pipe = redis.pipeline.return_value
+    assert pipe.execute.await_count == 1
+
+    await tracker.cleanup()
+
+    assert pipe.execute.await_count == 2
+    redis.aclose.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -197,6 +248,43 @@ async def test_get_price_history_validates_currency():
         await tracker.get_price_history("DOGE")
 
 
+@pytest.mark.asyncio
+async def test_get_price_bars_reads_minute_tier_for_a_day(monkeypatch):
+    from common.price_history_buckets import PriceBar
+
+    now = datetime(2025, 1, 2, 12, 0, 30, tzinfo=timezone.utc)
+    bar_ts = int(now.timestamp()) - 30
+    redis = _make_price_redis(zrangebyscore_result=[f"{bar_ts}|45000.0|45100.5|44990.0|45050.0".encode()])
+    monkeypatch.setattr("common.history_tracker.get_redis_connection", AsyncMock(return_value=redis))
+    monkeypatch.setattr("common.price_history_retriever.get_current_utc", lambda: now)
+
+    tracker = PriceHistoryTracker()
+    bars = await tracker.get_price_bars("BTC", hours=24)
+
+    assert bars == [PriceBar(bar_ts, 45000.0, 45100.5, 44990.0, 45050.0)]
+    key, start = redis.zrangebyscore.await_args.args[:2]
+    assert key == "history:btc:1m"
+    assert start == (now - timedelta(hours=24)).replace(second=0).timestamp()
+
+
+@pytest.mark.asyncio
+async def test_get_price_bars_uses_raw_ticks_for_short_windows(monkeypatch):
+    from common.price_history_buckets import PriceBar
+    from common.price_history_utils import build_history_member
+
+    now = datetime(2025, 1, 2, 12, 0, tzinfo=timezone.utc)
+    ts = int(now.timestamp())
+    redis = _make_price_redis(zrangebyscore_result=[(build_history_member(ts, 3000.0), float(ts))])
+    monkeypatch.setattr("common.history_tracker.get_redis_connection", AsyncMock(return_value=redis))
+    monkeypatch.setattr("common.price_history_retriever.get_current_utc", lambda: now)
+
+    tracker = PriceHistoryTracker()
+    bars = await tracker.get_price_bars("ETH", hours=1, max_points=5000)
+
+    assert bars == [PriceBar(ts, 3000.0, 3000.0, 3000.0, 3000.0)]
+    assert redis.zrangebyscore.await_args.args[0] == "history:eth"
+
+
 # WeatherHistoryTracker -----------------------------------------------------------
 def _make_weather_redis(
     *,
@@ -211,6 +299,10 @@ def _make_weather_redis(
     redis.expire = AsyncMock(return_value=True)
     redis.zrange = AsyncMock(return_value=zrange_result or [])
     redis.zrangebyscore = AsyncMock(return_value=zrangebyscore_result or [])
+    pipe = MagicMock()
+    pipe.__aenter__.return_value = pipe
+    pipe.execute = AsyncMock(return_value=[])
+    redis.pipeline = MagicMock(return_value=pipe)
     return redis
 
 
@@ -226,20 +318,20 @@ async def test_record_temperature_update_success(monkeypatch):
     result = await tracker.record_temperature_update("KAUS", 72.5)
 
     assert result is True
-    zadd_args = redis.zadd.await_args.args  # type: ignore[attr-defined]
-    assert zadd_args[0] == WeatherHistoryKey(icao="KAUS").key()
-    payload = zadd_args[1]
-    assert isinstance(payload, dict) and len(payload) == 1
-    payload_json = next(iter(payload.keys()))
-    decoded = json.loads(payload_json)
-    assert decoded["temp_f"] == _VAL_72_5
-    assert decoded["observed_at"] == now.isoformat()
+    pipe = redis.pipeline.return_value
+    redis.pipeline.assert_called_once_with(transaction=True)
+    zadd_calls = pipe.zadd.call_args_list
+    assert zadd_calls[0].args == (WeatherHistoryKey(icao="KAUS").key(), {"1735754400:72.5": 1_735_754_400})
+    rollup_key = WeatherRollupKey(icao="KAUS", date_str="2025-01-01").key()
+    assert {call.args[0] for call in zadd_calls[1:]} == {rollup_key}
+    assert (rollup_key, {"high": _VAL_72_5}) in [call.args for call in zadd_calls]
+    pipe.execute.assert_awaited_once()
 
 
 @pytest.mark.asyncio
 async def test_record_temperature_update_handles_errors(monkeypatch):
     redis = _make_weather_redis()
-    redis.zadd = AsyncMock(side_effect=RuntimeError("fail"))
+    redis.pipeline.return_value.execute = AsyncMock(side_effect=RuntimeError("fail"))
 
     monkeypatch.setattr("common.history_tracker.get_redis_connection", AsyncMock(return_value=redis))
     fixed_time = datetime(2025, 1, 1, tzinfo=timezone.utc)
@@ -309,6 +401,63 @@ async def test_get_temperature_history_validates_station():
         await tracker.get_temperature_history("")
 
 
+@pytest.mark.asyncio
+async def test_get_temperature_history_batch_pipelines_stations(monkeypatch):
+    now = datetime(2025, 1, 1, 18, 0, tzinfo=timezone.utc)
+    ts = int(now.timestamp()) - 60
+    redis = _make_weather_redis()
+    pipe = redis.pipeline.return_value
+    pipe.execute = AsyncMock(return_value=[[(f"{ts}:70.5", float(ts))], []])
+
+    monkeypatch.setattr("common.history_tracker.get_redis_connection", AsyncMock(return_value=redis))
+    monkeypatch.setattr("common.weather_history_tracker_helpers.statistics_retriever.get_current_utc", lambda: now)
+
+    tracker = WeatherHistoryTracker()
+    histories = await tracker.get_temperature_history_batch(["KAUS", "KMDW", "KAUS"], hours=3)
+
+    redis.pipeline.assert_called_once_with(transaction=False)
+    assert [call.args[0] for call in pipe.zrangebyscore.call_args_list] == [
+        WeatherHistoryKey(icao="KAUS").key(),
+        WeatherHistoryKey(icao="KMDW").key(),
+    ]
+    assert histories["KAUS"].to_pairs() == [(ts, 70.5)]
+    assert histories["KMDW"].to_pairs() == []
+
+
+@pytest.mark.asyncio
+async def test_get_temperature_rollups_reads_one_key_per_day(monkeypatch):
+    now = datetime(2025, 1, 2, 1, 30, tzinfo=timezone.utc)
+    redis = _make_weather_redis()
+    pipe = redis.pipeline.return_value
+    pipe.execute = AsyncMock(
+        return_value=[
+            [("23:min", 40.0), ("23:max", 42.0), ("23:last", 41.0), ("high", 60.0)],
+            [("01:min", 38.0), ("01:max", 39.0), ("01:last", 38.5), ("high", 39.0)],
+        ]
+    )
+
+    monkeypatch.setattr("common.history_tracker.get_redis_connection", AsyncMock(return_value=redis))
+    monkeypatch.setattr("common.weather_history_tracker_helpers.statistics_retriever.get_current_utc", lambda: now)
+
+    tracker = WeatherHistoryTracker()
+    rollups = await tracker.get_temperature_rollups(["KAUS"], hours=6)
+
+    assert [call.args[0] for call in pipe.zrange.call_args_list] == [
+        WeatherRollupKey(icao="KAUS", date_str="2025-01-01").key(),
+        WeatherRollupKey(icao="KAUS", date_str="2025-01-02").key(),
+    ]
+    assert [(hour.min_f, hour.max_f, hour.last_f) for hour in rollups["KAUS"].hourly] == [(40.0, 42.0, 41.0), (38.0, 39.0, 38.5)]
+    assert rollups["KAUS"].utc_day_high_f == 39.0
+
+
+@pytest.mark.asyncio
+async def test_get_temperature_history_batch_validates_stations(monkeypatch):
+    monkeypatch.setattr("common.history_tracker.get_redis_connection", AsyncMock(return_value=_make_weather_redis()))
+    tracker = WeatherHistoryTracker()
+    with pytest.raises(ValueError):
+        await tracker.get_temperature_history_batch(["KAUS", ""])
+
+
 # BalanceHistoryTracker -----------------------------------------------------------
 from common.history_tracker import BalanceHistoryTracker
 from common.redis_protocol.config import BALANCE_KEY_PREFIX
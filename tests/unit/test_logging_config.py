@@ -43,6 +43,7 @@ def logging_module(monkeypatch):
 
     yield logging_config
 
+    logging_config.shutdown_logging()
     root = logging.getLogger()
     _close_and_remove_handlers(root)
 
@@ -181,3 +182,74 @@ class TestCloseHandlers:
         logging_module._close_handlers(test_logger, "test_close_error_v2")
 
         mock_handler.close.assert_called_once()
+
+
+class TestQueueMode:
+    """Tests for the QueueHandler/QueueListener backend."""
+
+    def test_root_only_enqueues_and_listener_writes_file(self, logging_module, monkeypatch, tmp_path):
+        fake_root = _set_fake_project_root(monkeypatch, tmp_path)
+        monkeypatch.delenv("MANAGED_BY_MONITOR", raising=False)
+
+        logging_module.setup_logging(service_name="kalshi", use_queue=True)
+
+        root = logging.getLogger()
+        assert [type(h) for h in root.handlers] == [logging_module._BoundedQueueHandler]
+        logging.getLogger("test.queue.mode").info("queued record")
+        logging_module.shutdown_logging()
+
+        assert "queued record" in (fake_root / "logs" / "kalshi.log").read_text()
+        assert logging_module.get_log_queue_stats() is None
+        assert any(isinstance(h, logging.FileHandler) for h in root.handlers)
+
+    def test_env_enables_queue_mode(self, logging_module, monkeypatch, tmp_path):
+        _set_fake_project_root(monkeypatch, tmp_path)
+        monkeypatch.setenv("MANAGED_BY_MONITOR", "1")
+        monkeypatch.setenv("LOG_QUEUE_MODE", "1")
+
+        logging_module.setup_logging()
+
+        stats = logging_module.get_log_queue_stats()
+        assert stats is not None and stats.dropped == 0
+
+    def test_reconfiguring_stops_previous_listener(self, logging_module, monkeypatch, tmp_path):
+        _set_fake_project_root(monkeypatch, tmp_path)
+        monkeypatch.setenv("MANAGED_BY_MONITOR", "1")
+
+        logging_module.setup_logging(use_queue=True)
+        first = logging_module._queue_backend
+        logging_module.setup_logging(use_queue=False)
+
+        assert first.listener._thread is None
+        assert logging_module.get_log_queue_stats() is None
+
+    def test_full_queue_drops_and_counts(self, logging_module):
+        import queue
+
+        handler = logging_module._BoundedQueueHandler(queue.Queue(maxsize=1), {})
+        for index in range(3):
+            handler.handle(logging.makeLogRecord({"name": "svc", "levelno": logging.INFO, "msg": f"m{index}"}))
+
+        assert handler.stats.queued == 1
+        assert handler.stats.dropped == 2
+
+    def test_hot_logger_sampling_keeps_one_in_n_below_warning(self, logging_module):
+        import queue
+
+        log_queue = queue.Queue()
+        handler = logging_module._BoundedQueueHandler(log_queue, {"hot": 3})
+        for index in range(6):
+            handler.handle(logging.makeLogRecord({"name": "hot.child", "levelno": logging.DEBUG, "msg": f"d{index}"}))
+        handler.handle(logging.makeLogRecord({"name": "hot.child", "levelno": logging.WARNING, "msg": "warn"}))
+        handler.handle(logging.makeLogRecord({"name": "cold", "levelno": logging.INFO, "msg": "cold"}))
+
+        assert [log_queue.get_nowait().msg for _ in range(log_queue.qsize())] == ["d0", "d3", "warn", "cold"]
+        assert handler.stats.sampled_out == 4
+
+    def test_rejects_empty_queue(self, logging_module):
+        with pytest.raises(ValueError):
+            logging_module.setup_logging(use_queue=True, queue_size=0)
+
+
+def test_module_does_not_import_matplotlib(logging_module):
+    assert not hasattr(logging_module, "matplotlib")
@@ -0,0 +1,163 @@
+"""Tests for src/common/metric_sink.py."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from common.metric_sink import MetricSink, SortedSetSample, get_shared_metric_sink
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _redis(*, execute_error: Exception | None = None) -> tuple[MagicMock, MagicMock]:
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[], side_effect=execute_error)
+    redis = MagicMock()
+    redis.pipeline = MagicMock(return_value=pipe)
+    return redis, pipe
+
+
+def _sample(key: str, ts: int, value: float, retention_seconds: int | None = None) -> SortedSetSample:
+    return SortedSetSample(key, f"{ts}:{value}", float(ts), retention_seconds=retention_seconds)
+
+
+@pytest.mark.asyncio
+async def test_first_record_flushes_then_buffers_until_interval():
+    clock = FakeClock()
+    sink = MetricSink(flush_interval_seconds=1.0, clock=clock)
+    redis, pipe = _redis()
+
+    await sink.record(redis, _sample("history:kalshi", 100, 5.0))
+    await sink.record(redis, _sample("history:deribit", 100, 2.0))
+    await sink.record(redis, _sample("history:kalshi", 101, 6.0))
+    assert pipe.execute.await_count == 1
+
+    clock.now = 1.5
+    await sink.record(redis, _sample("history:deribit", 101, 3.0))
+
+    assert pipe.execute.await_count == 2
+    redis.pipeline.assert_called_with(transaction=False)
+    assert pipe.zadd.call_count == 4
+    assert sink.stats.flushed_samples == 4
+    assert sink.stats.buffered == 0
+
+
+@pytest.mark.asyncio
+async def test_same_key_and_second_coalesces_to_latest_sample():
+    sink = MetricSink()
+    redis, pipe = _redis()
+
+    sink.add(redis, _sample("history:kalshi", 100, 5.0))
+    sink.add(redis, _sample("history:kalshi", 100, 7.0))
+    await sink.flush(redis)
+
+    pipe.zadd.assert_called_once_with("history:kalshi", {"100:7.0": 100.0})
+    assert sink.stats.coalesced_samples == 1
+
+
+def test_full_buffer_drops_oldest_samples():
+    sink = MetricSink(max_buffered_samples=2)
+    redis, _pipe = _redis()
+
+    for ts in range(100, 104):
+        sink.add(redis, _sample("history:kalshi", ts, 1.0))
+
+    assert sink.stats.buffered == 2
+    assert sink.stats.dropped_samples == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_requeues_and_reraises():
+    sink = MetricSink(max_buffered_samples=3)
+    redis, _pipe = _redis(execute_error=ConnectionError("down"))
+    sink.add(redis, _sample("history:kalshi", 100, 1.0))
+    sink.add(redis, _sample("history:kalshi", 101, 1.0))
+
+    with pytest.raises(ConnectionError):
+        await sink.flush(redis)
+
+    assert sink.stats.failed_flushes == 1
+    assert sink.stats.buffered == 2
+
+    redis.pipeline.return_value.execute.side_effect = None
+    assert await sink.flush(redis) == 2
+    assert [call.args[1] for call in redis.pipeline.return_value.zadd.call_args_list[-2:]] == [{"100:1.0": 100.0}, {"101:1.0": 101.0}]
+
+
+@pytest.mark.asyncio
+async def test_clients_flush_only_their_own_samples():
+    sink = MetricSink(flush_interval_seconds=0.0)
+    broken, _broken_pipe = _redis(execute_error=ConnectionError("down"))
+    healthy, healthy_pipe = _redis()
+    sink.add(broken, _sample("history:kalshi", 100, 1.0))
+
+    await sink.record(healthy, _sample("history:deribit", 100, 2.0))
+
+    healthy_pipe.zadd.assert_called_once_with("history:deribit", {"100:2.0": 100.0})
+    assert sink.stats.buffered == 1
+    with pytest.raises(ConnectionError):
+        await sink.record(broken, _sample("history:kalshi", 101, 1.0))
+
+
+@pytest.mark.asyncio
+async def test_background_loop_flushes_idle_buffers():
+    clock = FakeClock()
+    sink = MetricSink(flush_interval_seconds=0.01, clock=clock)
+    redis, pipe = _redis()
+    await sink.record(redis, _sample("history:kalshi", 100, 1.0))
+    await sink.record(redis, _sample("history:kalshi", 101, 1.0))
+    assert sink.stats.buffered == 1
+
+    await asyncio.sleep(0.05)
+
+    assert sink.stats.buffered == 0
+    assert pipe.execute.await_count == 2
+    await sink.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_remaining_samples():
+    sink = MetricSink(flush_interval_seconds=60.0)
+    redis, pipe = _redis()
+    sink.add(redis, _sample("history:kalshi", 100, 1.0))
+    await sink.start()
+
+    await sink.stop()
+
+    pipe.zadd.assert_called_once_with("history:kalshi", {"100:1.0": 100.0})
+    assert sink.stats.buffered == 0
+
+
+@pytest.mark.asyncio
+async def test_prunes_only_every_prune_interval():
+    clock = FakeClock()
+    sink = MetricSink(flush_interval_seconds=0.0, prune_interval_seconds=300.0, clock=clock, wall_clock=lambda: 10_000.0)
+    redis, pipe = _redis()
+
+    await sink.record(redis, _sample("history:kalshi", 9_990, 1.0, retention_seconds=3600))
+    clock.now = 200.0
+    await sink.record(redis, _sample("history:kalshi", 9_991, 1.0, retention_seconds=3600))
+    pipe.zremrangebyscore.assert_not_called()
+
+    clock.now = 301.0
+    await sink.record(redis, _sample("history:kalshi", 9_992, 1.0, retention_seconds=3600))
+    pipe.zremrangebyscore.assert_called_once_with("history:kalshi", "-inf", "(6400")
+    assert sink.stats.prune_runs == 1
+
+
+def test_shared_sink_is_process_wide():
+    assert get_shared_metric_sink() is get_shared_metric_sink()
+
+
+def test_rejects_invalid_configuration():
+    with pytest.raises(ValueError):
+        MetricSink(max_buffered_samples=0)
+    with pytest.raises(ValueError):
+        MetricSink(flush_interval_seconds=-1)
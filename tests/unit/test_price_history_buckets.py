@@ -0,0 +1,89 @@
+"""Tests for src/common/price_history_buckets.py."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from common.price_history_buckets import (
+    _SCRIPT_PATH,
+    HOUR_RESOLUTION,
+    MINUTE_RESOLUTION,
+    RAW_RESOLUTION,
+    PriceBar,
+    PriceTickScript,
+    parse_bar_member,
+    select_resolution,
+)
+
+
+class TestSelectResolution:
+    def test_short_window_reads_raw_ticks(self):
+        assert select_resolution(0.5, max_points=2000) == RAW_RESOLUTION
+
+    def test_day_window_reads_minute_bars(self):
+        assert select_resolution(24, max_points=2000) == MINUTE_RESOLUTION
+
+    def test_small_budget_steps_down_to_hour_bars(self):
+        assert select_resolution(24, max_points=100) == HOUR_RESOLUTION
+
+    def test_window_beyond_minute_retention_reads_hour_bars(self):
+        assert select_resolution(24 * 30, max_points=1_000_000) == HOUR_RESOLUTION
+
+    def test_budget_too_small_for_any_tier_uses_coarsest_covering_tier(self):
+        assert select_resolution(24, max_points=1) == HOUR_RESOLUTION
+        assert select_resolution(24 * 365, max_points=1) == HOUR_RESOLUTION
+
+    def test_rejects_non_positive_inputs(self):
+        with pytest.raises(ValueError):
+            select_resolution(0)
+        with pytest.raises(ValueError):
+            select_resolution(1, max_points=0)
+
+
+def test_parse_bar_member():
+    assert parse_bar_member(b"1735689600|95000.0|95100.5|94900.0|95050.25") == PriceBar(1735689600, 95000.0, 95100.5, 94900.0, 95050.25)
+
+
+def test_parse_bar_member_rejects_raw_members():
+    with pytest.raises(ValueError):
+        parse_bar_member("1735689600|95000.0")
+
+
+class TestPriceTickScript:
+    def test_script_file_ships_with_package(self):
+        assert _SCRIPT_PATH.is_file()
+        assert "ZREMRANGEBYSCORE" in _SCRIPT_PATH.read_text(encoding="utf-8")
+
+    @pytest.mark.asyncio
+    async def test_record_passes_tiers_and_registers_once(self):
+        script = AsyncMock(return_value=1)
+        redis = MagicMock()
+        redis.register_script = MagicMock(return_value=script)
+        tick_script = PriceTickScript(resolutions=(MINUTE_RESOLUTION,))
+
+        for _ in range(2):
+            updated = await tick_script.record(redis, currency="ETH", int_ts=120, price=3000, member="120|3000.0")
+
+        assert updated == 1
+        redis.register_script.assert_called_once()
+        script.assert_awaited_with(
+            keys=["history:eth", "history:eth:1m"],
+            args=[120, "3000.0", "120|3000.0", 60, MINUTE_RESOLUTION.retention_seconds],
+            client=redis,
+        )
+
+
+@pytest.mark.asyncio
+async def test_tick_sample_queues_script_on_pipeline():
+    pipe = MagicMock()
+    script = AsyncMock(return_value=pipe)
+    pipe.register_script = MagicMock(return_value=script)
+    sample = PriceTickScript(resolutions=(HOUR_RESOLUTION,)).sample(currency="BTC", int_ts=7200, price=1.5, member="7200|1.5")
+
+    await sample.queue(pipe)
+
+    assert sample.coalesce_key is None
+    assert (sample.key, sample.retention_seconds) == ("history:btc", RAW_RESOLUTION.retention_seconds)
+    script.assert_awaited_once_with(
+        keys=["history:btc", "history:btc:1h"], args=[7200, "1.5", "7200|1.5", 3600, HOUR_RESOLUTION.retention_seconds], client=pipe
+    )
@@ -16,6 +16,7 @@ from common.session_tracker import (
     track_session_request,
     tracked_session,
 )
+from common.session_tracker_helpers.lifecycle import SessionIdGenerator
 
 
 class FakeSession:
@@ -32,7 +33,7 @@ def fresh_tracker() -> SessionTracker:
     SessionTracker.__init__(tracker)
     tracker.sessions = {}
     tracker.session_refs = {}
-    tracker._next_session_id = 1
+    tracker._id_generator = SessionIdGenerator()
     return tracker
 
 
@@ -57,6 +58,22 @@ def test_track_session_activity_increments_request(monkeypatch: pytest.MonkeyPat
     assert info.last_activity <= time.time()
 
 
+def test_track_session_connection_counts_reuse(monkeypatch: pytest.MonkeyPatch):
+    tracker = fresh_tracker()
+    fake_session = FakeSession()
+    session_id = tracker.track_session_creation(cast(aiohttp.ClientSession, fake_session), "svc")
+
+    tracker.track_session_connection(session_id, reused=False, connect_seconds=0.25)
+    tracker.track_session_connection(session_id, reused=True)
+    tracker.track_session_connection(session_id, reused=True)
+
+    info = tracker.sessions[session_id]
+    assert info.new_connections == 1
+    assert info.reused_connections == 2
+    assert info.max_connect_seconds == pytest.approx(0.25)
+    assert info.connection_reuse_ratio == pytest.approx(2 / 3)
+
+
 def test_track_session_closure_marks_closed(monkeypatch: pytest.MonkeyPatch):
     tracker = fresh_tracker()
     fake_session = FakeSession()
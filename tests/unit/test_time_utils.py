@@ -157,5 +157,9 @@ class TestTimeUtilsReexports:
             "calculate_dusk_utc",
             "is_between_dawn_and_dusk",
             "is_after_midpoint_noon_to_dusk",
+            "calculate_twilight_batch",
+            "TwilightArrays",
+            "SolarDay",
+            "SolarDayCache",
         }
         assert set(time_utils.__all__) == expected_exports
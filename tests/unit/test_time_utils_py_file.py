@@ -48,6 +48,10 @@ def test_time_utils_py_file_all_exports():
         "calculate_dusk_utc",
         "is_between_dawn_and_dusk",
         "is_after_midpoint_noon_to_dusk",
+        "calculate_twilight_batch",
+        "TwilightArrays",
+        "SolarDay",
+        "SolarDayCache",
     ]
     assert set(time_utils_module.__all__) == set(expected)
 
@@ -0,0 +1,91 @@
+"""Tests for the priority-aware token bucket."""
+
+import asyncio
+
+import pytest
+
+from common.token_bucket import RequestPriority, TokenBucket
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_rejects_non_positive_rate():
+    with pytest.raises(ValueError, match="rate_per_second"):
+        TokenBucket(0)
+
+
+def test_rejects_capacity_below_one_request():
+    with pytest.raises(ValueError, match="capacity"):
+        TokenBucket(10, capacity=0.5)
+
+
+@pytest.mark.asyncio
+async def test_acquire_consumes_burst_capacity_without_waiting():
+    clock = _Clock()
+    bucket = TokenBucket(5, capacity=3, clock=clock)
+
+    for _ in range(3):
+        await asyncio.wait_for(bucket.acquire(), timeout=0.1)
+
+    assert bucket.available_tokens == 0
+
+
+def test_refills_at_rate_up_to_capacity():
+    clock = _Clock()
+    bucket = TokenBucket(4, capacity=2, clock=clock)
+    bucket.drain()
+    clock.now = 0.25
+    assert bucket.available_tokens == 1
+    clock.now = 10.0
+    assert bucket.available_tokens == 2
+
+
+def test_drain_with_penalty_goes_into_debt():
+    clock = _Clock()
+    bucket = TokenBucket(10, clock=clock)
+
+    bucket.drain(penalty_seconds=0.5)
+
+    assert bucket.available_tokens == -5
+    clock.now = 0.6
+    assert bucket.available_tokens == pytest.approx(1)
+
+
+@pytest.mark.asyncio
+async def test_urgent_requests_skip_ahead_of_queued_background_requests():
+    bucket = TokenBucket(200, capacity=1)
+    bucket.drain()
+    served = []
+
+    async def request(name, priority):
+        await bucket.acquire(priority)
+        served.append(name)
+
+    background = [asyncio.create_task(request(f"poll-{i}", RequestPriority.BACKGROUND)) for i in range(3)]
+    await asyncio.sleep(0)
+    urgent = asyncio.create_task(request("order", RequestPriority.URGENT))
+    await asyncio.wait_for(asyncio.gather(urgent, *background), timeout=1.0)
+
+    assert served[0] == "order"
+    assert served[1:] == ["poll-0", "poll-1", "poll-2"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue():
+    bucket = TokenBucket(1, capacity=1)
+    bucket.drain(penalty_seconds=10)
+    waiter = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0)
+    assert bucket.queued == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert bucket.queued == 0
@@ -0,0 +1,87 @@
+"""Tests for the per-station solar day cache."""
+
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from common.time_utils.base import AstronomicalComputationError
+from common.time_utils.solar_cache import SolarDayCache
+from common.time_utils.twilight import (
+    calculate_dawn_utc,
+    calculate_dusk_utc,
+    calculate_twilight_batch,
+    is_between_dawn_and_dusk,
+)
+from common.utils.solar import compute_solar_times
+
+_NYC = ("KNYC", 40.7128, -74.0060)
+_LAX = ("KLAX", 33.9425, -118.4081)
+
+
+class TestSolarDayCache:
+    """Tests for SolarDayCache."""
+
+    def test_values_match_scalar_functions(self):
+        cache = SolarDayCache()
+        day = date(2024, 6, 21)
+
+        solar_day = cache.get(*_NYC, day)
+
+        solar = compute_solar_times(_NYC[1], _NYC[2], day)
+        assert (solar_day.sunrise, solar_day.solar_noon, solar_day.sunset) == tuple(solar)
+        assert solar_day.dawn == calculate_dawn_utc(_NYC[1], _NYC[2], day)
+        assert solar_day.dusk == calculate_dusk_utc(_NYC[1], _NYC[2], day)
+
+    def test_memoizes_and_batches_known_stations(self):
+        cache = SolarDayCache()
+        cache.get(*_NYC, date(2024, 6, 20))
+        cache.get(*_LAX, date(2024, 6, 20))
+
+        with patch("common.time_utils.solar_cache.calculate_twilight_batch", wraps=calculate_twilight_batch) as batch:
+            cache.get(*_NYC, date(2024, 6, 21))
+            cache.get(*_LAX, date(2024, 6, 21))
+            cache.get(*_NYC, date(2024, 6, 21))
+
+        batch.assert_called_once()
+        assert len(batch.call_args.args[0]) == 2
+
+    def test_evicts_days_older_than_yesterday_on_rollover(self):
+        cache = SolarDayCache()
+        for offset in range(4):
+            cache.get(*_NYC, date(2024, 6, 18) + timedelta(days=offset))
+
+        assert len(cache) == 2
+
+    def test_moved_station_is_recomputed(self):
+        cache = SolarDayCache()
+        day = date(2024, 6, 21)
+        first = cache.get("STN", 40.0, -74.0, day)
+
+        moved = cache.get("STN", 34.0, -118.0, day)
+
+        assert moved != first
+
+    @pytest.mark.parametrize("latitude", [95.0, float("nan")])
+    def test_bad_station_does_not_break_other_stations(self, latitude):
+        cache = SolarDayCache()
+        day = date(2024, 6, 21)
+        cache.get(*_NYC, date(2024, 6, 20))
+
+        with pytest.raises(ValueError):
+            cache.get("BAD", latitude, -74.0, day)
+
+        assert cache.get(*_NYC, day).dawn == calculate_dawn_utc(_NYC[1], _NYC[2], day)
+        assert cache.get(*_LAX, day).dusk == calculate_dusk_utc(_LAX[1], _LAX[2], day)
+
+    @pytest.mark.parametrize("hour", [0, 2, 6, 12, 18, 22, 23])
+    def test_daylight_check_matches_scalar(self, hour):
+        cache = SolarDayCache()
+        current = datetime(2024, 3, 10, hour, 30, tzinfo=timezone.utc)
+
+        assert cache.is_between_dawn_and_dusk(*_LAX, current) == is_between_dawn_and_dusk(_LAX[1], _LAX[2], current)
+
+    def test_daylight_check_raises_for_polar_day(self):
+        cache = SolarDayCache()
+        with pytest.raises(AstronomicalComputationError):
+            cache.is_between_dawn_and_dusk("ENSB", 78.22, 15.65, datetime(2024, 6, 21, 12, tzinfo=timezone.utc))
@@ -1,13 +1,17 @@
 """Tests for twilight calculation functions."""
 
+import math
 from datetime import date, datetime, timedelta, timezone
 
+import numpy as np
 import pytest
 
 from common.time_utils.base import AstronomicalComputationError
+from common.time_utils.solar import calculate_solar_noon_utc
 from common.time_utils.twilight import (
     calculate_dawn_utc,
     calculate_dusk_utc,
+    calculate_twilight_batch,
     is_after_midpoint_noon_to_dusk,
     is_between_dawn_and_dusk,
 )
@@ -69,6 +73,38 @@ class TestCalculateDuskUtc:
             calculate_dusk_utc(89.0, 0.0, date(2024, 12, 21))
 
 
+class TestCalculateTwilightBatch:
+    """Tests for calculate_twilight_batch function."""
+
+    def test_matches_scalar_functions(self):
+        """Batch values equal the scalar dawn/noon/dusk to the second."""
+        latitudes = np.array([40.7128, 0.0, -33.87, 47.61])
+        longitudes = np.array([-74.0060, 0.0, 151.21, -122.33])
+        dates = [date(2024, 1, 1) + timedelta(days=offset) for offset in range(0, 366, 11)]
+
+        batch = calculate_twilight_batch(latitudes[:, None], longitudes[:, None], dates)
+
+        for row, (lat, lon) in enumerate(zip(latitudes, longitudes)):
+            for col, day in enumerate(dates):
+                assert batch.dawn[row, col] == calculate_dawn_utc(float(lat), float(lon), day).timestamp()
+                assert batch.solar_noon[row, col] == calculate_solar_noon_utc(float(lat), float(lon), day).timestamp()
+                assert batch.dusk[row, col] == calculate_dusk_utc(float(lat), float(lon), day).timestamp()
+
+    def test_polar_day_is_nan(self):
+        """Entries where the scalar functions raise are NaN."""
+        batch = calculate_twilight_batch([78.22], [15.65], [date(2024, 6, 21)])
+        with pytest.raises(AstronomicalComputationError):
+            calculate_dawn_utc(78.22, 15.65, date(2024, 6, 21))
+        assert math.isnan(batch.dawn[0])
+        assert math.isnan(batch.dusk[0])
+        assert not math.isnan(batch.solar_noon[0])
+
+    def test_rejects_out_of_range_coordinates(self):
+        """Invalid coordinates raise like the scalar functions."""
+        with pytest.raises(ValueError, match="Latitude"):
+            calculate_twilight_batch([40.0, 95.0], [0.0, 0.0], [date(2024, 6, 21)])
+
+
 class TestIsBetweenDawnAndDusk:
     """Tests for is_between_dawn_and_dusk function."""
 
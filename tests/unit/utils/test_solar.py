@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import math
-from datetime import date, datetime, time, timezone
+from datetime import date, datetime, time, timedelta, timezone
 
+import numpy as np
 import pytest
 
 from common.utils.solar import (
@@ -13,6 +14,8 @@ from common.utils.solar import (
     compute_solar_diurnal,
     compute_solar_diurnal_from_iso,
     compute_solar_times,
+    compute_solar_times_batch,
+    seconds_of_day_to_time,
 )
 
 # New York City coordinates
@@ -68,6 +71,30 @@ class TestComputeSolarTimes:
         assert day_length_hours(summer) > day_length_hours(winter)
 
 
+class TestComputeSolarTimesBatch:
+    """Tests for compute_solar_times_batch."""
+
+    def test_matches_scalar_on_station_date_grid(self) -> None:
+        latitudes = np.array([_NYC_LAT, 0.0, -33.87, 64.84, 78.22])
+        longitudes = np.array([_NYC_LON, 0.0, 151.21, -147.72, 15.65])
+        dates = [date(2024, 1, 1) + timedelta(days=offset) for offset in range(0, 366, 7)]
+
+        batch = compute_solar_times_batch(latitudes[:, None], longitudes[:, None], dates)
+
+        assert batch.sunrise.shape == (len(latitudes), len(dates))
+        for row, (lat, lon) in enumerate(zip(latitudes, longitudes)):
+            for col, d in enumerate(dates):
+                scalar = compute_solar_times(float(lat), float(lon), d)
+                assert seconds_of_day_to_time(batch.sunrise[row, col]) == scalar.sunrise
+                assert seconds_of_day_to_time(batch.solar_noon[row, col]) == scalar.solar_noon
+                assert seconds_of_day_to_time(batch.sunset[row, col]) == scalar.sunset
+
+    def test_accepts_datetime64_dates(self) -> None:
+        batch = compute_solar_times_batch(_NYC_LAT, _NYC_LON, np.array(["2024-06-21"], dtype="datetime64[D]"))
+        scalar = compute_solar_times(_NYC_LAT, _NYC_LON, date(2024, 6, 21))
+        assert seconds_of_day_to_time(batch.solar_noon[0]) == scalar.solar_noon
+
+
 class TestComputeSolarDiurnal:
     """Tests for compute_solar_diurnal."""
 
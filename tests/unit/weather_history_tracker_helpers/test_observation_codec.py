@@ -0,0 +1,52 @@
+"""Tests for src/common/weather_history_tracker_helpers/observation_codec.py."""
+
+import json
+
+import numpy as np
+
+from common.weather_history_tracker_helpers.observation_codec import (
+    decode_observations,
+    empty_observations,
+    encode_observation,
+)
+
+
+def test_encode_observation_is_compact():
+    assert encode_observation(1_735_754_400, 72.5) == "1735754400:72.5"
+    assert encode_observation(1_735_754_400.9, 70) == "1735754400:70.0"
+
+
+def test_decode_round_trips_compact_members():
+    entries = [(encode_observation(ts, temp), float(ts)) for ts, temp in [(100, 70.0), (160, 71.3), (220, -4.2)]]
+
+    decoded = decode_observations(entries)
+
+    assert decoded.timestamps.dtype == np.int64
+    assert decoded.to_pairs() == [(100, 70.0), (160, 71.3), (220, -4.2)]
+
+
+def test_decode_reads_legacy_json_members_and_bytes():
+    legacy = json.dumps({"temp_f": 65.0, "observed_at": "2025-01-01T00:00:00+00:00"})
+    entries = [(legacy, 100.0), (b"160:66.5", 160.0)]
+
+    assert decode_observations(entries).to_pairs() == [(100, 65.0), (160, 66.5)]
+
+
+def test_decode_drops_malformed_and_out_of_range_entries(caplog):
+    entries = [
+        (b"not-json", 100.0),
+        (json.dumps({"no_temp": 10}), 110.0),
+        ("120:250.0", 120.0),
+        ("130:abc", 130.0),
+        ("140:68.0", 140.0),
+    ]
+
+    decoded = decode_observations(entries)
+
+    assert decoded.to_pairs() == [(140, 68.0)]
+    assert "4 invalid temperature entries" in caplog.text
+
+
+def test_decode_empty_reply():
+    decoded = decode_observations([])
+    assert decoded.to_pairs() == empty_observations().to_pairs() == []
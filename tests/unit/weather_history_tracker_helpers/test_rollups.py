@@ -0,0 +1,74 @@
+"""Tests for src/common/weather_history_tracker_helpers/rollups.py."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from common.weather_history_tracker_helpers.rollups import (
+    HourlyRollup,
+    parse_station_rollups,
+    queue_rollup_updates,
+    rollup_days,
+)
+
+_DAY = datetime(2025, 1, 2, tzinfo=timezone.utc)
+
+
+def test_queue_rollup_updates_uses_conditional_zadd():
+    pipe = MagicMock()
+    observed_at = datetime(2025, 1, 2, 7, 45, tzinfo=timezone.utc)
+
+    queue_rollup_updates(pipe, "KAUS", observed_at, 61.0)
+
+    key = "weather:station_rollup:KAUS:2025-01-02"
+    assert [call.args for call in pipe.zadd.call_args_list] == [
+        (key, {"07:min": 61.0}),
+        (key, {"07:max": 61.0}),
+        (key, {"07:last": 61.0}),
+        (key, {"high": 61.0}),
+    ]
+    assert [call.kwargs for call in pipe.zadd.call_args_list] == [{"lt": True}, {"gt": True}, {}, {"gt": True}]
+    pipe.expire.assert_called_once()
+
+
+def test_rollup_key_follows_utc_date():
+    pipe = MagicMock()
+    local_evening = datetime(2025, 1, 1, 20, 0, tzinfo=timezone(timedelta(hours=-6)))
+
+    queue_rollup_updates(pipe, "KAUS", local_evening, 50.0)
+
+    assert pipe.zadd.call_args_list[0].args == ("weather:station_rollup:KAUS:2025-01-02", {"02:min": 50.0})
+
+
+def test_rollup_days_spans_midnight():
+    now = datetime(2025, 1, 2, 6, 0, tzinfo=timezone.utc)
+    assert rollup_days(now, 24) == [datetime(2025, 1, 1, tzinfo=timezone.utc), _DAY]
+    assert rollup_days(now, 3) == [_DAY]
+
+
+def test_parse_station_rollups_filters_window_and_reads_high():
+    yesterday = _DAY - timedelta(days=1)
+    replies = [
+        [("22:min", 40.0), ("22:max", 44.0), ("22:last", 42.0), ("23:min", 39.0), ("23:max", 41.0), ("23:last", 39.5), ("high", 55.0)],
+        [(b"00:min", 38.0), (b"00:last", 38.5), (b"00:max", 39.0), (b"high", 39.0)],
+    ]
+    cutoff_ts = (_DAY - timedelta(minutes=30)).timestamp()
+
+    rollups = parse_station_rollups([yesterday, _DAY], replies, cutoff_ts)
+
+    day_start = int(_DAY.timestamp())
+    assert rollups.hourly == [
+        HourlyRollup(hour_start=day_start - 3600, min_f=39.0, max_f=41.0, last_f=39.5),
+        HourlyRollup(hour_start=day_start, min_f=38.0, max_f=39.0, last_f=38.5),
+    ]
+    assert rollups.utc_day_high_f == 39.0
+
+
+def test_parse_station_rollups_without_data():
+    rollups = parse_station_rollups([_DAY], [[]], 0)
+    assert rollups.hourly == []
+    assert rollups.utc_day_high_f is None
+
+
+def test_parse_station_rollups_ignores_previous_day_high():
+    rollups = parse_station_rollups([_DAY - timedelta(days=1), _DAY], [[("high", 55.0)], []], 0)
+    assert rollups.utc_day_high_f is None
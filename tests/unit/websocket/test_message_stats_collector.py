@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from common.metric_sink import MetricSink
 from common.websocket.message_stats_collector import MessageStatsCollector
 
 _TEST_COUNT_2 = 2
@@ -38,7 +39,7 @@ class FakeRedisClient:
         self.history = {}
         self.expire_calls = []
 
-    def pipeline(self):
+    def pipeline(self, transaction=True):
         return FakePipeline(self)
 
 
@@ -103,7 +104,7 @@ async def test_check_silent_failure_no_alert_when_messages_recent():
 
 @pytest.mark.asyncio
 async def test_write_to_history_redis_records_data(monkeypatch):
-    collector = MessageStatsCollector("kalshi")
+    collector = MessageStatsCollector("kalshi", metric_sink=MetricSink())
     fake_client = FakeRedisClient()
 
     async def fake_get_connection():
@@ -125,7 +126,8 @@ async def test_write_to_history_redis_records_data(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_write_to_history_redis_raises_on_failure(monkeypatch):
-    collector = MessageStatsCollector("kalshi")
+    sink = MetricSink()
+    collector = MessageStatsCollector("kalshi", metric_sink=sink)
 
     class BrokenPipeline:
         def zremrangebyscore(self, *a):
@@ -141,7 +143,7 @@ async def test_write_to_history_redis_raises_on_failure(monkeypatch):
             raise RuntimeError("boom")
 
     class BrokenRedis(FakeRedisClient):
-        def pipeline(self):
+        def pipeline(self, transaction=True):
             return BrokenPipeline()
 
     fake_client = BrokenRedis()
@@ -156,3 +158,5 @@ async def test_write_to_history_redis_raises_on_failure(monkeypatch):
 
     with pytest.raises(ConnectionError):
         await collector._write_to_history_redis(1, 0)
+    assert sink.stats.failed_flushes == 1
+    assert sink.stats.buffered == 1